@@ -0,0 +1,190 @@
+"""
+Async dashboard and job status endpoints (ASGI) with an async cache-hit fast path.
+
+A sync gunicorn worker is tied up for as long as its request waits on the
+database, and requests queue behind it. Under an ASGI server
+(data_ingestion.asgi) the worker's event loop keeps accepting requests:
+- Job status is read from the in-memory job store on the event loop
+- A dashboard request looks up its dataset version with the async ORM and
+  answers 304s and warm rendered-cache hits without running the DRF view
+- Everything else (cache misses, invalid parameters, other methods) runs
+  the unchanged sync DRF view via sync_to_async. The service and repository
+  layers stay synchronous (pandas, rollups, analytics cube, query cache), so
+  a miss does the same blocking work as under WSGI, in a thread that
+  Django's ASGI handler gives each request: a slow query only holds up the
+  request that sent it, and warm hits are not queued behind it
+
+Django 4.2's async ORM runs queries in a thread as well, so a single warm
+hit is not cheaper than under WSGI; the gain is per-worker concurrency
+(see the benchmarks in tests/test_async_views.py).
+
+Mounted on the regular URLs when DASHBOARD_ASYNC_VIEWS is set (asgi.py turns
+it on); status codes, headers and bodies are the same as the DRF views'.
+"""
+
+import logging
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework import status
+
+from data_ingestion.api.responses import PrerenderedResponse, render_json
+from data_ingestion.api.serializers import (
+    DepartmentKPIQuerySerializer,
+    PublicationDashboardQuerySerializer,
+    ResearchFundingQuerySerializer,
+    StudentDashboardQuerySerializer,
+)
+from data_ingestion.api.views import (
+    DepartmentKPIView,
+    PublicationDashboardView,
+    ResearchFundingView,
+    StatusViewSet,
+    StudentDashboardView,
+    _cache_headers,
+    _conditional_response,
+    department_kpi_params,
+    research_funding_params,
+)
+from data_ingestion.infrastructure.dataset_versions import (
+    aget_dataset_state,
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+)
+from data_ingestion.infrastructure.job_status_store import get_job_store
+from data_ingestion.infrastructure.response_cache import get_response_cache
+
+logger = logging.getLogger(__name__)
+
+# endpoint -> (DRF view, dataset, query serializer, cache params from the
+# validated query); params must match the ones the DRF view caches under
+DASHBOARD_ENDPOINTS = {
+    'research_funding': (
+        ResearchFundingView.as_view({'get': 'list'}),
+        DATASET_RESEARCH_FUNDING,
+        ResearchFundingQuerySerializer,
+        research_funding_params,
+    ),
+    'students': (
+        StudentDashboardView.as_view({'get': 'list'}),
+        DATASET_STUDENTS,
+        StudentDashboardQuerySerializer,
+        lambda data: {
+            'department': data.get('department', 'all'),
+            'status': data.get('status', '재학'),
+        },
+    ),
+    'publications': (
+        PublicationDashboardView.as_view({'get': 'list'}),
+        DATASET_PUBLICATIONS,
+        PublicationDashboardQuerySerializer,
+        lambda data: {
+            'department': data.get('department', 'all'),
+            'journal_tier': data.get('journal_tier', 'all'),
+        },
+    ),
+    'department_kpi': (
+        DepartmentKPIView.as_view({'get': 'list'}),
+        DATASET_KPI,
+        DepartmentKPIQuerySerializer,
+        department_kpi_params,
+    ),
+}
+
+STATUS_VIEW = StatusViewSet.as_view({'get': 'retrieve'})
+
+# Methods DRF lists on every response of a GET-only ViewSet route
+ALLOWED_METHODS = 'GET, HEAD, OPTIONS'
+
+
+async def _cached_response(request, endpoint: str, dataset: str, params: dict):
+    """
+    304 or warm rendered-cache response of a dashboard request.
+
+    Returns:
+        The response, or None if the DRF view has to compute it
+    """
+    try:
+        version, updated_at = await aget_dataset_state(dataset)
+    except Exception as e:
+        logger.warning(f"Async dataset version lookup failed for {endpoint}: {e}")
+        return None
+
+    not_modified, validators = _conditional_response(request, endpoint, params, version, updated_at)
+    if not_modified is not None:
+        not_modified['Allow'] = ALLOWED_METHODS
+        return not_modified
+
+    # The cache backend may be the database table, so it is read off the loop
+    rendered = await sync_to_async(get_response_cache().get_rendered)(
+        endpoint, dataset, params, version
+    )
+    if rendered is None:
+        return None
+    return PrerenderedResponse(
+        rendered,
+        request,
+        status=status.HTTP_200_OK,
+        headers={**_cache_headers(True, validators), 'Allow': ALLOWED_METHODS}
+    )
+
+
+async def _dashboard(request, endpoint: str):
+    """Serve a dashboard endpoint, running the DRF view only when needed."""
+    view, dataset, query_serializer_class, get_params = DASHBOARD_ENDPOINTS[endpoint]
+
+    query_serializer = query_serializer_class(data=request.GET)
+    if request.method == 'GET' and query_serializer.is_valid():
+        response = await _cached_response(
+            request, endpoint, dataset, get_params(query_serializer.validated_data)
+        )
+        if response is not None:
+            return response
+
+    # Cold cache, invalid parameters or other methods: the DRF view answers
+    return await sync_to_async(view)(request)
+
+
+async def research_funding(request):
+    """GET /api/dashboard/research-funding/ (see ResearchFundingView)"""
+    return await _dashboard(request, 'research_funding')
+
+
+async def students(request):
+    """GET /api/dashboard/students/ (see StudentDashboardView)"""
+    return await _dashboard(request, 'students')
+
+
+async def publications(request):
+    """GET /api/dashboard/publications/ (see PublicationDashboardView)"""
+    return await _dashboard(request, 'publications')
+
+
+async def department_kpi(request):
+    """GET /api/dashboard/department-kpi/ (see DepartmentKPIView)"""
+    return await _dashboard(request, 'department_kpi')
+
+
+async def upload_status(request, pk):
+    """GET /api/upload/status/{job_id}/ (see StatusViewSet.retrieve)"""
+    if request.method != 'GET':
+        return await sync_to_async(STATUS_VIEW)(request, pk=pk)
+
+    job_info = get_job_store().get_job(pk)
+    if job_info is None:
+        payload, status_code = {
+            'error': 'not_found',
+            'message': '작업 정보를 찾을 수 없습니다.'
+        }, status.HTTP_404_NOT_FOUND
+    else:
+        payload, status_code = StatusViewSet._serialize_job(job_info), status.HTTP_200_OK
+
+    rendered = render_json(payload)
+    return HttpResponse(
+        rendered.body,
+        content_type=rendered.content_type,
+        status=status_code,
+        headers={'Allow': ALLOWED_METHODS}
+    )
@@ -0,0 +1,87 @@
+"""
+Responses served from pre-rendered dashboard bodies.
+
+A cached RenderedResponse already holds the JSON bytes (and a gzip copy),
+so PrerenderedResponse skips DRF's renderer and writes them as-is.
+render_dashboard() builds those bodies for both the views and the cache
+warm-up, so a warmed body is byte-identical to a rendered one.
+"""
+
+import json
+
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from data_ingestion.api.serializers import (
+    PublicationDashboardResponseSerializer,
+    StudentDashboardResponseSerializer,
+)
+from data_ingestion.infrastructure.response_cache import RenderedResponse
+
+
+def render_json(data) -> RenderedResponse:
+    """Render response data exactly as the default JSONRenderer would."""
+    return RenderedResponse.from_body(JSONRenderer().render(data), JSONRenderer.media_type)
+
+
+def _validated_by(serializer_class):
+    def serialize(dashboard_data):
+        response_serializer = serializer_class(data=dashboard_data)
+        response_serializer.is_valid(raise_exception=True)
+        return response_serializer.validated_data
+    return serialize
+
+
+# Endpoint -> response payload of a service result (others send the result as-is)
+DASHBOARD_PAYLOADS = {
+    'research_funding': lambda dashboard_data: {'status': 'success', 'data': dashboard_data},
+    'students': _validated_by(StudentDashboardResponseSerializer),
+    'publications': _validated_by(PublicationDashboardResponseSerializer),
+}
+
+
+def render_dashboard(endpoint: str, data) -> RenderedResponse:
+    """
+    Render the response body of a dashboard endpoint from its service result.
+
+    Raises:
+        rest_framework.exceptions.ValidationError if the response serializer
+        rejects the result
+    """
+    serialize = DASHBOARD_PAYLOADS.get(endpoint)
+    return render_json(serialize(data) if serialize else data)
+
+
+class PrerenderedResponse(Response):
+    """
+    DRF Response whose body was rendered ahead of time.
+
+    The gzip copy is sent when the client accepts it. `data` is decoded
+    from the body on access only (tests, debugging); the hot path never
+    builds Python objects.
+    """
+
+    def __init__(self, rendered: RenderedResponse, request, status=None, headers=None):
+        super().__init__(status=status, headers=headers, content_type=rendered.content_type)
+        self.rendered = rendered
+        if rendered.gzipped is not None:
+            patch_vary_headers(self, ('Accept-Encoding',))
+            if 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+                self['Content-Encoding'] = 'gzip'
+
+    @property
+    def data(self):
+        return json.loads(self.rendered.body) if hasattr(self, 'rendered') else None
+
+    @data.setter
+    def data(self, value):
+        # Response.__init__ assigns data=None; the body is the source of truth
+        pass
+
+    @property
+    def rendered_content(self):
+        self['Content-Type'] = self.content_type
+        if self.has_header('Content-Encoding'):
+            return self.rendered.gzipped
+        return self.rendered.body
@@ -6,6 +6,7 @@ Following spec.md Section 4: API specifications and validation rules.
 import magic
 from rest_framework import serializers
 from django.conf import settings
+from data_ingestion.services.period_comparison import COMPARE_TO_CHOICES
 
 
 class UploadSerializer(serializers.Serializer):
@@ -114,14 +115,107 @@ class JobStatusSerializer(serializers.Serializer):
     """
 
     job_id = serializers.UUIDField()
-    status = serializers.ChoiceField(choices=['processing', 'completed', 'failed', 'partial_success'])
+    status = serializers.ChoiceField(
+        choices=['pending', 'waiting', 'processing', 'completed', 'failed', 'partial_success', 'cancelled']
+    )
     progress = serializers.IntegerField(min_value=0, max_value=100)
+    blocked_by = serializers.CharField(required=False)
+    message = serializers.CharField(required=False)
     files = serializers.ListField(required=False)
+    cache_warmup = serializers.DictField(required=False)
     error_message = serializers.CharField(required=False)
     completed_at = serializers.DateTimeField(required=False)
     failed_at = serializers.DateTimeField(required=False)
 
 
+class JobStatusBatchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for batch job status query parameters.
+
+    Query Parameters:
+        job_ids: str - Comma-separated job IDs (max MAX_JOB_IDS)
+        since: datetime - Return all jobs updated at or after this time (ISO 8601)
+
+    Exactly one of job_ids / since must be provided.
+    """
+
+    MAX_JOB_IDS = 100
+
+    job_ids = serializers.CharField(
+        required=False,
+        help_text="Comma-separated job IDs"
+    )
+
+    since = serializers.DateTimeField(
+        required=False,
+        help_text="Return jobs updated at or after this timestamp"
+    )
+
+    def validate_job_ids(self, value):
+        """Split comma-separated IDs, drop blanks and duplicates (order preserved)."""
+        job_ids = list(dict.fromkeys(
+            job_id.strip() for job_id in value.split(',') if job_id.strip()
+        ))
+
+        if not job_ids:
+            raise serializers.ValidationError('최소 1개 이상의 작업 ID가 필요합니다.')
+
+        if len(job_ids) > self.MAX_JOB_IDS:
+            raise serializers.ValidationError(
+                f'한 번에 최대 {self.MAX_JOB_IDS}개의 작업만 조회할 수 있습니다.'
+            )
+
+        return job_ids
+
+    def validate(self, attrs):
+        """Require exactly one of job_ids / since."""
+        if ('job_ids' in attrs) == ('since' in attrs):
+            raise serializers.ValidationError(
+                'job_ids 또는 since 중 하나만 지정해야 합니다.'
+            )
+
+        return attrs
+
+
+class DepartmentListField(serializers.CharField):
+    """
+    Comma-separated department names for comparison queries.
+
+    Blanks and duplicates are dropped (order preserved); at most
+    MAX_DEPARTMENTS departments per request.
+    """
+
+    MAX_DEPARTMENTS = 10
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        departments = list(dict.fromkeys(
+            department.strip() for department in value.split(',') if department.strip()
+        ))
+
+        if not departments:
+            raise serializers.ValidationError('최소 1개 이상의 학과가 필요합니다.')
+
+        if len(departments) > self.MAX_DEPARTMENTS:
+            raise serializers.ValidationError(
+                f'한 번에 최대 {self.MAX_DEPARTMENTS}개 학과까지 비교할 수 있습니다.'
+            )
+
+        return departments
+
+
+def _validate_departments_filter(attrs):
+    """departments compares several departments; a single department filter cannot be combined."""
+    if 'departments' in attrs and attrs.get('department', 'all') != 'all':
+        raise serializers.ValidationError(
+            'department와 departments는 함께 사용할 수 없습니다.'
+        )
+    if 'departments' in attrs and 'compare_to' in attrs:
+        raise serializers.ValidationError(
+            'departments와 compare_to는 함께 사용할 수 없습니다.'
+        )
+
+
 class ResearchFundingQuerySerializer(serializers.Serializer):
     """
     Serializer for Research Funding API query parameters.
@@ -130,11 +224,17 @@ class ResearchFundingQuerySerializer(serializers.Serializer):
 
     Query Parameters:
         department: str - Department filter ('all' or specific department name)
+        departments: str - Comma-separated departments to compare (one series each)
         period: str - Time period filter ('latest', '1year', '3years')
+        start: date - First execution date (YYYY-MM-DD), replaces period
+        end: date - Last execution date (YYYY-MM-DD), replaces period
+        granularity: str - Trend bucket ('week', 'month', 'quarter', 'year')
+        compare_to: str - Execution total against 'previous_period' / 'previous_year'
 
     Defaults:
         department: 'all'
         period: 'latest'
+        granularity: 'month' (coarser if the range exceeds the point budget)
     """
 
     department = serializers.CharField(
@@ -143,6 +243,11 @@ class ResearchFundingQuerySerializer(serializers.Serializer):
         help_text="Department filter ('all' or specific department name)"
     )
 
+    departments = DepartmentListField(
+        required=False,
+        help_text="Comma-separated departments to compare"
+    )
+
     period = serializers.ChoiceField(
         choices=['latest', '1year', '3years'],
         default='latest',
@@ -150,6 +255,42 @@ class ResearchFundingQuerySerializer(serializers.Serializer):
         help_text="Time period filter"
     )
 
+    start = serializers.DateField(
+        required=False,
+        help_text="First execution date (inclusive)"
+    )
+
+    end = serializers.DateField(
+        required=False,
+        help_text="Last execution date (inclusive)"
+    )
+
+    granularity = serializers.ChoiceField(
+        choices=['week', 'month', 'quarter', 'year'],
+        required=False,
+        help_text="Trend bucket size"
+    )
+
+    compare_to = serializers.ChoiceField(
+        choices=COMPARE_TO_CHOICES,
+        required=False,
+        help_text="Comparison window for the execution total"
+    )
+
+    def validate(self, attrs):
+        """A date range replaces the period filter and must not be reversed."""
+        _validate_departments_filter(attrs)
+        has_range = 'start' in attrs or 'end' in attrs
+        if has_range and attrs.get('period', 'latest') != 'latest':
+            raise serializers.ValidationError(
+                'period와 start/end는 함께 사용할 수 없습니다.'
+            )
+        if 'start' in attrs and 'end' in attrs and attrs['start'] > attrs['end']:
+            raise serializers.ValidationError(
+                '시작일은 종료일보다 이전이거나 같아야 합니다.'
+            )
+        return attrs
+
 
 class StudentDashboardQuerySerializer(serializers.Serializer):
     """
@@ -301,8 +442,10 @@ class DepartmentKPIQuerySerializer(serializers.Serializer):
 
     Query Parameters:
         department: str - Department filter ('all' or specific department name)
+        departments: str - Comma-separated departments to compare (one series each)
         start_year: int - Start year (inclusive), default: current_year - 5
         end_year: int - End year (inclusive), default: current_year
+        compare_to: str - Employment rate against 'previous_period' / 'previous_year'
 
     Business Rules (validated in Service Layer):
         - start_year <= end_year
@@ -317,6 +460,11 @@ class DepartmentKPIQuerySerializer(serializers.Serializer):
         help_text="Department filter ('all' or specific department name)"
     )
 
+    departments = DepartmentListField(
+        required=False,
+        help_text="Comma-separated departments to compare"
+    )
+
     start_year = serializers.IntegerField(
         required=False,
         min_value=1900,  # Allow any reasonable year, validation in service
@@ -331,6 +479,12 @@ class DepartmentKPIQuerySerializer(serializers.Serializer):
         help_text="End year for KPI data (inclusive)"
     )
 
+    compare_to = serializers.ChoiceField(
+        choices=COMPARE_TO_CHOICES,
+        required=False,
+        help_text="Comparison window for the employment rate"
+    )
+
     def validate(self, attrs):
         """
         Add default values for start_year and end_year if not provided.
@@ -341,6 +495,8 @@ class DepartmentKPIQuerySerializer(serializers.Serializer):
         from datetime import datetime
         current_year = datetime.now().year
 
+        _validate_departments_filter(attrs)
+
         # Set default values if not provided
         if 'start_year' not in attrs or attrs['start_year'] is None:
             attrs['start_year'] = current_year - 5
@@ -3,18 +3,50 @@ DRF ViewSets for CSV upload API endpoints.
 Following spec.md Sections 3.3 (Upload) and 3.6 (Status).
 """
 
+import copy
+import json
 import os
+import shutil
 import tempfile
 import logging
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
 from data_ingestion.api.permissions import AdminAPIKeyPermission
-from data_ingestion.api.serializers import UploadSerializer, JobStatusSerializer
-from data_ingestion.services.ingestion_service import submit_upload_job
+from data_ingestion.api.responses import PrerenderedResponse, render_dashboard, render_json
+from data_ingestion.api.serializers import (
+    UploadSerializer,
+    JobStatusSerializer,
+    JobStatusBatchQuerySerializer
+)
+from data_ingestion.services.ingestion_service import (
+    submit_upload_job,
+    cancel_upload_job,
+    check_admission,
+    estimate_completion_seconds,
+    AdmissionRejected,
+    QueueFullError
+)
 from data_ingestion.infrastructure.job_status_store import get_job_store
+from data_ingestion.infrastructure.response_cache import (
+    DATE_ANCHOR_PARAM,
+    RenderedResponse,
+    get_response_cache,
+    make_etag,
+    with_date_anchor,
+)
+from data_ingestion.infrastructure.dataset_versions import (
+    get_all_dataset_versions,
+    get_dataset_state,
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +57,7 @@ class UploadViewSet(viewsets.ViewSet):
 
     Endpoints:
     - POST /api/upload/ - Submit files for background processing
+    - POST /api/upload/{job_id}/cancel/ - Cancel a queued or running job
     """
 
     permission_classes = [AdminAPIKeyPermission]
@@ -35,14 +68,17 @@ class UploadViewSet(viewsets.ViewSet):
 
         Flow:
         1. Validate files (size, format, MIME type)
-        2. Save to temporary directory
-        3. Submit background job
-        4. Return 202 Accepted with job_id
+        2. Admission control (queue depth, temp-disk quota)
+        3. Save to temporary directory
+        4. Submit background job
+        5. Return 202 Accepted with job_id and estimated completion time
 
         Returns:
             HTTP 202 Accepted: Job submitted successfully
             HTTP 400 Bad Request: Validation failed
             HTTP 403 Forbidden: Invalid API key
+            HTTP 429 Too Many Requests: Upload queue full (Retry-After)
+            HTTP 503 Service Unavailable: Temp-disk quota exceeded (Retry-After)
         """
         # Validate uploaded files
         serializer = UploadSerializer(data=request.FILES)
@@ -53,6 +89,17 @@ class UploadViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Reject before writing anything to temp disk
+        upload_bytes = sum(
+            uploaded_file.size
+            for uploaded_file in serializer.validated_data.values()
+            if uploaded_file
+        )
+        try:
+            check_admission(upload_bytes)
+        except AdmissionRejected as e:
+            return self._admission_rejected_response(e)
+
         # Save files to temporary directory
         temp_dir = tempfile.mkdtemp(prefix='upload_')
         file_paths = {}
@@ -71,24 +118,29 @@ class UploadViewSet(viewsets.ViewSet):
                     file_paths[file_type] = temp_path
                     logger.info(f"Saved {file_type} to {temp_path}")
 
-            # Submit background processing job
-            job_id = submit_upload_job(file_paths)
+            # Submit background processing job (job owns temp_dir from here on)
+            job_id = submit_upload_job(file_paths, temp_dir=temp_dir)
+            estimated_seconds = estimate_completion_seconds(job_id)
 
             return Response(
                 {
                     'status': 'processing',
                     'job_id': job_id,
                     'message': '파일 업로드가 시작되었습니다. 처리가 완료되면 알려드리겠습니다.',
-                    'estimated_time': '약 30초 소요 예상'
+                    'estimated_time': f'약 {estimated_seconds}초 소요 예상',
+                    'estimated_seconds': estimated_seconds
                 },
                 status=status.HTTP_202_ACCEPTED
             )
 
+        except AdmissionRejected as e:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return self._admission_rejected_response(e)
+
         except Exception as e:
             logger.exception(f"Error processing upload: {e}")
 
             # Cleanup temp files on error
-            import shutil
             try:
                 shutil.rmtree(temp_dir)
             except Exception as cleanup_error:
@@ -102,15 +154,130 @@ class UploadViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @staticmethod
+    def _admission_rejected_response(error: AdmissionRejected) -> Response:
+        """Build the 429 (queue full) / 503 (temp-disk quota) response."""
+        if isinstance(error, QueueFullError):
+            error_code, http_status = 'ERR_QUEUE_001', status.HTTP_429_TOO_MANY_REQUESTS
+        else:
+            error_code, http_status = 'ERR_DISK_001', status.HTTP_503_SERVICE_UNAVAILABLE
+
+        return Response(
+            {
+                'error': error_code,
+                'message': str(error),
+                'retry_after': error.retry_after
+            },
+            status=http_status,
+            headers={'Retry-After': str(error.retry_after)}
+        )
+
+    def cancel(self, request, pk=None):
+        """
+        Cancel a queued or running upload job.
+
+        Queued jobs are cancelled immediately; running jobs stop at the next
+        checkpoint between files or insert batches.
+
+        Args:
+            pk: job_id (UUID)
+
+        Returns:
+            HTTP 202 Accepted: Cancellation requested
+            HTTP 404 Not Found: Job ID not found
+            HTTP 409 Conflict: Job already finished
+        """
+        job_id = pk
+
+        if get_job_store().get_job(job_id) is None:
+            return Response(
+                {
+                    'error': 'not_found',
+                    'message': '작업 정보를 찾을 수 없습니다.'
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if not cancel_upload_job(job_id):
+            return Response(
+                {
+                    'error': 'conflict',
+                    'message': '이미 완료되었거나 취소된 작업입니다.'
+                },
+                status=status.HTTP_409_CONFLICT
+            )
+
+        return Response(
+            {
+                'job_id': job_id,
+                'message': '작업 취소가 요청되었습니다.'
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
+
 
 class StatusViewSet(viewsets.ViewSet):
     """
     ViewSet for job status queries.
 
     Endpoints:
+    - GET /api/upload/status/?job_ids=a,b,c - Get status of several jobs
+    - GET /api/upload/status/?since=<ISO 8601> - Get all jobs updated since T
     - GET /api/upload/status/{job_id}/ - Get job processing status
     """
 
+    def list(self, request):
+        """
+        Get processing status of several jobs in one round trip.
+
+        Query Parameters:
+            job_ids (str): Comma-separated job IDs
+            since (datetime): Return all jobs updated at or after this timestamp
+
+        Returns:
+            HTTP 200 OK: {'jobs': [...], 'not_found': [...], 'as_of': ...}
+            HTTP 400 Bad Request: Invalid parameters
+
+        Note:
+            'as_of' can be passed back as 'since' on the next poll.
+        """
+        from django.utils import timezone
+
+        query_serializer = JobStatusBatchQuerySerializer(data=request.query_params)
+
+        if not query_serializer.is_valid():
+            return Response(
+                {
+                    'error': 'validation_error',
+                    'message': '유효하지 않은 조회 파라미터입니다.',
+                    'details': query_serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        as_of = timezone.now()
+        job_store = get_job_store()
+        not_found = []
+
+        if 'job_ids' in query_serializer.validated_data:
+            # Single lookup pass over the store for all requested IDs
+            found = job_store.get_jobs(query_serializer.validated_data['job_ids'])
+            not_found = [job_id for job_id, job_info in found.items() if job_info is None]
+            job_infos = [job_info for job_info in found.values() if job_info is not None]
+        else:
+            # JobInfo timestamps are naive local time
+            since = timezone.make_naive(query_serializer.validated_data['since'])
+            job_infos = job_store.find_jobs_updated_since(since)
+
+        return Response(
+            {
+                'jobs': [self._serialize_job(job_info) for job_info in job_infos],
+                'not_found': not_found,
+                'as_of': as_of
+            },
+            status=status.HTTP_200_OK
+        )
+
     def retrieve(self, request, pk=None):
         """
         Get job processing status.
@@ -135,19 +302,159 @@ class StatusViewSet(viewsets.ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Convert JobInfo to dict for serialization
+        return Response(self._serialize_job(job_info), status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _serialize_job(job_info):
+        """Convert a JobInfo snapshot to the validated response dict."""
         job_data = {
             'job_id': job_info.job_id,
             'status': job_info.status.value,
             'progress': job_info.progress,
             'total': job_info.total
         }
+        if job_info.error_message:
+            job_data['error_message'] = job_info.error_message
+        if job_info.blocked_by:
+            job_data['blocked_by'] = job_info.blocked_by
+            job_data['message'] = f'작업 {job_info.blocked_by} 완료 대기 중'
+        if job_info.result:
+            for key in ('files', 'cache_warmup'):
+                if key in job_info.result:
+                    job_data[key] = job_info.result[key]
 
-        # Serialize response
         serializer = JobStatusSerializer(data=job_data)
         serializer.is_valid(raise_exception=True)
 
-        return Response(serializer.validated_data, status=status.HTTP_200_OK)
+        return serializer.validated_data
+
+
+def _evaluate_conditional_get(request, endpoint: str, dataset: str, params: dict):
+    """
+    Evaluate If-None-Match / If-Modified-Since for a dashboard request.
+
+    Only the dataset version row is read; a matching client copy is answered
+    with 304 before any aggregation runs.
+
+    Returns:
+        (not_modified, validators, version) - not_modified is a 304 response
+        or None; validators are the ETag/Last-Modified headers for the full
+        response; version is None if the lookup failed.
+    """
+    try:
+        version, updated_at = get_dataset_state(dataset)
+    except Exception as e:
+        logger.warning(f"Dataset version lookup failed, skipping conditional GET: {e}")
+        return None, {}, None
+
+    return (*_conditional_response(request, endpoint, params, version, updated_at), version)
+
+
+def _conditional_response(request, endpoint: str, params: dict, version: int, updated_at):
+    """
+    Validators of a dashboard response and the 304 answering them, if any.
+
+    Returns:
+        (not_modified, validators) - see _evaluate_conditional_get()
+    """
+    last_modified = int(updated_at.timestamp()) if updated_at else None
+    validators = {
+        'ETag': make_etag(endpoint, version, params),
+        # Always revalidate: data can change with the next ingestion
+        'Cache-Control': 'no-cache',
+    }
+    if last_modified is not None:
+        validators['Last-Modified'] = http_date(last_modified)
+
+    not_modified = get_conditional_response(
+        request, etag=validators['ETag'], last_modified=last_modified
+    )
+    if not_modified is not None:
+        for header, value in validators.items():
+            not_modified[header] = value
+    return not_modified, validators
+
+
+def _cache_headers(cache_hit: bool, validators: dict) -> dict:
+    """Response headers: X-Cache HIT/MISS plus conditional-GET validators."""
+    return {'X-Cache': 'HIT' if cache_hit else 'MISS', **validators}
+
+
+def _dashboard_response(request, endpoint, dataset, params, version, validators, compute):
+    """
+    Serve a dashboard response from the rendered-body cache.
+
+    A warm request is one cache read: the stored bytes are written as-is.
+    Otherwise the service result (itself cached) is shaped into the endpoint's
+    payload (render_dashboard), rendered once and stored for every later request.
+
+    Args:
+        compute: Zero-argument callable returning the service result
+
+    Raises:
+        Whatever compute() or the payload serializer raise (views map them to 400/500)
+    """
+    cache = get_response_cache()
+    rendered = cache.get_rendered(endpoint, dataset, params, version)
+    cache_hit = rendered is not None
+
+    if rendered is None:
+        data, cache_hit = cache.get_or_compute(endpoint, dataset, params, compute, version=version)
+        rendered = render_dashboard(endpoint, data)
+        cache.set_rendered(endpoint, dataset, params, version, rendered)
+
+    return PrerenderedResponse(
+        rendered,
+        request,
+        status=status.HTTP_200_OK,
+        headers=_cache_headers(cache_hit, validators)
+    )
+
+
+def research_funding_params(validated_data: dict) -> dict:
+    """
+    Cache params of a research funding request (service keyword arguments).
+
+    Range and granularity are included only when given, so default requests
+    share their entries with the cache warm-up. Comparison requests carry
+    departments instead of department. Filters relative to today (rolling
+    periods, compare_to without an end date) add the local date anchor;
+    service_kwargs() drops it again.
+    """
+    if 'departments' in validated_data:
+        params = {'departments': validated_data['departments']}
+    else:
+        params = {'department': validated_data.get('department', 'all')}
+    params['period'] = validated_data.get('period', 'latest')
+    for key in ('start', 'end', 'granularity', 'compare_to'):
+        if key in validated_data:
+            params[key] = validated_data[key]
+    if params['period'] != 'latest' or ('compare_to' in params and 'end' not in params):
+        params = with_date_anchor(params)
+    return params
+
+
+def service_kwargs(params: dict) -> dict:
+    """Service keyword arguments of cache params (without the date anchor)."""
+    return {key: value for key, value in params.items() if key != DATE_ANCHOR_PARAM}
+
+
+def department_kpi_params(validated_data: dict) -> dict:
+    """
+    Cache params of a department KPI request (service keyword arguments).
+
+    departments replaces department when given; compare_to is included only
+    when given.
+    """
+    if 'departments' in validated_data:
+        params = {'departments': validated_data['departments']}
+    else:
+        params = {'department': validated_data.get('department', 'all')}
+    params['start_year'] = validated_data.get('start_year')
+    params['end_year'] = validated_data.get('end_year')
+    if 'compare_to' in validated_data:
+        params['compare_to'] = validated_data['compare_to']
+    return params
 
 
 class ResearchFundingView(viewsets.ViewSet):
@@ -166,7 +473,13 @@ class ResearchFundingView(viewsets.ViewSet):
 
         Query Parameters:
             department (str, optional): Department filter ('all' or specific department)
+            departments (str, optional): Comma-separated departments to compare; the
+                data then holds granularity and one entry per department in series
             period (str, optional): Time period filter ('latest', '1year', '3years')
+            start, end (date, optional): Execution date range (YYYY-MM-DD), instead of period
+            granularity (str, optional): Trend bucket ('week', 'month', 'quarter', 'year')
+            compare_to (str, optional): 'previous_period' or 'previous_year'; data then
+                holds comparison with the execution total of both windows and the change
 
         Returns:
             HTTP 200 OK: Success with dashboard data
@@ -179,6 +492,7 @@ class ResearchFundingView(viewsets.ViewSet):
                 "data": {
                     "current_balance": 1530000000,
                     "current_balance_formatted": "15.3억원",
+                    "granularity": "month",
                     "trend": [...]
                 }
             }
@@ -202,24 +516,24 @@ class ResearchFundingView(viewsets.ViewSet):
             )
 
         # Extract validated parameters
-        department = serializer.validated_data.get('department', 'all')
-        period = serializer.validated_data.get('period', 'latest')
+        params = research_funding_params(serializer.validated_data)
+
+        # Answer revalidation requests before touching the dashboard tables
+        not_modified, validators, version = _evaluate_conditional_get(
+            request, 'research_funding', DATASET_RESEARCH_FUNDING, params
+        )
+        if not_modified is not None:
+            return not_modified
 
         try:
             # Call service layer
             service = ResearchFundingService()
-            dashboard_data = service.get_dashboard_data(
-                department=department,
-                period=period
-            )
-
-            # Return successful response
-            return Response(
-                {
-                    'status': 'success',
-                    'data': dashboard_data
-                },
-                status=status.HTTP_200_OK
+            return _dashboard_response(
+                request, 'research_funding', DATASET_RESEARCH_FUNDING, params, version, validators,
+                lambda: (
+                    service.get_comparison_data(**service_kwargs(params)) if 'departments' in params
+                    else service.get_dashboard_data(**service_kwargs(params))
+                )
             )
 
         except Exception as e:
@@ -279,10 +593,7 @@ class StudentDashboardView(viewsets.ViewSet):
             - 400: validation_error - Invalid enrollment status or nonexistent department
             - 500: server_error - Database error or unexpected exception
         """
-        from data_ingestion.api.serializers import (
-            StudentDashboardQuerySerializer,
-            StudentDashboardResponseSerializer
-        )
+        from data_ingestion.api.serializers import StudentDashboardQuerySerializer
         from data_ingestion.services.student_dashboard_service import StudentDashboardService
         from data_ingestion.constants.error_codes import ErrorCode
         from django.core.exceptions import ValidationError
@@ -303,23 +614,24 @@ class StudentDashboardView(viewsets.ViewSet):
         # Extract validated parameters
         department = query_serializer.validated_data.get('department', 'all')
         enrollment_status = query_serializer.validated_data.get('status', '재학')
+        params = {'department': department, 'status': enrollment_status}
+
+        # Answer revalidation requests before touching the dashboard tables
+        not_modified, validators, version = _evaluate_conditional_get(
+            request, 'students', DATASET_STUDENTS, params
+        )
+        if not_modified is not None:
+            return not_modified
 
         try:
             # Call service layer
             service = StudentDashboardService()
-            dashboard_data = service.get_student_dashboard_data(
-                department=department,
-                status=enrollment_status
-            )
-
-            # Serialize response
-            response_serializer = StudentDashboardResponseSerializer(data=dashboard_data)
-            response_serializer.is_valid(raise_exception=True)
-
-            # Return successful response
-            return Response(
-                response_serializer.validated_data,
-                status=status.HTTP_200_OK
+            return _dashboard_response(
+                request, 'students', DATASET_STUDENTS, params, version, validators,
+                lambda: service.get_student_dashboard_data(
+                    department=department,
+                    status=enrollment_status
+                )
             )
 
         except ValidationError as e:
@@ -387,10 +699,7 @@ class PublicationDashboardView(viewsets.ViewSet):
             - 400: validation_error - Invalid journal tier or nonexistent department
             - 500: server_error - Database error or unexpected exception
         """
-        from data_ingestion.api.serializers import (
-            PublicationDashboardQuerySerializer,
-            PublicationDashboardResponseSerializer
-        )
+        from data_ingestion.api.serializers import PublicationDashboardQuerySerializer
         from data_ingestion.services.publication_service import PublicationService
         from django.core.exceptions import ValidationError
 
@@ -410,23 +719,24 @@ class PublicationDashboardView(viewsets.ViewSet):
         # Extract validated parameters
         department = query_serializer.validated_data.get('department', 'all')
         journal_tier = query_serializer.validated_data.get('journal_tier', 'all')
+        params = {'department': department, 'journal_tier': journal_tier}
+
+        # Answer revalidation requests before touching the dashboard tables
+        not_modified, validators, version = _evaluate_conditional_get(
+            request, 'publications', DATASET_PUBLICATIONS, params
+        )
+        if not_modified is not None:
+            return not_modified
 
         try:
             # Call service layer
             service = PublicationService()
-            dashboard_data = service.get_distribution(
-                department=department,
-                journal_tier=journal_tier
-            )
-
-            # Serialize response
-            response_serializer = PublicationDashboardResponseSerializer(data=dashboard_data)
-            response_serializer.is_valid(raise_exception=True)
-
-            # Return successful response
-            return Response(
-                response_serializer.validated_data,
-                status=status.HTTP_200_OK
+            return _dashboard_response(
+                request, 'publications', DATASET_PUBLICATIONS, params, version, validators,
+                lambda: service.get_distribution(
+                    department=department,
+                    journal_tier=journal_tier
+                )
             )
 
         except ValidationError as e:
@@ -466,8 +776,12 @@ class DepartmentKPIView(viewsets.ViewSet):
 
         Query Parameters:
             department (str, optional): Department filter ('all' or specific department)
+            departments (str, optional): Comma-separated departments to compare; data
+                then holds one entry per department with its trend
             start_year (int, optional): Start year, default: current_year - 5
             end_year (int, optional): End year, default: current_year
+            compare_to (str, optional): 'previous_period' or 'previous_year'; the
+                response then holds comparison with the employment rate change
 
         Returns:
             HTTP 200 OK: Success with dashboard data
@@ -519,23 +833,24 @@ class DepartmentKPIView(viewsets.ViewSet):
             )
 
         # Extract validated parameters
-        department = query_serializer.validated_data.get('department', 'all')
-        start_year = query_serializer.validated_data.get('start_year')
-        end_year = query_serializer.validated_data.get('end_year')
+        params = department_kpi_params(query_serializer.validated_data)
+
+        # Answer revalidation requests before touching the dashboard tables
+        not_modified, validators, version = _evaluate_conditional_get(
+            request, 'department_kpi', DATASET_KPI, params
+        )
+        if not_modified is not None:
+            return not_modified
 
         try:
             # Call service layer
             service = KPIService()
-            dashboard_data = service.get_kpi_trend(
-                department=department,
-                start_year=start_year,
-                end_year=end_year
-            )
-
-            # Return successful response
-            return Response(
-                dashboard_data,
-                status=status.HTTP_200_OK
+            return _dashboard_response(
+                request, 'department_kpi', DATASET_KPI, params, version, validators,
+                lambda: (
+                    service.get_kpi_comparison(**params) if 'departments' in params
+                    else service.get_kpi_trend(**params)
+                )
             )
 
         except ValueError as e:
@@ -597,10 +912,10 @@ class FilterOptionsView(viewsets.ViewSet):
             }
         """
         from data_ingestion.api.validators import (
-            VALID_DEPARTMENTS,
             VALID_ENROLLMENT_STATUS,
             VALID_JOURNAL_TIERS
         )
+        from data_ingestion.infrastructure.repositories import get_department_options
         from datetime import datetime
 
         # Get current year and generate year options
@@ -611,13 +926,149 @@ class FilterOptionsView(viewsets.ViewSet):
             year_options.append(str(year))
 
         filter_options = {
-            'departments': VALID_DEPARTMENTS,
+            # Departments actually present in the uploaded data (cached catalog)
+            'departments': ['all'] + get_department_options(),
             'years': year_options,
             'student_statuses': VALID_ENROLLMENT_STATUS,
             'journal_tiers': VALID_JOURNAL_TIERS
         }
 
-        return Response(filter_options, status=status.HTTP_200_OK)
+        # Options only change with the year or an ingestion, so a hash of
+        # the payload itself is the validator
+        validators = {
+            'ETag': make_etag('filter_options', 0, filter_options),
+            'Cache-Control': 'no-cache',
+        }
+        not_modified = get_conditional_response(request, etag=validators['ETag'])
+        if not_modified is not None:
+            for header, value in validators.items():
+                not_modified[header] = value
+            return not_modified
+
+        return Response(filter_options, status=status.HTTP_200_OK, headers=validators)
+
+
+# Sections of GET /api/dashboard/overview/: response key -> view computing it
+OVERVIEW_SECTIONS = (
+    ('research_funding', ResearchFundingView.as_view({'get': 'list'})),
+    ('students', StudentDashboardView.as_view({'get': 'list'})),
+    ('publications', PublicationDashboardView.as_view({'get': 'list'})),
+    ('department_kpi', DepartmentKPIView.as_view({'get': 'list'})),
+    ('filter_options', FilterOptionsView.as_view({'get': 'list'})),
+)
+
+# Headers not forwarded to the sections: their bodies are embedded in the
+# overview, so they must not answer 304 or send their gzip copy
+OVERVIEW_STRIPPED_HEADERS = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_ACCEPT_ENCODING')
+
+
+def _render_section(view, request):
+    """Run one dashboard view in-process on a copy of the overview request."""
+    section_request = copy.copy(request._request)
+    section_request.META = {
+        key: value for key, value in request.META.items()
+        if key not in OVERVIEW_STRIPPED_HEADERS
+    }
+    response = view(section_request)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+class DashboardOverviewView(viewsets.ViewSet):
+    """
+    ViewSet for the batched dashboard overview (initial page load).
+
+    Endpoints:
+    - GET /api/dashboard/overview/ - All dashboard sections in one response
+    """
+
+    def list(self, request):
+        """
+        Get every dashboard section for one shared filter set.
+
+        The sections run in-process, one after another, on this request's
+        database connection; each one is served from the rendered-body cache
+        when warm, and its cached bytes are embedded without re-parsing.
+
+        Query Parameters:
+            department (str, optional): Department filter for every section
+            period (str, optional): Research funding period
+            status (str, optional): Student enrollment status
+            journal_tier (str, optional): Publication journal tier
+            start_year, end_year (int, optional): KPI year range
+
+        Returns:
+            HTTP 200 OK: Sections keyed research_funding, students,
+            publications, department_kpi and filter_options, each with the
+            body of its standalone endpoint. A section that fails is null and
+            its status code and error body are listed under "errors".
+
+        Response Example:
+            {
+                "research_funding": {"status": "success", "data": {...}},
+                "students": {"total_students": 1234, ...},
+                "publications": {...},
+                "department_kpi": {...},
+                "filter_options": {"departments": [...], ...},
+                "errors": {}
+            }
+        """
+        parts = []
+        cache_states = []
+        errors = {}
+
+        for key, view in OVERVIEW_SECTIONS:
+            response = _render_section(view, request)
+            if response.status_code == status.HTTP_200_OK:
+                parts.append(json.dumps(key).encode() + b':' + response.content)
+                if response.has_header('X-Cache'):
+                    cache_states.append(f"{key}={response['X-Cache']}")
+            else:
+                parts.append(json.dumps(key).encode() + b':null')
+                errors[key] = {'status': response.status_code, 'body': response.data}
+
+        parts.append(b'"errors":' + render_json(errors).body)
+        rendered = RenderedResponse.from_body(b'{' + b','.join(parts) + b'}')
+
+        return PrerenderedResponse(
+            rendered,
+            request,
+            status=status.HTTP_200_OK,
+            headers={'X-Cache-Sections': ', '.join(cache_states), 'Cache-Control': 'no-cache'}
+        )
+
+
+class CacheStatsView(viewsets.ViewSet):
+    """
+    ViewSet for dashboard cache diagnostics.
+
+    Endpoints:
+    - GET /api/dashboard/cache-stats/ - Hit/miss statistics and dataset versions
+    """
+
+    permission_classes = [AdminAPIKeyPermission]
+
+    def list(self, request):
+        """
+        Get response cache statistics for this worker process.
+
+        Response Example:
+            {
+                "response_cache": {
+                    "endpoints": {"students": {"hits": 12, "misses": 3, "hit_rate": 0.8}},
+                    "total": {"hits": 12, "misses": 3, "hit_rate": 0.8}
+                },
+                "dataset_versions": {"research_funding": 4, "students": 2, ...}
+            }
+        """
+        return Response(
+            {
+                'response_cache': get_response_cache().stats(),
+                'dataset_versions': get_all_dataset_versions(),
+            },
+            status=status.HTTP_200_OK
+        )
 
 
 class HealthCheckView(viewsets.ViewSet):
@@ -0,0 +1,28 @@
+"""
+ASGI config for data_ingestion project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+The dashboard and job status endpoints are served by the async views
+(DASHBOARD_ASYNC_VIEWS), e.g.:
+
+    gunicorn data_ingestion.asgi:application -k uvicorn.workers.UvicornWorker
+
+For more information on this file, see
+https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'data_ingestion.settings')
+os.environ.setdefault('DASHBOARD_ASYNC_VIEWS', 'True')
+# Request threads are not reused under ASGI, so persistent connections would
+# pile up; DB_POOL_ENABLED reuses connections instead
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
+application = get_asgi_application()
+
+from data_ingestion.infrastructure.analytics_cube import warm_analytics_cube  # noqa: E402
+
+warm_analytics_cube()
@@ -0,0 +1,415 @@
+"""
+In-process columnar snapshot of the dashboard datasets.
+
+Optional (ANALYTICS_CUBE_ENABLED). Each dataset is held as NumPy arrays with
+dictionary-encoded department/status/tier columns, so dashboard filters and
+aggregates run as vectorized operations without touching the dashboard
+tables. A snapshot is tied to a dataset version: every lookup compares it
+with dataset_versions (one primary-key read) and reloads when an ingestion
+has committed since.
+
+Query methods return the same shapes as the repository methods they back,
+or None when the cube is disabled or the dataset has never been ingested
+(callers then fall back to the database).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from data_ingestion.infrastructure.models import (
+    DatasetVersion,
+    ResearchProject,
+    Student,
+    Publication,
+    DepartmentKPI,
+)
+from data_ingestion.infrastructure.dataset_versions import (
+    ALL_DATASETS,
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+)
+
+logger = logging.getLogger(__name__)
+
+PROGRAM_TYPES = ['학사', '석사', '박사']
+
+# Period filters of the research funding dashboard (days back from today)
+PERIOD_DAYS = {'1year': 365, '3years': 1095}
+
+
+@dataclass(frozen=True)
+class EncodedColumn:
+    """Dictionary-encoded string column: int32 codes into a category list."""
+    codes: np.ndarray
+    categories: Tuple[str, ...]
+
+    @classmethod
+    def encode(cls, values: List[str]) -> 'EncodedColumn':
+        categories, codes = np.unique(np.asarray(values, dtype=object), return_inverse=True)
+        return cls(codes=codes.astype(np.int32), categories=tuple(categories))
+
+    def mask(self, value: str) -> np.ndarray:
+        """Boolean row mask for value (all False if the value never occurs)."""
+        try:
+            code = self.categories.index(value)
+        except ValueError:
+            return np.zeros(len(self.codes), dtype=bool)
+        return self.codes == code
+
+
+@dataclass(frozen=True)
+class ColumnarSnapshot:
+    """Immutable column set of one dataset at one version."""
+    dataset: str
+    version: int
+    row_count: int
+    columns: Dict[str, np.ndarray]
+    encoded: Dict[str, EncodedColumn]
+
+    def select(self, **filters: str) -> np.ndarray:
+        """Row mask for equality filters on encoded columns; 'all' matches everything."""
+        mask = np.ones(self.row_count, dtype=bool)
+        for column, value in filters.items():
+            if value is not None and value != 'all':
+                mask &= self.encoded[column].mask(value)
+        return mask
+
+
+def _group_sum(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum values per distinct key (keys returned sorted).
+
+    Uses sort + reduceat rather than bincount so integer sums stay exact.
+    """
+    if len(keys) == 0:
+        return keys, values
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.concatenate(([0], np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1))
+    return sorted_keys[starts], np.add.reduceat(values[order], starts)
+
+
+def _load_research_funding(version: int) -> ColumnarSnapshot:
+    rows = list(ResearchProject.objects.values_list(
+        'department', 'execution_date', 'total_budget', 'execution_amount'
+    ))
+    departments, dates, budgets, amounts = zip(*rows) if rows else ([], [], [], [])
+    return ColumnarSnapshot(
+        dataset=DATASET_RESEARCH_FUNDING,
+        version=version,
+        row_count=len(rows),
+        columns={
+            'execution_date': np.array(dates, dtype='datetime64[D]'),
+            'total_budget': np.array(budgets, dtype=np.int64),
+            'execution_amount': np.array(amounts, dtype=np.int64),
+        },
+        encoded={'department': EncodedColumn.encode(list(departments))},
+    )
+
+
+def _load_students(version: int) -> ColumnarSnapshot:
+    rows = list(Student.objects.values_list('department', 'program_type', 'enrollment_status'))
+    departments, programs, statuses = zip(*rows) if rows else ([], [], [])
+    return ColumnarSnapshot(
+        dataset=DATASET_STUDENTS,
+        version=version,
+        row_count=len(rows),
+        columns={},
+        encoded={
+            'department': EncodedColumn.encode(list(departments)),
+            'program_type': EncodedColumn.encode(list(programs)),
+            'enrollment_status': EncodedColumn.encode(list(statuses)),
+        },
+    )
+
+
+def _load_publications(version: int) -> ColumnarSnapshot:
+    rows = list(Publication.objects.values_list('department', 'journal_tier', 'impact_factor'))
+    departments, tiers, impact_factors = zip(*rows) if rows else ([], [], [])
+    return ColumnarSnapshot(
+        dataset=DATASET_PUBLICATIONS,
+        version=version,
+        row_count=len(rows),
+        columns={
+            # NULL Impact Factor -> NaN
+            'impact_factor': np.array(
+                [np.nan if value is None else value for value in impact_factors],
+                dtype=np.float64
+            ),
+        },
+        encoded={
+            'department': EncodedColumn.encode(list(departments)),
+            'journal_tier': EncodedColumn.encode(list(tiers)),
+        },
+    )
+
+
+def _load_kpi(version: int) -> ColumnarSnapshot:
+    rows = list(DepartmentKPI.objects.values_list(
+        'evaluation_year', 'department', 'employment_rate', 'tech_transfer_revenue'
+    ))
+    years, departments, employment, revenue = zip(*rows) if rows else ([], [], [], [])
+    return ColumnarSnapshot(
+        dataset=DATASET_KPI,
+        version=version,
+        row_count=len(rows),
+        columns={
+            'evaluation_year': np.array(years, dtype=np.int32),
+            'employment_rate': np.array(employment, dtype=np.float64),
+            'tech_transfer_revenue': np.array(revenue, dtype=np.float64),
+        },
+        encoded={'department': EncodedColumn.encode(list(departments))},
+    )
+
+
+LOADERS = {
+    DATASET_RESEARCH_FUNDING: _load_research_funding,
+    DATASET_STUDENTS: _load_students,
+    DATASET_PUBLICATIONS: _load_publications,
+    DATASET_KPI: _load_kpi,
+}
+
+
+class AnalyticsCube:
+    """
+    Version-checked columnar snapshots of all dashboard datasets.
+
+    Snapshots are immutable and swapped atomically, so concurrent readers
+    never see a partially loaded dataset.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, ColumnarSnapshot] = {}
+        self._refresh_lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'ANALYTICS_CUBE_ENABLED', False)
+
+    def snapshot(self, dataset: str) -> Optional[ColumnarSnapshot]:
+        """
+        Current snapshot of a dataset, reloaded if its version changed.
+
+        Returns:
+            ColumnarSnapshot, or None if disabled or the dataset was never ingested
+        """
+        if not self.is_enabled():
+            return None
+
+        version = DatasetVersion.objects.filter(dataset=dataset).values_list(
+            'version', flat=True
+        ).first()
+        if version is None:
+            return None
+
+        current = self._snapshots.get(dataset)
+        if current is not None and current.version == version:
+            return current
+
+        with self._refresh_lock:
+            current = self._snapshots.get(dataset)
+            if current is None or current.version != version:
+                current = LOADERS[dataset](version)
+                self._snapshots[dataset] = current
+                logger.info(f"Analytics cube loaded {dataset} v{version} ({current.row_count} rows)")
+        return current
+
+    def warm(self) -> None:
+        """Load every ingested dataset (called once at server startup)."""
+        for dataset in ALL_DATASETS:
+            self.snapshot(dataset)
+
+    def clear(self) -> None:
+        """Drop all snapshots (for testing purposes)."""
+        with self._refresh_lock:
+            self._snapshots.clear()
+
+    # Research funding
+
+    def current_balance(self, department: Optional[str]) -> Optional[int]:
+        """Same as ResearchFundingRepository.get_current_balance()."""
+        snap = self.snapshot(DATASET_RESEARCH_FUNDING)
+        if snap is None:
+            return None
+        mask = snap.select(department=department)
+        budget = snap.columns['total_budget'][mask].sum()
+        execution = snap.columns['execution_amount'][mask].sum()
+        return int(budget - execution)
+
+    def monthly_trend(
+        self,
+        department: Optional[str],
+        period: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Same as ResearchFundingRepository.get_monthly_trend()."""
+        snap = self.snapshot(DATASET_RESEARCH_FUNDING)
+        if snap is None:
+            return None
+        mask = snap.select(department=department)
+        dates = snap.columns['execution_date']
+        if period in PERIOD_DAYS:
+            # Local (TIME_ZONE) date, like the ORM's execution_date__gte filter
+            from data_ingestion.infrastructure.repositories import ResearchFundingRepository
+            cutoff = ResearchFundingRepository.period_start(period)
+            mask &= dates >= np.datetime64(cutoff, 'D')
+
+        total_budget = int(snap.columns['total_budget'][mask].sum())
+        months, executions = _group_sum(
+            dates[mask].astype('datetime64[M]'),
+            snap.columns['execution_amount'][mask]
+        )
+        balances = total_budget - np.cumsum(executions)
+
+        return [
+            {
+                'month': str(month),
+                'balance': int(balance),
+                'execution': int(execution),
+            }
+            for month, execution, balance in zip(months, executions, balances)
+        ]
+
+    # Students
+
+    def department_program_counts(
+        self,
+        department: str,
+        status: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Same as StudentRepository.get_department_program_counts()."""
+        snap = self.snapshot(DATASET_STUDENTS)
+        if snap is None:
+            return None
+        mask = snap.select(department=department, enrollment_status=status)
+        departments = snap.encoded['department']
+        programs = snap.encoded['program_type']
+
+        # counts[department_code, program_code] in a single pass
+        counts = np.zeros((len(departments.categories), len(programs.categories)), dtype=np.int64)
+        np.add.at(counts, (departments.codes[mask], programs.codes[mask]), 1)
+
+        result = []
+        for dept_code, dept_counts in enumerate(counts):
+            total = int(dept_counts.sum())
+            if total == 0:
+                continue
+            row = {'department': departments.categories[dept_code]}
+            for program in PROGRAM_TYPES:
+                row[program] = (
+                    int(dept_counts[programs.categories.index(program)])
+                    if program in programs.categories else 0
+                )
+            row['total'] = total
+            result.append(row)
+
+        return sorted(result, key=lambda row: -row['total'])
+
+    # Publications
+
+    def tier_summary(
+        self,
+        department: str,
+        journal_tier: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Same as PublicationRepository.get_tier_summary()."""
+        snap = self.snapshot(DATASET_PUBLICATIONS)
+        if snap is None:
+            return None
+        mask = snap.select(department=department, journal_tier=journal_tier)
+        tiers = snap.encoded['journal_tier']
+        impact_factors = snap.columns['impact_factor'][mask]
+        tier_codes = tiers.codes[mask]
+        has_if = ~np.isnan(impact_factors)
+
+        size = len(tiers.categories)
+        counts = np.bincount(tier_codes, minlength=size)
+        if_counts = np.bincount(tier_codes[has_if], minlength=size)
+        if_sums = np.bincount(tier_codes[has_if], weights=impact_factors[has_if], minlength=size)
+
+        result = [
+            {
+                'journal_tier': tiers.categories[code],
+                'count': int(counts[code]),
+                'if_count': int(if_counts[code]),
+                'if_sum': float(if_sums[code]),
+            }
+            for code in range(size)
+            if counts[code] > 0
+        ]
+        return sorted(result, key=lambda row: -row['count'])
+
+    # KPI
+
+    def kpi_yearly_summary(
+        self,
+        department: str,
+        start_year: int,
+        end_year: int
+    ) -> Optional[Dict[str, Any]]:
+        """Same as KPIRepository.get_yearly_summary()."""
+        snap = self.snapshot(DATASET_KPI)
+        if snap is None:
+            return None
+        years = snap.columns['evaluation_year']
+        mask = snap.select(department=department) & (years >= start_year) & (years <= end_year)
+        employment = snap.columns['employment_rate'][mask]
+        revenue = snap.columns['tech_transfer_revenue'][mask]
+
+        distinct_years, year_index = np.unique(years[mask], return_inverse=True)
+        rows_per_year = np.bincount(year_index, minlength=len(distinct_years))
+        employment_sums = np.bincount(year_index, weights=employment, minlength=len(distinct_years))
+        revenue_sums = np.bincount(year_index, weights=revenue, minlength=len(distinct_years))
+
+        return {
+            'data': [
+                {
+                    'evaluation_year': int(year),
+                    'avg_employment_rate': float(employment_sum / count),
+                    'total_tech_income': float(revenue_sum),
+                }
+                for year, count, employment_sum, revenue_sum in zip(
+                    distinct_years, rows_per_year, employment_sums, revenue_sums
+                )
+            ],
+            'overall_avg_employment_rate': float(employment.mean()) if len(employment) else None,
+        }
+
+    # Departments
+
+    def departments(self, dataset: str) -> Optional[List[str]]:
+        """Distinct departments of a dataset."""
+        snap = self.snapshot(dataset)
+        if snap is None:
+            return None
+        return list(snap.encoded['department'].categories)
+
+
+# Global singleton instance
+_cube_instance = None
+
+
+def get_analytics_cube() -> AnalyticsCube:
+    """Get the global analytics cube instance."""
+    global _cube_instance
+    if _cube_instance is None:
+        _cube_instance = AnalyticsCube()
+    return _cube_instance
+
+
+def warm_analytics_cube() -> None:
+    """Load the analytics cube before the first request (if enabled)."""
+    cube = get_analytics_cube()
+    if not cube.is_enabled():
+        return
+    try:
+        cube.warm()
+    except Exception as e:
+        # Requests still load snapshots lazily (or fall back to the ORM)
+        logger.warning(f"Analytics cube warm-up failed: {e}")
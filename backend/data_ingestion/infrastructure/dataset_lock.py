@@ -0,0 +1,189 @@
+"""
+Cross-process ingestion lock per dataset.
+
+Each gunicorn worker runs its own ingestion executor, so two workers can
+replace the same dataset (delete + bulk_create) at the same time. This lock
+serializes writers of one dataset across processes and nodes:
+
+- PostgreSQL: session-level advisory lock (pg_try_advisory_lock); the holder
+  job is recorded in the ingestion_locks table for status reporting.
+- Other backends (SQLite dev/test): fcntl file lock in INGESTION_LOCK_DIR;
+  the holder job ID is written into the lock file. Process-wide only on
+  a single host, which matches how SQLite is deployed.
+"""
+
+import os
+import time
+import zlib
+import fcntl
+import logging
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_SECONDS = 0.5
+
+
+class DatasetLock(ABC):
+    """
+    Non-blocking lock primitive for one dataset.
+
+    A backend missing one of the methods fails when it is instantiated,
+    not partway through an ingestion that holds the lock.
+    """
+
+    def __init__(self, dataset: str, job_id: str):
+        self.dataset = dataset
+        self.job_id = job_id
+
+    @abstractmethod
+    def try_acquire(self) -> bool:
+        """Try to take the lock without waiting. Returns True on success."""
+
+    @abstractmethod
+    def release(self) -> None:
+        """Release a lock taken by try_acquire()."""
+
+    @abstractmethod
+    def current_holder(self) -> Optional[str]:
+        """Job ID currently holding the lock, if known."""
+
+
+class AdvisoryDatasetLock(DatasetLock):
+    """PostgreSQL session-level advisory lock (works across nodes)."""
+
+    @property
+    def key(self) -> int:
+        """Stable 32-bit lock key (Python's hash() is randomized per process)."""
+        return zlib.crc32(f'ingestion:{self.dataset}'.encode('utf-8'))
+
+    def try_acquire(self) -> bool:
+        from data_ingestion.infrastructure.models import IngestionLock
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_try_advisory_lock(%s)', [self.key])
+            acquired = cursor.fetchone()[0]
+
+        if acquired:
+            IngestionLock.objects.update_or_create(
+                dataset=self.dataset,
+                defaults={'job_id': self.job_id}
+            )
+        return acquired
+
+    def release(self) -> None:
+        from data_ingestion.infrastructure.models import IngestionLock
+
+        IngestionLock.objects.filter(dataset=self.dataset, job_id=self.job_id).delete()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_unlock(%s)', [self.key])
+
+    def current_holder(self) -> Optional[str]:
+        from data_ingestion.infrastructure.models import IngestionLock
+
+        return IngestionLock.objects.filter(dataset=self.dataset).values_list(
+            'job_id', flat=True
+        ).first()
+
+
+class FileDatasetLock(DatasetLock):
+    """fcntl.flock-based lock file (works across processes on one host)."""
+
+    def __init__(self, dataset: str, job_id: str):
+        super().__init__(dataset, job_id)
+        lock_dir = getattr(settings, 'INGESTION_LOCK_DIR', None) or os.path.join(
+            tempfile.gettempdir(), 'ingestion_locks'
+        )
+        os.makedirs(lock_dir, exist_ok=True)
+        self.path = os.path.join(lock_dir, f'{dataset}.lock')
+        self._fd: Optional[int] = None
+
+    def try_acquire(self) -> bool:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, self.job_id.encode('utf-8'), 0)
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        os.ftruncate(self._fd, 0)
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+    def current_holder(self) -> Optional[str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as lock_file:
+                return lock_file.read().strip() or None
+        except OSError:
+            return None
+
+
+def get_dataset_lock(dataset: str, job_id: str) -> DatasetLock:
+    """Pick the lock implementation for the configured database backend."""
+    if connection.vendor == 'postgresql':
+        return AdvisoryDatasetLock(dataset, job_id)
+    return FileDatasetLock(dataset, job_id)
+
+
+@contextmanager
+def acquire_dataset_lock(
+    dataset: str,
+    job_id: str,
+    on_wait: Optional[Callable[[Optional[str]], None]] = None,
+    checkpoint: Optional[Callable[[], None]] = None,
+    poll_seconds: Optional[float] = None
+) -> Iterator[bool]:
+    """
+    Hold the ingestion lock for a dataset, waiting for other jobs if needed.
+
+    Args:
+        dataset: Dataset name (file type, e.g. 'students')
+        job_id: Job taking the lock (recorded as holder)
+        on_wait: Called with the holder job ID (or None if unknown) when
+                 this job starts waiting and whenever the holder changes
+        checkpoint: Called between polls; may raise to give up waiting
+                    (cancellation / timeout)
+        poll_seconds: Poll interval (default INGESTION_LOCK_POLL_SECONDS)
+
+    Yields:
+        True if the job had to wait for another holder, False otherwise
+    """
+    if poll_seconds is None:
+        poll_seconds = getattr(settings, 'INGESTION_LOCK_POLL_SECONDS', DEFAULT_POLL_SECONDS)
+
+    lock = get_dataset_lock(dataset, job_id)
+    waited = False
+    reported_holder = None
+
+    while not lock.try_acquire():
+        holder = lock.current_holder()
+        if not waited or holder != reported_holder:
+            logger.info(f"Job {job_id} waiting for {dataset} lock held by job {holder}")
+            if on_wait:
+                on_wait(holder)
+            reported_holder = holder
+        waited = True
+
+        if checkpoint:
+            checkpoint()
+        time.sleep(poll_seconds)
+
+    try:
+        yield waited
+    finally:
+        lock.release()
@@ -0,0 +1,97 @@
+"""
+Per-dataset version counters used for cache keys and invalidation.
+
+Dataset names match the upload file types in ingestion_service.FILE_TYPE_PARSERS.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from django.db.models import F
+from django.utils import timezone
+
+from data_ingestion.infrastructure.models import DatasetVersion
+
+DATASET_RESEARCH_FUNDING = 'research_funding'
+DATASET_STUDENTS = 'students'
+DATASET_PUBLICATIONS = 'publications'
+DATASET_KPI = 'kpi'
+
+ALL_DATASETS = [
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+]
+
+
+def bump_dataset_version(dataset: str) -> None:
+    """
+    Increment the version of a dataset.
+
+    Call inside the transaction that writes the dataset, so the new
+    version becomes visible exactly when the data commits.
+
+    Args:
+        dataset: Dataset name (one of ALL_DATASETS)
+    """
+    _, created = DatasetVersion.objects.get_or_create(
+        dataset=dataset,
+        defaults={'version': 1}
+    )
+    if not created:
+        DatasetVersion.objects.filter(dataset=dataset).update(
+            version=F('version') + 1,
+            updated_at=timezone.now()
+        )
+
+
+def get_dataset_version(dataset: str) -> int:
+    """
+    Get the current version of a dataset (0 if never ingested).
+
+    Args:
+        dataset: Dataset name
+
+    Returns:
+        Version counter
+    """
+    version = DatasetVersion.objects.filter(dataset=dataset).values_list(
+        'version', flat=True
+    ).first()
+    return version or 0
+
+
+def get_dataset_state(dataset: str) -> Tuple[int, Optional[datetime]]:
+    """
+    Get version and last ingestion time of a dataset in one query.
+
+    Args:
+        dataset: Dataset name
+
+    Returns:
+        (version, updated_at) - (0, None) if never ingested
+    """
+    row = DatasetVersion.objects.filter(dataset=dataset).values_list(
+        'version', 'updated_at'
+    ).first()
+    return row if row else (0, None)
+
+
+async def aget_dataset_state(dataset: str) -> Tuple[int, Optional[datetime]]:
+    """Async ORM variant of get_dataset_state() for ASGI views."""
+    row = await DatasetVersion.objects.filter(dataset=dataset).values_list(
+        'version', 'updated_at'
+    ).afirst()
+    return row if row else (0, None)
+
+
+def get_all_dataset_versions() -> Dict[str, int]:
+    """
+    Get versions of all datasets in one query.
+
+    Returns:
+        Dict of dataset -> version (0 for datasets never ingested)
+    """
+    versions = dict.fromkeys(ALL_DATASETS, 0)
+    versions.update(DatasetVersion.objects.values_list('dataset', 'version'))
+    return versions
@@ -0,0 +1,154 @@
+"""
+Database router sending dashboard reads to a read replica.
+
+Enabled when a 'replica' database is configured (DB_REPLICA_HOST, see
+settings.DATABASES):
+- Reads of the dataset tables and their rollups (the repository queries)
+  go to the replica
+- Everything else - save_*_data() writes, dataset_versions, ingestion
+  locks, the database cache table - stays on the primary
+
+Read-your-writes: for DB_REPLICA_READ_YOUR_WRITES_SECONDS after the last
+ingestion (the newest dataset_versions.updated_at on the primary), dataset
+reads also go to the primary. An upload job reports completed only after
+its transaction committed, so every worker then sees the new data, and no
+cache entry keyed by the new dataset version is filled from a replica that
+has not replayed it yet. The window must exceed the replica's worst-case lag.
+
+The primary is asked for the last ingestion time once per request. Outside
+requests (ingestion and warm-up threads, sync_to_async calls) an open window
+is reused until it closes, and a closed one until the version of the dataset
+being read changes (known from the query cache's known_dataset_version()
+scope, which every cached aggregate and response cache computation runs
+in), or at most for DB_REPLICA_RECHECK_SECONDS when no version is known.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from data_ingestion.infrastructure.query_cache import TABLE_DATASETS, known_version
+
+PRIMARY_DATABASE = DEFAULT_DB_ALIAS
+REPLICA_DATABASE = 'replica'
+
+DEFAULT_READ_YOUR_WRITES_SECONDS = 30
+DEFAULT_RECHECK_SECONDS = 5
+
+# Models whose reads may be served by the replica (dataset tables and rollups)
+REPLICA_MODELS = frozenset({
+    'researchproject',
+    'student',
+    'publication',
+    'departmentkpi',
+    'researchfundingdailyrollup',
+    'studentcountrollup',
+    'publicationtierrollup',
+})
+
+# Per thread: primary_until (epoch seconds, None = unknown), the dataset
+# versions and time it was looked up at (versions, checked_at), in_request
+_state = threading.local()
+
+
+def _start_request(**kwargs) -> None:
+    _state.primary_until = None
+    _state.in_request = True
+
+
+def _finish_request(**kwargs) -> None:
+    _state.primary_until = None
+    _state.in_request = False
+
+
+request_started.connect(_start_request, dispatch_uid='db_router_request_started')
+request_finished.connect(_finish_request, dispatch_uid='db_router_request_finished')
+
+
+def replica_configured() -> bool:
+    """True if a replica database is configured."""
+    return REPLICA_DATABASE in connections.settings
+
+
+def _read_your_writes_until() -> Tuple[float, Dict[str, int]]:
+    """
+    End of the read-your-writes window of the last ingestion (0 if none),
+    and the dataset versions it was computed from.
+    """
+    from data_ingestion.infrastructure.models import DatasetVersion
+
+    rows = list(
+        DatasetVersion.objects.using(PRIMARY_DATABASE).values_list('dataset', 'version', 'updated_at')
+    )
+    versions = {dataset: version for dataset, version, _ in rows}
+    latest = max((updated_at for _, _, updated_at in rows), default=None)
+    if latest is None:
+        return 0.0, versions
+    window = getattr(
+        settings, 'DB_REPLICA_READ_YOUR_WRITES_SECONDS', DEFAULT_READ_YOUR_WRITES_SECONDS
+    )
+    return latest.timestamp() + window, versions
+
+
+def _closed_window_stale(dataset: Optional[str], now: float) -> bool:
+    """True if a closed window seen outside a request must be looked up again."""
+    version = known_version(dataset) if dataset else None
+    if version is not None and version != _state.versions.get(dataset, 0):
+        # A newer ingestion than the one the window was computed from
+        return True
+    recheck = getattr(settings, 'DB_REPLICA_RECHECK_SECONDS', DEFAULT_RECHECK_SECONDS)
+    return now - _state.checked_at >= recheck
+
+
+def pinned_to_primary(dataset: Optional[str] = None) -> bool:
+    """
+    True while dataset reads must stay on the primary.
+
+    Within a request the window is looked up once. Outside requests an
+    open window is reused until it closes, and a closed one until the
+    known version of the dataset being read differs from the one it was
+    looked up at, or DB_REPLICA_RECHECK_SECONDS have passed.
+
+    Args:
+        dataset: Dataset owning the table being read (None if unknown)
+    """
+    if connections[PRIMARY_DATABASE].in_atomic_block:
+        # Reads inside a write transaction must see its uncommitted rows
+        return True
+
+    now = time.time()
+    primary_until = getattr(_state, 'primary_until', None)
+    if primary_until is None or (
+        primary_until <= now
+        and not getattr(_state, 'in_request', False)
+        and _closed_window_stale(dataset, now)
+    ):
+        primary_until, _state.versions = _read_your_writes_until()
+        _state.primary_until = primary_until
+        _state.checked_at = now
+    return primary_until > now
+
+
+class ReplicaRouter:
+    """Routes dataset reads to the replica, everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.model_name not in REPLICA_MODELS or not replica_configured():
+            return None
+        dataset = TABLE_DATASETS.get(model._meta.db_table)
+        return PRIMARY_DATABASE if pinned_to_primary(dataset) else REPLICA_DATABASE
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives schema changes through replication
+        return False if db == REPLICA_DATABASE else None
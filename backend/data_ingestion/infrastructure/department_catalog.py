@@ -0,0 +1,67 @@
+"""
+Per-dataset department sets for filter validation and dropdowns.
+
+Department lists only change on ingestion, so each set is cached per
+process under the dataset version it was loaded at. A lookup costs one
+primary-key read of dataset_versions instead of a SELECT DISTINCT scan,
+and membership checks against the returned frozenset are O(1).
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, Tuple
+
+from data_ingestion.infrastructure.models import DatasetVersion
+
+
+class DepartmentCatalog:
+    """Version-keyed cache of department sets, one per dataset."""
+
+    def __init__(self):
+        self._sets: Dict[str, Tuple[int, frozenset]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, dataset: str, loader: Callable[[], Iterable[str]]) -> frozenset:
+        """
+        Department set of a dataset, loading it on first use or after ingestion.
+
+        Datasets never ingested through save_*_data() have no version to key
+        on, so they are loaded uncached.
+
+        Args:
+            dataset: Dataset name (see dataset_versions.ALL_DATASETS)
+            loader: Callable returning the dataset's distinct departments
+
+        Returns:
+            frozenset of department names
+        """
+        version = DatasetVersion.objects.filter(dataset=dataset).values_list(
+            'version', flat=True
+        ).first()
+        if version is None:
+            return frozenset(loader())
+
+        cached = self._sets.get(dataset)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        departments = frozenset(loader())
+        with self._lock:
+            self._sets[dataset] = (version, departments)
+        return departments
+
+    def clear(self) -> None:
+        """Drop all cached sets (for testing purposes)."""
+        with self._lock:
+            self._sets.clear()
+
+
+# Global singleton instance
+_catalog_instance = None
+
+
+def get_department_catalog() -> DepartmentCatalog:
+    """Get the global department catalog instance."""
+    global _catalog_instance
+    if _catalog_instance is None:
+        _catalog_instance = DepartmentCatalog()
+    return _catalog_instance
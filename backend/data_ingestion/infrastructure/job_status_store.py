@@ -6,7 +6,8 @@ This is a MVP simplification - avoids Redis/database for job tracking.
 """
 
 import threading
-from typing import Dict, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -14,35 +15,48 @@ from enum import Enum
 class JobStatus(Enum):
     """Job processing status."""
     PENDING = "pending"
+    WAITING = "waiting"  # Queued behind another job holding the dataset lock
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
+@dataclass(frozen=True)
 class JobInfo:
-    """Job information data structure."""
+    """
+    Immutable job information snapshot.
 
-    def __init__(self, job_id: str):
-        self.job_id = job_id
-        self.status = JobStatus.PENDING
-        self.progress = 0
-        self.total = 0
-        self.error_message: Optional[str] = None
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+    Every update publishes a new instance, so a reference obtained from
+    get_job() is a consistent view that never changes under the caller.
+    """
+    job_id: str
+    status: JobStatus = JobStatus.PENDING
+    progress: int = 0
+    total: int = 0
+    error_message: Optional[str] = None
+    blocked_by: Optional[str] = None  # Job ID this job is waiting on (WAITING only)
+    result: Optional[Dict[str, Any]] = None  # Per-file outcomes, cache warm-up report
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
 
 class JobStatusStore:
     """
     Thread-safe in-memory store for job status tracking.
 
-    P0 CRITICAL: All state access/modification must be protected by lock
+    P0 CRITICAL: All state modification must be protected by lock
     to prevent race conditions in concurrent processing.
+
+    Reads are lock-free: the store maps job_id -> immutable JobInfo and
+    writers swap in a new snapshot with a single dict assignment, which is
+    atomic under the GIL. Pollers therefore never queue behind each other
+    or behind progress updates.
     """
 
     def __init__(self):
         self._store: Dict[str, JobInfo] = {}
-        self._lock = threading.Lock()  # P0: Thread-safety guarantee
+        self._lock = threading.Lock()  # P0: Serializes writers only
 
     def create_job(self, job_id: str) -> JobInfo:
         """
@@ -64,16 +78,60 @@ class JobStatusStore:
 
     def get_job(self, job_id: str) -> Optional[JobInfo]:
         """
-        Retrieve job information.
+        Retrieve job information (lock-free).
 
         Args:
             job_id: Job identifier
 
         Returns:
-            JobInfo if exists, None otherwise
+            JobInfo snapshot if exists, None otherwise
         """
-        with self._lock:  # Critical section
-            return self._store.get(job_id)
+        return self._store.get(job_id)
+
+    def get_jobs(self, job_ids: Iterable[str]) -> Dict[str, Optional[JobInfo]]:
+        """
+        Retrieve several jobs in one lock-free pass.
+
+        Args:
+            job_ids: Job identifiers
+
+        Returns:
+            Dict of job_id -> JobInfo (None for unknown ids), in request order
+        """
+        store = self._store
+        return {job_id: store.get(job_id) for job_id in job_ids}
+
+    def find_jobs_updated_since(self, since: datetime) -> List[JobInfo]:
+        """
+        Retrieve all jobs updated at or after a timestamp.
+
+        Args:
+            since: Naive local datetime (same clock as JobInfo.updated_at)
+
+        Returns:
+            List of JobInfo snapshots, oldest update first
+        """
+        # list() copies the values in one step so concurrent writers
+        # cannot change the dict size during iteration
+        snapshots = list(self._store.values())
+        return sorted(
+            (job_info for job_info in snapshots if job_info.updated_at >= since),
+            key=lambda job_info: job_info.updated_at
+        )
+
+    def _publish(self, job_id: str, **changes) -> JobInfo:
+        """
+        Replace the snapshot for job_id with an updated copy.
+
+        Must be called with self._lock held.
+        """
+        job_info = self._store.get(job_id)
+        if not job_info:
+            raise ValueError(f"Job {job_id} not found")
+
+        updated = replace(job_info, updated_at=datetime.now(), **changes)
+        self._store[job_id] = updated
+        return updated
 
     def update_status(self, job_id: str, status: JobStatus, error_message: Optional[str] = None) -> None:
         """
@@ -85,14 +143,21 @@ class JobStatusStore:
             error_message: Optional error message for failed jobs
         """
         with self._lock:  # Critical section
-            job_info = self._store.get(job_id)
-            if not job_info:
-                raise ValueError(f"Job {job_id} not found")
-
-            job_info.status = status
-            job_info.updated_at = datetime.now()
             if error_message:
-                job_info.error_message = error_message
+                self._publish(job_id, status=status, error_message=error_message, blocked_by=None)
+            else:
+                self._publish(job_id, status=status, blocked_by=None)
+
+    def mark_waiting(self, job_id: str, blocked_by: Optional[str]) -> None:
+        """
+        Mark job as waiting for another job's dataset lock.
+
+        Args:
+            job_id: Job identifier
+            blocked_by: Job ID holding the lock (None if unknown)
+        """
+        with self._lock:  # Critical section
+            self._publish(job_id, status=JobStatus.WAITING, blocked_by=blocked_by)
 
     def update_progress(self, job_id: str, progress: int, total: int) -> None:
         """
@@ -104,13 +169,7 @@ class JobStatusStore:
             total: Total items to process
         """
         with self._lock:  # Critical section
-            job_info = self._store.get(job_id)
-            if not job_info:
-                raise ValueError(f"Job {job_id} not found")
-
-            job_info.progress = progress
-            job_info.total = total
-            job_info.updated_at = datetime.now()
+            self._publish(job_id, progress=progress, total=total)
 
     def increment_progress(self, job_id: str) -> int:
         """
@@ -127,9 +186,25 @@ class JobStatusStore:
             if not job_info:
                 raise ValueError(f"Job {job_id} not found")
 
-            job_info.progress += 1
-            job_info.updated_at = datetime.now()
-            return job_info.progress
+            return self._publish(job_id, progress=job_info.progress + 1).progress
+
+    def set_result(self, job_id: str, **items: Any) -> None:
+        """
+        Merge entries into the job result.
+
+        A new dict is published, so result dicts held by earlier snapshots
+        never change under their readers.
+
+        Args:
+            job_id: Job identifier
+            **items: Result entries to add or replace
+        """
+        with self._lock:  # Critical section
+            job_info = self._store.get(job_id)
+            if not job_info:
+                raise ValueError(f"Job {job_id} not found")
+
+            self._publish(job_id, result={**(job_info.result or {}), **items})
 
     def delete_job(self, job_id: str) -> None:
         """
@@ -139,8 +214,7 @@ class JobStatusStore:
             job_id: Job identifier
         """
         with self._lock:  # Critical section
-            if job_id in self._store:
-                del self._store[job_id]
+            self._store.pop(job_id, None)
 
     def clear_all(self) -> None:
         """Clear all jobs from store (for testing purposes)."""
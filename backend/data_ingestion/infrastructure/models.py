@@ -1,11 +1,16 @@
 """
 Django models for CSV data ingestion.
 Following spec.md section 5.2 - CSV to Django Model mapping.
+
+Dataset tables use CachedAggregateQuerySet, so aggregate() and count() on
+them go through the query cache (see query_cache.py).
 """
 
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from data_ingestion.infrastructure.query_cache import CachedAggregateQuerySet
+
 
 class ResearchProject(models.Model):
     """
@@ -35,10 +40,18 @@ class ResearchProject(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CachedAggregateQuerySet.as_manager()
+
     class Meta:
         db_table = 'research_projects'
         indexes = [
             models.Index(fields=['department'], name='idx_rp_dept'),
+            # Department filter + date range; covers the monthly totals query
+            models.Index(
+                fields=['department', 'execution_date'],
+                include=['total_budget', 'execution_amount'],
+                name='idx_rp_dept_date_cov'
+            ),
             models.Index(fields=['execution_date'], name='idx_rp_date'),
         ]
         verbose_name = 'Research Project'
@@ -91,10 +104,25 @@ class Student(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CachedAggregateQuerySet.as_manager()
+
     class Meta:
         db_table = 'students'
         indexes = [
             models.Index(fields=['department'], name='idx_student_dept'),
+            # Status/department filters grouped by program type
+            models.Index(
+                fields=['enrollment_status', 'department', 'program_type'],
+                include=['student_id'],
+                name='idx_student_status_dept_prog'
+            ),
+            # Default dashboard filter (재학)
+            models.Index(
+                fields=['department', 'program_type'],
+                include=['student_id'],
+                condition=models.Q(enrollment_status='재학'),
+                name='idx_student_enrolled_dept'
+            ),
         ]
         verbose_name = 'Student'
         verbose_name_plural = 'Students'
@@ -138,10 +166,18 @@ class Publication(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CachedAggregateQuerySet.as_manager()
+
     class Meta:
         db_table = 'publications'
         indexes = [
             models.Index(fields=['department'], name='idx_pub_dept'),
+            # Department/tier filters; covers the tier summary query
+            models.Index(
+                fields=['department', 'journal_tier', 'impact_factor'],
+                include=['paper_id'],
+                name='idx_pub_dept_tier_if'
+            ),
         ]
         verbose_name = 'Publication'
         verbose_name_plural = 'Publications'
@@ -176,6 +212,8 @@ class DepartmentKPI(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CachedAggregateQuerySet.as_manager()
+
     class Meta:
         db_table = 'department_kpis'
         constraints = [
@@ -193,3 +231,199 @@ class DepartmentKPI(models.Model):
 
     def __str__(self):
         return f"{self.evaluation_year} - {self.department}"
+
+
+class IngestionLock(models.Model):
+    """
+    Current holder of the cross-process ingestion lock for a dataset.
+
+    Informational only: mutual exclusion comes from a PostgreSQL advisory
+    lock; this row lets waiting jobs report which job they are queued behind.
+    """
+    dataset = models.CharField(
+        max_length=50,
+        primary_key=True,
+        verbose_name='데이터셋'
+    )
+    job_id = models.CharField(
+        max_length=64,
+        verbose_name='작업ID'
+    )
+    acquired_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'ingestion_locks'
+        verbose_name = 'Ingestion Lock'
+        verbose_name_plural = 'Ingestion Locks'
+
+    def __str__(self):
+        return f"{self.dataset} - {self.job_id}"
+
+
+class DatasetVersion(models.Model):
+    """
+    Monotonic version counter per dataset.
+
+    Bumped in the same transaction as every save_*_data() replace, so a
+    reader that sees version N is guaranteed to see the data committed
+    with it. Dashboard caches key their entries on this version.
+    """
+    dataset = models.CharField(
+        max_length=50,
+        primary_key=True,
+        verbose_name='데이터셋'
+    )
+    version = models.BigIntegerField(
+        default=0,
+        verbose_name='버전'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='최종 적재 시각'
+    )
+
+    class Meta:
+        db_table = 'dataset_versions'
+        verbose_name = 'Dataset Version'
+        verbose_name_plural = 'Dataset Versions'
+
+    def __str__(self):
+        return f"{self.dataset} v{self.version}"
+
+
+class ResearchFundingDailyRollup(models.Model):
+    """
+    Research funding totals per department and execution date.
+
+    Rebuilt by save_research_funding_data() in the ingestion transaction.
+    Column names mirror ResearchProject so the same aggregation queries
+    run against either table.
+    """
+    department = models.CharField(
+        max_length=100,
+        verbose_name='소속학과'
+    )
+    execution_date = models.DateField(
+        verbose_name='집행일자'
+    )
+    total_budget = models.BigIntegerField(
+        verbose_name='총연구비 합계'
+    )
+    execution_amount = models.BigIntegerField(
+        verbose_name='집행금액 합계'
+    )
+    record_count = models.IntegerField(
+        verbose_name='집행 건수'
+    )
+
+    objects = CachedAggregateQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'rollup_research_funding_daily'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['department', 'execution_date'],
+                include=['total_budget', 'execution_amount'],
+                name='unique_rollup_rf_dept_date'
+            )
+        ]
+        verbose_name = 'Research Funding Daily Rollup'
+        verbose_name_plural = 'Research Funding Daily Rollups'
+
+    def __str__(self):
+        return f"{self.department} - {self.execution_date}"
+
+
+class StudentCountRollup(models.Model):
+    """
+    Student counts per department, program type and enrollment status.
+
+    Rebuilt by save_student_data() in the ingestion transaction.
+    """
+    department = models.CharField(
+        max_length=100,
+        verbose_name='학과'
+    )
+    program_type = models.CharField(
+        max_length=20,
+        verbose_name='과정구분'
+    )
+    enrollment_status = models.CharField(
+        max_length=20,
+        verbose_name='학적상태'
+    )
+    student_count = models.IntegerField(
+        verbose_name='학생 수'
+    )
+
+    objects = CachedAggregateQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'rollup_student_counts'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['department', 'program_type', 'enrollment_status'],
+                name='unique_rollup_student_group'
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['enrollment_status', 'department', 'program_type'],
+                include=['student_count'],
+                name='idx_rollup_student_status'
+            ),
+            models.Index(
+                fields=['department', 'program_type'],
+                include=['student_count'],
+                condition=models.Q(enrollment_status='재학'),
+                name='idx_rollup_student_enrolled'
+            ),
+        ]
+        verbose_name = 'Student Count Rollup'
+        verbose_name_plural = 'Student Count Rollups'
+
+    def __str__(self):
+        return f"{self.department} - {self.program_type} - {self.enrollment_status}"
+
+
+class PublicationTierRollup(models.Model):
+    """
+    Paper counts and Impact Factor sums per department and journal tier.
+
+    Rebuilt by save_publication_data() in the ingestion transaction.
+    if_count/if_sum only cover papers with a non-NULL Impact Factor.
+    """
+    department = models.CharField(
+        max_length=100,
+        verbose_name='학과'
+    )
+    journal_tier = models.CharField(
+        max_length=20,
+        verbose_name='저널등급'
+    )
+    paper_count = models.IntegerField(
+        verbose_name='논문 수'
+    )
+    if_count = models.IntegerField(
+        verbose_name='IF 보유 논문 수'
+    )
+    if_sum = models.FloatField(
+        verbose_name='IF 합계'
+    )
+
+    objects = CachedAggregateQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'rollup_publication_tiers'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['department', 'journal_tier'],
+                include=['paper_count', 'if_count', 'if_sum'],
+                name='unique_rollup_pub_dept_tier'
+            )
+        ]
+        verbose_name = 'Publication Tier Rollup'
+        verbose_name_plural = 'Publication Tier Rollups'
+
+    def __str__(self):
+        return f"{self.department} - {self.journal_tier}"
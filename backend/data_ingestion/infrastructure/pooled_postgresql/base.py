@@ -0,0 +1,104 @@
+"""
+PostgreSQL backend drawing its connections from an in-process pool.
+
+Django opens one connection per thread and disconnects it when the thread's
+request ends (or when CONN_MAX_AGE expires). With this backend, close()
+hands the connection back to a process-wide psycopg2 pool instead, so
+request threads, the ingestion job thread and the cache warm-up threads
+reuse connections whose TLS handshake is already done.
+
+Enabled with DB_POOL_ENABLED (see settings.DATABASES). Extra keys read from
+the database settings:
+- POOL_SIZE:     idle connections kept open per process
+- POOL_MAX_SIZE: connections checked out at once; beyond it a thread gets
+                 a direct, unpooled connection instead of an error
+
+With CONN_HEALTH_CHECKS, a pooled connection is pinged when it is checked
+out and replaced if the server has dropped it.
+"""
+
+import logging
+import os
+import threading
+
+import psycopg2.extras
+from psycopg2 import pool as pg_pool
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_POOL_MAX_SIZE = 8
+
+# (process id, alias) -> pool; keyed by pid so forked workers never share sockets
+_pools: dict = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(alias: str, settings_dict: dict, conn_params: dict) -> pg_pool.ThreadedConnectionPool:
+    """The pool of a database alias in the current process, created on first use."""
+    key = (os.getpid(), alias)
+    with _pools_lock:
+        if key not in _pools:
+            size = settings_dict.get('POOL_SIZE', DEFAULT_POOL_SIZE)
+            max_size = max(size, settings_dict.get('POOL_MAX_SIZE', DEFAULT_POOL_MAX_SIZE))
+            # psycopg2 keeps at most minconn idle connections
+            _pools[key] = pg_pool.ThreadedConnectionPool(size, max_size, **conn_params)
+        return _pools[key]
+
+
+def _is_alive(connection) -> bool:
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        return True
+    except psycopg2.Error:
+        return False
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL DatabaseWrapper whose connections come from a shared pool."""
+
+    _pooled = False
+
+    def get_new_connection(self, conn_params):
+        pool = _get_pool(self.alias, self.settings_dict, conn_params)
+        try:
+            connection = self._checkout(pool)
+            self._pooled = True
+        except pg_pool.PoolError:
+            logger.warning(f"Connection pool for '{self.alias}' exhausted; opening a direct connection")
+            connection = self.Database.connect(**conn_params)
+            self._pooled = False
+
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = IsolationLevel(isolation_level or IsolationLevel.READ_COMMITTED)
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        # Same as the stock backend: skip the json round trip for JSONField
+        psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+        return connection
+
+    def _checkout(self, pool):
+        """A live connection from the pool (dead ones are discarded when health checks are on)."""
+        for _ in range(pool.maxconn + 1):
+            connection = pool.getconn()
+            if not connection.closed and (not self.health_check_enabled or _is_alive(connection)):
+                if not connection.autocommit:
+                    # The health check ping may have opened a transaction
+                    connection.rollback()
+                return connection
+            pool.putconn(connection, close=True)
+        raise pg_pool.PoolError('no live connection in pool')
+
+    def _close(self):
+        if self.connection is None:
+            return
+        with self.wrap_database_errors:
+            if self._pooled:
+                pool = _get_pool(self.alias, self.settings_dict, self.get_connection_params())
+                # putconn() rolls back open transactions and drops broken connections
+                pool.putconn(self.connection)
+            else:
+                self.connection.close()
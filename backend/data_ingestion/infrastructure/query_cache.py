@@ -0,0 +1,165 @@
+"""
+Read-through cache for aggregate queries (QuerySet.aggregate() and count()).
+
+The dashboard models use CachedAggregateQuerySet as their manager, so
+repositories and services get the cache without code changes. Entries are
+keyed by the queryset's SQL and parameters plus the aggregate expressions,
+and stored in the shared cache namespace of the dataset that owns the
+queried table, at its current version. save_*_data() bumps that version in
+its write transaction, so a write through them invalidates every cached
+aggregate over the dataset's tables (raw and rollup) on all workers.
+
+The version is looked up once per computation, not per query: the response
+cache runs compute() inside known_dataset_version() with the version it
+already read, so a cached aggregate inside it costs no query at all.
+Outside such a scope every cached query reads the version row first, and
+runs its own query inside one (the read replica router keys its cached
+read-your-writes state on these versions, see db_router).
+
+Queries bypass the cache when:
+- the dataset has no dataset_versions row (rows written directly through
+  the ORM are not versioned and always read live)
+- they run inside a transaction (a rolled-back write would otherwise leave
+  entries under a version number that is reused later); this also keeps
+  tests on pytest's transactional fixtures live
+- QUERY_CACHE_ENABLED is False or inside query_cache_disabled() (tests)
+"""
+
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, models
+
+from data_ingestion.infrastructure.shared_cache import SharedCache
+
+# db_table -> dataset whose save_*_data() writes the table
+# (names as in dataset_versions; not imported to avoid a models import cycle)
+TABLE_DATASETS = {
+    'research_projects': 'research_funding',
+    'rollup_research_funding_daily': 'research_funding',
+    'students': 'students',
+    'rollup_student_counts': 'students',
+    'publications': 'publications',
+    'rollup_publication_tiers': 'publications',
+    'department_kpis': 'kpi',
+}
+
+_MISSING = object()
+_local = threading.local()
+
+
+def is_enabled() -> bool:
+    """Whether aggregate queries may be served from the cache."""
+    return getattr(settings, 'QUERY_CACHE_ENABLED', True) and not getattr(_local, 'disabled', False)
+
+
+@contextmanager
+def query_cache_disabled() -> Iterator[None]:
+    """Run aggregate queries live in the current thread (for tests)."""
+    previous = getattr(_local, 'disabled', False)
+    _local.disabled = True
+    try:
+        yield
+    finally:
+        _local.disabled = previous
+
+
+@contextmanager
+def known_dataset_version(dataset: str, version: int) -> Iterator[None]:
+    """
+    Key cached aggregates of a dataset by an already-read version (current thread).
+
+    Args:
+        dataset: Dataset name (as in dataset_versions)
+        version: Version read by the caller (0 = never ingested: read live)
+    """
+    previous = getattr(_local, 'versions', {})
+    _local.versions = {**previous, dataset: version}
+    try:
+        yield
+    finally:
+        _local.versions = previous
+
+
+def known_version(dataset: str) -> Optional[int]:
+    """Version of a dataset set by known_dataset_version() (current thread), None if unset."""
+    return getattr(_local, 'versions', {}).get(dataset)
+
+
+def _dataset_version(dataset: str) -> Optional[int]:
+    """Current version of a dataset, None if it was never ingested."""
+    known = known_version(dataset)
+    if known is not None:
+        return known or None
+
+    from data_ingestion.infrastructure.models import DatasetVersion
+
+    return DatasetVersion.objects.filter(dataset=dataset).values_list(
+        'version', flat=True
+    ).first()
+
+
+def cached_query(
+    queryset: models.QuerySet,
+    operation: Tuple[Any, ...],
+    compute: Callable[[], Any]
+) -> Any:
+    """
+    Return the cached result of an aggregate over a queryset.
+
+    Args:
+        queryset: Queryset the aggregate runs over
+        operation: Hashable description of the aggregate (part of the key)
+        compute: Zero-argument callable running the query
+
+    Returns:
+        Query result, from the cache when possible
+    """
+    if not is_enabled():
+        return compute()
+
+    dataset = TABLE_DATASETS.get(queryset.model._meta.db_table)
+    if dataset is None or connections[queryset.db].in_atomic_block:
+        return compute()
+
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return compute()
+
+    version = _dataset_version(dataset)
+    if version is None:
+        return compute()
+
+    digest = hashlib.sha1(
+        repr((queryset.db, sql, params, operation)).encode('utf-8')
+    ).hexdigest()
+    namespace = SharedCache().namespace(dataset, version)
+    key = f'query:{digest}'
+
+    result = namespace.get(key, _MISSING)
+    if result is _MISSING:
+        with known_dataset_version(dataset, version):
+            result = compute()
+        namespace.set(key, result, getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', None))
+    return result
+
+
+class CachedAggregateQuerySet(models.QuerySet):
+    """QuerySet whose aggregate() and count() results are cached per dataset version."""
+
+    def aggregate(self, *args, **kwargs):
+        operation = ('aggregate', repr(args), repr(sorted(kwargs.items())))
+        return cached_query(
+            self, operation,
+            lambda: super(CachedAggregateQuerySet, self).aggregate(*args, **kwargs)
+        )
+
+    def count(self):
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        return cached_query(self, ('count',), lambda: super(CachedAggregateQuerySet, self).count())
@@ -4,24 +4,107 @@ Direct Django ORM usage (no abstraction layer for MVP).
 """
 
 import pandas as pd
-from typing import Dict, Any
-from django.db import transaction
-from django.db.models import Sum
+from typing import Dict, Any, Callable, List, Optional
+from django.db import connections, transaction
+from django.db.models import Avg, Count, F, Func, Max, Min, Sum, Q, Value, Window
+from django.db.models.functions import Coalesce, TruncMonth, TruncQuarter, TruncWeek, TruncYear
+from django.utils import timezone
+from datetime import date, timedelta
 from data_ingestion.infrastructure.models import (
     ResearchProject,
     Student,
     Publication,
-    DepartmentKPI
+    DepartmentKPI,
+    ResearchFundingDailyRollup,
+    StudentCountRollup,
+    PublicationTierRollup,
 )
+from data_ingestion.infrastructure.analytics_cube import get_analytics_cube, PERIOD_DAYS
+from data_ingestion.infrastructure.department_catalog import get_department_catalog
+from data_ingestion.infrastructure.rollups import (
+    rollups_available,
+    rebuild_research_funding_rollup,
+    rebuild_student_rollup,
+    rebuild_publication_rollup,
+)
+from data_ingestion.infrastructure.dataset_versions import (
+    bump_dataset_version,
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+)
+
+# Rows per bulk INSERT; the checkpoint callback runs between batches
+BULK_BATCH_SIZE = 1000
+
+# Suffix of the per-period keys in ResearchFundingRepository._monthly_totals()
+# rows ('' for the unrestricted series)
+TREND_SERIES = ('',) + tuple(f'_{period}' for period in PERIOD_DAYS)
+
+# Research funding trend buckets, finest first; get_trend() moves to the next
+# one until the range fits the point budget
+TREND_GRANULARITIES = {
+    'week': TruncWeek,
+    'month': TruncMonth,
+    'quarter': TruncQuarter,
+    'year': TruncYear,
+}
+DEFAULT_TREND_MAX_POINTS = 60
+
+
+class _SumOver(Func):
+    """SUM() applied to a grouped aggregate inside a window (SUM(SUM(x)) OVER ...)."""
 
+    function = 'SUM'
+    window_compatible = True
 
-def save_research_funding_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict[str, Any]:
+
+class _GroupedWindow(Window):
+    """
+    Window over the rows of a GROUP BY query.
+
+    Its ORDER BY columns are already grouping keys; Django would otherwise
+    add the whole window expression to the GROUP BY clause.
+    """
+
+    def get_group_by_cols(self):
+        return []
+
+
+def _bulk_create_in_batches(
+    model,
+    records: List[Any],
+    checkpoint: Optional[Callable[[], None]] = None
+) -> None:
+    """
+    Bulk insert records in BULK_BATCH_SIZE chunks.
+
+    Args:
+        model: Django model class
+        records: Unsaved model instances
+        checkpoint: Optional callback run before each batch. It may raise
+                    to abort the insert (e.g. job cancelled / timed out);
+                    the caller's transaction then rolls back.
+    """
+    for start in range(0, len(records), BULK_BATCH_SIZE):
+        if checkpoint:
+            checkpoint()
+        model.objects.bulk_create(records[start:start + BULK_BATCH_SIZE], batch_size=BULK_BATCH_SIZE)
+
+
+def save_research_funding_data(
+    dataframe: pd.DataFrame,
+    replace: bool = True,
+    checkpoint: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
     """
     Save research funding data to database.
 
     Args:
         dataframe: Pandas DataFrame with research funding data
         replace: If True, delete all existing data before inserting
+        checkpoint: Optional callback run between insert batches (may raise to abort)
 
     Returns:
         dict with 'rows_inserted' count
@@ -33,7 +116,8 @@ def save_research_funding_data(dataframe: pd.DataFrame, replace: bool = True) ->
         if replace:
             ResearchProject.objects.all().delete()
 
-        if len(dataframe) == 0:
+        # Nothing changed; an empty replace still has to rebuild and bump below
+        if len(dataframe) == 0 and not replace:
             return {'rows_inserted': 0}
 
         # Convert DataFrame to list of model instances
@@ -49,18 +133,29 @@ def save_research_funding_data(dataframe: pd.DataFrame, replace: bool = True) ->
         ]
 
         # Bulk insert with batching (1000 per batch for performance)
-        ResearchProject.objects.bulk_create(records, batch_size=1000)
+        _bulk_create_in_batches(ResearchProject, records, checkpoint)
+
+        # Rebuild dashboard aggregates from the committed rows
+        rebuild_research_funding_rollup()
+
+        # Invalidate cached dashboards atomically with the new data
+        bump_dataset_version(DATASET_RESEARCH_FUNDING)
 
         return {'rows_inserted': len(records)}
 
 
-def save_student_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict[str, Any]:
+def save_student_data(
+    dataframe: pd.DataFrame,
+    replace: bool = True,
+    checkpoint: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
     """
     Save student enrollment data to database.
 
     Args:
         dataframe: Pandas DataFrame with student data
         replace: If True, delete all existing data before inserting
+        checkpoint: Optional callback run between insert batches (may raise to abort)
 
     Returns:
         dict with 'rows_inserted' count
@@ -69,7 +164,8 @@ def save_student_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict[str
         if replace:
             Student.objects.all().delete()
 
-        if len(dataframe) == 0:
+        # Nothing changed; an empty replace still has to rebuild and bump below
+        if len(dataframe) == 0 and not replace:
             return {'rows_inserted': 0}
 
         records = [
@@ -83,18 +179,29 @@ def save_student_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict[str
             for _, row in dataframe.iterrows()
         ]
 
-        Student.objects.bulk_create(records, batch_size=1000)
+        _bulk_create_in_batches(Student, records, checkpoint)
+
+        # Rebuild dashboard aggregates from the committed rows
+        rebuild_student_rollup()
+
+        # Invalidate cached dashboards atomically with the new data
+        bump_dataset_version(DATASET_STUDENTS)
 
         return {'rows_inserted': len(records)}
 
 
-def save_publication_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict[str, Any]:
+def save_publication_data(
+    dataframe: pd.DataFrame,
+    replace: bool = True,
+    checkpoint: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
     """
     Save publication records to database.
 
     Args:
         dataframe: Pandas DataFrame with publication data
         replace: If True, delete all existing data before inserting
+        checkpoint: Optional callback run between insert batches (may raise to abort)
 
     Returns:
         dict with 'rows_inserted' count
@@ -103,7 +210,8 @@ def save_publication_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict
         if replace:
             Publication.objects.all().delete()
 
-        if len(dataframe) == 0:
+        # Nothing changed; an empty replace still has to rebuild and bump below
+        if len(dataframe) == 0 and not replace:
             return {'rows_inserted': 0}
 
         records = [
@@ -116,18 +224,29 @@ def save_publication_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict
             for _, row in dataframe.iterrows()
         ]
 
-        Publication.objects.bulk_create(records, batch_size=1000)
+        _bulk_create_in_batches(Publication, records, checkpoint)
+
+        # Rebuild dashboard aggregates from the committed rows
+        rebuild_publication_rollup()
+
+        # Invalidate cached dashboards atomically with the new data
+        bump_dataset_version(DATASET_PUBLICATIONS)
 
         return {'rows_inserted': len(records)}
 
 
-def save_department_kpi_data(dataframe: pd.DataFrame, replace: bool = True) -> Dict[str, Any]:
+def save_department_kpi_data(
+    dataframe: pd.DataFrame,
+    replace: bool = True,
+    checkpoint: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
     """
     Save department KPI metrics to database.
 
     Args:
         dataframe: Pandas DataFrame with KPI data
         replace: If True, delete all existing data before inserting
+        checkpoint: Optional callback run between insert batches (may raise to abort)
 
     Returns:
         dict with 'rows_inserted' count
@@ -140,7 +259,8 @@ def save_department_kpi_data(dataframe: pd.DataFrame, replace: bool = True) -> D
         if replace:
             DepartmentKPI.objects.all().delete()
 
-        if len(dataframe) == 0:
+        # Nothing changed; an empty replace still has to rebuild and bump below
+        if len(dataframe) == 0 and not replace:
             return {'rows_inserted': 0}
 
         records = [
@@ -153,7 +273,10 @@ def save_department_kpi_data(dataframe: pd.DataFrame, replace: bool = True) -> D
             for _, row in dataframe.iterrows()
         ]
 
-        DepartmentKPI.objects.bulk_create(records, batch_size=1000)
+        _bulk_create_in_batches(DepartmentKPI, records, checkpoint)
+
+        # Invalidate cached dashboards atomically with the new data
+        bump_dataset_version(DATASET_KPI)
 
         return {'rows_inserted': len(records)}
 
@@ -165,38 +288,70 @@ class StudentRepository:
     Following plan.md Phase 1 - Infrastructure Layer (Data Access).
     """
 
-    def get_students_by_filter(self, department: str = 'all', status: str = 'all'):
+    def get_department_program_counts(
+        self,
+        department: str = 'all',
+        status: str = 'all'
+    ) -> list[dict[str, Any]]:
         """
-        Get students filtered by department and enrollment status.
+        Get student counts per department and program type in one grouped query.
+
+        Reads the rollup when it has been built, raw student rows otherwise.
 
         Args:
             department: Department filter ('all' or specific department name)
             status: Enrollment status filter ('all', '재학', '휴학', '졸업')
 
         Returns:
-            QuerySet of Student objects matching the filters
+            List of dicts {'department', '학사', '석사', '박사', 'total'} sorted by
+            total descending
         """
-        queryset = Student.objects.all()
+        from_cube = get_analytics_cube().department_program_counts(department, status)
+        if from_cube is not None:
+            return from_cube
+
+        if rollups_available(DATASET_STUDENTS):
+            queryset = StudentCountRollup.objects.all()
+
+            def tally(condition=None):
+                return Sum('student_count', filter=condition)
+        else:
+            # Rows written directly through the ORM: same single grouped query
+            queryset = Student.objects.all()
+
+            def tally(condition=None):
+                return Count('student_id', filter=condition)
 
-        # Apply department filter
         if department != 'all':
             queryset = queryset.filter(department=department)
-
-        # Apply enrollment status filter
         if status != 'all':
             queryset = queryset.filter(enrollment_status=status)
 
-        return queryset
+        aggregated = queryset.values('department').annotate(
+            학사=Coalesce(tally(Q(program_type='학사')), 0),
+            석사=Coalesce(tally(Q(program_type='석사')), 0),
+            박사=Coalesce(tally(Q(program_type='박사')), 0),
+            total=tally()
+        ).order_by('-total')
+
+        return list(aggregated)
 
-    def get_all_departments(self) -> list[str]:
+    def get_all_departments(self) -> frozenset[str]:
         """
-        Get list of all unique departments (for dropdown population).
+        Get all unique departments (for validation and dropdown population).
 
         Returns:
-            List of distinct department names (alphabetically sorted)
+            frozenset of department names, cached until the next ingestion
         """
-        departments = Student.objects.values_list('department', flat=True).distinct()
-        return list(departments)
+        return get_department_catalog().get(DATASET_STUDENTS, self._load_departments)
+
+    def _load_departments(self) -> list[str]:
+        from_cube = get_analytics_cube().departments(DATASET_STUDENTS)
+        if from_cube is not None:
+            return from_cube
+
+        model = StudentCountRollup if rollups_available(DATASET_STUDENTS) else Student
+        return list(model.objects.values_list('department', flat=True).distinct())
 
 
 class ResearchFundingRepository:
@@ -204,8 +359,84 @@ class ResearchFundingRepository:
     Repository for ResearchProject data access.
     Responsibility: Database CRUD operations and aggregation queries.
     Following plan.md Phase 1.2 - Direct Django ORM usage (MVP simplification).
+
+    Queries run against the daily rollup once the dataset has been ingested;
+    it shares ResearchProject's column names, so the same aggregations apply.
+
+    Balance and trend for every period come from one grouped query per
+    department, memoized on the instance; repositories are created per
+    request (per service instance), so the memo never outlives a request.
     """
 
+    def __init__(self):
+        self._monthly_totals_memo: dict[str, list[dict[str, Any]]] = {}
+
+    def _base_queryset(self):
+        """Daily rollup rows when available, raw execution rows otherwise."""
+        if rollups_available(DATASET_RESEARCH_FUNDING):
+            return ResearchFundingDailyRollup.objects.all()
+        return ResearchProject.objects.all()
+
+    def _monthly_totals(self, department: str | None) -> list[dict[str, Any]]:
+        """
+        Monthly sums, running totals and budget totals per period, in one query.
+
+        Each period ('1year', '3years') gets conditional sums and a row count
+        over execution_date >= its cutoff, so one GROUP BY month serves the
+        balance and the trend of every period. On databases with window
+        functions (PostgreSQL, SQLite >= 3.25) the cumulative execution and
+        the budget total come from SUM() OVER in the same statement; other
+        backends accumulate the grouped rows in Python.
+
+        Returns:
+            Rows ordered by month with keys month, rows_<period> and, for each
+            series suffix in TREND_SERIES, budget<s>, execution<s>,
+            budget_total<s> (sum over all rows) and running_execution<s>
+            (cumulative up to and including the month)
+        """
+        key = department if department and department != 'all' else 'all'
+        if key not in self._monthly_totals_memo:
+            queryset = self._base_queryset()
+            if key != 'all':
+                queryset = queryset.filter(department=key)
+
+            sums = {'budget': Sum('total_budget'), 'execution': Sum('execution_amount')}
+            for period, days in PERIOD_DAYS.items():
+                in_period = Q(execution_date__gte=timezone.now() - timedelta(days=days))
+                sums[f'budget_{period}'] = Sum('total_budget', filter=in_period)
+                sums[f'execution_{period}'] = Sum('execution_amount', filter=in_period)
+                sums[f'rows_{period}'] = Count('execution_date', filter=in_period)
+
+            use_window = connections[queryset.db].features.supports_over_clause
+            if use_window:
+                for suffix in TREND_SERIES:
+                    budget, execution = sums[f'budget{suffix}'], sums[f'execution{suffix}']
+                    sums[f'budget_total{suffix}'] = _GroupedWindow(_SumOver(budget))
+                    sums[f'running_execution{suffix}'] = _GroupedWindow(
+                        _SumOver(execution), order_by=F('month').asc()
+                    )
+
+            months = list(
+                queryset.annotate(
+                    month=TruncMonth('execution_date')
+                ).values('month').annotate(**sums).order_by('month')
+            )
+            if not use_window:
+                self._accumulate(months)
+            self._monthly_totals_memo[key] = months
+        return self._monthly_totals_memo[key]
+
+    @staticmethod
+    def _accumulate(months: list[dict[str, Any]], series=TREND_SERIES) -> None:
+        """Fill budget_total<s> and running_execution<s> without window functions."""
+        for suffix in series:
+            budget_total = sum(month[f'budget{suffix}'] or 0 for month in months)
+            running_execution = 0
+            for month in months:
+                running_execution += month[f'execution{suffix}'] or 0
+                month[f'budget_total{suffix}'] = budget_total
+                month[f'running_execution{suffix}'] = running_execution
+
     def get_current_balance(self, department: str | None = None) -> int:
         """
         Calculate current balance: SUM(total_budget) - SUM(execution_amount).
@@ -216,22 +447,38 @@ class ResearchFundingRepository:
         Returns:
             Current balance in Korean Won (원). Returns 0 if no data.
         """
-        queryset = ResearchProject.objects.all()
+        from_cube = get_analytics_cube().current_balance(department)
+        if from_cube is not None:
+            return from_cube
 
-        if department and department != "all":
-            queryset = queryset.filter(department=department)
-
-        result = queryset.aggregate(
-            total_budget=Sum('total_budget'),
-            total_execution=Sum('execution_amount')
-        )
+        months = self._monthly_totals(department)
+        if not months:
+            return 0
 
-        total_budget = result['total_budget'] or 0
-        total_execution = result['total_execution'] or 0
-        current_balance = total_budget - total_execution
+        # The last month's running execution is the overall execution total
+        latest = months[-1]
+        current_balance = (latest['budget_total'] or 0) - (latest['running_execution'] or 0)
 
         return current_balance
 
+    def get_all_departments(self) -> frozenset[str]:
+        """
+        Get all unique departments (for validation and dropdown population).
+
+        Returns:
+            frozenset of department names, cached until the next ingestion
+        """
+        return get_department_catalog().get(DATASET_RESEARCH_FUNDING, self._load_departments)
+
+    def _load_departments(self) -> list[str]:
+        from_cube = get_analytics_cube().departments(DATASET_RESEARCH_FUNDING)
+        if from_cube is not None:
+            return from_cube
+
+        return list(
+            self._base_queryset().values_list('department', flat=True).distinct()
+        )
+
     def get_monthly_trend(
         self,
         department: str | None = None,
@@ -247,55 +494,262 @@ class ResearchFundingRepository:
         Returns:
             List of dicts with keys: month (str), execution (int), balance (int)
         """
-        from django.utils import timezone
-        from datetime import timedelta
-        from django.db.models.functions import TruncMonth
+        from_cube = get_analytics_cube().monthly_trend(department, period)
+        if from_cube is not None:
+            return from_cube
 
-        queryset = ResearchProject.objects.all()
+        months = self._monthly_totals(department)
 
-        # Apply department filter
-        if department and department != "all":
-            queryset = queryset.filter(department=department)
+        # Restrict to months with executions inside the period
+        if period in PERIOD_DAYS:
+            months = [month for month in months if month[f'rows_{period}']]
+            suffix = f'_{period}'
+        else:
+            suffix = ''
 
-        # Apply period filter
-        if period == "1year":
-            one_year_ago = timezone.now() - timedelta(days=365)
-            queryset = queryset.filter(execution_date__gte=one_year_ago)
-        elif period == "3years":
-            three_years_ago = timezone.now() - timedelta(days=1095)
-            queryset = queryset.filter(execution_date__gte=three_years_ago)
-
-        # Calculate total budget (for balance calculation)
-        # MVP simplification: sum all total_budget values
+        # Balance = Total Budget - Cumulative Execution
+        # MVP simplification: total budget sums all total_budget values
         # Note: This assumes each execution_id has unique total_budget
-        total_budget_result = queryset.aggregate(total=Sum('total_budget'))
-        total_budget = total_budget_result['total'] or 0
+        return [
+            {
+                'month': month['month'].strftime('%Y-%m'),
+                'balance': (
+                    (month[f'budget_total{suffix}'] or 0)
+                    - (month[f'running_execution{suffix}'] or 0)
+                ),
+                'execution': month[f'execution{suffix}'],
+            }
+            for month in months
+        ]
+
+    @staticmethod
+    def period_start(period: str) -> date | None:
+        """First execution date inside a period filter (None for 'latest')."""
+        if period not in PERIOD_DAYS:
+            return None
+        return timezone.localdate() - timedelta(days=PERIOD_DAYS[period])
+
+    @staticmethod
+    def _bucket_count(first: date, last: date, granularity: str) -> int:
+        """Buckets of a granularity between two dates, both ends included."""
+        if granularity == 'week':
+            # Weeks start on Monday (date_trunc('week'))
+            first_monday = first - timedelta(days=first.weekday())
+            last_monday = last - timedelta(days=last.weekday())
+            return (last_monday - first_monday).days // 7 + 1
+        if granularity == 'month':
+            return (last.year - first.year) * 12 + last.month - first.month + 1
+        if granularity == 'quarter':
+            return (last.year - first.year) * 4 + (last.month - 1) // 3 - (first.month - 1) // 3 + 1
+        return last.year - first.year + 1
+
+    def _range_queryset(
+        self,
+        departments: list[str] | None,
+        start: date | None,
+        end: date | None
+    ):
+        """Rows of the given departments (None = all) inside an execution date range."""
+        queryset = self._base_queryset()
+        if departments is not None:
+            queryset = queryset.filter(department__in=departments)
+        if start is not None:
+            queryset = queryset.filter(execution_date__gte=start)
+        if end is not None:
+            queryset = queryset.filter(execution_date__lte=end)
+        return queryset
+
+    def _fit_granularity(self, queryset, granularity: str, max_points: int):
+        """
+        Coarsest-needed granularity for the range covered by the rows (MIN/MAX).
+
+        Returns:
+            (granularity, queryset) - the queryset is restricted to the last
+            max_points years if even yearly buckets do not fit, and is None
+            when there are no rows
+        """
+        span = queryset.aggregate(first=Min('execution_date'), last=Max('execution_date'))
+        if span['first'] is None:
+            return granularity, None
+
+        granularities = list(TREND_GRANULARITIES)
+        for granularity in granularities[granularities.index(granularity):]:
+            if self._bucket_count(span['first'], span['last'], granularity) <= max_points:
+                return granularity, queryset
 
-        # Monthly execution aggregation
-        trend_data = queryset.annotate(
-            month=TruncMonth('execution_date')
-        ).values('month').annotate(
-            monthly_execution=Sum('execution_amount')
-        ).order_by('month')
+        oldest_year = span['last'].year - max_points + 1
+        return granularity, queryset.filter(execution_date__gte=date(oldest_year, 1, 1))
 
-        # Calculate cumulative balance
-        cumulative_execution = 0
-        result = []
+    def _bucket_totals(
+        self,
+        queryset,
+        granularity: str,
+        by_department: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Sums per bucket with budget total and running execution, in one grouped query.
 
-        for item in trend_data:
-            monthly_execution = item['monthly_execution']
-            cumulative_execution += monthly_execution
+        With by_department, rows are grouped by (department, bucket) and the
+        window sums are partitioned by department, so every department gets
+        its own running balance from the same statement.
+        """
+        group_by = ('department', 'bucket') if by_department else ('bucket',)
+        partition_by = [F('department')] if by_department else None
+
+        sums = {'budget': Sum('total_budget'), 'execution': Sum('execution_amount')}
+        use_window = connections[queryset.db].features.supports_over_clause
+        if use_window:
+            sums['budget_total'] = _GroupedWindow(_SumOver(sums['budget']), partition_by=partition_by)
+            sums['running_execution'] = _GroupedWindow(
+                _SumOver(sums['execution']), partition_by=partition_by, order_by=F('bucket').asc()
+            )
 
-            # Balance = Total Budget - Cumulative Execution
-            balance = total_budget - cumulative_execution
+        buckets = list(
+            queryset.annotate(
+                bucket=TREND_GRANULARITIES[granularity]('execution_date')
+            ).values(*group_by).annotate(**sums).order_by(*group_by)
+        )
+        if not use_window:
+            if by_department:
+                per_department: dict[str, list[dict[str, Any]]] = {}
+                for bucket in buckets:
+                    per_department.setdefault(bucket['department'], []).append(bucket)
+                for department_buckets in per_department.values():
+                    self._accumulate(department_buckets, series=('',))
+            else:
+                self._accumulate(buckets, series=('',))
+        return buckets
+
+    @staticmethod
+    def _trend_point(bucket: dict[str, Any]) -> dict[str, Any]:
+        return {
+            'period_start': bucket['bucket'],
+            'balance': (bucket['budget_total'] or 0) - (bucket['running_execution'] or 0),
+            'execution': bucket['execution'],
+        }
+
+    def get_trend(
+        self,
+        department: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        granularity: str = 'month',
+        max_points: int = DEFAULT_TREND_MAX_POINTS
+    ) -> dict[str, Any]:
+        """
+        Execution trend with cumulative balance over a date range, bucketed in the database.
 
-            result.append({
-                'month': item['month'].strftime('%Y-%m'),
-                'balance': balance,
-                'execution': monthly_execution
-            })
+        The range actually covered by executions is read first (MIN/MAX);
+        if it holds more than max_points buckets of the requested
+        granularity, the next coarser one is used. Beyond max_points years
+        only the most recent years are returned. Like the period filters,
+        the balance counts the budgets and executions inside the range.
 
-        return result
+        Args:
+            department: Optional department filter
+            start: First execution date included (None = no lower bound)
+            end: Last execution date included (None = no upper bound)
+            granularity: 'week', 'month', 'quarter' or 'year'
+            max_points: Maximum number of trend points
+
+        Returns:
+            Dict with keys: granularity (str, the one used) and trend (list of
+            dicts with keys period_start (date), execution (int), balance (int))
+        """
+        departments = [department] if department and department != 'all' else None
+        granularity, queryset = self._fit_granularity(
+            self._range_queryset(departments, start, end), granularity, max_points
+        )
+        if queryset is None:
+            return {'granularity': granularity, 'trend': []}
+
+        return {
+            'granularity': granularity,
+            'trend': [self._trend_point(bucket) for bucket in self._bucket_totals(queryset, granularity)],
+        }
+
+    def get_trend_by_department(
+        self,
+        departments: list[str],
+        start: date | None = None,
+        end: date | None = None,
+        granularity: str = 'month',
+        max_points: int = DEFAULT_TREND_MAX_POINTS
+    ) -> dict[str, Any]:
+        """
+        get_trend() for several departments, grouped by department and bucket in one query.
+
+        All series share one granularity, fitted to the range covered by the
+        executions of all the departments together.
+
+        Args:
+            departments: Department names
+            start, end, granularity, max_points: As for get_trend()
+
+        Returns:
+            Dict with keys: granularity (str) and series (dict of department ->
+            trend points as in get_trend(); empty for departments without rows)
+        """
+        series: dict[str, list[dict[str, Any]]] = {department: [] for department in departments}
+        granularity, queryset = self._fit_granularity(
+            self._range_queryset(departments, start, end), granularity, max_points
+        )
+        if queryset is not None:
+            for bucket in self._bucket_totals(queryset, granularity, by_department=True):
+                series[bucket['department']].append(self._trend_point(bucket))
+
+        return {'granularity': granularity, 'series': series}
+
+    def get_current_balances(self, departments: list[str]) -> dict[str, int]:
+        """
+        Current balance of several departments in one grouped query.
+
+        Args:
+            departments: Department names
+
+        Returns:
+            Dict of department -> SUM(total_budget) - SUM(execution_amount)
+            (0 for departments without rows)
+        """
+        balances = dict.fromkeys(departments, 0)
+        totals = self._range_queryset(departments, None, None).values('department').annotate(
+            budget=Sum('total_budget'),
+            execution=Sum('execution_amount')
+        ).order_by()
+        for row in totals:
+            balances[row['department']] = (row['budget'] or 0) - (row['execution'] or 0)
+        return balances
+
+    def get_execution_totals(
+        self,
+        department: str | None,
+        windows: dict[str, tuple[date, date]]
+    ) -> dict[str, int]:
+        """
+        Execution total of several date windows in one pass.
+
+        Each window is a conditional sum (SUM(...) FILTER (WHERE ...)) over
+        the rows spanning all windows, so comparing periods costs one query.
+
+        Args:
+            department: Optional department filter
+            windows: Dict of name -> (first, last) execution date, inclusive
+
+        Returns:
+            Dict of name -> SUM(execution_amount) in the window (0 if no rows)
+        """
+        departments = [department] if department and department != 'all' else None
+        queryset = self._range_queryset(
+            departments,
+            min(first for first, _ in windows.values()),
+            max(last for _, last in windows.values())
+        )
+        return queryset.aggregate(**{
+            name: Coalesce(
+                Sum('execution_amount', filter=Q(execution_date__gte=first, execution_date__lte=last)), 0
+            )
+            for name, (first, last) in windows.items()
+        })
 
 
 class PublicationRepository:
@@ -305,38 +759,69 @@ class PublicationRepository:
     Following plan.md Phase 1.1 - Infrastructure Layer (Data Access).
     """
 
-    def get_publications_by_filter(self, department: str = 'all', journal_tier: str = 'all'):
+    def get_tier_summary(
+        self,
+        department: str = 'all',
+        journal_tier: str = 'all'
+    ) -> list[dict[str, Any]]:
         """
-        Get publications filtered by department and journal tier.
+        Get paper counts and Impact Factor sums per journal tier in one grouped query.
+
+        Reads the rollup when it has been built, raw publication rows otherwise.
 
         Args:
             department: Department filter ('all' or specific department name)
             journal_tier: Journal tier filter ('all', 'SCIE', 'KCI', '기타')
 
         Returns:
-            QuerySet of Publication objects matching the filters
+            List of dicts {'journal_tier', 'count', 'if_count', 'if_sum'} sorted by
+            count descending
         """
-        queryset = Publication.objects.all()
+        from_cube = get_analytics_cube().tier_summary(department, journal_tier)
+        if from_cube is not None:
+            return from_cube
+
+        if rollups_available(DATASET_PUBLICATIONS):
+            queryset = PublicationTierRollup.objects.all()
+            aggregates = {
+                'count': Sum('paper_count'),
+                'if_count': Sum('if_count'),
+                'if_sum': Sum('if_sum'),
+            }
+        else:
+            # Rows written directly through the ORM: same single grouped query
+            queryset = Publication.objects.all()
+            aggregates = {
+                'count': Count('paper_id'),
+                'if_count': Count('impact_factor'),
+                'if_sum': Coalesce(Sum('impact_factor'), Value(0.0)),
+            }
 
-        # Apply department filter
         if department != 'all':
             queryset = queryset.filter(department=department)
-
-        # Apply journal tier filter
         if journal_tier != 'all':
             queryset = queryset.filter(journal_tier=journal_tier)
 
-        return queryset
+        aggregated = queryset.values('journal_tier').annotate(**aggregates).order_by('-count')
+
+        return list(aggregated)
 
-    def get_all_departments(self) -> list[str]:
+    def get_all_departments(self) -> frozenset[str]:
         """
-        Get list of all unique departments (for dropdown population).
+        Get all unique departments (for validation and dropdown population).
 
         Returns:
-            List of distinct department names
+            frozenset of department names, cached until the next ingestion
         """
-        departments = Publication.objects.values_list('department', flat=True).distinct()
-        return list(departments)
+        return get_department_catalog().get(DATASET_PUBLICATIONS, self._load_departments)
+
+    def _load_departments(self) -> list[str]:
+        from_cube = get_analytics_cube().departments(DATASET_PUBLICATIONS)
+        if from_cube is not None:
+            return from_cube
+
+        model = PublicationTierRollup if rollups_available(DATASET_PUBLICATIONS) else Publication
+        return list(model.objects.values_list('department', flat=True).distinct())
 
 
 class KPIRepository:
@@ -344,6 +829,9 @@ class KPIRepository:
     Repository for DepartmentKPI data access.
     Responsibility: Database query operations for department KPI dashboard.
     Following plan.md Phase 3.2 - Repository Layer (Data Access).
+
+    department_kpis is unique on (evaluation_year, department), which is
+    already the rollup grain, so no separate rollup table is kept.
     """
 
     def find_by_department_and_year(
@@ -377,6 +865,150 @@ class KPIRepository:
         # Order by year ascending
         return queryset.order_by('evaluation_year')
 
+    def get_yearly_summary(
+        self,
+        department: str,
+        start_year: int,
+        end_year: int
+    ) -> dict[str, Any]:
+        """
+        Get per-year KPI aggregates from the analytics cube, or in one grouped query.
+
+        The overall average is derived from the per-year employment rate sums
+        and counts, so no second query over the same rows is needed.
+
+        Args:
+            department: Department filter ('all' or specific department name)
+            start_year: Start year (inclusive)
+            end_year: End year (inclusive)
+
+        Returns:
+            {'data': [{'evaluation_year', 'avg_employment_rate', 'total_tech_income'}],
+             'overall_avg_employment_rate': float | None}
+        """
+        from_cube = get_analytics_cube().kpi_yearly_summary(department, start_year, end_year)
+        if from_cube is not None:
+            return from_cube
+
+        rows = list(
+            self.find_by_department_and_year(department, start_year, end_year)
+            .values('evaluation_year')
+            .annotate(
+                avg_employment_rate=Avg('employment_rate'),
+                total_tech_income=Sum('tech_transfer_revenue'),
+                rate_sum=Sum('employment_rate'),
+                rate_count=Count('employment_rate')
+            )
+            .order_by('evaluation_year')
+        )
+
+        rate_sum = sum(row.pop('rate_sum') or 0 for row in rows)
+        rate_count = sum(row.pop('rate_count') for row in rows)
+
+        return {
+            'data': rows,
+            'overall_avg_employment_rate': rate_sum / rate_count if rate_count else None,
+        }
+
+    def find_by_departments_and_year(
+        self,
+        departments: list[str],
+        start_year: int,
+        end_year: int
+    ):
+        """
+        Get KPI data of several departments in a year range.
+
+        Args:
+            departments: Department names
+            start_year: Start year (inclusive)
+            end_year: End year (inclusive)
+
+        Returns:
+            QuerySet of DepartmentKPI objects ordered by department, then
+            evaluation_year ascending
+        """
+        return DepartmentKPI.objects.filter(
+            department__in=departments,
+            evaluation_year__gte=start_year,
+            evaluation_year__lte=end_year
+        ).order_by('department', 'evaluation_year')
+
+    def get_yearly_summary_by_department(
+        self,
+        departments: list[str],
+        start_year: int,
+        end_year: int
+    ) -> dict[str, dict[str, Any]]:
+        """
+        get_yearly_summary() for several departments, grouped by department and year in one query.
+
+        Args:
+            departments: Department names
+            start_year: Start year (inclusive)
+            end_year: End year (inclusive)
+
+        Returns:
+            Dict of department -> summary as returned by get_yearly_summary()
+            (no data and a None average for departments without rows)
+        """
+        rows = (
+            self.find_by_departments_and_year(departments, start_year, end_year)
+            .values('department', 'evaluation_year')
+            .annotate(
+                avg_employment_rate=Avg('employment_rate'),
+                total_tech_income=Sum('tech_transfer_revenue'),
+                rate_sum=Sum('employment_rate'),
+                rate_count=Count('employment_rate')
+            )
+            .order_by('department', 'evaluation_year')
+        )
+
+        per_department: dict[str, list[dict[str, Any]]] = {department: [] for department in departments}
+        for row in rows:
+            per_department[row.pop('department')].append(row)
+
+        summaries = {}
+        for department, department_rows in per_department.items():
+            rate_sum = sum(row.pop('rate_sum') or 0 for row in department_rows)
+            rate_count = sum(row.pop('rate_count') for row in department_rows)
+            summaries[department] = {
+                'data': department_rows,
+                'overall_avg_employment_rate': rate_sum / rate_count if rate_count else None,
+            }
+        return summaries
+
+    def get_employment_rate_by_window(
+        self,
+        department: str,
+        windows: dict[str, tuple[int, int]]
+    ) -> dict[str, float | None]:
+        """
+        Average employment rate of several year windows in one pass.
+
+        Each window is a conditional average (AVG(...) FILTER (WHERE ...))
+        over the rows spanning all windows.
+
+        Args:
+            department: Department filter ('all' or specific department name)
+            windows: Dict of name -> (start_year, end_year), inclusive
+
+        Returns:
+            Dict of name -> average employment rate (None if no rows)
+        """
+        queryset = self.find_by_department_and_year(
+            department,
+            min(start_year for start_year, _ in windows.values()),
+            max(end_year for _, end_year in windows.values())
+        ).order_by()
+        return queryset.aggregate(**{
+            name: Avg(
+                'employment_rate',
+                filter=Q(evaluation_year__gte=start_year, evaluation_year__lte=end_year)
+            )
+            for name, (start_year, end_year) in windows.items()
+        })
+
     def find_by_year(self, year: int):
         """
         Get KPI data for a specific year.
@@ -398,12 +1030,36 @@ class KPIRepository:
         """
         return DepartmentKPI.objects.all()
 
-    def get_all_departments(self) -> list[str]:
+    def get_all_departments(self) -> frozenset[str]:
         """
-        Get list of all unique departments (for dropdown population).
+        Get all unique departments (for validation and dropdown population).
 
         Returns:
-            List of distinct department names
+            frozenset of department names, cached until the next ingestion
         """
-        departments = DepartmentKPI.objects.values_list('department', flat=True).distinct()
-        return list(departments)
+        return get_department_catalog().get(DATASET_KPI, self._load_departments)
+
+    def _load_departments(self) -> list[str]:
+        from_cube = get_analytics_cube().departments(DATASET_KPI)
+        if from_cube is not None:
+            return from_cube
+
+        return list(DepartmentKPI.objects.values_list('department', flat=True).distinct())
+
+
+def get_department_options() -> list[str]:
+    """
+    Departments present in any dataset, for the dashboard filter dropdown.
+
+    Returns:
+        Sorted department names (union over all four datasets)
+    """
+    departments = set()
+    for repository in (
+        ResearchFundingRepository(),
+        StudentRepository(),
+        PublicationRepository(),
+        KPIRepository(),
+    ):
+        departments |= repository.get_all_departments()
+    return sorted(departments)
@@ -0,0 +1,383 @@
+"""
+Dataset-versioned cache for dashboard responses.
+
+Entries are keyed by endpoint, canonical filter parameters and the current
+version of the dataset the endpoint reads. Ingestion bumps the version in
+the same transaction as the data, so an entry can never be served after
+the data it was computed from has been replaced: the next request simply
+computes a new key. Old-version entries age out of the cache backend.
+
+Storage goes through the shared cache (per-dataset namespaces), so with a
+file or database backend every worker serves what any worker computed.
+
+Misses are single-flight: concurrent identical requests in one process wait
+for the thread computing the entry, and other processes wait on a lock key
+in the shared cache and poll for the result. Waiters give up after
+DASHBOARD_CACHE_COALESCE_TIMEOUT and compute the result themselves.
+
+Next to the service results the cache keeps the final response bodies
+(RenderedResponse: JSON bytes, optionally pre-gzipped), so a warm request
+is answered without serializing or rendering anything.
+"""
+
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from data_ingestion.infrastructure.dataset_versions import get_dataset_version
+from data_ingestion.infrastructure.query_cache import known_dataset_version
+from data_ingestion.infrastructure.shared_cache import (
+    DEFAULT_CACHE_ALIAS,
+    DatasetNamespace,
+    SharedCache,
+    namespace_prefix,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TIMEOUT = 24 * 60 * 60  # 1 day; versioned keys never go stale
+DEFAULT_COALESCE_TIMEOUT = 10.0  # Seconds a waiter waits before computing itself
+COALESCE_POLL_SECONDS = 0.05  # Poll interval while another process computes
+GZIP_MIN_BYTES = 1024  # Smaller bodies are not worth compressing
+DATE_ANCHOR_PARAM = 'as_of'  # Cache-only param: local date of time-relative filters
+
+_MISSING = object()
+
+
+def canonical_params_digest(params: Dict[str, Any]) -> str:
+    """
+    Digest of filter parameters, independent of ordering and value types.
+
+    Params are canonicalized (sorted keys, str values) so equivalent
+    query strings share cache entries and ETags.
+    """
+    canonical = json.dumps(
+        {key: str(value) for key, value in params.items()},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def make_etag(endpoint: str, version: int, params: Dict[str, Any]) -> str:
+    """
+    Strong ETag for a dashboard response.
+
+    The response body is fully determined by endpoint, filters and the
+    dataset version (plus the date anchor of time-relative filters, see
+    with_date_anchor()), so the tag can be computed without building the body.
+    """
+    return f'"{endpoint}-v{version}-{canonical_params_digest(params)[:16]}"'
+
+
+def with_date_anchor(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Params plus today's local (TIME_ZONE) date under DATE_ANCHOR_PARAM.
+
+    For filters relative to today (rolling periods, year-to-date windows):
+    the dataset version does not change when the date does, so the date
+    has to be part of the cache key and ETag.
+    """
+    return {**params, DATE_ANCHOR_PARAM: timezone.localdate().isoformat()}
+
+
+@dataclass(frozen=True)
+class RenderedResponse:
+    """Final body of a successful dashboard response, ready to write."""
+    body: bytes
+    gzipped: Optional[bytes] = None  # Same body, gzip-compressed (if worthwhile)
+    content_type: str = 'application/json'
+
+    @classmethod
+    def from_body(cls, body: bytes, content_type: str = 'application/json') -> 'RenderedResponse':
+        """Wrap a rendered body, pre-compressing it if DASHBOARD_CACHE_PRECOMPRESS is on."""
+        gzipped = None
+        if getattr(settings, 'DASHBOARD_CACHE_PRECOMPRESS', True) and len(body) >= GZIP_MIN_BYTES:
+            compressed = gzip.compress(body, compresslevel=6, mtime=0)
+            if len(compressed) < len(body):
+                gzipped = compressed
+        return cls(body=body, gzipped=gzipped, content_type=content_type)
+
+
+@dataclass
+class _Flight:
+    """An in-progress computation that identical requests can wait for."""
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = _MISSING
+
+
+class DashboardResponseCache:
+    """
+    Read-through cache for dashboard service results.
+
+    Entries are shared across workers when the backend is; hit/miss
+    counters are per process (each gunicorn worker keeps its own).
+    """
+
+    def __init__(self, cache_alias: str = DEFAULT_CACHE_ALIAS):
+        self.shared_cache = SharedCache(cache_alias)
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._coalescing: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}  # Full cache key -> in-progress computation
+        self._flights_lock = threading.Lock()
+
+    @staticmethod
+    def entry_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """Key of one endpoint/filter combination within a dataset namespace."""
+        return f'{endpoint}:{canonical_params_digest(params)}'
+
+    @classmethod
+    def make_key(cls, endpoint: str, dataset: str, version: int, params: Dict[str, Any]) -> str:
+        """Build the full cache key for one endpoint/filter/version combination."""
+        return f'{namespace_prefix(dataset, version)}:{cls.entry_key(endpoint, params)}'
+
+    def get_rendered(
+        self,
+        endpoint: str,
+        dataset: str,
+        params: Dict[str, Any],
+        version: Optional[int]
+    ) -> Optional[RenderedResponse]:
+        """
+        Return the cached response body for the request (counted as a hit).
+
+        Args:
+            version: Dataset version read by the caller; None (lookup failed)
+                     or a disabled cache always misses
+
+        Returns:
+            RenderedResponse, or None on a miss
+        """
+        if version is None or not getattr(settings, 'DASHBOARD_CACHE_ENABLED', True):
+            return None
+
+        namespace = self.shared_cache.namespace(dataset, version)
+        rendered = namespace.get(f'rendered:{self.entry_key(endpoint, params)}')
+        if rendered is not None:
+            self._record(endpoint, hit=True)
+        return rendered
+
+    def set_rendered(
+        self,
+        endpoint: str,
+        dataset: str,
+        params: Dict[str, Any],
+        version: Optional[int],
+        rendered: RenderedResponse
+    ) -> None:
+        """Store the response body for the request (no-op without a version)."""
+        if version is None or not getattr(settings, 'DASHBOARD_CACHE_ENABLED', True):
+            return
+
+        namespace = self.shared_cache.namespace(dataset, version)
+        timeout = getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT)
+        namespace.set(f'rendered:{self.entry_key(endpoint, params)}', rendered, timeout)
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        dataset: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Any],
+        version: Optional[int] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Return the cached result for the request, computing it on a miss.
+
+        The dataset version is read before computing, so a result computed
+        while an upload commits is stored under the old version at worst.
+        compute() runs with that version as the known version of the dataset,
+        so its cached aggregates (query_cache) do not look it up again.
+        Exceptions from compute() propagate and are never cached. If the
+        version lookup itself fails the cache is bypassed.
+
+        Args:
+            endpoint: Endpoint name (e.g. 'students')
+            dataset: Dataset the endpoint reads
+            params: Validated filter parameters (after defaults)
+            compute: Zero-argument callable producing the result
+            version: Dataset version already read by the caller (optional)
+
+        Returns:
+            (result, hit) tuple
+        """
+        if not getattr(settings, 'DASHBOARD_CACHE_ENABLED', True):
+            return compute(), False
+
+        if version is None:
+            try:
+                version = get_dataset_version(dataset)
+            except Exception as e:
+                logger.warning(f"Dataset version lookup failed, bypassing cache: {e}")
+                return compute(), False
+
+        namespace = self.shared_cache.namespace(dataset, version)
+        key = self.entry_key(endpoint, params)
+        cached = namespace.get(key, _MISSING)
+        if cached is not _MISSING:
+            self._record(endpoint, hit=True)
+            return cached, True
+
+        def compute_at_version():
+            # Cached aggregates inside reuse this version instead of reading it again
+            with known_dataset_version(dataset, version):
+                return compute()
+
+        return self._compute_single_flight(endpoint, namespace, key, compute_at_version)
+
+    def _compute_single_flight(
+        self,
+        endpoint: str,
+        namespace: DatasetNamespace,
+        key: str,
+        compute: Callable[[], Any]
+    ) -> Tuple[Any, bool]:
+        """
+        Compute a missing entry once for all concurrent identical requests.
+
+        A request served from another request's computation counts as a hit
+        and as 'coalesced'; a waiter that times out computes the result itself
+        and counts as a miss and a 'timeout'.
+        """
+        coalesce_timeout = getattr(settings, 'DASHBOARD_CACHE_COALESCE_TIMEOUT', DEFAULT_COALESCE_TIMEOUT)
+        flight_key = namespace.make_key(key)
+
+        with self._flights_lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+
+        if not leader:
+            # Another thread of this process is computing (or waiting on a peer)
+            finished = flight.done.wait(coalesce_timeout)
+            if finished and flight.result is not _MISSING:
+                return self._coalesced(endpoint, flight.result)
+            # Timed out, or the computation failed: compute independently
+            return self._compute_and_store(endpoint, namespace, key, compute, timed_out=not finished)
+
+        lock_key = f'{key}:lock'
+        locked = False
+        try:
+            locked = namespace.add(lock_key, True, coalesce_timeout)
+            if locked:
+                # A peer may have stored the entry and released its lock
+                # between our miss and the add()
+                result = namespace.get(key, _MISSING)
+            else:
+                # Another process holds the lock; poll for its result
+                result = self._wait_for_peer(namespace, key, coalesce_timeout)
+            if result is not _MISSING:
+                flight.result = result
+                return self._coalesced(endpoint, result)
+
+            result, hit = self._compute_and_store(endpoint, namespace, key, compute, timed_out=not locked)
+            flight.result = result
+            return result, hit
+        finally:
+            if locked:
+                namespace.delete(lock_key)
+            with self._flights_lock:
+                self._flights.pop(flight_key, None)
+            flight.done.set()
+
+    @staticmethod
+    def _wait_for_peer(namespace: DatasetNamespace, key: str, timeout: float) -> Any:
+        """Poll the shared cache until another process stores the entry."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(COALESCE_POLL_SECONDS)
+            result = namespace.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+        return _MISSING
+
+    def _compute_and_store(
+        self,
+        endpoint: str,
+        namespace: DatasetNamespace,
+        key: str,
+        compute: Callable[[], Any],
+        timed_out: bool = False
+    ) -> Tuple[Any, bool]:
+        if timed_out:
+            self._record_coalescing(endpoint, 'timeouts')
+        result = compute()
+        timeout = getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT)
+        namespace.set(key, result, timeout)
+        self._record(endpoint, hit=False)
+        return result, False
+
+    def _coalesced(self, endpoint: str, result: Any) -> Tuple[Any, bool]:
+        self._record(endpoint, hit=True)
+        self._record_coalescing(endpoint, 'coalesced')
+        return result, True
+
+    def _record(self, endpoint: str, hit: bool) -> None:
+        with self._stats_lock:
+            counters = self._stats.setdefault(endpoint, {'hits': 0, 'misses': 0})
+            counters['hits' if hit else 'misses'] += 1
+
+    def _record_coalescing(self, endpoint: str, outcome: str) -> None:
+        with self._stats_lock:
+            counters = self._coalescing.setdefault(endpoint, {'coalesced': 0, 'timeouts': 0})
+            counters[outcome] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss statistics per endpoint and in total.
+
+        Coalesced requests (served by a concurrent identical request's
+        computation) are counted as hits and reported again under
+        'coalescing', together with waits that timed out.
+
+        Returns:
+            {'endpoints': {name: {'hits', 'misses', 'hit_rate'}}, 'total': {...},
+             'coalescing': {name: {'coalesced', 'timeouts'}}}
+        """
+        with self._stats_lock:
+            snapshot = {endpoint: dict(counters) for endpoint, counters in self._stats.items()}
+            coalescing = {endpoint: dict(counters) for endpoint, counters in self._coalescing.items()}
+
+        def with_rate(counters):
+            lookups = counters['hits'] + counters['misses']
+            rate = round(counters['hits'] / lookups, 3) if lookups else 0.0
+            return {**counters, 'hit_rate': rate}
+
+        total = {
+            'hits': sum(c['hits'] for c in snapshot.values()),
+            'misses': sum(c['misses'] for c in snapshot.values()),
+        }
+        return {
+            'endpoints': {endpoint: with_rate(c) for endpoint, c in snapshot.items()},
+            'total': with_rate(total),
+            'coalescing': coalescing,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics (for testing purposes)."""
+        self.shared_cache.clear()
+        with self._stats_lock:
+            self._stats.clear()
+            self._coalescing.clear()
+
+
+# Global singleton instance
+_response_cache_instance = None
+
+
+def get_response_cache() -> DashboardResponseCache:
+    """Get the global dashboard response cache instance."""
+    global _response_cache_instance
+    if _response_cache_instance is None:
+        _response_cache_instance = DashboardResponseCache()
+    return _response_cache_instance
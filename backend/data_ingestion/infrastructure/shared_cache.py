@@ -0,0 +1,209 @@
+"""
+Shared cache for dashboard data, partitioned into per-dataset namespaces.
+
+The Django cache alias behind it is selected with DASHBOARD_CACHE_BACKEND
+(see settings.CACHES):
+- locmem:   per worker process (development, tests)
+- file:     one directory shared by every worker process on the host,
+            no external service required
+- database: a table in the application database, shared by every node
+            (created by `python manage.py createcachetable`)
+
+A namespace is bound to a dataset and its current version, so replacing a
+dataset moves every reader to fresh keys on all workers at once; entries of
+older versions are never read again and age out via the cache timeout.
+
+Backend failures (full disk, missing cache table) are logged and treated as
+misses so a broken shared cache degrades to computing every response.
+
+add() is atomic across processes, so it can serve as a cross-worker lock:
+Django's file and database backends check and write in two steps, so for
+those the entry is created with an exclusive primitive instead (see
+SharedCache.add).
+"""
+
+import base64
+import logging
+import os
+import pickle
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.db import connections, router
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_ALIAS = 'default'
+
+
+def namespace_prefix(dataset: str, version: int) -> str:
+    """Key prefix shared by all entries of a dataset version."""
+    return f'dashboard:{dataset}:v{version}'
+
+
+class DatasetNamespace:
+    """Cache keys of one dataset at one version."""
+
+    def __init__(self, shared_cache: 'SharedCache', dataset: str, version: int):
+        self.shared_cache = shared_cache
+        self.dataset = dataset
+        self.version = version
+        self.prefix = namespace_prefix(dataset, version)
+
+    def make_key(self, key: str) -> str:
+        """Full backend key for a key within this namespace."""
+        return f'{self.prefix}:{key}'
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or default on a miss or backend error."""
+        try:
+            return self.shared_cache.backend.get(self.make_key(key), default)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {self.prefix}: {e}")
+            return default
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Store a value; backend errors are logged and ignored."""
+        try:
+            self.shared_cache.backend.set(self.make_key(key), value, timeout)
+        except Exception as e:
+            logger.warning(f"Shared cache write failed for {self.prefix}: {e}")
+
+    def add(self, key: str, value: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Store a value only if the key is absent or expired (atomic across
+        processes, see SharedCache.add).
+
+        Returns:
+            True if stored; also True on backend errors so callers that use
+            add() as a lock proceed instead of waiting on a broken cache
+        """
+        try:
+            return self.shared_cache.add(self.make_key(key), value, timeout)
+        except Exception as e:
+            logger.warning(f"Shared cache add failed for {self.prefix}: {e}")
+            return True
+
+    def delete(self, key: str) -> None:
+        """Remove a key; backend errors are logged and ignored."""
+        try:
+            self.shared_cache.backend.delete(self.make_key(key))
+        except Exception as e:
+            logger.warning(f"Shared cache delete failed for {self.prefix}: {e}")
+
+
+class SharedCache:
+    """Entry point to the configured cache backend."""
+
+    def __init__(self, cache_alias: str = DEFAULT_CACHE_ALIAS):
+        self.cache_alias = cache_alias
+
+    @property
+    def backend(self):
+        return caches[self.cache_alias]
+
+    def namespace(self, dataset: str, version: int) -> DatasetNamespace:
+        """
+        Get the namespace for a dataset version.
+
+        Args:
+            dataset: Dataset name (e.g. 'students')
+            version: Current dataset version (see dataset_versions)
+
+        Returns:
+            DatasetNamespace scoped to that version
+        """
+        return DatasetNamespace(self, dataset, version)
+
+    def add(self, key: str, value: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Store a value only if the key is absent or expired.
+
+        Django's FileBasedCache.add() and DatabaseCache.add() run has_key()
+        (or a SELECT) before writing, so two processes can both succeed. Here:
+        - file:     the entry is written to a temp file and hard-linked into
+                    place; os.link() fails if the entry file exists
+        - database: INSERT ... ON CONFLICT DO NOTHING, then an UPDATE that
+                    only matches an expired row (PostgreSQL, SQLite)
+        Other backends (locmem, memcached, redis) already add atomically.
+
+        Returns:
+            True if this call stored the value
+        """
+        backend = self.backend
+        if isinstance(backend, FileBasedCache):
+            return _file_add(backend, key, value, timeout)
+        if isinstance(backend, DatabaseCache):
+            db = router.db_for_write(backend.cache_model_class)
+            if connections[db].vendor in ('postgresql', 'sqlite'):
+                return _database_add(backend, db, key, value, timeout)
+        return backend.add(key, value, timeout)
+
+    def clear(self) -> None:
+        """Drop every entry of every namespace (for testing purposes)."""
+        self.backend.clear()
+
+
+def _file_add(backend: FileBasedCache, key: str, value: Any, timeout: Optional[float]) -> bool:
+    fname = backend._key_to_file(key)
+    backend._createdir()
+    fd, tmp_path = tempfile.mkstemp(dir=backend._dir)
+    try:
+        with open(fd, 'wb') as f:
+            backend._write_content(f, timeout, value)
+        for _ in range(2):
+            try:
+                os.link(tmp_path, fname)
+                return True
+            except FileExistsError:
+                # has_key() deletes an expired entry file; then try once more
+                if backend.has_key(key):
+                    return False
+        return False
+    finally:
+        os.remove(tmp_path)
+
+
+def _database_add(
+    backend: DatabaseCache,
+    db: str,
+    key: str,
+    value: Any,
+    timeout: Optional[float]
+) -> bool:
+    key = backend.make_and_validate_key(key)
+    connection = connections[db]
+    quote_name = connection.ops.quote_name
+    table = quote_name(backend._table)
+
+    # Same encoding and expiry format as DatabaseCache._base_set()
+    encoded = base64.b64encode(pickle.dumps(value, backend.pickle_protocol)).decode('latin1')
+    expiry = backend.get_backend_timeout(timeout)
+    if expiry is None:
+        expires = datetime.max
+    else:
+        expires = datetime.fromtimestamp(expiry, tz=dt_timezone.utc if settings.USE_TZ else None)
+    expires = connection.ops.adapt_datetimefield_value(expires.replace(microsecond=0))
+    now = connection.ops.adapt_datetimefield_value(timezone.now().replace(microsecond=0))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} ({quote_name("cache_key")}, {quote_name("value")}, '
+            f'{quote_name("expires")}) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING',
+            [key, encoded, expires]
+        )
+        if cursor.rowcount == 1:
+            return True
+        # The row exists; take it over only if it has expired
+        cursor.execute(
+            f'UPDATE {table} SET {quote_name("value")} = %s, {quote_name("expires")} = %s '
+            f'WHERE {quote_name("cache_key")} = %s AND {quote_name("expires")} < %s',
+            [encoded, expires, key, now]
+        )
+        return cursor.rowcount == 1
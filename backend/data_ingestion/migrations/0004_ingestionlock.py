@@ -0,0 +1,26 @@
+# Generated by Django 4.2.25 on 2026-10-19 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_ingestion', '0003_alter_student_grade'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestionLock',
+            fields=[
+                ('dataset', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='데이터셋')),
+                ('job_id', models.CharField(max_length=64, verbose_name='작업ID')),
+                ('acquired_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Ingestion Lock',
+                'verbose_name_plural': 'Ingestion Locks',
+                'db_table': 'ingestion_locks',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.25 on 2026-10-19 03:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_ingestion', '0004_ingestionlock'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetVersion',
+            fields=[
+                ('dataset', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='데이터셋')),
+                ('version', models.BigIntegerField(default=0, verbose_name='버전')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='최종 적재 시각')),
+            ],
+            options={
+                'verbose_name': 'Dataset Version',
+                'verbose_name_plural': 'Dataset Versions',
+                'db_table': 'dataset_versions',
+            },
+        ),
+    ]
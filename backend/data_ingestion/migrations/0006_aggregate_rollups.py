@@ -0,0 +1,94 @@
+# Generated by Django 4.2.25 on 2026-10-19 03:26
+
+from django.db import migrations, models
+
+
+def backfill_rollups(apps, schema_editor):
+    """Build rollups for data ingested before rollup tables existed."""
+    from data_ingestion.infrastructure import rollups
+
+    DatasetVersion = apps.get_model('data_ingestion', 'DatasetVersion')
+    builders = [
+        ('research_funding', 'ResearchProject', 'ResearchFundingDailyRollup',
+         rollups.rebuild_research_funding_rollup),
+        ('students', 'Student', 'StudentCountRollup', rollups.rebuild_student_rollup),
+        ('publications', 'Publication', 'PublicationTierRollup',
+         rollups.rebuild_publication_rollup),
+    ]
+    for dataset, source_name, rollup_name, rebuild in builders:
+        source_model = apps.get_model('data_ingestion', source_name)
+        if not source_model.objects.exists():
+            continue
+        rebuild(source_model, apps.get_model('data_ingestion', rollup_name))
+        # Mark the rollup as authoritative for the repositories
+        DatasetVersion.objects.get_or_create(dataset=dataset)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_ingestion', '0005_datasetversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublicationTierRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100, verbose_name='학과')),
+                ('journal_tier', models.CharField(max_length=20, verbose_name='저널등급')),
+                ('paper_count', models.IntegerField(verbose_name='논문 수')),
+                ('if_count', models.IntegerField(verbose_name='IF 보유 논문 수')),
+                ('if_sum', models.FloatField(verbose_name='IF 합계')),
+            ],
+            options={
+                'verbose_name': 'Publication Tier Rollup',
+                'verbose_name_plural': 'Publication Tier Rollups',
+                'db_table': 'rollup_publication_tiers',
+            },
+        ),
+        migrations.CreateModel(
+            name='ResearchFundingDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100, verbose_name='소속학과')),
+                ('execution_date', models.DateField(verbose_name='집행일자')),
+                ('total_budget', models.BigIntegerField(verbose_name='총연구비 합계')),
+                ('execution_amount', models.BigIntegerField(verbose_name='집행금액 합계')),
+                ('record_count', models.IntegerField(verbose_name='집행 건수')),
+            ],
+            options={
+                'verbose_name': 'Research Funding Daily Rollup',
+                'verbose_name_plural': 'Research Funding Daily Rollups',
+                'db_table': 'rollup_research_funding_daily',
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentCountRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100, verbose_name='학과')),
+                ('program_type', models.CharField(max_length=20, verbose_name='과정구분')),
+                ('enrollment_status', models.CharField(max_length=20, verbose_name='학적상태')),
+                ('student_count', models.IntegerField(verbose_name='학생 수')),
+            ],
+            options={
+                'verbose_name': 'Student Count Rollup',
+                'verbose_name_plural': 'Student Count Rollups',
+                'db_table': 'rollup_student_counts',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='studentcountrollup',
+            constraint=models.UniqueConstraint(fields=('department', 'program_type', 'enrollment_status'), name='unique_rollup_student_group'),
+        ),
+        migrations.AddConstraint(
+            model_name='researchfundingdailyrollup',
+            constraint=models.UniqueConstraint(fields=('department', 'execution_date'), name='unique_rollup_rf_dept_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='publicationtierrollup',
+            constraint=models.UniqueConstraint(fields=('department', 'journal_tier'), name='unique_rollup_pub_dept_tier'),
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.25 on 2026-10-19 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_ingestion', '0006_aggregate_rollups'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='publicationtierrollup',
+            name='unique_rollup_pub_dept_tier',
+        ),
+        migrations.RemoveConstraint(
+            model_name='researchfundingdailyrollup',
+            name='unique_rollup_rf_dept_date',
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['department', 'journal_tier', 'impact_factor'], include=('paper_id',), name='idx_pub_dept_tier_if'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['department', 'execution_date'], include=('total_budget', 'execution_amount'), name='idx_rp_dept_date_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['enrollment_status', 'department', 'program_type'], include=('student_id',), name='idx_student_status_dept_prog'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('enrollment_status', '재학')), fields=['department', 'program_type'], include=('student_id',), name='idx_student_enrolled_dept'),
+        ),
+        migrations.AddIndex(
+            model_name='studentcountrollup',
+            index=models.Index(fields=['enrollment_status', 'department', 'program_type'], include=('student_count',), name='idx_rollup_student_status'),
+        ),
+        migrations.AddIndex(
+            model_name='studentcountrollup',
+            index=models.Index(condition=models.Q(('enrollment_status', '재학')), fields=['department', 'program_type'], include=('student_count',), name='idx_rollup_student_enrolled'),
+        ),
+        migrations.AddConstraint(
+            model_name='publicationtierrollup',
+            constraint=models.UniqueConstraint(fields=('department', 'journal_tier'), include=('paper_count', 'if_count', 'if_sum'), name='unique_rollup_pub_dept_tier'),
+        ),
+        migrations.AddConstraint(
+            model_name='researchfundingdailyrollup',
+            constraint=models.UniqueConstraint(fields=('department', 'execution_date'), include=('total_budget', 'execution_amount'), name='unique_rollup_rf_dept_date'),
+        ),
+    ]
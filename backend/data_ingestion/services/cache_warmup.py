@@ -0,0 +1,244 @@
+"""
+Cache Warm-up Service - Pre-computes dashboard responses after ingestion.
+
+Responsibility:
+- Enumerate every valid filter combination of the datasets an upload replaced
+- Compute them into the dashboard response cache, service result and
+  rendered body, with a concurrency cap
+- Report duration and coverage for the job result
+
+Cache keys must match the dashboard views exactly: WARMUP_QUERIES uses the
+same endpoint names and parameter dicts as api/views.py.
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+from data_ingestion.api.responses import render_dashboard
+from data_ingestion.infrastructure.response_cache import get_response_cache, with_date_anchor
+from data_ingestion.infrastructure.repositories import (
+    ResearchFundingRepository,
+    StudentRepository,
+    PublicationRepository,
+    KPIRepository,
+)
+from data_ingestion.infrastructure.dataset_versions import (
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+    get_dataset_version,
+)
+from data_ingestion.services.research_funding_service import ResearchFundingService
+from data_ingestion.services.student_dashboard_service import StudentDashboardService
+from data_ingestion.services.publication_service import PublicationService
+from data_ingestion.services.kpi_service import KPIService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_CONCURRENCY = 2
+WARMUP_NICENESS = 10  # Added to the warm-up threads' nice value (Linux)
+
+PERIODS = ['latest', '1year', '3years']
+STUDENT_STATUSES = ['all', '재학', '휴학', '졸업']
+JOURNAL_TIERS = ['all', 'SCIE', 'KCI', '기타']
+KPI_DEFAULT_YEARS = 5  # Matches DepartmentKPIQuerySerializer defaults
+
+WarmupTask = Tuple[str, str, Dict[str, Any], Callable[[], Any]]
+
+
+def _research_funding_tasks(departments: Iterable[str]) -> List[WarmupTask]:
+    # Rolling periods are cached under today's date (research_funding_params)
+    return [
+        (
+            'research_funding', DATASET_RESEARCH_FUNDING,
+            (
+                {'department': department, 'period': period} if period == 'latest'
+                else with_date_anchor({'department': department, 'period': period})
+            ),
+            lambda d=department, p=period: ResearchFundingService().get_dashboard_data(
+                department=d, period=p
+            )
+        )
+        for department in departments
+        for period in PERIODS
+    ]
+
+
+def _student_tasks(departments: Iterable[str]) -> List[WarmupTask]:
+    return [
+        (
+            'students', DATASET_STUDENTS,
+            {'department': department, 'status': status},
+            lambda d=department, s=status: StudentDashboardService().get_student_dashboard_data(
+                department=d, status=s
+            )
+        )
+        for department in departments
+        for status in STUDENT_STATUSES
+    ]
+
+
+def _publication_tasks(departments: Iterable[str]) -> List[WarmupTask]:
+    return [
+        (
+            'publications', DATASET_PUBLICATIONS,
+            {'department': department, 'journal_tier': tier},
+            lambda d=department, t=tier: PublicationService().get_distribution(
+                department=d, journal_tier=t
+            )
+        )
+        for department in departments
+        for tier in JOURNAL_TIERS
+    ]
+
+
+def _kpi_tasks(departments: Iterable[str]) -> List[WarmupTask]:
+    # Only the default year range is warmed; custom ranges are unbounded
+    end_year = datetime.now().year
+    start_year = end_year - KPI_DEFAULT_YEARS
+    return [
+        (
+            'department_kpi', DATASET_KPI,
+            {'department': department, 'start_year': start_year, 'end_year': end_year},
+            lambda d=department: KPIService().get_kpi_trend(
+                department=d, start_year=start_year, end_year=end_year
+            )
+        )
+        for department in departments
+    ]
+
+
+# Dataset (upload file type) -> (repository for departments, task builder)
+WARMUP_QUERIES = {
+    DATASET_RESEARCH_FUNDING: (ResearchFundingRepository, _research_funding_tasks),
+    DATASET_STUDENTS: (StudentRepository, _student_tasks),
+    DATASET_PUBLICATIONS: (PublicationRepository, _publication_tasks),
+    DATASET_KPI: (KPIRepository, _kpi_tasks),
+}
+
+
+def build_warmup_tasks(datasets: Iterable[str]) -> List[WarmupTask]:
+    """
+    Enumerate every valid filter combination of the given datasets.
+
+    Args:
+        datasets: Dataset names (upload file types)
+
+    Returns:
+        List of (endpoint, dataset, params, compute) tuples
+    """
+    tasks = []
+    for dataset in datasets:
+        if dataset not in WARMUP_QUERIES:
+            continue
+        repository_class, build_tasks = WARMUP_QUERIES[dataset]
+        departments = ['all'] + sorted(repository_class().get_all_departments())
+        tasks.extend(build_tasks(departments))
+    return tasks
+
+
+def _lower_thread_priority() -> None:
+    """
+    Best effort: lower the scheduling priority of the calling warm-up thread.
+
+    On Linux setpriority() with a thread id only affects that thread; pool
+    threads are discarded after the warm-up, so the change never leaks.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), WARMUP_NICENESS)
+    except (AttributeError, OSError):
+        pass
+
+
+def warm_dashboard_cache(
+    datasets: Iterable[str],
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Pre-compute dashboard responses for the given datasets into the cache.
+
+    Both cache layers are filled: the service result (get_or_compute) and
+    the rendered response body (set_rendered), so the first request after an
+    upload writes stored bytes without serializing anything.
+
+    Runs on a small low-priority thread pool (DASHBOARD_CACHE_WARMUP_CONCURRENCY).
+    Each thread works through the shared task queue on its own database
+    connection and closes it once, when the queue is empty.
+    A failing combination is logged and counted, never raised.
+
+    Args:
+        datasets: Dataset names whose data just changed
+        deadline: Optional time.monotonic() value after which remaining
+                  combinations are skipped
+
+    Returns:
+        dict with keys: datasets, combinations, warmed, already_cached,
+        failed, skipped, coverage (0.0-1.0), duration_seconds
+    """
+    started = time.monotonic()
+    datasets = list(datasets)
+    tasks = build_warmup_tasks(datasets)
+    cache = get_response_cache()
+    counts = {'warmed': 0, 'already_cached': 0, 'failed': 0, 'skipped': 0}
+    counts_lock = threading.Lock()
+    pending = queue.SimpleQueue()
+    for task in tasks:
+        pending.put(task)
+
+    def warm(task: WarmupTask) -> str:
+        endpoint, dataset, params, compute = task
+        version = get_dataset_version(dataset)
+        if cache.get_rendered(endpoint, dataset, params, version) is not None:
+            return 'already_cached'
+        data, _ = cache.get_or_compute(endpoint, dataset, params, compute, version=version)
+        cache.set_rendered(endpoint, dataset, params, version, render_dashboard(endpoint, data))
+        return 'warmed'
+
+    def work() -> None:
+        try:
+            while True:
+                try:
+                    task = pending.get_nowait()
+                except queue.Empty:
+                    return
+                if deadline is not None and time.monotonic() > deadline:
+                    outcome = 'skipped'
+                else:
+                    try:
+                        outcome = warm(task)
+                    except Exception as e:
+                        logger.warning(f"Cache warm-up failed for {task[0]} {task[2]}: {e}")
+                        outcome = 'failed'
+                with counts_lock:
+                    counts[outcome] += 1
+        finally:
+            connections.close_all()
+
+    concurrency = max(1, getattr(settings, 'DASHBOARD_CACHE_WARMUP_CONCURRENCY', DEFAULT_WARMUP_CONCURRENCY))
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix='cache-warmup',
+        initializer=_lower_thread_priority
+    ) as pool:
+        workers = [pool.submit(work) for _ in range(min(concurrency, len(tasks)))]
+        for worker in workers:
+            worker.result()
+
+    covered = counts['warmed'] + counts['already_cached']
+    return {
+        'datasets': datasets,
+        'combinations': len(tasks),
+        **counts,
+        'coverage': round(covered / len(tasks), 3) if tasks else 1.0,
+        'duration_seconds': round(time.monotonic() - started, 3),
+    }
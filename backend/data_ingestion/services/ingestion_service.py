@@ -6,13 +6,26 @@ Responsibility:
 - Coordinate file parsing → storage flow
 - Manage background jobs with ThreadPoolExecutor
 - Update job status and handle errors
+- Cancellation, per-job timeout and coalescing of superseded queued uploads
+- Admission control (queue depth, temp-disk quota) and wait-time estimates
+- Dataset-level mutual exclusion across worker processes (dataset_lock)
+- Dashboard cache warm-up for the datasets an upload replaced
 """
 
+import os
+import math
+import time
 import uuid
+import shutil
 import logging
+import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
 import pandas as pd
+from django.conf import settings
+from django.db import connections
 
 from data_ingestion.services.excel_parser import ExcelParser, ValidationError
 from data_ingestion.infrastructure.repositories import (
@@ -21,12 +34,22 @@ from data_ingestion.infrastructure.repositories import (
     save_publication_data,
     save_department_kpi_data
 )
-from data_ingestion.infrastructure.job_status_store import get_job_store
+from data_ingestion.infrastructure.job_status_store import get_job_store, JobStatus
+from data_ingestion.infrastructure.dataset_lock import acquire_dataset_lock
+from data_ingestion.services.cache_warmup import warm_dashboard_cache
 
 logger = logging.getLogger(__name__)
 
+# Marks the executor's worker thread (see _release_stale_connections)
+_executor_thread = threading.local()
+
+
+def _mark_executor_thread() -> None:
+    _executor_thread.active = True
+
+
 # Module-level ThreadPoolExecutor (MVP: single worker for sequential processing)
-executor = ThreadPoolExecutor(max_workers=1)
+executor = ThreadPoolExecutor(max_workers=1, initializer=_mark_executor_thread)
 
 
 FILE_TYPE_PARSERS = {
@@ -36,23 +59,105 @@ FILE_TYPE_PARSERS = {
     'kpi': (ExcelParser.parse_department_kpi, save_department_kpi_data),
 }
 
+# Defaults (overridable via settings)
+DEFAULT_JOB_TIMEOUT_SECONDS = 600
+DEFAULT_MAX_QUEUE_DEPTH = 10
+DEFAULT_TEMP_QUOTA_BYTES = 200 * 1024 * 1024  # 200MB
+
+# Wait-time estimate: assumed job duration until real durations are observed
+DEFAULT_ESTIMATED_JOB_SECONDS = 30
+THROUGHPUT_WINDOW = 20  # Number of recent job durations averaged
+
+
+class JobInterrupted(Exception):
+    """Base class for cooperative job aborts raised at checkpoints."""
+
+
+class JobCancelled(JobInterrupted):
+    """Raised at a checkpoint when cancellation was requested."""
+
+
+class JobTimedOut(JobInterrupted):
+    """Raised at a checkpoint when the job exceeded its wall-clock timeout."""
+
+
+class AdmissionRejected(Exception):
+    """Raised when the ingestion queue cannot accept another upload."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
-def submit_upload_job(files: Dict[str, str]) -> str:
+class QueueFullError(AdmissionRejected):
+    """Too many jobs are waiting for the executor."""
+
+
+class TempQuotaExceededError(AdmissionRejected):
+    """Accepting the upload would exceed the temp-disk quota."""
+
+
+@dataclass
+class _JobControl:
+    """Per-job control state shared between the request and worker threads."""
+    files: Dict[str, str]
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    started: bool = False
+    # Temp files owned by the job (only for jobs submitted with temp_dir)
+    temp_dir: Optional[str] = None
+    file_sizes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_live(self) -> bool:
+        """Queued or running (not cancelled before it started)."""
+        return self.started or not self.cancel_event.is_set()
+
+    @property
+    def temp_bytes(self) -> int:
+        return sum(self.file_sizes.get(file_type, 0) for file_type in self.files)
+
+
+# job_id -> control state for queued/running jobs (guarded by _jobs_lock)
+_jobs: Dict[str, _JobControl] = {}
+_jobs_lock = threading.Lock()
+
+# Durations (seconds) of recently finished jobs, for throughput estimates
+_recent_durations: Deque[float] = deque(maxlen=THROUGHPUT_WINDOW)
+
+
+def submit_upload_job(files: Dict[str, str], temp_dir: Optional[str] = None) -> str:
     """
     Submit file upload job to background processing queue.
 
+    Queued jobs that have not started yet are coalesced: any file type that
+    is also present in this upload is dropped from the older job, and an
+    older job left with no files is cancelled as superseded.
+
     Args:
         files: Dict of file_type -> file_path (e.g., {'research_funding': '/tmp/...csv'})
+        temp_dir: Optional temp directory holding the files. The job takes
+                  ownership: it counts toward the temp-disk quota and is
+                  removed when the job finishes.
 
     Returns:
         job_id: UUID string for status tracking
+
+    Raises:
+        QueueFullError: Queue depth limit reached
+        TempQuotaExceededError: Temp-disk quota would be exceeded
     """
     job_id = str(uuid.uuid4())
+    file_sizes = _measure_files(files) if temp_dir else {}
 
-    # Initialize job status
-    job_store = get_job_store()
-    job_info = job_store.create_job(job_id)
-    # Note: Additional job metadata would be stored in a separate structure if needed
+    with _jobs_lock:
+        _check_admission_locked(sum(file_sizes.values()))
+
+        # Initialize job status
+        job_store = get_job_store()
+        job_store.create_job(job_id)
+
+        _coalesce_superseded(job_id, files)
+        _jobs[job_id] = _JobControl(files=dict(files), temp_dir=temp_dir, file_sizes=file_sizes)
 
     # Submit to background thread
     executor.submit(process_upload, job_id, files)
@@ -61,23 +166,274 @@ def submit_upload_job(files: Dict[str, str]) -> str:
     return job_id
 
 
+def check_admission(upload_bytes: int) -> None:
+    """
+    Check whether an upload of the given size would be accepted.
+
+    Lets the view reject before writing anything to temp disk;
+    submit_upload_job repeats the check atomically.
+
+    Args:
+        upload_bytes: Total size of the files to be uploaded
+
+    Raises:
+        QueueFullError: Queue depth limit reached
+        TempQuotaExceededError: Temp-disk quota would be exceeded
+    """
+    with _jobs_lock:
+        _check_admission_locked(upload_bytes)
+
+
+def _check_admission_locked(upload_bytes: int) -> None:
+    """Admission check; must be called with _jobs_lock held."""
+    max_depth = getattr(settings, 'INGESTION_MAX_QUEUE_DEPTH', DEFAULT_MAX_QUEUE_DEPTH)
+    quota = getattr(settings, 'INGESTION_TEMP_QUOTA_BYTES', DEFAULT_TEMP_QUOTA_BYTES)
+
+    live = [control for control in _jobs.values() if control.is_live]
+    queued = sum(1 for control in live if not control.started)
+    if queued >= max_depth:
+        raise QueueFullError(
+            '업로드 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.',
+            retry_after=_retry_after_seconds()
+        )
+
+    temp_bytes = sum(control.temp_bytes for control in live)
+    if temp_bytes + upload_bytes > quota:
+        raise TempQuotaExceededError(
+            '임시 저장 공간이 부족합니다. 잠시 후 다시 시도하세요.',
+            retry_after=_retry_after_seconds()
+        )
+
+
+def _average_job_seconds() -> float:
+    """Mean duration of recent jobs (default until any job has finished)."""
+    durations = list(_recent_durations)
+    if not durations:
+        return DEFAULT_ESTIMATED_JOB_SECONDS
+    return sum(durations) / len(durations)
+
+
+def _retry_after_seconds() -> int:
+    """Expected time until the executor frees up one slot."""
+    return max(1, math.ceil(_average_job_seconds()))
+
+
+def estimate_completion_seconds(job_id: str) -> int:
+    """
+    Estimate seconds until job_id completes, from recent throughput.
+
+    Counts the live jobs submitted before it (the executor runs them in
+    order) plus the job itself, times the average recent job duration.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Estimated seconds (at least 1)
+    """
+    with _jobs_lock:
+        position = 0
+        for other_id, control in _jobs.items():
+            if other_id == job_id:
+                break
+            if control.is_live:
+                position += 1
+
+    return max(1, math.ceil((position + 1) * _average_job_seconds()))
+
+
+def _measure_files(files: Dict[str, str]) -> Dict[str, int]:
+    """Return file_type -> size on disk (0 if missing)."""
+    sizes = {}
+    for file_type, file_path in files.items():
+        try:
+            sizes[file_type] = os.path.getsize(file_path)
+        except OSError:
+            sizes[file_type] = 0
+    return sizes
+
+
+def _release_temp_files(control: _JobControl) -> None:
+    """Delete the temp directory owned by a job (no-op for unowned files)."""
+    if control.temp_dir:
+        shutil.rmtree(control.temp_dir, ignore_errors=True)
+        control.file_sizes.clear()
+
+
+def _discard_temp_file(control: _JobControl, file_type: str, file_path: str) -> None:
+    """Delete one superseded temp file owned by a job."""
+    if control.temp_dir:
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+        control.file_sizes.pop(file_type, None)
+
+
+def cancel_upload_job(job_id: str) -> bool:
+    """
+    Request cancellation of a queued or running job.
+
+    Queued jobs are marked cancelled immediately. Running jobs stop at the
+    next checkpoint (between files and between insert batches); the file
+    being saved at that moment is rolled back.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        True if cancellation was requested, False if the job is not
+        queued or running (unknown or already finished)
+    """
+    with _jobs_lock:
+        control = _jobs.get(job_id)
+        if control is None or control.cancel_event.is_set():
+            return False
+
+        # The entry stays registered until the worker picks the job up,
+        # so process_upload sees the cancel flag and skips it
+        control.cancel_event.set()
+        if not control.started:
+            _release_temp_files(control)
+            get_job_store().update_status(job_id, JobStatus.CANCELLED, '사용자 요청으로 취소되었습니다.')
+
+    logger.info(f"Cancellation requested for job {job_id}")
+    return True
+
+
+def _coalesce_superseded(new_job_id: str, files: Dict[str, str]) -> None:
+    """
+    Drop file types re-uploaded in new_job_id from older queued jobs.
+
+    Must be called with _jobs_lock held.
+    """
+    for old_job_id, control in _jobs.items():
+        if control.started or control.cancel_event.is_set():
+            continue
+
+        superseded = [file_type for file_type in files if file_type in control.files]
+        for file_type in superseded:
+            _discard_temp_file(control, file_type, control.files.pop(file_type))
+            logger.info(f"Job {old_job_id}: {file_type} superseded by job {new_job_id}")
+
+        if superseded and not control.files:
+            control.cancel_event.set()
+            _release_temp_files(control)
+            get_job_store().update_status(
+                old_job_id,
+                JobStatus.CANCELLED,
+                f'최신 업로드(작업 {new_job_id})로 대체되었습니다.'
+            )
+
+
+def _start_job(job_id: str, files: Dict[str, str]) -> Optional[_JobControl]:
+    """
+    Mark a job as started and return its control state.
+
+    Returns None if the job was cancelled or superseded while queued; its
+    entry is unregistered here, as process_upload() returns without
+    reaching its cleanup. Jobs not registered via submit_upload_job (direct
+    calls) get a fresh control state for the given files.
+    """
+    with _jobs_lock:
+        control = _jobs.get(job_id)
+        if control is None:
+            control = _JobControl(files=dict(files))
+            _jobs[job_id] = control
+        if control.cancel_event.is_set():
+            # Temp files were released when the job was cancelled
+            _jobs.pop(job_id, None)
+            return None
+        control.started = True
+        return control
+
+
+def _make_checkpoint(control: _JobControl, deadline: float):
+    """Build the cancellation/timeout check run between files and batches."""
+    def checkpoint() -> None:
+        if control.cancel_event.is_set():
+            raise JobCancelled('사용자 요청으로 취소되었습니다.')
+        if time.monotonic() > deadline:
+            raise JobTimedOut('처리 시간이 초과되었습니다.')
+    return checkpoint
+
+
+def _warm_caches(job_id: str, file_results: List[dict], deadline: float) -> None:
+    """
+    Pre-compute dashboard responses for the datasets this job replaced.
+
+    Runs before the final status is published so that a client reacting to
+    'completed' hits a warm cache. Warm-up problems never fail the job.
+    """
+    datasets = [f['file_type'] for f in file_results if f['status'] == 'completed']
+    if not datasets or not getattr(settings, 'DASHBOARD_CACHE_ENABLED', True):
+        return
+
+    try:
+        report = warm_dashboard_cache(datasets, deadline=deadline)
+    except Exception as e:
+        logger.exception(f"Cache warm-up failed for job {job_id}: {e}")
+        return
+
+    logger.info(
+        f"Job {job_id} warmed {report['warmed']}/{report['combinations']} "
+        f"dashboard responses in {report['duration_seconds']}s"
+    )
+    get_job_store().set_result(job_id, cache_warmup=report)
+
+
+def _release_stale_connections() -> None:
+    """
+    Close this thread's database connections that are broken or past
+    CONN_MAX_AGE, as Django does around every request.
+
+    The executor thread outlives its jobs; without this, a connection the
+    server dropped while idle would fail the next job. Other threads are left
+    alone: request threads get the same handling from Django's request
+    signals, and synchronous callers (tests) manage their own connections.
+    """
+    if not getattr(_executor_thread, 'active', False):
+        return
+    for connection in connections.all(initialized_only=True):
+        if not connection.in_atomic_block:
+            connection.close_if_unusable_or_obsolete()
+
+
 def process_upload(job_id: str, files: Dict[str, str]) -> None:
     """
     Process uploaded files in background thread.
 
     Following spec.md Section 3.5: File-level independent transactions for partial success.
+    Cancellation and the per-job timeout are checked between files and between
+    insert batches; files committed before the abort are kept.
 
     Args:
         job_id: Job UUID for status updates
         files: Dict of file_type -> file_path
     """
+    job_store = get_job_store()
+    _release_stale_connections()
+
+    control = _start_job(job_id, files)
+    if control is None:
+        logger.info(f"Job {job_id} was cancelled before it started")
+        return
+
+    timeout = getattr(settings, 'INGESTION_JOB_TIMEOUT_SECONDS', DEFAULT_JOB_TIMEOUT_SECONDS)
+    started_at = time.monotonic()
+    checkpoint = _make_checkpoint(control, started_at + timeout)
+    completed_count = 0
+
     try:
+        files = control.files
         total_files = len(files)
-        completed_count = 0
         file_results = []
 
+        job_store.update_status(job_id, JobStatus.PROCESSING)
+
         for file_type, file_path in files.items():
             try:
+                checkpoint()
                 logger.info(f"Processing {file_type} from {file_path}")
 
                 # Get parser and repository functions
@@ -89,9 +445,19 @@ def process_upload(job_id: str, files: Dict[str, str]) -> None:
                 # Parse CSV/Excel file
                 df = pd.read_csv(file_path, encoding='utf-8')
                 validated_df = parser_func(df)
+                checkpoint()
 
-                # Save to database (independent transaction per file)
-                result = repo_func(validated_df, replace=True)
+                # Save to database (independent transaction per file), holding
+                # the cross-process lock so only one job replaces this dataset
+                with acquire_dataset_lock(
+                    file_type,
+                    job_id,
+                    on_wait=lambda holder: job_store.mark_waiting(job_id, holder),
+                    checkpoint=checkpoint
+                ) as waited:
+                    if waited:
+                        job_store.update_status(job_id, JobStatus.PROCESSING)
+                    result = repo_func(validated_df, replace=True, checkpoint=checkpoint)
 
                 # Update file status
                 file_results.append({
@@ -104,6 +470,8 @@ def process_upload(job_id: str, files: Dict[str, str]) -> None:
 
                 completed_count += 1
 
+            except JobInterrupted:
+                raise
             except ValidationError as e:
                 logger.error(f"Validation error for {file_type}: {e}")
                 file_results.append({
@@ -131,17 +499,31 @@ def process_upload(job_id: str, files: Dict[str, str]) -> None:
         else:
             job_status = 'partial_success'
 
+        job_store.set_result(job_id, files=file_results)
+        _warm_caches(job_id, file_results, deadline=started_at + timeout)
+
         # Update final job status
-        job_store = get_job_store()
-        from data_ingestion.infrastructure.job_status_store import JobStatus
         status_enum = JobStatus.COMPLETED if job_status == 'completed' else JobStatus.FAILED
         job_store.update_status(job_id, status_enum)
         job_store.update_progress(job_id, 100, 100)
 
         logger.info(f"Job {job_id} finished with status: {job_status}")
 
+    except JobCancelled as e:
+        logger.info(f"Job {job_id} cancelled after {completed_count} file(s)")
+        job_store.update_status(job_id, JobStatus.CANCELLED, str(e))
+
+    except JobTimedOut as e:
+        logger.error(f"Job {job_id} timed out after {timeout}s ({completed_count} file(s) saved)")
+        job_store.update_status(job_id, JobStatus.FAILED, str(e))
+
     except Exception as e:
         logger.exception(f"Critical error in job {job_id}: {e}")
-        job_store = get_job_store()
-        from data_ingestion.infrastructure.job_status_store import JobStatus
         job_store.update_status(job_id, JobStatus.FAILED, str(e))
+
+    finally:
+        _recent_durations.append(time.monotonic() - started_at)
+        _release_temp_files(control)
+        with _jobs_lock:
+            _jobs.pop(job_id, None)
+        _release_stale_connections()
@@ -5,8 +5,8 @@ Following plan.md Phase 3.3 - Service Layer (Business Logic).
 
 from datetime import datetime
 from typing import Dict, List, Any
-from django.db.models import Avg, Sum
 from data_ingestion.infrastructure.repositories import KPIRepository
+from data_ingestion.services.period_comparison import metric_change, previous_year_window
 
 
 class KPIService:
@@ -27,7 +27,8 @@ class KPIService:
         self,
         department: str,
         start_year: int,
-        end_year: int
+        end_year: int,
+        compare_to: str | None = None
     ) -> Dict[str, Any]:
         """
         Get department KPI trend data with aggregation.
@@ -36,9 +37,13 @@ class KPIService:
             department: Department filter ('all' or specific department name)
             start_year: Start year (inclusive)
             end_year: End year (inclusive)
+            compare_to: Optional 'previous_period' or 'previous_year'; adds the
+                        average employment rate of the year range against the
+                        comparison range (one conditional-aggregation query)
 
         Returns:
-            Dictionary with 'status', 'data', and 'meta' keys
+            Dictionary with 'status', 'data', and 'meta' keys, plus
+            'comparison' with compare_to
 
         Raises:
             ValueError: If year range validation fails
@@ -46,28 +51,22 @@ class KPIService:
         # 1. Validate year range (business rules)
         self._validate_year_range(start_year, end_year)
 
-        # 2. Fetch data from repository
-        queryset = self.repository.find_by_department_and_year(
+        # 2. Per-year summary from the repository (cube or one grouped query)
+        summary = self.repository.get_yearly_summary(
             department=department,
             start_year=start_year,
             end_year=end_year
         )
 
-        # 3. Aggregate by year
-        trend_data = queryset.values('evaluation_year').annotate(
-            avg_employment_rate=Avg('employment_rate'),
-            total_tech_income=Sum('tech_transfer_revenue')
-        ).order_by('evaluation_year')
-
-        # 4. Calculate overall average employment rate
-        overall_avg = queryset.aggregate(avg=Avg('employment_rate'))['avg']
+        trend_data = summary['data']
+        overall_avg = summary['overall_avg_employment_rate']
 
         # Round to one decimal place if not None
         if overall_avg is not None:
             overall_avg = round(overall_avg, 1)
 
-        # 5. Format response
-        return {
+        # 3. Format response
+        result = {
             'status': 'success',
             'data': list(trend_data),
             'meta': {
@@ -78,6 +77,74 @@ class KPIService:
             }
         }
 
+        if compare_to:
+            previous_start, previous_end = previous_year_window(start_year, end_year, compare_to)
+            rates = self.repository.get_employment_rate_by_window(
+                department,
+                {'current': (start_year, end_year), 'previous': (previous_start, previous_end)}
+            )
+            result['comparison'] = {
+                'compare_to': compare_to,
+                'current': {'start_year': start_year, 'end_year': end_year},
+                'previous': {'start_year': previous_start, 'end_year': previous_end},
+                'metrics': {
+                    'employment_rate': metric_change(rates['current'], rates['previous'], digits=1),
+                },
+            }
+
+        return result
+
+    def get_kpi_comparison(
+        self,
+        departments: List[str],
+        start_year: int,
+        end_year: int
+    ) -> Dict[str, Any]:
+        """
+        Get KPI trends of several departments side by side.
+
+        All series come from one query grouped by department and year.
+
+        Args:
+            departments: Department names
+            start_year: Start year (inclusive)
+            end_year: End year (inclusive)
+
+        Returns:
+            Dictionary with 'status', 'data' (one entry per department with
+            'department', 'trend' and 'overall_avg_employment_rate') and 'meta'
+
+        Raises:
+            ValueError: If year range validation fails
+        """
+        self._validate_year_range(start_year, end_year)
+
+        summaries = self.repository.get_yearly_summary_by_department(
+            departments=departments,
+            start_year=start_year,
+            end_year=end_year
+        )
+
+        series = []
+        for department in departments:
+            summary = summaries[department]
+            overall_avg = summary['overall_avg_employment_rate']
+            series.append({
+                'department': department,
+                'trend': summary['data'],
+                'overall_avg_employment_rate': round(overall_avg, 1) if overall_avg is not None else None,
+            })
+
+        return {
+            'status': 'success',
+            'data': series,
+            'meta': {
+                'departments': departments,
+                'year_range': f'{start_year}-{end_year}',
+                'total_count': sum(len(item['trend']) for item in series)
+            }
+        }
+
     def _validate_year_range(self, start_year: int, end_year: int) -> None:
         """
         Validate year range according to business rules.
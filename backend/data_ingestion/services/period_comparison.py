@@ -0,0 +1,92 @@
+"""
+Period-over-period comparison helpers shared by the dashboard services.
+
+compare_to options:
+- previous_period: the window of the same length right before the current one
+- previous_year: the current window shifted back one year
+
+The services read both windows in one query (conditional aggregation,
+FILTER (WHERE ...) per window) and report the change with metric_change().
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+COMPARE_TO_CHOICES = ['previous_period', 'previous_year']
+
+
+def _one_year_earlier(day: date) -> date:
+    # 29 February maps to 28 February
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:
+        return day.replace(year=day.year - 1, day=28)
+
+
+def previous_date_window(start: date, end: date, compare_to: str) -> Tuple[date, date]:
+    """
+    Comparison window of a date range (both ends inclusive).
+
+    Args:
+        start: First day of the current window
+        end: Last day of the current window
+        compare_to: One of COMPARE_TO_CHOICES
+
+    Returns:
+        (start, end) of the comparison window
+    """
+    if compare_to == 'previous_year':
+        return _one_year_earlier(start), _one_year_earlier(end)
+    previous_end = start - timedelta(days=1)
+    return previous_end - (end - start), previous_end
+
+
+def previous_year_window(start_year: int, end_year: int, compare_to: str) -> Tuple[int, int]:
+    """
+    Comparison window of a year range (both ends inclusive).
+
+    Args:
+        start_year: First year of the current window
+        end_year: Last year of the current window
+        compare_to: One of COMPARE_TO_CHOICES
+
+    Returns:
+        (start_year, end_year) of the comparison window
+    """
+    shift = 1 if compare_to == 'previous_year' else end_year - start_year + 1
+    return start_year - shift, end_year - shift
+
+
+def metric_change(
+    current: Optional[float],
+    previous: Optional[float],
+    digits: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Current and previous value of a metric with their difference.
+
+    Args:
+        current: Value in the current window (None = no data)
+        previous: Value in the comparison window (None = no data)
+        digits: Round values and delta to this many decimals (None = as is)
+
+    Returns:
+        {'current', 'previous', 'delta', 'change_pct'} - delta is None if
+        either value is missing, change_pct (rounded to 0.1%) also if the
+        previous value is 0
+    """
+    delta = current - previous if current is not None and previous is not None else None
+    change_pct = round(delta / abs(previous) * 100, 1) if delta is not None and previous else None
+
+    if digits is not None:
+        current, previous, delta = (
+            round(value, digits) if value is not None else None
+            for value in (current, previous, delta)
+        )
+
+    return {
+        'current': current,
+        'previous': previous,
+        'delta': delta,
+        'change_pct': change_pct,
+    }
@@ -4,7 +4,6 @@ Following plan.md Phase 1.2 - Orchestrates repository calls and data aggregation
 """
 
 from typing import Dict, Any
-from django.db.models import Count, Avg, Q
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from data_ingestion.infrastructure.repositories import PublicationRepository
@@ -58,18 +57,16 @@ class PublicationService:
         # Step 1: Validate input parameters
         self._validate_inputs(department, journal_tier)
 
-        # Step 2: Fetch filtered data from repository
-        queryset = self.repository.get_publications_by_filter(
+        # Step 2: Per-tier summary (cube, rollup or one grouped query)
+        tier_summary = self.repository.get_tier_summary(
             department=department,
             journal_tier=journal_tier
         )
 
-        # Step 3: Aggregate data by journal tier
-        distribution = self._aggregate_by_tier(queryset)
-
-        # Step 4: Calculate overall statistics
-        total_papers = queryset.count()
-        avg_if, papers_with_if = self._calculate_avg_impact_factor(queryset)
+        # Steps 3-4: Distribution and overall statistics from the summary
+        distribution, total_papers, avg_if, papers_with_if = (
+            self._summarize_tiers(tier_summary)
+        )
 
         # Step 5: Format response
         return {
@@ -107,72 +104,35 @@ class PublicationService:
                     f"존재하지 않는 학과입니다: {department}"
                 )
 
-    def _aggregate_by_tier(self, queryset):
+    def _summarize_tiers(self, tier_summary):
         """
-        Aggregate publications by journal tier.
+        Build distribution and overall statistics from rollup tier rows.
 
-        Following spec.md Section 7.1 - Django ORM aggregation.
-
-        Business Rules (BR3):
-        - Percentages rounded to 1 decimal place
-        - Sum of percentages should be 99.9~100.1% (rounding tolerance)
+        Business Rules:
+        - BR1: papers without an IF are excluded from the averages
+          (IF sums divided by the number of papers with an IF)
+        - BR3: percentages rounded to 1 decimal place
 
         Args:
-            queryset: Filtered QuerySet of Publication objects
+            tier_summary: Rows from PublicationRepository.get_tier_summary()
 
         Returns:
-            List of dicts with keys: journal_tier, count, percentage, avg_if
-        """
-        total_count = queryset.count()
-
-        # Handle empty dataset
-        if total_count == 0:
-            return []
-
-        # Aggregate by journal tier
-        aggregated = queryset.values('journal_tier').annotate(
-            count=Count('paper_id'),
-            avg_if=Avg('impact_factor', filter=Q(impact_factor__isnull=False))
-        ).order_by('-count')  # Sort by count descending
-
-        # Calculate percentages
-        result = []
-        for item in aggregated:
-            percentage = round((item['count'] / total_count) * 100, 1)
-            result.append({
-                'journal_tier': item['journal_tier'],
-                'count': item['count'],
-                'percentage': percentage,
-                'avg_if': round(item['avg_if'], 2) if item['avg_if'] is not None else None
-            })
-
-        return result
-
-    def _calculate_avg_impact_factor(self, queryset):
+            tuple: (distribution, total_papers, avg_if | None, papers_with_if)
         """
-        Calculate average Impact Factor (excluding NULL values).
-
-        Following spec.md Section 3 - Business Rule BR1:
-        - IF가 NULL인 논문은 평균 계산에서 제외
-        - papers_with_if 카운트도 반환
-
-        Args:
-            queryset: Filtered QuerySet of Publication objects
-
-        Returns:
-            tuple: (avg_if: float | None, papers_with_if: int)
-        """
-        # Filter publications with non-NULL impact factor
-        publications_with_if = queryset.filter(impact_factor__isnull=False)
-        papers_with_if = publications_with_if.count()
-
-        # Return None if no papers have IF
-        if papers_with_if == 0:
-            return None, 0
-
-        # Calculate average
-        avg_if = publications_with_if.aggregate(
-            avg=Avg('impact_factor')
-        )['avg']
-
-        return avg_if, papers_with_if
+        total_papers = sum(item['count'] for item in tier_summary)
+        papers_with_if = sum(item['if_count'] for item in tier_summary)
+        if_sum = sum(item['if_sum'] for item in tier_summary)
+
+        distribution = []
+        if total_papers > 0:
+            for item in tier_summary:
+                tier_avg = item['if_sum'] / item['if_count'] if item['if_count'] else None
+                distribution.append({
+                    'journal_tier': item['journal_tier'],
+                    'count': item['count'],
+                    'percentage': round((item['count'] / total_papers) * 100, 1),
+                    'avg_if': round(tier_avg, 2) if tier_avg is not None else None
+                })
+
+        avg_if = if_sum / papers_with_if if papers_with_if else None
+        return distribution, total_papers, avg_if, papers_with_if
@@ -3,8 +3,15 @@ Service layer for research funding business logic.
 Following plan.md Phase 2 - Orchestrates repository calls and data formatting.
 """
 
-from typing import Dict, Any
-from data_ingestion.infrastructure.repositories import ResearchFundingRepository
+from datetime import date
+from typing import Dict, Any, List, Optional
+from django.conf import settings
+from django.utils import timezone
+from data_ingestion.infrastructure.repositories import (
+    ResearchFundingRepository,
+    DEFAULT_TREND_MAX_POINTS,
+)
+from data_ingestion.services.period_comparison import metric_change, previous_date_window
 
 
 class ResearchFundingService:
@@ -26,51 +33,197 @@ class ResearchFundingService:
     def get_dashboard_data(
         self,
         department: str = 'all',
-        period: str = 'latest'
+        period: str = 'latest',
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: Optional[str] = None,
+        compare_to: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get formatted dashboard data for research funding.
 
+        The trend has at most RESEARCH_FUNDING_TREND_MAX_POINTS points; longer
+        ranges are bucketed by the next coarser granularity (see
+        ResearchFundingRepository.get_trend()).
+
         Args:
             department: Department filter ('all' or specific department name)
             period: Time period filter ('latest', '1year', '3years')
+            start: Optional first execution date (replaces period)
+            end: Optional last execution date (replaces period)
+            granularity: Trend bucket ('week', 'month', 'quarter', 'year'),
+                         default 'month'
+            compare_to: Optional 'previous_period' or 'previous_year'; adds
+                        the execution total of the selected window against
+                        the comparison window (see _compare_execution())
 
         Returns:
             Dict with keys:
                 - current_balance: int (원)
                 - current_balance_formatted: str (억원)
-                - trend: list of formatted monthly trend data
+                - granularity: str, bucket of the trend points
+                - trend: list of formatted trend data; 'month' and
+                  'month_formatted' hold the bucket's month and label
+                - comparison: only with compare_to
         """
+        max_points = getattr(settings, 'RESEARCH_FUNDING_TREND_MAX_POINTS', DEFAULT_TREND_MAX_POINTS)
+
+        comparison = None
+        if compare_to:
+            window_start = start if start or end else self.repository.period_start(period)
+            comparison = self._compare_execution(department, window_start, end, compare_to)
+
         # Fetch raw data from repository
         current_balance = self.repository.get_current_balance(department=department)
-        monthly_trend = self.repository.get_monthly_trend(
-            department=department,
-            period=period
-        )
+
+        trend = None
+        if start is None and end is None and granularity in (None, 'month'):
+            # Default view: monthly totals (shared with the balance query)
+            monthly_trend = self.repository.get_monthly_trend(
+                department=department,
+                period=period
+            )
+            if monthly_trend is None or len(monthly_trend) <= max_points:
+                granularity = 'month'
+                trend = [
+                    {**item, 'period_start': date.fromisoformat(f"{item['month']}-01")}
+                    for item in monthly_trend or []
+                ]
+
+        if trend is None:
+            if start is None:
+                # The period filter still applies to other granularities
+                start = self.repository.period_start(period)
+            bucketed = self.repository.get_trend(
+                department=department,
+                start=start,
+                end=end,
+                granularity=granularity or 'month',
+                max_points=max_points
+            )
+            granularity, trend = bucketed['granularity'], bucketed['trend']
 
         # Handle None values defensively
         if current_balance is None:
             current_balance = 0
-        if monthly_trend is None:
-            monthly_trend = []
 
         # Format data
-        return {
+        data = {
             'current_balance': current_balance,
             'current_balance_formatted': self._format_currency(current_balance),
-            'trend': [
+            'granularity': granularity,
+            'trend': self._format_trend(trend, granularity)
+        }
+        if comparison is not None:
+            data['comparison'] = comparison
+        return data
+
+    def _compare_execution(
+        self,
+        department: str,
+        start: Optional[date],
+        end: Optional[date],
+        compare_to: str
+    ) -> Dict[str, Any]:
+        """
+        Execution total of the selected window against the comparison window.
+
+        Both totals come from one conditional-aggregation query. Without a
+        lower bound ('latest' period) the window is the year to date of its
+        last day.
+
+        Returns:
+            Dict with compare_to, current / previous windows (ISO dates) and
+            metrics.execution (current, previous, delta, change_pct and the
+            formatted amounts)
+        """
+        end = end or timezone.localdate()
+        start = start or date(end.year, 1, 1)
+        previous_start, previous_end = previous_date_window(start, end, compare_to)
+
+        totals = self.repository.get_execution_totals(
+            department,
+            {'current': (start, end), 'previous': (previous_start, previous_end)}
+        )
+        execution = metric_change(totals['current'], totals['previous'])
+        for key in ('current', 'previous', 'delta'):
+            execution[f'{key}_formatted'] = self._format_currency(execution[key])
+
+        return {
+            'compare_to': compare_to,
+            'current': {'start': start.isoformat(), 'end': end.isoformat()},
+            'previous': {'start': previous_start.isoformat(), 'end': previous_end.isoformat()},
+            'metrics': {'execution': execution},
+        }
+
+    def get_comparison_data(
+        self,
+        departments: List[str],
+        period: str = 'latest',
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get formatted research funding series of several departments.
+
+        The trends come from one query grouped by department and bucket and
+        share one granularity; the balances from one query grouped by
+        department.
+
+        Args:
+            departments: Department names
+            period, start, end, granularity: As for get_dashboard_data()
+
+        Returns:
+            Dict with keys:
+                - granularity: str, bucket of the trend points
+                - series: list of dicts with department, current_balance,
+                  current_balance_formatted and trend (as in get_dashboard_data())
+        """
+        max_points = getattr(settings, 'RESEARCH_FUNDING_TREND_MAX_POINTS', DEFAULT_TREND_MAX_POINTS)
+
+        if start is None and end is None:
+            start = self.repository.period_start(period)
+
+        balances = self.repository.get_current_balances(departments)
+        bucketed = self.repository.get_trend_by_department(
+            departments=departments,
+            start=start,
+            end=end,
+            granularity=granularity or 'month',
+            max_points=max_points
+        )
+        granularity = bucketed['granularity']
+
+        return {
+            'granularity': granularity,
+            'series': [
                 {
-                    'month': item['month'],
-                    'month_formatted': self._format_month(item['month']),
-                    'balance': item['balance'],
-                    'balance_formatted': self._format_currency(item['balance']),
-                    'execution': item['execution'],
-                    'execution_formatted': self._format_currency(item['execution'])
+                    'department': department,
+                    'current_balance': balances[department],
+                    'current_balance_formatted': self._format_currency(balances[department]),
+                    'trend': self._format_trend(bucketed['series'][department], granularity)
                 }
-                for item in monthly_trend
+                for department in departments
             ]
         }
 
+    def _format_trend(self, trend: List[Dict[str, Any]], granularity: str) -> List[Dict[str, Any]]:
+        """Format repository trend points (period_start, balance, execution) for the response."""
+        return [
+            {
+                'month': item['period_start'].strftime('%Y-%m'),
+                'month_formatted': self._format_period(item['period_start'], granularity),
+                'period_start': item['period_start'].isoformat(),
+                'balance': item['balance'],
+                'balance_formatted': self._format_currency(item['balance']),
+                'execution': item['execution'],
+                'execution_formatted': self._format_currency(item['execution'])
+            }
+            for item in trend
+        ]
+
     def _format_currency(self, amount: int) -> str:
         """
         Format amount in Korean Won to 억원 (100 million won units).
@@ -96,3 +249,18 @@ class ResearchFundingService:
         """
         year, month = month_str.split('-')
         return f"{year}년 {int(month)}월"
+
+    def _format_period(self, period_start: date, granularity: str) -> str:
+        """
+        Format a trend bucket's first day in Korean.
+
+        Returns:
+            "2024년 1월 8일 주", "2024년 1월", "2024년 1분기" or "2024년"
+        """
+        if granularity == 'week':
+            return f"{period_start.year}년 {period_start.month}월 {period_start.day}일 주"
+        if granularity == 'quarter':
+            return f"{period_start.year}년 {(period_start.month - 1) // 3 + 1}분기"
+        if granularity == 'year':
+            return f"{period_start.year}년"
+        return self._format_month(period_start.strftime('%Y-%m'))
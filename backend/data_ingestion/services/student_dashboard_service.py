@@ -11,9 +11,8 @@ Responsibilities:
 Following CLAUDE.md architecture: Service layer orchestrates business logic.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict
 from django.core.exceptions import ValidationError
-from django.db.models import Q, Count, QuerySet
 from django.utils import timezone
 from data_ingestion.infrastructure.repositories import StudentRepository
 
@@ -63,19 +62,18 @@ class StudentDashboardService:
 
         Business Logic:
         1. Validate inputs (department existence, status whitelist)
-        2. Query repository with filters
-        3. Aggregate by department and program_type
+        2. Read per-department counts from the repository (one grouped query)
+        3. Total the per-department counts
         4. Return structured response
         """
         # Step 1: Input validation
         self._validate_inputs(department, status)
 
-        # Step 2: Repository query
-        students = self.repository.get_students_by_filter(department, status)
+        # Step 2: Per-department counts (cube, rollup or one grouped query)
+        by_department = self.repository.get_department_program_counts(department, status)
 
-        # Step 3: Aggregation
-        by_department = self._aggregate_by_department(students)
-        total_students = students.count()
+        # Step 3: Total across departments
+        total_students = sum(item['total'] for item in by_department)
 
         # Step 4: Response structure
         return {
@@ -111,41 +109,3 @@ class StudentDashboardService:
             valid_departments = self.repository.get_all_departments()
             if department not in valid_departments:
                 raise ValidationError(f"존재하지 않는 학과: {department}")
-
-    def _aggregate_by_department(self, queryset: QuerySet) -> List[Dict[str, Any]]:
-        """
-        Aggregate students by department and program_type.
-
-        Args:
-            queryset: QuerySet of Student objects
-
-        Returns:
-            List of dicts with structure:
-            [
-                {
-                    'department': '컴퓨터공학과',
-                    '학사': 120,
-                    '석사': 35,
-                    '박사': 12,
-                    'total': 167
-                },
-                ...
-            ]
-
-        Business Rules:
-        - Count by program_type (학사, 석사, 박사)
-        - Missing program types default to 0
-        - Sort by total students descending (spec.md Section 9 - Business Rule 4)
-
-        Implementation:
-        - Uses Django ORM annotate with conditional aggregation
-        - Single database query for efficiency
-        """
-        aggregated = queryset.values('department').annotate(
-            학사=Count('student_id', filter=Q(program_type='학사')),
-            석사=Count('student_id', filter=Q(program_type='석사')),
-            박사=Count('student_id', filter=Q(program_type='박사')),
-            total=Count('student_id')
-        ).order_by('-total')  # Business Rule 4: Descending order by student count
-
-        return list(aggregated)
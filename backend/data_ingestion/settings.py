@@ -4,7 +4,9 @@ Minimal configuration for MVP with testing support.
 """
 
 import os
+import tempfile
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -69,17 +71,49 @@ print(f"[CORS] Final allowed origins: {CORS_ALLOWED_ORIGINS}")
 ROOT_URLCONF = 'data_ingestion.urls'
 
 # Database - PostgreSQL via Supabase
+# Persistent connections: each thread keeps its connection for DB_CONN_MAX_AGE
+# seconds (0 = reconnect per request) and pings it before reusing it
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', '60'))
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'True') == 'True'
+# In-process connection pool shared by request, ingestion and warm-up threads;
+# connections go back to the pool after every request (CONN_MAX_AGE 0)
+DB_POOL_ENABLED = os.environ.get('DB_POOL_ENABLED', 'False') == 'True'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': (
+            'data_ingestion.infrastructure.pooled_postgresql' if DB_POOL_ENABLED
+            else 'django.db.backends.postgresql'
+        ),
         'NAME': os.environ.get('DB_NAME', 'postgres'),
         'USER': os.environ.get('DB_USER', 'postgres'),
         'PASSWORD': os.environ.get('DB_PASSWORD', 'postgres'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 0 if DB_POOL_ENABLED else DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+        'POOL_SIZE': int(os.environ.get('DB_POOL_SIZE', '2')),
+        'POOL_MAX_SIZE': int(os.environ.get('DB_POOL_MAX_SIZE', '8')),
     }
 }
 
+# Read replica for dashboard queries (unset = everything on the primary).
+# Dataset reads stay on the primary for DB_REPLICA_READ_YOUR_WRITES_SECONDS
+# after each ingestion; keep it above the replica's worst-case lag. Outside
+# requests a closed window is looked up again at most every
+# DB_REPLICA_RECHECK_SECONDS unless the dataset version being read changed.
+DB_REPLICA_HOST = os.environ.get('DB_REPLICA_HOST')
+DB_REPLICA_READ_YOUR_WRITES_SECONDS = int(os.environ.get('DB_REPLICA_READ_YOUR_WRITES_SECONDS', '30'))
+DB_REPLICA_RECHECK_SECONDS = int(os.environ.get('DB_REPLICA_RECHECK_SECONDS', '5'))
+if DB_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': DB_REPLICA_HOST,
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['data_ingestion.infrastructure.db_router.ReplicaRouter']
+
 # For testing, use SQLite in-memory database
 # Check both sys.argv and environment variable for pytest
 import sys
@@ -91,6 +125,12 @@ if 'test' in sys.argv or 'pytest' in sys.modules or os.environ.get('PYTEST_CURRE
         }
     }
 
+# Async dashboard and job status views (api/async_views.py) on the regular
+# URLs; asgi.py turns this on. Under ASGI every request runs its ORM work in
+# its own thread, so asgi.py also disables persistent connections - set
+# DB_POOL_ENABLED to reuse connections there.
+DASHBOARD_ASYNC_VIEWS = os.environ.get('DASHBOARD_ASYNC_VIEWS', 'False') == 'True'
+
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
@@ -107,6 +147,73 @@ ADMIN_API_KEY = os.environ.get('ADMIN_API_KEY', 'mvp-admin-key-123')
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 
+# Background ingestion: wall-clock limit per upload job (seconds)
+INGESTION_JOB_TIMEOUT_SECONDS = int(os.environ.get('INGESTION_JOB_TIMEOUT_SECONDS', '600'))
+
+# Background ingestion admission control: max queued (not started) jobs and
+# max bytes of uploaded temp files held by queued/running jobs
+INGESTION_MAX_QUEUE_DEPTH = int(os.environ.get('INGESTION_MAX_QUEUE_DEPTH', '10'))
+INGESTION_TEMP_QUOTA_BYTES = int(os.environ.get('INGESTION_TEMP_QUOTA_BYTES', str(200 * 1024 * 1024)))
+
+# Cross-process dataset lock: PostgreSQL advisory locks, or lock files in
+# INGESTION_LOCK_DIR on other backends (default: <tmp>/ingestion_locks)
+INGESTION_LOCK_DIR = os.environ.get('INGESTION_LOCK_DIR')
+INGESTION_LOCK_POLL_SECONDS = 0.5
+
+# Dashboard response cache
+# Entries are keyed by dataset version, so the timeout only bounds memory use.
+# DASHBOARD_CACHE_BACKEND: 'locmem' (per worker process), 'file' (shared by all
+# workers on the host, DASHBOARD_CACHE_DIR) or 'database' (shared by all nodes;
+# table created by `python manage.py createcachetable`)
+DASHBOARD_CACHE_BACKEND = os.environ.get('DASHBOARD_CACHE_BACKEND', 'locmem')
+_DASHBOARD_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'dashboard-responses',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('DASHBOARD_CACHE_DIR') or os.path.join(
+            tempfile.gettempdir(), 'dashboard_cache'
+        ),
+    },
+    'database': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'dashboard_cache',
+    },
+}
+if DASHBOARD_CACHE_BACKEND not in _DASHBOARD_CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"DASHBOARD_CACHE_BACKEND must be one of {sorted(_DASHBOARD_CACHE_BACKENDS)}"
+    )
+CACHES = {
+    'default': {
+        **_DASHBOARD_CACHE_BACKENDS[DASHBOARD_CACHE_BACKEND],
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    }
+}
+DASHBOARD_CACHE_ENABLED = os.environ.get('DASHBOARD_CACHE_ENABLED', 'True') == 'True'
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', str(24 * 60 * 60)))
+# Also store gzip-compressed copies of cached response bodies (>= 1KB)
+DASHBOARD_CACHE_PRECOMPRESS = os.environ.get('DASHBOARD_CACHE_PRECOMPRESS', 'True') == 'True'
+# Seconds a request waits for an identical in-flight computation (any worker)
+# before computing the response itself
+DASHBOARD_CACHE_COALESCE_TIMEOUT = float(os.environ.get('DASHBOARD_CACHE_COALESCE_TIMEOUT', '10'))
+# Threads used to pre-compute every filter combination after an upload
+DASHBOARD_CACHE_WARMUP_CONCURRENCY = int(os.environ.get('DASHBOARD_CACHE_WARMUP_CONCURRENCY', '2'))
+
+# Cache aggregate()/count() results of the dataset tables per dataset version
+# (stored in the cache above; writes through save_*_data() invalidate them)
+QUERY_CACHE_ENABLED = os.environ.get('QUERY_CACHE_ENABLED', 'True') == 'True'
+
+# Maximum points in the research funding trend; longer date ranges are
+# bucketed by the next coarser granularity (week -> month -> quarter -> year)
+RESEARCH_FUNDING_TREND_MAX_POINTS = int(os.environ.get('RESEARCH_FUNDING_TREND_MAX_POINTS', '60'))
+
+# In-memory NumPy snapshot of the dashboard datasets (loaded at startup,
+# reloaded when a dataset version changes). Costs RAM per worker process.
+ANALYTICS_CUBE_ENABLED = os.environ.get('ANALYTICS_CUBE_ENABLED', 'False') == 'True'
+
 # Internationalization
 LANGUAGE_CODE = 'ko-kr'
 TIME_ZONE = 'Asia/Seoul'
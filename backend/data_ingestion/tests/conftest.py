@@ -52,3 +52,24 @@ def sample_department_kpi():
         '졸업생 취업률(%)': [85.5, 78.3, 87.2],
         '연간 기술이전 수입액(억원)': [5.2, 3.1, 6.5]
     })
+
+
+@pytest.fixture(autouse=True)
+def clear_dashboard_caches():
+    """
+    Start every test with empty dashboard caches (responses, cube, departments).
+
+    Tests create rows directly via the ORM (bypassing the dataset version
+    bump) and roll them back afterwards, so the same version number can
+    stand for different data in different tests.
+    """
+    from data_ingestion.infrastructure.response_cache import get_response_cache
+    from data_ingestion.infrastructure.analytics_cube import get_analytics_cube
+    from data_ingestion.infrastructure.department_catalog import get_department_catalog
+
+    caches = [get_response_cache(), get_analytics_cube(), get_department_catalog()]
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
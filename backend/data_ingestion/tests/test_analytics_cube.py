@@ -0,0 +1,220 @@
+"""
+Tests for the in-memory columnar analytics cube.
+
+Following test-plan.md:
+- Parity: cube results equal the ORM path for every dashboard query
+- Snapshots reload when the dataset version changes
+- Benchmark: per-query latency, cube vs ORM
+"""
+
+import time
+from datetime import datetime, timezone as dt_timezone
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_ingestion.infrastructure.analytics_cube import get_analytics_cube
+from data_ingestion.infrastructure.repositories import (
+    ResearchFundingRepository,
+    StudentRepository,
+    PublicationRepository,
+    save_research_funding_data,
+    save_student_data,
+    save_publication_data,
+    save_department_kpi_data,
+)
+from data_ingestion.services.kpi_service import KPIService
+from data_ingestion.services.publication_service import PublicationService
+from data_ingestion.services.student_dashboard_service import StudentDashboardService
+
+DEPARTMENTS = ['컴퓨터공학과', '전자공학과', '기계공학과', '화학공학과', '경영학과']
+
+
+def _ingest_all(rows: int, seed: int = 7):
+    """Ingest reproducible random data for all four datasets."""
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp.now().normalize() - pd.to_timedelta(rng.integers(0, 1500, rows), unit='D')
+    save_research_funding_data(pd.DataFrame({
+        'execution_id': [f'E{i:06d}' for i in range(rows)],
+        'department': rng.choice(DEPARTMENTS, rows),
+        'total_budget': rng.integers(10_000_000, 500_000_000, rows),
+        'execution_date': dates,
+        'execution_amount': rng.integers(100_000, 20_000_000, rows),
+    }))
+    save_student_data(pd.DataFrame({
+        'student_id': [f'S{i:06d}' for i in range(rows)],
+        'department': rng.choice(DEPARTMENTS, rows),
+        'grade': rng.integers(1, 5, rows),
+        'program_type': rng.choice(['학사', '석사', '박사'], rows, p=[0.7, 0.2, 0.1]),
+        'enrollment_status': rng.choice(['재학', '휴학', '졸업'], rows),
+    }))
+    impact_factors = np.round(rng.uniform(0.1, 9.0, rows), 3)
+    impact_factors[rng.random(rows) < 0.3] = np.nan
+    save_publication_data(pd.DataFrame({
+        'paper_id': [f'P{i:06d}' for i in range(rows)],
+        'department': rng.choice(DEPARTMENTS, rows),
+        'journal_tier': rng.choice(['SCIE', 'KCI', '기타'], rows),
+        'impact_factor': impact_factors,
+    }))
+    years = list(range(2015, 2025))
+    save_department_kpi_data(pd.DataFrame({
+        'evaluation_year': [year for year in years for _ in DEPARTMENTS],
+        'department': DEPARTMENTS * len(years),
+        'employment_rate': np.round(rng.uniform(50, 99, len(years) * len(DEPARTMENTS)), 1),
+        'tech_transfer_income': np.round(rng.uniform(0, 20, len(years) * len(DEPARTMENTS)), 2),
+    }))
+
+
+def _dashboard_queries():
+    """One callable per dashboard query, all filter combinations."""
+    funding = ResearchFundingRepository()
+    students = StudentDashboardService(StudentRepository())
+    publications = PublicationService(PublicationRepository())
+    kpi = KPIService()
+
+    def without_timestamp(result, key):
+        result.pop(key)
+        return result
+
+    queries = {}
+    for department in ['all', '컴퓨터공학과', '없는학과']:
+        queries[f'balance:{department}'] = lambda d=department: funding.get_current_balance(d)
+        for period in ['latest', '1year', '3years']:
+            queries[f'trend:{department}:{period}'] = (
+                lambda d=department, p=period: funding.get_monthly_trend(d, p)
+            )
+        queries[f'kpi:{department}'] = lambda d=department: kpi.get_kpi_trend(d, 2016, 2023)
+    for department in ['all', '전자공학과']:
+        for status in ['all', '재학', '졸업']:
+            queries[f'students:{department}:{status}'] = (
+                lambda d=department, s=status: without_timestamp(
+                    students.get_student_dashboard_data(d, s), 'updated_at'
+                )
+            )
+        for tier in ['all', 'SCIE', 'KCI']:
+            queries[f'publications:{department}:{tier}'] = (
+                lambda d=department, t=tier: without_timestamp(
+                    publications.get_distribution(d, t), 'last_updated'
+                )
+            )
+    return queries
+
+
+def _normalize(value):
+    """Order-insensitive, float-tolerant comparison form of a result."""
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        items = [_normalize(item) for item in value]
+        return sorted(items, key=repr) if items and isinstance(items[0], dict) else items
+    if isinstance(value, float):
+        return pytest.approx(value, rel=1e-9, abs=1e-9)
+    return value
+
+
+@pytest.mark.django_db
+class TestAnalyticsCubeParity:
+    """Every dashboard query answers identically from the cube and the ORM."""
+
+    def test_all_queries_match_orm(self, settings):
+        # Arrange
+        _ingest_all(rows=600)
+        queries = _dashboard_queries()
+        settings.ANALYTICS_CUBE_ENABLED = False
+        from_orm = {name: query() for name, query in queries.items()}
+
+        # Act
+        settings.ANALYTICS_CUBE_ENABLED = True
+        from_cube = {name: query() for name, query in queries.items()}
+
+        # Assert
+        for name in queries:
+            assert _normalize(from_cube[name]) == _normalize(from_orm[name]), name
+
+    def test_period_cutoff_uses_local_date(self, settings):
+        # Arrange: 20:00 UTC is already the next day in Asia/Seoul
+        frozen = datetime(2026, 10, 18, 20, 0, tzinfo=dt_timezone.utc)
+        save_research_funding_data(pd.DataFrame({
+            'execution_id': ['E1', 'E2', 'E3', 'E4'],
+            'department': ['컴퓨터공학과'] * 4,
+            'total_budget': [100_000_000] * 4,
+            # Day before / first day of the 1year and 3years windows (local dates)
+            'execution_date': pd.to_datetime(['2025-10-18', '2025-10-19', '2023-10-19', '2023-10-20']),
+            'execution_amount': [1_000_000, 2_000_000, 3_000_000, 4_000_000],
+        }))
+
+        with patch('django.utils.timezone.now', return_value=frozen):
+            settings.ANALYTICS_CUBE_ENABLED = False
+            from_orm = {
+                period: ResearchFundingRepository().get_monthly_trend('all', period)
+                for period in ('1year', '3years')
+            }
+
+            # Act
+            settings.ANALYTICS_CUBE_ENABLED = True
+            from_cube = {
+                period: ResearchFundingRepository().get_monthly_trend('all', period)
+                for period in ('1year', '3years')
+            }
+
+        # Assert
+        assert from_cube == from_orm
+        assert [month['execution'] for month in from_cube['1year']] == [2_000_000]
+
+    def test_snapshot_reloads_after_ingestion(self, settings):
+        # Arrange
+        settings.ANALYTICS_CUBE_ENABLED = True
+        _ingest_all(rows=50)
+        cube = get_analytics_cube()
+        before = cube.snapshot('students')
+
+        # Act
+        save_student_data(pd.DataFrame({
+            'student_id': ['X1'], 'department': ['경영학과'], 'grade': [1],
+            'program_type': ['학사'], 'enrollment_status': ['재학'],
+        }))
+        after = cube.snapshot('students')
+
+        # Assert
+        assert cube.snapshot('students') is after
+        assert after.version == before.version + 1
+        assert after.row_count == 1
+
+    def test_disabled_or_never_ingested_returns_none(self, settings):
+        settings.ANALYTICS_CUBE_ENABLED = True
+        assert get_analytics_cube().current_balance('all') is None
+
+        settings.ANALYTICS_CUBE_ENABLED = False
+        assert get_analytics_cube().snapshot('students') is None
+
+
+@pytest.mark.django_db
+class TestAnalyticsCubeBenchmark:
+    """Benchmark prints mean per-query latency for the ORM and cube paths."""
+
+    def test_query_latency_cube_vs_orm(self, settings):
+        # Arrange
+        _ingest_all(rows=5000)
+        queries = _dashboard_queries()
+        rounds = 5
+
+        def mean_latency_ms():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for query in queries.values():
+                    query()
+            return (time.perf_counter() - start) * 1000 / (rounds * len(queries))
+
+        # Act
+        settings.ANALYTICS_CUBE_ENABLED = False
+        orm_ms = mean_latency_ms()
+        settings.ANALYTICS_CUBE_ENABLED = True
+        get_analytics_cube().warm()
+        cube_ms = mean_latency_ms()
+
+        # Assert
+        print(f"\n[benchmark] queries={len(queries)} rows=5000 "
+              f"orm={orm_ms:.2f}ms cube={cube_ms:.2f}ms")
+        assert cube_ms > 0 and orm_ms > 0
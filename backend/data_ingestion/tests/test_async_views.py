@@ -0,0 +1,246 @@
+"""
+Tests for the async (ASGI) dashboard and job status views.
+
+Following test-plan.md:
+- Every async dashboard view returns what its DRF view returns
+- Warm requests and 304s are answered without running the DRF view
+- Invalid parameters get the DRF view's error response
+- Job status is served from the job store
+- Benchmark: concurrent slow requests per worker, ASGI vs sync WSGI
+- Benchmark: warm hits arriving behind slow misses, ASGI vs sync WSGI
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+from unittest.mock import patch
+from asgiref.sync import ThreadSensitiveContext, async_to_sync
+from django.test import AsyncRequestFactory
+from rest_framework.test import APIClient
+
+from data_ingestion.api import async_views
+from data_ingestion.infrastructure.job_status_store import get_job_store
+from data_ingestion.infrastructure.response_cache import get_response_cache
+from data_ingestion.services.kpi_service import KPIService
+from data_ingestion.services.research_funding_service import ResearchFundingService
+from data_ingestion.tests.test_prerendered_responses import _ingest_all
+
+ASYNC_DASHBOARD_URLS = {
+    'research_funding': ('/api/dashboard/research-funding/', {'department': '학과01', 'period': '1year'}),
+    'students': ('/api/dashboard/students/', {'department': 'all', 'status': 'all'}),
+    'publications': ('/api/dashboard/publications/', {'journal_tier': 'SCIE'}),
+    'department_kpi': ('/api/dashboard/department-kpi/', {'department': '학과02'}),
+}
+
+factory = AsyncRequestFactory()
+
+
+def _call(async_view, url, params=None, headers=None, **kwargs):
+    """Run an async view on a request built for url, rendered like a served response."""
+    response = async_to_sync(async_view)(factory.get(url, params or {}, headers=headers), **kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestAsyncDashboardViews:
+    """async_views.research_funding / students / publications / department_kpi"""
+
+    @pytest.mark.parametrize('endpoint', sorted(ASYNC_DASHBOARD_URLS))
+    def test_matches_drf_view(self, endpoint):
+        # Arrange
+        _ingest_all()
+        url, params = ASYNC_DASHBOARD_URLS[endpoint]
+        async_view = getattr(async_views, endpoint)
+
+        # Act
+        cold = _call(async_view, url, params)
+        warm = _call(async_view, url, params)
+        expected = APIClient().get(url, params)
+
+        # Assert
+        assert cold.status_code == warm.status_code == 200
+        assert cold.content == warm.content == expected.content
+        assert (cold['X-Cache'], warm['X-Cache']) == ('MISS', 'HIT')
+        assert (warm['ETag'], warm['Allow']) == (expected['ETag'], expected['Allow'])
+
+    def test_warm_request_skips_drf_view(self):
+        # Arrange
+        _ingest_all()
+        url, params = ASYNC_DASHBOARD_URLS['students']
+        APIClient().get(url, params)
+        entry = async_views.DASHBOARD_ENDPOINTS['students']
+
+        # Act
+        with patch.dict(async_views.DASHBOARD_ENDPOINTS, {'students': (None, *entry[1:])}):
+            response = _call(async_views.students, url, params)
+
+        # Assert
+        assert response.status_code == 200
+        assert response['X-Cache'] == 'HIT'
+
+    def test_revalidation_answered_with_304(self):
+        # Arrange
+        _ingest_all()
+        url, params = ASYNC_DASHBOARD_URLS['publications']
+        etag = APIClient().get(url, params)['ETag']
+
+        # Act
+        response = _call(async_views.publications, url, params, headers={'If-None-Match': etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+
+    def test_invalid_parameters_get_drf_error(self):
+        # Arrange
+        url, params = '/api/dashboard/students/', {'status': 'INVALID'}
+
+        # Act
+        response = _call(async_views.students, url, params)
+
+        # Assert
+        assert response.status_code == 400
+        assert response.content == APIClient().get(url, params).content
+
+
+@pytest.mark.unit
+class TestAsyncUploadStatusView:
+    """async_views.upload_status"""
+
+    def test_returns_job_status(self):
+        # Arrange
+        job_id = str(uuid.uuid4())
+        get_job_store().create_job(job_id)
+        url = f'/api/upload/status/{job_id}/'
+
+        # Act
+        response = _call(async_views.upload_status, url, pk=job_id)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.content == APIClient().get(url).content
+
+    def test_unknown_job_is_404(self):
+        # Act
+        response = _call(async_views.upload_status, '/api/upload/status/unknown/', pk='unknown')
+
+        # Assert
+        assert response.status_code == 404
+        assert response.content == APIClient().get('/api/upload/status/unknown/').content
+
+
+@pytest.mark.integration
+@pytest.mark.django_db(transaction=True)
+class TestAsyncCapacityBenchmark:
+    """
+    Requests one worker completes while each waits on a slow query.
+
+    A sync gunicorn worker serves them one after another. The async view
+    runs each in its own request context (as Django's ASGI handler does),
+    so the waits overlap. ASYNC_BENCHMARK_REQUESTS sets the concurrency.
+    """
+
+    def test_concurrent_slow_requests_wsgi_vs_asgi(self, settings):
+        # Arrange
+        settings.DASHBOARD_CACHE_ENABLED = False
+        _ingest_all()
+        concurrency = int(os.environ.get('ASYNC_BENCHMARK_REQUESTS', '20'))
+        query_seconds = 0.05
+        url = '/api/dashboard/research-funding/'
+        result = ResearchFundingService().get_dashboard_data(department='all', period='latest')
+
+        def slow_query(self, **kwargs):
+            time.sleep(query_seconds)
+            return result
+
+        sync_view = async_views.DASHBOARD_ENDPOINTS['research_funding'][0]
+
+        async def asgi_request():
+            async with ThreadSensitiveContext():
+                return await async_views.research_funding(factory.get(url))
+
+        async def asgi_burst():
+            return await asyncio.gather(*(asgi_request() for _ in range(concurrency)))
+
+        # Act
+        with patch.object(ResearchFundingService, 'get_dashboard_data', slow_query):
+            started = time.perf_counter()
+            wsgi_codes = [sync_view(factory.get(url)).status_code for _ in range(concurrency)]
+            wsgi_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            # An event loop with no sync caller above it, as under an ASGI server
+            asgi_codes = [response.status_code for response in asyncio.run(asgi_burst())]
+            asgi_seconds = time.perf_counter() - started
+
+        # Assert
+        print(
+            f"\n[benchmark] concurrent={concurrency} query={query_seconds * 1000:.0f}ms "
+            f"wsgi={concurrency / wsgi_seconds:.1f} req/s asgi={concurrency / asgi_seconds:.1f} req/s"
+        )
+        assert wsgi_codes == asgi_codes == [200] * concurrency
+        assert asgi_seconds < wsgi_seconds
+
+    def test_warm_hit_behind_slow_misses_wsgi_vs_asgi(self):
+        """
+        A warm hit that arrives after a burst of slow cache misses.
+
+        The sync worker serves it only after every miss; the async fast path
+        answers it while the misses still wait on their queries.
+        """
+        # Arrange
+        _ingest_all()
+        concurrency = min(int(os.environ.get('ASYNC_BENCHMARK_REQUESTS', '20')), 20)
+        query_seconds = 0.05
+        hit_url, hit_params = ASYNC_DASHBOARD_URLS['students']
+        miss_url = '/api/dashboard/department-kpi/'
+        # Distinct year ranges, so every miss computes its own entry
+        miss_params = [{'start_year': 2000 + i, 'end_year': 2020} for i in range(concurrency)]
+        result = KPIService().get_kpi_trend(department='all', start_year=2020, end_year=2020)
+
+        def slow_query(self, **kwargs):
+            time.sleep(query_seconds)
+            return result
+
+        miss_view = async_views.DASHBOARD_ENDPOINTS['department_kpi'][0]
+        hit_view = async_views.DASHBOARD_ENDPOINTS['students'][0]
+
+        async def asgi_request(view, url, params):
+            async with ThreadSensitiveContext():
+                response = await view(factory.get(url, params))
+                return response, time.perf_counter()
+
+        async def asgi_burst():
+            misses = [asgi_request(async_views.department_kpi, miss_url, p) for p in miss_params]
+            return await asyncio.gather(*misses, asgi_request(async_views.students, hit_url, hit_params))
+
+        # Act
+        with patch.object(KPIService, 'get_kpi_trend', slow_query):
+            get_response_cache().clear()
+            APIClient().get(hit_url, hit_params)  # Warm
+            started = time.perf_counter()
+            wsgi_codes = [miss_view(factory.get(miss_url, p)).status_code for p in miss_params]
+            wsgi_hit = hit_view(factory.get(hit_url, hit_params))
+            wsgi_hit_seconds = time.perf_counter() - started
+
+            get_response_cache().clear()
+            APIClient().get(hit_url, hit_params)  # Warm
+            started = time.perf_counter()
+            # An event loop with no sync caller above it, as under an ASGI server
+            *asgi_misses, (asgi_hit, hit_done) = asyncio.run(asgi_burst())
+            asgi_hit_seconds = hit_done - started
+
+        # Assert
+        print(
+            f"\n[benchmark] misses={concurrency} query={query_seconds * 1000:.0f}ms "
+            f"warm hit after wsgi={wsgi_hit_seconds * 1000:.0f}ms asgi={asgi_hit_seconds * 1000:.0f}ms"
+        )
+        assert wsgi_codes == [response.status_code for response, _ in asgi_misses] == [200] * concurrency
+        assert (wsgi_hit['X-Cache'], asgi_hit['X-Cache']) == ('HIT', 'HIT')
+        assert asgi_hit_seconds < wsgi_hit_seconds
@@ -0,0 +1,268 @@
+"""
+Tests for post-ingestion dashboard cache warm-up.
+
+Following test-plan.md:
+- Every filter combination of a replaced dataset is pre-computed
+- The first dashboard request after an upload is a cache hit that renders nothing
+- Warm-up threads reuse one database connection each
+- Warm-up coverage and duration are recorded in the job result
+"""
+
+import time
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+from rest_framework.test import APIClient
+
+from data_ingestion.infrastructure.dataset_versions import (
+    DATASET_RESEARCH_FUNDING,
+    DATASET_STUDENTS,
+    DATASET_PUBLICATIONS,
+    DATASET_KPI,
+)
+from data_ingestion.infrastructure.job_status_store import JobStatusStore
+from data_ingestion.infrastructure.repositories import (
+    save_research_funding_data,
+    save_student_data,
+    save_publication_data,
+    save_department_kpi_data,
+)
+from data_ingestion.services.cache_warmup import (
+    JOURNAL_TIERS,
+    PERIODS,
+    STUDENT_STATUSES,
+    build_warmup_tasks,
+    warm_dashboard_cache,
+)
+from data_ingestion.services.ingestion_service import process_upload
+
+DEPARTMENTS = ['컴퓨터공학과', '전자공학과']
+
+
+def _ingest_all():
+    save_research_funding_data(pd.DataFrame({
+        'execution_id': ['E001', 'E002'],
+        'department': DEPARTMENTS,
+        'total_budget': [100_000_000, 50_000_000],
+        'execution_date': [pd.Timestamp.now().normalize()] * 2,
+        'execution_amount': [1_000_000, 2_000_000],
+    }))
+    save_student_data(pd.DataFrame({
+        'student_id': ['S001', 'S002'],
+        'department': DEPARTMENTS,
+        'grade': [1, 2],
+        'program_type': ['학사', '석사'],
+        'enrollment_status': ['재학', '휴학'],
+    }))
+    save_publication_data(pd.DataFrame({
+        'paper_id': ['P001', 'P002'],
+        'department': DEPARTMENTS,
+        'journal_tier': ['SCIE', 'KCI'],
+        'impact_factor': [2.5, None],
+    }))
+    save_department_kpi_data(pd.DataFrame({
+        'evaluation_year': [2023, 2023],
+        'department': DEPARTMENTS,
+        'employment_rate': [80.0, 75.5],
+        'tech_transfer_income': [1.5, 0.0],
+    }))
+
+
+def _dashboard_urls():
+    """Every request URL the warm-up is expected to cover."""
+    urls = []
+    for department in ['all'] + DEPARTMENTS:
+        urls += [
+            f'/api/dashboard/research-funding/?department={department}&period={period}'
+            for period in PERIODS
+        ]
+        urls += [
+            f'/api/dashboard/students/?department={department}&status={status}'
+            for status in STUDENT_STATUSES
+        ]
+        urls += [
+            f'/api/dashboard/publications/?department={department}&journal_tier={tier}'
+            for tier in JOURNAL_TIERS
+        ]
+        urls.append(f'/api/dashboard/department-kpi/?department={department}')
+    return urls
+
+
+@pytest.mark.integration
+@pytest.mark.django_db(transaction=True)  # Warm-up threads need committed rows
+class TestWarmDashboardCache:
+    """Warm-up enumeration and its effect on dashboard requests."""
+
+    ALL_DATASETS = [DATASET_RESEARCH_FUNDING, DATASET_STUDENTS, DATASET_PUBLICATIONS, DATASET_KPI]
+
+    def test_enumerates_every_filter_combination(self):
+        """Combinations = ('all' + departments) x each dataset's filter values."""
+        # Arrange
+        _ingest_all()
+
+        # Act
+        tasks = build_warmup_tasks(self.ALL_DATASETS)
+
+        # Assert
+        per_department = len(PERIODS) + len(STUDENT_STATUSES) + len(JOURNAL_TIERS) + 1
+        assert len(tasks) == (len(DEPARTMENTS) + 1) * per_department
+
+    def test_first_request_after_warmup_is_a_hit(self, settings):
+        """Every dashboard URL is served from the warmed cache."""
+        # Arrange
+        settings.DASHBOARD_CACHE_WARMUP_CONCURRENCY = 2
+        _ingest_all()
+        client = APIClient()
+
+        # Act
+        report = warm_dashboard_cache(self.ALL_DATASETS)
+        responses = {url: client.get(url) for url in _dashboard_urls()}
+
+        # Assert
+        assert report['failed'] == 0
+        assert report['coverage'] == 1.0
+        assert report['warmed'] == report['combinations'] == len(responses)
+        for url, response in responses.items():
+            assert response.status_code == 200, url
+            assert response['X-Cache'] == 'HIT', url
+
+    def test_first_request_after_warmup_renders_nothing(self):
+        """Warm-up stores the rendered bodies, not only the service results."""
+        # Arrange
+        _ingest_all()
+        warm_dashboard_cache(self.ALL_DATASETS)
+        client = APIClient()
+
+        # Act
+        with patch('data_ingestion.api.views.render_dashboard') as mock_render:
+            responses = [client.get(url) for url in _dashboard_urls()]
+
+        # Assert
+        mock_render.assert_not_called()
+        assert all(response.status_code == 200 for response in responses)
+
+    def test_connections_closed_once_per_thread(self, settings):
+        """Each warm-up thread closes its connection when it runs out of work."""
+        # Arrange
+        settings.DASHBOARD_CACHE_WARMUP_CONCURRENCY = 2
+        _ingest_all()
+
+        # Act
+        with patch('data_ingestion.services.cache_warmup.connections') as mock_connections:
+            report = warm_dashboard_cache([DATASET_STUDENTS])
+
+        # Assert
+        assert report['warmed'] == report['combinations'] > 2
+        assert mock_connections.close_all.call_count == 2
+
+    def test_second_warmup_finds_entries_cached(self):
+        """Re-warming an unchanged dataset computes nothing."""
+        # Arrange
+        _ingest_all()
+        warm_dashboard_cache([DATASET_STUDENTS])
+
+        # Act
+        report = warm_dashboard_cache([DATASET_STUDENTS])
+
+        # Assert
+        assert report['warmed'] == 0
+        assert report['already_cached'] == report['combinations']
+
+    def test_expired_deadline_skips_remaining_combinations(self):
+        """Warm-up never runs past the job deadline."""
+        # Arrange
+        _ingest_all()
+
+        # Act
+        report = warm_dashboard_cache([DATASET_PUBLICATIONS], deadline=time.monotonic() - 1)
+
+        # Assert
+        assert report['skipped'] == report['combinations']
+        assert report['coverage'] == 0.0
+
+
+@pytest.mark.unit
+class TestWarmupJobResult:
+    """Warm-up report stored with the ingestion job."""
+
+    @patch('data_ingestion.services.ingestion_service.warm_dashboard_cache')
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    @patch('data_ingestion.services.ingestion_service.FILE_TYPE_PARSERS')
+    def test_report_recorded_for_completed_files(
+        self, mock_parsers_dict, mock_read_csv, mock_warm, tmp_path
+    ):
+        """Only datasets that were saved are warmed; the report lands in the job result."""
+        # Arrange
+        job_store = JobStatusStore()
+        job_store.create_job('warm-job')
+        mock_read_csv.return_value = pd.DataFrame({'a': [1]})
+        mock_repo = Mock(return_value={'rows_inserted': 1})
+        mock_parsers_dict.__getitem__.return_value = (Mock(side_effect=lambda df: df), mock_repo)
+        mock_parsers_dict.__contains__.side_effect = lambda file_type: file_type != 'unknown'
+        report = {'combinations': 12, 'warmed': 12, 'coverage': 1.0, 'duration_seconds': 0.2}
+        mock_warm.return_value = report
+
+        # Act
+        with patch('data_ingestion.services.ingestion_service.get_job_store', return_value=job_store), \
+                patch('data_ingestion.services.ingestion_service.acquire_dataset_lock') as mock_lock:
+            mock_lock.return_value.__enter__.return_value = False
+            process_upload('warm-job', {'students': str(tmp_path / 'a.csv'), 'unknown': str(tmp_path / 'b.csv')})
+
+        # Assert
+        assert mock_warm.call_args.args[0] == ['students']
+        result = job_store.get_job('warm-job').result
+        assert result['cache_warmup'] == report
+        assert [f['status'] for f in result['files']] == ['completed', 'failed']
+
+    @patch('data_ingestion.services.ingestion_service.warm_dashboard_cache')
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    @patch('data_ingestion.services.ingestion_service.FILE_TYPE_PARSERS')
+    def test_warmup_failure_does_not_fail_job(
+        self, mock_parsers_dict, mock_read_csv, mock_warm, tmp_path
+    ):
+        """A crashing warm-up is logged; the job still completes."""
+        # Arrange
+        job_store = JobStatusStore()
+        job_store.create_job('warm-job')
+        mock_read_csv.return_value = pd.DataFrame({'a': [1]})
+        mock_parsers_dict.__getitem__.return_value = (
+            Mock(side_effect=lambda df: df), Mock(return_value={'rows_inserted': 1})
+        )
+        mock_parsers_dict.__contains__.return_value = True
+        mock_warm.side_effect = RuntimeError('cache down')
+
+        # Act
+        with patch('data_ingestion.services.ingestion_service.get_job_store', return_value=job_store), \
+                patch('data_ingestion.services.ingestion_service.acquire_dataset_lock') as mock_lock:
+            mock_lock.return_value.__enter__.return_value = False
+            process_upload('warm-job', {'kpi': str(tmp_path / 'a.csv')})
+
+        # Assert
+        job_info = job_store.get_job('warm-job')
+        assert job_info.status.value == 'completed'
+        assert 'cache_warmup' not in job_info.result
+
+
+@pytest.mark.unit
+class TestJobResult:
+    """JobStatusStore.set_result merge semantics."""
+
+    def test_set_result_merges_into_new_dict(self):
+        """Earlier snapshots keep their own result dict."""
+        # Arrange
+        store = JobStatusStore()
+        store.create_job('job-1')
+        store.set_result('job-1', files=[])
+        before = store.get_job('job-1')
+
+        # Act
+        store.set_result('job-1', cache_warmup={'coverage': 1.0})
+
+        # Assert
+        assert before.result == {'files': []}
+        assert store.get_job('job-1').result == {'files': [], 'cache_warmup': {'coverage': 1.0}}
+
+    def test_unknown_job_raises(self):
+        with pytest.raises(ValueError):
+            JobStatusStore().set_result('missing', files=[])
@@ -0,0 +1,153 @@
+"""
+Tests for ETag / Last-Modified conditional GETs on dashboard endpoints.
+
+Following test-plan.md:
+- ETag derived from dataset version + filter parameters
+- Matching If-None-Match answered with 304 without running aggregations
+- Ingestion changes the ETag
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from rest_framework.test import APIClient
+
+from data_ingestion.infrastructure.repositories import save_student_data
+
+STUDENTS_URL = '/api/dashboard/students/?department=all&status=재학'
+
+
+def _ingest_students(student_ids):
+    save_student_data(pd.DataFrame({
+        'student_id': student_ids,
+        'department': ['컴퓨터공학과'] * len(student_ids),
+        'grade': [1] * len(student_ids),
+        'program_type': ['학사'] * len(student_ids),
+        'enrollment_status': ['재학'] * len(student_ids),
+    }))
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestDashboardConditionalGet:
+    """Conditional GET handling for dashboard views."""
+
+    @pytest.mark.parametrize('url', [
+        '/api/dashboard/research-funding/',
+        '/api/dashboard/students/',
+        '/api/dashboard/publications/',
+        '/api/dashboard/department-kpi/',
+    ])
+    def test_dashboard_responses_carry_validators(self, api_client, url):
+        """Every dashboard view returns an ETag and requires revalidation."""
+        response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response['ETag'].startswith('"')
+        assert response['Cache-Control'] == 'no-cache'
+
+    def test_matching_etag_returns_304_without_aggregation(
+        self, api_client, django_assert_num_queries
+    ):
+        """Revalidation reads only the dataset version row."""
+        # Arrange
+        _ingest_students(['S001'])
+        etag = api_client.get(STUDENTS_URL)['ETag']
+
+        # Act
+        with patch(
+            'data_ingestion.services.student_dashboard_service.'
+            'StudentDashboardService.get_student_dashboard_data'
+        ) as mock_service:
+            with django_assert_num_queries(1):
+                response = api_client.get(STUDENTS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        mock_service.assert_not_called()
+
+    def test_last_modified_reflects_ingestion(self, api_client):
+        """Last-Modified is set once the dataset has been ingested."""
+        # Arrange
+        _ingest_students(['S001'])
+
+        # Act
+        first = api_client.get(STUDENTS_URL)
+        second = api_client.get(STUDENTS_URL, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        # Assert
+        assert second.status_code == 304
+
+    def test_ingestion_changes_etag(self, api_client):
+        """A new upload invalidates clients' copies."""
+        # Arrange
+        _ingest_students(['S001'])
+        old_etag = api_client.get(STUDENTS_URL)['ETag']
+
+        # Act
+        _ingest_students(['S001', 'S002'])
+        response = api_client.get(STUDENTS_URL, HTTP_IF_NONE_MATCH=old_etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert response['ETag'] != old_etag
+        assert response.json()['total_students'] == 2
+
+    def test_etag_depends_on_filters(self, api_client):
+        """Different filter parameters produce different ETags."""
+        enrolled = api_client.get('/api/dashboard/students/?status=재학')
+        on_leave = api_client.get('/api/dashboard/students/?status=휴학')
+
+        assert enrolled['ETag'] != on_leave['ETag']
+
+
+    @pytest.mark.parametrize('query, rolls', [
+        ('period=1year', True),
+        ('period=3years', True),
+        ('compare_to=previous_year', True),
+        ('start=2024-01-01&end=2024-06-30&compare_to=previous_year', False),
+        ('period=latest', False),
+    ])
+    def test_time_relative_filters_revalidate_on_a_new_day(self, api_client, query, rolls):
+        """Rolling windows are not answered from yesterday's cache entry."""
+        # Arrange
+        url = f'/api/dashboard/research-funding/?{query}'
+        today = datetime(2026, 10, 19, 3, 0, tzinfo=dt_timezone.utc)
+        with patch('django.utils.timezone.now', return_value=today):
+            etag = api_client.get(url)['ETag']
+
+        # Act
+        with patch('django.utils.timezone.now', return_value=today + timedelta(days=1)):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        if rolls:
+            assert response.status_code == 200
+            assert response['X-Cache'] == 'MISS'
+            assert response['ETag'] != etag
+        else:
+            assert response.status_code == 304
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestFilterOptionsConditionalGet:
+    """Filter options are validated by a hash of the payload."""
+
+    def test_matching_etag_returns_304(self, api_client):
+        # Arrange
+        etag = api_client.get('/api/dashboard/filter-options/')['ETag']
+
+        # Act
+        response = api_client.get('/api/dashboard/filter-options/', HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 304
+        assert response['ETag'] == etag
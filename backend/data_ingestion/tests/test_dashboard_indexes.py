@@ -0,0 +1,153 @@
+"""
+EXPLAIN regression tests for the dashboard filter indexes (PostgreSQL only).
+
+Following test-plan.md:
+- Every dashboard aggregate is planned as an index (or index-only) scan on
+  the composite/covering/partial index built for its filters, on raw rows
+  and on the rollups
+
+The queries are the ones the repositories actually send, captured and
+re-run under EXPLAIN. Test tables are tiny, so sequential scans are
+disabled for the transaction; the test asserts the index path exists and
+is the one the planner prefers, not absolute costs.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from data_ingestion.infrastructure.models import (
+    DepartmentKPI,
+    Publication,
+    ResearchProject,
+    Student,
+)
+from data_ingestion.infrastructure.repositories import (
+    KPIRepository,
+    PublicationRepository,
+    ResearchFundingRepository,
+    StudentRepository,
+    save_publication_data,
+    save_research_funding_data,
+    save_student_data,
+)
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != 'postgresql',
+    reason='EXPLAIN plans are asserted against PostgreSQL only'
+)
+
+DEPARTMENT = '컴퓨터공학과'
+
+
+def _plan(call) -> str:
+    """EXPLAIN output for the last query a repository call sends."""
+    with CaptureQueriesContext(connection) as queries:
+        call()
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+        cursor.execute('EXPLAIN ' + queries.captured_queries[-1]['sql'])
+        return '\n'.join(row[0] for row in cursor.fetchall())
+
+
+def _create_raw_rows():
+    """Unversioned rows: the repositories query the raw tables."""
+    for i, status in enumerate(['재학', '휴학']):
+        Student.objects.create(
+            student_id=f'S{i}', department=DEPARTMENT, grade=1,
+            program_type='학사', enrollment_status=status
+        )
+    ResearchProject.objects.create(
+        execution_id='E1', department=DEPARTMENT, total_budget=100_000_000,
+        execution_date=date(2024, 3, 1), execution_amount=1_000_000
+    )
+    Publication.objects.create(
+        paper_id='P1', department=DEPARTMENT, journal_tier='SCIE', impact_factor=1.5
+    )
+    DepartmentKPI.objects.create(
+        evaluation_year=2024, department=DEPARTMENT,
+        employment_rate=80.0, tech_transfer_revenue=1.0
+    )
+
+
+def _ingest_versioned():
+    """Versioned ingestion: the repositories query the rollups."""
+    save_research_funding_data(pd.DataFrame({
+        'execution_id': ['E1'],
+        'department': [DEPARTMENT],
+        'total_budget': [100_000_000],
+        'execution_date': [pd.Timestamp('2024-03-01')],
+        'execution_amount': [1_000_000],
+    }))
+    save_student_data(pd.DataFrame({
+        'student_id': ['S1', 'S2'],
+        'department': [DEPARTMENT] * 2,
+        'grade': [1, 2],
+        'program_type': ['학사', '석사'],
+        'enrollment_status': ['재학', '휴학'],
+    }))
+    save_publication_data(pd.DataFrame({
+        'paper_id': ['P1'],
+        'department': [DEPARTMENT],
+        'journal_tier': ['SCIE'],
+        'impact_factor': [1.5],
+    }))
+
+
+RAW_QUERIES = {
+    'idx_rp_dept_date_cov':
+        lambda: ResearchFundingRepository().get_monthly_trend(DEPARTMENT),
+    'idx_student_enrolled_dept':
+        lambda: StudentRepository().get_department_program_counts(DEPARTMENT, '재학'),
+    'idx_student_status_dept_prog':
+        lambda: StudentRepository().get_department_program_counts(DEPARTMENT, '휴학'),
+    'idx_pub_dept_tier_if':
+        lambda: PublicationRepository().get_tier_summary(DEPARTMENT, 'SCIE'),
+    # department_kpis is small and already keyed on (evaluation_year, department)
+    'unique_year_department_kpi|idx_kpi_dept':
+        lambda: KPIRepository().get_yearly_summary(DEPARTMENT, 2020, 2024),
+}
+
+ROLLUP_QUERIES = {
+    'unique_rollup_rf_dept_date':
+        lambda: ResearchFundingRepository().get_monthly_trend(DEPARTMENT),
+    'idx_rollup_student_enrolled':
+        lambda: StudentRepository().get_department_program_counts(DEPARTMENT, '재학'),
+    'idx_rollup_student_status':
+        lambda: StudentRepository().get_department_program_counts(DEPARTMENT, '휴학'),
+    'unique_rollup_pub_dept_tier':
+        lambda: PublicationRepository().get_tier_summary(DEPARTMENT, 'SCIE'),
+}
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestDashboardQueryPlans:
+    """Dashboard aggregates use the index built for their filters."""
+
+    @pytest.mark.parametrize('index_name', sorted(RAW_QUERIES))
+    def test_raw_table_queries_use_index(self, index_name):
+        # Arrange
+        _create_raw_rows()
+
+        # Act
+        plan = _plan(RAW_QUERIES[index_name])
+
+        # Assert
+        assert any(name in plan for name in index_name.split('|')), plan
+        assert 'Index' in plan and 'Seq Scan' not in plan, plan
+
+    @pytest.mark.parametrize('index_name', sorted(ROLLUP_QUERIES))
+    def test_rollup_queries_use_index(self, index_name):
+        # Arrange
+        _ingest_versioned()
+
+        # Act
+        plan = _plan(ROLLUP_QUERIES[index_name])
+
+        # Assert
+        assert index_name in plan, plan
+        assert 'Index' in plan and 'Seq Scan' not in plan, plan
@@ -0,0 +1,100 @@
+"""
+Tests for the batched dashboard overview endpoint.
+
+Following test-plan.md:
+- Every section equals the body of its standalone endpoint
+- A failing section is reported under "errors" without failing the others
+- Warm overview requests are served from the rendered section caches
+"""
+
+import gzip
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from data_ingestion.tests.test_prerendered_responses import _ingest_all
+
+OVERVIEW_URL = '/api/dashboard/overview/'
+
+SECTION_URLS = {
+    'research_funding': '/api/dashboard/research-funding/',
+    'students': '/api/dashboard/students/',
+    'publications': '/api/dashboard/publications/',
+    'department_kpi': '/api/dashboard/department-kpi/',
+    'filter_options': '/api/dashboard/filter-options/',
+}
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestDashboardOverview:
+    """GET /api/dashboard/overview/"""
+
+    def test_sections_match_standalone_endpoints(self):
+        """One request returns what the five first-paint requests return."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+        params = {'department': '학과01', 'status': '재학', 'period': '1year'}
+
+        # Act
+        response = client.get(OVERVIEW_URL, params)
+
+        # Assert
+        assert response.status_code == 200
+        overview = response.json()
+        assert overview['errors'] == {}
+        for key, url in SECTION_URLS.items():
+            assert overview[key] == client.get(url, params).json(), key
+
+    def test_failed_section_is_reported_separately(self):
+        """Section validation errors do not fail the whole overview."""
+        # Arrange
+        _ingest_all()
+
+        # Act
+        response = APIClient().get(OVERVIEW_URL, {'department': 'all', 'journal_tier': 'INVALID'})
+
+        # Assert
+        overview = response.json()
+        assert response.status_code == 200
+        assert overview['publications'] is None
+        assert overview['errors']['publications']['status'] == 400
+        assert overview['students']['total_students'] == 40
+        assert 'departments' in overview['filter_options']
+
+    def test_warm_overview_served_from_section_caches(self):
+        """The second request reads cached section bodies only."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+        client.get(OVERVIEW_URL)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(OVERVIEW_URL)
+
+        # Assert
+        assert response['X-Cache-Sections'] == (
+            'research_funding=HIT, students=HIT, publications=HIT, department_kpi=HIT'
+        )
+        assert all('dataset_versions' in q['sql'] for q in queries.captured_queries)
+
+    def test_client_conditional_and_gzip_headers_apply_to_overview_only(self):
+        """Sections never answer 304 or gzip inside the combined body."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+        etag = client.get(SECTION_URLS['students'])['ETag']
+
+        # Act
+        response = client.get(
+            OVERVIEW_URL, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT_ENCODING='gzip'
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response['Content-Encoding'] == 'gzip'
+        assert b'"students":{' in gzip.decompress(response.content)
@@ -0,0 +1,155 @@
+"""
+Unit tests for the cross-process dataset ingestion lock.
+
+Following test-plan.md:
+- File-lock backend exercised directly (SQLite test database)
+- Waiting jobs must report the holder job ("queued behind job X")
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+
+from data_ingestion.infrastructure.dataset_lock import (
+    AdvisoryDatasetLock,
+    DatasetLock,
+    FileDatasetLock,
+    acquire_dataset_lock,
+    get_dataset_lock,
+)
+
+
+@pytest.fixture
+def lock_dir(tmp_path):
+    """Isolated lock directory per test."""
+    with patch('django.conf.settings.INGESTION_LOCK_DIR', str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.mark.unit
+class TestFileDatasetLock:
+    """File-lock fallback used on non-PostgreSQL backends."""
+
+    def test_sqlite_backend_uses_file_lock(self, lock_dir):
+        """Non-PostgreSQL connections fall back to FileDatasetLock."""
+        assert isinstance(get_dataset_lock('students', 'job-a'), FileDatasetLock)
+
+    def test_second_holder_is_excluded_until_release(self, lock_dir):
+        """Only one job may hold a dataset lock at a time."""
+        # Arrange
+        first = FileDatasetLock('students', 'job-a')
+        second = FileDatasetLock('students', 'job-b')
+
+        # Act / Assert
+        assert first.try_acquire() is True
+        assert second.try_acquire() is False
+        assert second.current_holder() == 'job-a'
+
+        first.release()
+        assert second.try_acquire() is True
+        assert first.current_holder() == 'job-b'
+        second.release()
+
+    def test_different_datasets_do_not_conflict(self, lock_dir):
+        """Locks are per dataset."""
+        # Arrange
+        students = FileDatasetLock('students', 'job-a')
+        kpi = FileDatasetLock('kpi', 'job-b')
+
+        # Act / Assert
+        assert students.try_acquire() is True
+        assert kpi.try_acquire() is True
+        students.release()
+        kpi.release()
+
+
+@pytest.mark.unit
+class TestDatasetLockInterface:
+    """Abstract base class of the lock backends."""
+
+    def test_incomplete_backend_cannot_be_instantiated(self):
+        """A backend missing release() fails when created, not when releasing."""
+        # Arrange
+        class NoReleaseLock(DatasetLock):
+            def try_acquire(self):
+                return True
+
+            def current_holder(self):
+                return None
+
+        # Act / Assert
+        with pytest.raises(TypeError):
+            NoReleaseLock('students', 'job-1')
+
+
+@pytest.mark.unit
+class TestAcquireDatasetLock:
+    """Blocking acquire with wait reporting and checkpoints."""
+
+    def test_uncontended_acquire_does_not_wait(self, lock_dir):
+        """Free lock is taken immediately without calling on_wait."""
+        waits = []
+
+        with acquire_dataset_lock('students', 'job-a', on_wait=waits.append) as waited:
+            assert waited is False
+
+        assert waits == []
+
+    def test_waiter_reports_holder_and_runs_after_release(self, lock_dir):
+        """A waiting job reports the holder and proceeds once it is released."""
+        # Arrange
+        holder_ready = threading.Event()
+        release_holder = threading.Event()
+        waits = []
+        order = []
+
+        def holder():
+            with acquire_dataset_lock('students', 'job-a', poll_seconds=0.01):
+                order.append('a')
+                holder_ready.set()
+                release_holder.wait(timeout=5)
+
+        def on_wait(blocked_by):
+            waits.append(blocked_by)
+            release_holder.set()
+
+        # Act
+        holder_thread = threading.Thread(target=holder)
+        holder_thread.start()
+        holder_ready.wait(timeout=5)
+        with acquire_dataset_lock('students', 'job-b', on_wait=on_wait, poll_seconds=0.01) as waited:
+            order.append('b')
+        holder_thread.join()
+
+        # Assert
+        assert waited is True
+        assert waits == ['job-a']
+        assert order == ['a', 'b']
+
+    def test_checkpoint_can_abort_waiting(self, lock_dir):
+        """An exception from checkpoint stops waiting without taking the lock."""
+        # Arrange
+        held = FileDatasetLock('students', 'job-a')
+        held.try_acquire()
+
+        def checkpoint():
+            raise RuntimeError('cancelled')
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            with acquire_dataset_lock('students', 'job-b', checkpoint=checkpoint, poll_seconds=0.01):
+                pass
+
+        assert held.current_holder() == 'job-a'
+        held.release()
+
+
+@pytest.mark.unit
+class TestAdvisoryDatasetLock:
+    """PostgreSQL advisory lock key derivation."""
+
+    def test_key_is_stable_and_per_dataset(self):
+        """Keys must match across processes (no randomized hash())."""
+        assert AdvisoryDatasetLock('students', 'a').key == AdvisoryDatasetLock('students', 'b').key
+        assert AdvisoryDatasetLock('students', 'a').key != AdvisoryDatasetLock('kpi', 'a').key
+        assert 0 <= AdvisoryDatasetLock('students', 'a').key < 2 ** 32
@@ -0,0 +1,164 @@
+"""
+Tests for the read-replica database router.
+
+Following test-plan.md:
+- Dataset reads go to the replica, other models and all writes to the primary
+- Nothing is routed while no replica is configured
+- Dataset reads stay on the primary during the read-your-writes window after
+  an ingestion and inside write transactions
+- The window is looked up once per request; outside requests a closed one
+  is reused until the dataset version changes or the recheck interval passes
+"""
+
+from datetime import timedelta
+
+import pytest
+from unittest.mock import patch
+from django.core.signals import request_finished, request_started
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from data_ingestion.infrastructure import db_router
+from data_ingestion.infrastructure.query_cache import known_dataset_version
+from data_ingestion.infrastructure.dataset_versions import (
+    DATASET_STUDENTS,
+    bump_dataset_version,
+    get_dataset_version,
+)
+from data_ingestion.infrastructure.models import DatasetVersion, IngestionLock, Student
+
+router = db_router.ReplicaRouter()
+
+
+@pytest.fixture
+def replica():
+    """A configured replica; each test starts outside any request."""
+    db_router._finish_request()
+    with patch.object(db_router, 'replica_configured', return_value=True):
+        yield
+    db_router._finish_request()
+
+
+def _ingested(seconds_ago: float) -> int:
+    bump_dataset_version(DATASET_STUDENTS)
+    DatasetVersion.objects.update(updated_at=timezone.now() - timedelta(seconds=seconds_ago))
+    return get_dataset_version(DATASET_STUDENTS)
+
+
+def _lookups(queries: CaptureQueriesContext) -> list:
+    """The router's last-ingestion lookups among the captured queries."""
+    return [
+        q for q in queries.captured_queries
+        if q['sql'].startswith('SELECT') and '"updated_at"' in q['sql'] and 'WHERE' not in q['sql']
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db(transaction=True)
+class TestReplicaRouter:
+    """ReplicaRouter.db_for_read / db_for_write"""
+
+    def test_dataset_reads_go_to_replica(self, replica):
+        # Act / Assert
+        assert router.db_for_read(Student) == db_router.REPLICA_DATABASE
+        assert router.db_for_read(DatasetVersion) is None
+        assert router.db_for_read(IngestionLock) is None
+
+    def test_writes_go_to_primary(self, replica):
+        # Act / Assert
+        assert router.db_for_write(Student) == db_router.PRIMARY_DATABASE
+
+    def test_no_routing_without_replica(self):
+        # Act / Assert
+        assert router.db_for_read(Student) is None
+
+    def test_reads_stay_on_primary_after_ingestion(self, replica):
+        # Arrange
+        _ingested(seconds_ago=1)
+
+        # Act / Assert
+        assert router.db_for_read(Student) == db_router.PRIMARY_DATABASE
+
+    def test_reads_return_to_replica_after_window(self, replica, settings):
+        # Arrange
+        settings.DB_REPLICA_READ_YOUR_WRITES_SECONDS = 30
+        _ingested(seconds_ago=60)
+
+        # Act / Assert
+        assert router.db_for_read(Student) == db_router.REPLICA_DATABASE
+
+    def test_reads_inside_write_transaction_use_primary(self, replica):
+        # Act
+        with transaction.atomic():
+            db = router.db_for_read(Student)
+
+        # Assert
+        assert db == db_router.PRIMARY_DATABASE
+
+    def test_window_looked_up_once_per_request(self, replica):
+        # Arrange
+        request_started.send(sender=self.__class__)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            first = router.db_for_read(Student)
+            _ingested(seconds_ago=1)
+            second = router.db_for_read(Student)
+        request_finished.send(sender=self.__class__)
+        next_request = router.db_for_read(Student)
+
+        # Assert
+        assert len(_lookups(queries)) == 1
+        assert first == second == db_router.REPLICA_DATABASE
+        assert next_request == db_router.PRIMARY_DATABASE
+
+    def test_closed_window_reused_outside_requests(self, replica, settings):
+        # Arrange
+        settings.DB_REPLICA_RECHECK_SECONDS = 60
+        version = _ingested(seconds_ago=60)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            unscoped = [router.db_for_read(Student) for _ in range(5)]
+            with known_dataset_version(DATASET_STUDENTS, version):
+                scoped = [router.db_for_read(Student) for _ in range(5)]
+
+        # Assert
+        assert len(_lookups(queries)) == 1
+        assert unscoped == scoped == [db_router.REPLICA_DATABASE] * 5
+
+    def test_closed_window_looked_up_again_after_recheck_interval(self, replica, settings):
+        # Arrange
+        settings.DB_REPLICA_RECHECK_SECONDS = 5
+        _ingested(seconds_ago=60)
+        router.db_for_read(Student)
+
+        # Act
+        with patch.object(db_router.time, 'time', return_value=db_router.time.time() + 10):
+            with CaptureQueriesContext(connection) as queries:
+                router.db_for_read(Student)
+                router.db_for_read(Student)
+
+        # Assert
+        assert len(_lookups(queries)) == 1
+
+    def test_new_dataset_version_reopens_closed_window(self, replica, settings):
+        # Arrange: a warm-up thread saw the window closed, then another
+        # worker ingested and this thread computes at the new version
+        settings.DB_REPLICA_RECHECK_SECONDS = 60
+        _ingested(seconds_ago=60)
+        router.db_for_read(Student)
+        version = _ingested(seconds_ago=1)
+
+        # Act
+        with known_dataset_version(DATASET_STUDENTS, version):
+            db = router.db_for_read(Student)
+
+        # Assert
+        assert db == db_router.PRIMARY_DATABASE
+
+    def test_migrations_skip_replica(self):
+        # Act / Assert
+        assert router.allow_migrate(db_router.REPLICA_DATABASE, 'data_ingestion') is False
+        assert router.allow_migrate(db_router.PRIMARY_DATABASE, 'data_ingestion') is None
@@ -0,0 +1,99 @@
+"""
+Tests for the cached per-dataset department catalog.
+
+Following test-plan.md:
+- Department validation costs one version read, not a DISTINCT scan
+- Ingestion invalidates the cached set
+- Filter options list the departments present in the data
+"""
+
+import pandas as pd
+import pytest
+from django.core.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from data_ingestion.infrastructure.models import Student
+from data_ingestion.infrastructure.repositories import (
+    StudentRepository,
+    save_student_data,
+    save_department_kpi_data,
+)
+from data_ingestion.services.student_dashboard_service import StudentDashboardService
+
+
+def _ingest_students(departments):
+    save_student_data(pd.DataFrame({
+        'student_id': [f'S{i:03d}' for i in range(len(departments))],
+        'department': departments,
+        'grade': [1] * len(departments),
+        'program_type': ['학사'] * len(departments),
+        'enrollment_status': ['재학'] * len(departments),
+    }))
+
+
+@pytest.mark.django_db
+class TestDepartmentCatalog:
+    """Version-keyed department sets."""
+
+    def test_cached_lookup_reads_only_dataset_version(self, django_assert_num_queries):
+        # Arrange
+        _ingest_students(['컴퓨터공학과', '전자공학과', '컴퓨터공학과'])
+        repository = StudentRepository()
+        repository.get_all_departments()
+
+        # Act
+        with django_assert_num_queries(1):
+            departments = repository.get_all_departments()
+
+        # Assert
+        assert departments == frozenset({'컴퓨터공학과', '전자공학과'})
+
+    def test_ingestion_invalidates_cached_set(self):
+        # Arrange
+        _ingest_students(['컴퓨터공학과'])
+        service = StudentDashboardService(StudentRepository())
+        with pytest.raises(ValidationError):
+            service._validate_inputs('경영학과', '재학')
+
+        # Act
+        _ingest_students(['컴퓨터공학과', '경영학과'])
+
+        # Assert: no error once the department has been ingested
+        service._validate_inputs('경영학과', '재학')
+
+    def test_never_ingested_dataset_is_not_cached(self):
+        """Rows written directly through the ORM are always visible."""
+        # Arrange
+        repository = StudentRepository()
+        assert repository.get_all_departments() == frozenset()
+
+        # Act
+        Student.objects.create(
+            student_id='S1', department='물리학과', grade=1,
+            program_type='학사', enrollment_status='재학'
+        )
+
+        # Assert
+        assert repository.get_all_departments() == frozenset({'물리학과'})
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestFilterOptionsDepartments:
+    """Filter dropdown options come from the catalog."""
+
+    def test_departments_are_union_of_datasets(self):
+        # Arrange
+        _ingest_students(['전자공학과'])
+        save_department_kpi_data(pd.DataFrame({
+            'evaluation_year': [2024],
+            'department': ['화학공학과'],
+            'employment_rate': [80.0],
+            'tech_transfer_income': [1.0],
+        }))
+
+        # Act
+        response = APIClient().get('/api/dashboard/filter-options/')
+
+        # Assert
+        assert response.json()['departments'] == ['all', '전자공학과', '화학공학과']
@@ -14,8 +14,14 @@ from unittest.mock import Mock, patch, MagicMock, call
 from data_ingestion.services.ingestion_service import (
     submit_upload_job,
     process_upload,
+    cancel_upload_job,
+    check_admission,
+    estimate_completion_seconds,
+    QueueFullError,
+    TempQuotaExceededError,
     FILE_TYPE_PARSERS
 )
+from data_ingestion.infrastructure.job_status_store import JobStatusStore, JobStatus
 from data_ingestion.services.excel_parser import ValidationError
 
 
@@ -265,6 +271,262 @@ class TestProcessUpload:
         mock_job_store.update_status.assert_called()
 
 
+@pytest.mark.unit
+class TestJobCancellationAndCoalescing:
+    """Test cancellation, timeout and superseded-upload coalescing."""
+
+    @pytest.fixture(autouse=True)
+    def job_store(self):
+        """Real store (so statuses can be asserted) with executor stubbed out."""
+        from data_ingestion.services import ingestion_service
+        store = JobStatusStore()
+        with patch('data_ingestion.services.ingestion_service.get_job_store', return_value=store), \
+                patch('data_ingestion.services.ingestion_service.executor'), \
+                patch.dict(ingestion_service._jobs, clear=True):
+            yield store
+
+    def test_newer_upload_supersedes_queued_job(self, job_store):
+        """A queued job whose only file is re-uploaded should be cancelled."""
+        # Act
+        old_job = submit_upload_job({'students': '/tmp/old.csv'})
+        new_job = submit_upload_job({'students': '/tmp/new.csv'})
+
+        # Assert
+        assert job_store.get_job(old_job).status == JobStatus.CANCELLED
+        assert new_job in job_store.get_job(old_job).error_message
+        assert job_store.get_job(new_job).status == JobStatus.PENDING
+
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    def test_partially_superseded_job_keeps_remaining_files(self, mock_read_csv, job_store):
+        """Only the re-uploaded file type is dropped from the older job."""
+        # Arrange
+        mock_df = pd.DataFrame({'test': [1]})
+        mock_read_csv.return_value = mock_df
+        old_job = submit_upload_job({'students': '/tmp/s.csv', 'kpi': '/tmp/k.csv'})
+        submit_upload_job({'students': '/tmp/s2.csv'})
+
+        # Act
+        with patch.dict(FILE_TYPE_PARSERS, {
+            'students': (Mock(return_value=mock_df), Mock(return_value={'rows_inserted': 1})),
+            'kpi': (Mock(return_value=mock_df), Mock(return_value={'rows_inserted': 1})),
+        }):
+            process_upload(old_job, {'students': '/tmp/s.csv', 'kpi': '/tmp/k.csv'})
+
+        # Assert
+        mock_read_csv.assert_called_once_with('/tmp/k.csv', encoding='utf-8')
+        assert job_store.get_job(old_job).status == JobStatus.COMPLETED
+
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    def test_cancel_queued_job_skips_processing(self, mock_read_csv, job_store):
+        """Cancelling before start marks job cancelled and skips all work."""
+        # Arrange
+        job_id = submit_upload_job({'students': '/tmp/s.csv'})
+
+        # Act
+        cancelled = cancel_upload_job(job_id)
+        process_upload(job_id, {'students': '/tmp/s.csv'})
+
+        # Assert
+        assert cancelled is True
+        assert job_store.get_job(job_id).status == JobStatus.CANCELLED
+        mock_read_csv.assert_not_called()
+
+    def test_cancelled_and_superseded_jobs_are_unregistered_when_picked_up(self, job_store):
+        """Jobs skipped at start leave no control state behind."""
+        from data_ingestion.services import ingestion_service
+
+        # Arrange
+        cancelled_job = submit_upload_job({'kpi': '/tmp/k.csv'})
+        cancel_upload_job(cancelled_job)
+        superseded_job = submit_upload_job({'students': '/tmp/old.csv'})
+        new_job = submit_upload_job({'students': '/tmp/new.csv'})
+
+        # Act
+        process_upload(cancelled_job, {'kpi': '/tmp/k.csv'})
+        process_upload(superseded_job, {'students': '/tmp/old.csv'})
+
+        # Assert
+        assert list(ingestion_service._jobs) == [new_job]
+
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    def test_cancel_running_job_stops_at_checkpoint(self, mock_read_csv, job_store):
+        """Cancelling a running job aborts at the next checkpoint."""
+        # Arrange
+        mock_df = pd.DataFrame({'test': [1]})
+        mock_read_csv.return_value = mock_df
+        job_id = submit_upload_job({'students': '/tmp/s.csv', 'kpi': '/tmp/k.csv'})
+
+        def repo_that_gets_cancelled(df, replace=True, checkpoint=None):
+            cancel_upload_job(job_id)
+            checkpoint()
+
+        kpi_repo = Mock(return_value={'rows_inserted': 1})
+
+        # Act
+        with patch.dict(FILE_TYPE_PARSERS, {
+            'students': (Mock(return_value=mock_df), repo_that_gets_cancelled),
+            'kpi': (Mock(return_value=mock_df), kpi_repo),
+        }):
+            process_upload(job_id, {'students': '/tmp/s.csv', 'kpi': '/tmp/k.csv'})
+
+        # Assert
+        assert job_store.get_job(job_id).status == JobStatus.CANCELLED
+        kpi_repo.assert_not_called()
+        assert cancel_upload_job(job_id) is False  # already finished
+
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    def test_job_exceeding_timeout_fails(self, mock_read_csv, job_store):
+        """A job past its wall-clock timeout fails at the next checkpoint."""
+        # Arrange
+        job_id = submit_upload_job({'students': '/tmp/s.csv'})
+
+        # Act
+        with patch('django.conf.settings.INGESTION_JOB_TIMEOUT_SECONDS', -1):
+            process_upload(job_id, {'students': '/tmp/s.csv'})
+
+        # Assert
+        job_info = job_store.get_job(job_id)
+        assert job_info.status == JobStatus.FAILED
+        assert '초과' in job_info.error_message
+        mock_read_csv.assert_not_called()
+
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    def test_job_waits_for_dataset_lock_held_by_other_job(self, mock_read_csv, job_store, tmp_path):
+        """A job blocked on the dataset lock shows WAITING behind the holder."""
+        # Arrange
+        from data_ingestion.infrastructure.dataset_lock import FileDatasetLock
+        mock_df = pd.DataFrame({'test': [1]})
+        mock_read_csv.return_value = mock_df
+        job_id = submit_upload_job({'students': '/tmp/s.csv'})
+        observed = []
+
+        with patch('django.conf.settings.INGESTION_LOCK_DIR', str(tmp_path)), \
+                patch('django.conf.settings.INGESTION_LOCK_POLL_SECONDS', 0.01):
+            other = FileDatasetLock('students', 'other-job')
+            other.try_acquire()
+
+            def mark_waiting_then_release(waiting_job_id, blocked_by):
+                JobStatusStore.mark_waiting(job_store, waiting_job_id, blocked_by)
+                observed.append(job_store.get_job(waiting_job_id))
+                other.release()
+
+            # Act
+            with patch.object(job_store, 'mark_waiting', side_effect=mark_waiting_then_release), \
+                    patch.dict(FILE_TYPE_PARSERS, {
+                        'students': (Mock(return_value=mock_df), Mock(return_value={'rows_inserted': 1})),
+                    }):
+                process_upload(job_id, {'students': '/tmp/s.csv'})
+
+        # Assert
+        assert observed[0].status == JobStatus.WAITING
+        assert observed[0].blocked_by == 'other-job'
+        assert job_store.get_job(job_id).status == JobStatus.COMPLETED
+        assert job_store.get_job(job_id).blocked_by is None
+
+    def test_cancel_unknown_job_returns_false(self):
+        """Unknown job IDs cannot be cancelled."""
+        assert cancel_upload_job('no-such-job') is False
+
+
+@pytest.mark.unit
+class TestAdmissionControl:
+    """Test bounded queue, temp-disk quota and wait-time estimates."""
+
+    @pytest.fixture(autouse=True)
+    def job_store(self):
+        """Isolated store, executor stub and empty queue/throughput state."""
+        from data_ingestion.services import ingestion_service
+        store = JobStatusStore()
+        with patch('data_ingestion.services.ingestion_service.get_job_store', return_value=store), \
+                patch('data_ingestion.services.ingestion_service.executor'), \
+                patch.dict(ingestion_service._jobs, clear=True), \
+                patch.object(ingestion_service, '_recent_durations', ingestion_service.deque(maxlen=20)):
+            yield store
+
+    @staticmethod
+    def _write_upload(tmp_path, name, size):
+        """Create a temp upload dir holding one file of the given size."""
+        temp_dir = tmp_path / name
+        temp_dir.mkdir()
+        file_path = temp_dir / 'students.csv'
+        file_path.write_bytes(b'x' * size)
+        return str(temp_dir), str(file_path)
+
+    def test_queue_full_rejects_with_retry_after(self):
+        """Submitting beyond INGESTION_MAX_QUEUE_DEPTH raises QueueFullError."""
+        # Arrange
+        with patch('django.conf.settings.INGESTION_MAX_QUEUE_DEPTH', 2):
+            submit_upload_job({'students': '/tmp/a.csv'})
+            submit_upload_job({'kpi': '/tmp/b.csv'})
+
+            # Act / Assert
+            with pytest.raises(QueueFullError) as exc_info:
+                submit_upload_job({'publications': '/tmp/c.csv'})
+
+        assert exc_info.value.retry_after >= 1
+
+    def test_temp_quota_counts_owned_files(self, tmp_path):
+        """Bytes held by queued jobs count toward INGESTION_TEMP_QUOTA_BYTES."""
+        # Arrange
+        temp_dir, file_path = self._write_upload(tmp_path, 'upload_a', 600)
+
+        with patch('django.conf.settings.INGESTION_TEMP_QUOTA_BYTES', 1000):
+            submit_upload_job({'students': file_path}, temp_dir=temp_dir)
+
+            # Act / Assert
+            check_admission(400)
+            with pytest.raises(TempQuotaExceededError):
+                check_admission(401)
+
+    def test_superseded_upload_frees_temp_files(self, tmp_path):
+        """Coalesced uploads delete their temp files and release quota."""
+        # Arrange
+        old_dir, old_path = self._write_upload(tmp_path, 'upload_old', 100)
+        new_dir, new_path = self._write_upload(tmp_path, 'upload_new', 100)
+
+        # Act
+        submit_upload_job({'students': old_path}, temp_dir=old_dir)
+        submit_upload_job({'students': new_path}, temp_dir=new_dir)
+
+        # Assert
+        import os
+        assert not os.path.exists(old_dir)
+        assert os.path.exists(new_path)
+
+    @patch('data_ingestion.services.ingestion_service.pd.read_csv')
+    def test_process_upload_removes_temp_dir_and_records_duration(self, mock_read_csv, tmp_path):
+        """Finished jobs delete their temp dir and feed the throughput window."""
+        # Arrange
+        from data_ingestion.services import ingestion_service
+        import os
+        mock_df = pd.DataFrame({'test': [1]})
+        mock_read_csv.return_value = mock_df
+        temp_dir, file_path = self._write_upload(tmp_path, 'upload_run', 10)
+        job_id = submit_upload_job({'students': file_path}, temp_dir=temp_dir)
+
+        # Act
+        with patch.dict(FILE_TYPE_PARSERS, {
+            'students': (Mock(return_value=mock_df), Mock(return_value={'rows_inserted': 1})),
+        }):
+            process_upload(job_id, {'students': file_path})
+
+        # Assert
+        assert not os.path.exists(temp_dir)
+        assert len(ingestion_service._recent_durations) == 1
+
+    def test_estimate_scales_with_queue_position_and_throughput(self):
+        """Estimate = (jobs ahead + 1) * average recent job duration."""
+        # Arrange
+        from data_ingestion.services import ingestion_service
+        ingestion_service._recent_durations.extend([4.0, 6.0])
+        first = submit_upload_job({'students': '/tmp/a.csv'})
+        second = submit_upload_job({'kpi': '/tmp/b.csv'})
+
+        # Act / Assert
+        assert estimate_completion_seconds(first) == 5
+        assert estimate_completion_seconds(second) == 10
+
+
 @pytest.mark.unit
 class TestFileTypeParsers:
     """Test FILE_TYPE_PARSERS configuration."""
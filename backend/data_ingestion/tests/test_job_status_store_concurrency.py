@@ -286,3 +286,128 @@ class TestJobStatusStoreBasicOperations:
 
         # Assert
         assert job_info is None
+
+    def test_job_info_snapshot_is_immutable(self):
+        """Snapshots returned by get_job must not change after later updates."""
+        # Arrange
+        store = JobStatusStore()
+        job_id = "test-job-5"
+        store.create_job(job_id)
+        before = store.get_job(job_id)
+
+        # Act
+        store.update_progress(job_id, progress=10, total=100)
+        after = store.get_job(job_id)
+
+        # Assert
+        assert before.progress == 0
+        assert after.progress == 10
+        with pytest.raises(AttributeError):
+            before.progress = 99
+
+
+    def test_get_jobs_returns_requested_ids_in_order(self):
+        """Batch lookup returns snapshots in request order, None for unknown."""
+        # Arrange
+        store = JobStatusStore()
+        store.create_job("job-a")
+        store.create_job("job-b")
+
+        # Act
+        jobs = store.get_jobs(["job-b", "missing", "job-a"])
+
+        # Assert
+        assert list(jobs.keys()) == ["job-b", "missing", "job-a"]
+        assert jobs["job-b"].job_id == "job-b"
+        assert jobs["missing"] is None
+
+    def test_find_jobs_updated_since(self):
+        """Only jobs updated at or after the timestamp are returned."""
+        # Arrange
+        from datetime import datetime
+        store = JobStatusStore()
+        store.create_job("old-job")
+        time.sleep(0.01)
+        cutoff = datetime.now()
+        store.create_job("new-job")
+
+        # Act
+        jobs = store.find_jobs_updated_since(cutoff)
+
+        # Assert
+        assert [job.job_id for job in jobs] == ["new-job"]
+
+@pytest.mark.unit
+class TestJobStatusStoreReadThroughput:
+    """
+    Read-optimized store: readers must never block on writers.
+
+    Benchmark prints get_job throughput at 1, 8 and 64 reader threads
+    while a writer continuously publishes progress updates.
+    """
+
+    def test_reader_does_not_block_while_writer_lock_held(self):
+        """get_job must return even while the writer lock is held."""
+        # Arrange
+        store = JobStatusStore()
+        job_id = "lock-free-read"
+        store.create_job(job_id)
+        result = []
+
+        # Act: hold the writer lock and read from another thread
+        with store._lock:
+            reader = threading.Thread(target=lambda: result.append(store.get_job(job_id)))
+            reader.start()
+            reader.join(timeout=1.0)
+            blocked = reader.is_alive()
+
+        # Assert
+        assert not blocked, "Reader blocked on writer lock"
+        assert result[0].job_id == job_id
+
+    @pytest.mark.parametrize("num_readers", [1, 8, 64])
+    def test_read_throughput_under_concurrent_writes(self, num_readers):
+        """Benchmark: polling throughput with a concurrent progress writer."""
+        # Arrange
+        store = JobStatusStore()
+        job_id = f"throughput-{num_readers}"
+        store.create_job(job_id)
+        store.update_progress(job_id, progress=0, total=1_000_000)
+        reads_per_reader = 20_000
+        stop_writer = threading.Event()
+        errors = []
+
+        def writer_worker():
+            while not stop_writer.is_set():
+                store.increment_progress(job_id)
+
+        def reader_worker():
+            last_progress = 0
+            try:
+                for _ in range(reads_per_reader):
+                    job_info = store.get_job(job_id)
+                    # Snapshots are published in order: progress never goes back
+                    assert job_info.progress >= last_progress
+                    last_progress = job_info.progress
+            except Exception as e:
+                errors.append(e)
+
+        # Act
+        writer = threading.Thread(target=writer_worker)
+        readers = [threading.Thread(target=reader_worker) for _ in range(num_readers)]
+        writer.start()
+        start = time.perf_counter()
+        for thread in readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        stop_writer.set()
+        writer.join()
+
+        # Assert
+        total_reads = num_readers * reads_per_reader
+        print(f"\n[benchmark] readers={num_readers} reads={total_reads} "
+              f"reads/sec={total_reads / elapsed:,.0f}")
+        assert not errors, f"Inconsistent snapshot observed: {errors}"
+        assert store.get_job(job_id).progress > 0
@@ -259,3 +259,60 @@ class DepartmentKPIAPIIntegrationTestCase(TestCase):
         # Assert: Years are in ascending order
         years = [item['evaluation_year'] for item in data]
         self.assertEqual(years, sorted(years))
+
+    def test_department_comparison_returns_series_per_department(self):
+        """departments 파라미터로 학과별 추이를 한 응답에 반환"""
+        # Act
+        response = self.client.get(self.url, {
+            'departments': '전자공학과,컴퓨터공학과',
+            'start_year': 2019,
+            'end_year': 2023
+        })
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        series = response.data['data']
+        self.assertEqual([item['department'] for item in series], ['전자공학과', '컴퓨터공학과'])
+        for item in series:
+            single = self.client.get(self.url, {
+                'department': item['department'],
+                'start_year': 2019,
+                'end_year': 2023
+            }).data
+            self.assertEqual(item['trend'], single['data'])
+            self.assertEqual(item['overall_avg_employment_rate'], single['meta']['overall_avg_employment_rate'])
+
+    def test_departments_with_department_filter_returns_400(self):
+        """departments와 department 동시 사용 시 400"""
+        # Act
+        response = self.client.get(self.url, {
+            'departments': '전자공학과,컴퓨터공학과',
+            'department': '컴퓨터공학과'
+        })
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+    def test_compare_to_previous_year(self):
+        """compare_to=previous_year 로 전년 대비 취업률 변화 조회"""
+        # Act
+        response = self.client.get(self.url, {
+            'department': '컴퓨터공학과',
+            'start_year': 2023,
+            'end_year': 2023,
+            'compare_to': 'previous_year'
+        })
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        employment_rate = response.data['comparison']['metrics']['employment_rate']
+        self.assertEqual((employment_rate['current'], employment_rate['previous']), (80.2, 78.5))
+        self.assertEqual(employment_rate['delta'], 1.7)
+
+    def test_invalid_compare_to_returns_400(self):
+        """잘못된 compare_to 값은 400"""
+        # Act
+        response = self.client.get(self.url, {'compare_to': 'last_decade'})
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
@@ -185,3 +185,43 @@ class KPIRepositoryTestCase(TestCase):
         self.assertEqual(len(departments), 2)
         self.assertIn('컴퓨터공학과', departments)
         self.assertIn('전자공학과', departments)
+
+    def test_yearly_summary_by_department_in_one_query(self):
+        """여러 학과의 년도별 요약을 한 번의 그룹 쿼리로 조회"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            summaries = self.repository.get_yearly_summary_by_department(
+                departments=['전자공학과', '컴퓨터공학과', '없는학과'],
+                start_year=2020,
+                end_year=2023
+            )
+
+        # Assert: One query, each department summarized as on its own
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(list(summaries), ['전자공학과', '컴퓨터공학과', '없는학과'])
+        for department in ('전자공학과', '컴퓨터공학과'):
+            self.assertEqual(
+                summaries[department],
+                self.repository.get_yearly_summary(department, 2020, 2023)
+            )
+        self.assertEqual(
+            summaries['없는학과'],
+            {'data': [], 'overall_avg_employment_rate': None}
+        )
+
+    def test_employment_rate_by_window(self):
+        """여러 년도 구간의 평균 취업률을 한 번의 조건부 집계로 조회"""
+        # Act
+        rates = self.repository.get_employment_rate_by_window(
+            '컴퓨터공학과',
+            {'current': (2023, 2023), 'previous': (2022, 2022), 'range': (2019, 2021), 'empty': (2010, 2011)}
+        )
+
+        # Assert
+        self.assertAlmostEqual(rates['current'], 80.2)
+        self.assertAlmostEqual(rates['previous'], 78.5)
+        self.assertAlmostEqual(rates['range'], (76.2 + 77.8 + 79.1) / 3)
+        self.assertIsNone(rates['empty'])
@@ -109,34 +109,30 @@ class KPIServiceTestCase(TestCase):
     @patch('data_ingestion.services.kpi_service.KPIRepository')
     def test_get_kpi_trend_returns_aggregated_data(self, mock_repo_class):
         """학과 KPI 추이 데이터 정상 집계"""
-        # Arrange: Mock repository to return QuerySet
+        # Arrange: Mock repository to return the per-year summary
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
 
-        # Create mock QuerySet with aggregate results
-        mock_queryset = Mock()
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = [
-            {
-                'evaluation_year': 2019,
-                'avg_employment_rate': 76.2,
-                'total_tech_income': 8.5
-            },
-            {
-                'evaluation_year': 2020,
-                'avg_employment_rate': 77.8,
-                'total_tech_income': 10.2
-            },
-            {
-                'evaluation_year': 2021,
-                'avg_employment_rate': 79.1,
-                'total_tech_income': 11.8
-            },
-        ]
-
-        # Mock aggregate for overall average
-        mock_queryset.aggregate.return_value = {'avg': 77.7}
-
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        mock_repo.get_yearly_summary.return_value = {
+            'data': [
+                {
+                    'evaluation_year': 2019,
+                    'avg_employment_rate': 76.2,
+                    'total_tech_income': 8.5
+                },
+                {
+                    'evaluation_year': 2020,
+                    'avg_employment_rate': 77.8,
+                    'total_tech_income': 10.2
+                },
+                {
+                    'evaluation_year': 2021,
+                    'avg_employment_rate': 79.1,
+                    'total_tech_income': 11.8
+                },
+            ],
+            'overall_avg_employment_rate': 77.7
+        }
 
         # Create new service with mocked repository
         service = KPIService()
@@ -170,17 +166,16 @@ class KPIServiceTestCase(TestCase):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
 
-        mock_queryset = Mock()
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = [
-            {
-                'evaluation_year': 2020,
-                'avg_employment_rate': 78.5,
-                'total_tech_income': 12.3
-            },
-        ]
-        mock_queryset.aggregate.return_value = {'avg': 78.5}
-
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        mock_repo.get_yearly_summary.return_value = {
+            'data': [
+                {
+                    'evaluation_year': 2020,
+                    'avg_employment_rate': 78.5,
+                    'total_tech_income': 12.3
+                },
+            ],
+            'overall_avg_employment_rate': 78.5
+        }
 
         # Create new service
         service = KPIService()
@@ -196,7 +191,7 @@ class KPIServiceTestCase(TestCase):
         self.assertEqual(result['meta']['department_filter'], '컴퓨터공학과')
 
         # Assert: Repository was called with correct department
-        mock_repo.find_by_department_and_year.assert_called_once_with(
+        mock_repo.get_yearly_summary.assert_called_once_with(
             department='컴퓨터공학과',
             start_year=2020,
             end_year=2023
@@ -205,15 +200,14 @@ class KPIServiceTestCase(TestCase):
     @patch('data_ingestion.services.kpi_service.KPIRepository')
     def test_overall_avg_employment_rate_is_null_when_no_data(self, mock_repo_class):
         """데이터 없을 때 overall_avg_employment_rate = null"""
-        # Arrange: Empty queryset
+        # Arrange: Empty summary
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
 
-        mock_queryset = Mock()
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = []
-        mock_queryset.aggregate.return_value = {'avg': None}
-
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        mock_repo.get_yearly_summary.return_value = {
+            'data': [],
+            'overall_avg_employment_rate': None
+        }
 
         # Create new service
         service = KPIService()
@@ -237,12 +231,11 @@ class KPIServiceTestCase(TestCase):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
 
-        mock_queryset = Mock()
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = []
         # Average is 78.456 (should round to 78.5)
-        mock_queryset.aggregate.return_value = {'avg': 78.456}
-
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        mock_repo.get_yearly_summary.return_value = {
+            'data': [],
+            'overall_avg_employment_rate': 78.456
+        }
 
         # Create new service
         service = KPIService()
@@ -264,17 +257,16 @@ class KPIServiceTestCase(TestCase):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
 
-        mock_queryset = Mock()
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = [
-            {
-                'evaluation_year': 2023,
-                'avg_employment_rate': 80.2,
-                'total_tech_income': 14.7
-            },
-        ]
-        mock_queryset.aggregate.return_value = {'avg': 80.2}
-
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        mock_repo.get_yearly_summary.return_value = {
+            'data': [
+                {
+                    'evaluation_year': 2023,
+                    'avg_employment_rate': 80.2,
+                    'total_tech_income': 14.7
+                },
+            ],
+            'overall_avg_employment_rate': 80.2
+        }
 
         # Create new service
         service = KPIService()
@@ -301,3 +293,83 @@ class KPIServiceTestCase(TestCase):
         # Act & Assert: Should raise ValueError
         with self.assertRaises(ValueError):
             self.service.get_kpi_trend(department, start_year, end_year)
+
+    @patch('data_ingestion.services.kpi_service.KPIRepository')
+    def test_get_kpi_comparison_returns_series_per_department(self, mock_repo_class):
+        """여러 학과 비교 시 학과별 추이를 요청 순서대로 반환"""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.get_yearly_summary_by_department.return_value = {
+            '전자공학과': {
+                'data': [{'evaluation_year': 2020, 'avg_employment_rate': 74.5, 'total_tech_income': 6.2}],
+                'overall_avg_employment_rate': 74.5,
+            },
+            '컴퓨터공학과': {
+                'data': [
+                    {'evaluation_year': 2020, 'avg_employment_rate': 77.8, 'total_tech_income': 10.2},
+                    {'evaluation_year': 2021, 'avg_employment_rate': 79.1, 'total_tech_income': 11.8},
+                ],
+                'overall_avg_employment_rate': 78.45,
+            },
+        }
+        service = KPIService()
+
+        # Act
+        result = service.get_kpi_comparison(['컴퓨터공학과', '전자공학과'], 2020, 2021)
+
+        # Assert
+        mock_repo.get_yearly_summary.assert_not_called()
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual([item['department'] for item in result['data']], ['컴퓨터공학과', '전자공학과'])
+        self.assertEqual(len(result['data'][0]['trend']), 2)
+        self.assertEqual(result['data'][0]['overall_avg_employment_rate'], 78.5)
+        self.assertEqual(result['meta']['departments'], ['컴퓨터공학과', '전자공학과'])
+        self.assertEqual(result['meta']['total_count'], 3)
+
+    def test_get_kpi_comparison_validates_year_range(self):
+        """get_kpi_comparison도 년도 범위 검증을 수행"""
+        with self.assertRaises(ValueError):
+            self.service.get_kpi_comparison(['컴퓨터공학과'], 2024, 2019)
+
+    @patch('data_ingestion.services.kpi_service.KPIRepository')
+    def test_get_kpi_trend_with_compare_to(self, mock_repo_class):
+        """compare_to 지정 시 비교 기간 대비 취업률 변화 포함"""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.get_yearly_summary.return_value = {
+            'data': [{'evaluation_year': 2023, 'avg_employment_rate': 80.2, 'total_tech_income': 14.7}],
+            'overall_avg_employment_rate': 80.2,
+        }
+        mock_repo.get_employment_rate_by_window.return_value = {'current': 80.2, 'previous': 78.5}
+        service = KPIService()
+
+        # Act
+        result = service.get_kpi_trend('컴퓨터공학과', 2023, 2023, compare_to='previous_year')
+
+        # Assert
+        mock_repo.get_employment_rate_by_window.assert_called_once_with(
+            '컴퓨터공학과', {'current': (2023, 2023), 'previous': (2022, 2022)}
+        )
+        self.assertEqual(result['comparison']['previous'], {'start_year': 2022, 'end_year': 2022})
+        self.assertEqual(
+            result['comparison']['metrics']['employment_rate'],
+            {'current': 80.2, 'previous': 78.5, 'delta': 1.7, 'change_pct': 2.2}
+        )
+
+    @patch('data_ingestion.services.kpi_service.KPIRepository')
+    def test_get_kpi_trend_without_compare_to_has_no_comparison(self, mock_repo_class):
+        """compare_to 미지정 시 comparison 없음 (추가 쿼리 없음)"""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.get_yearly_summary.return_value = {'data': [], 'overall_avg_employment_rate': None}
+        service = KPIService()
+
+        # Act
+        result = service.get_kpi_trend('all', 2020, 2023)
+
+        # Assert
+        self.assertNotIn('comparison', result)
+        mock_repo.get_employment_rate_by_window.assert_not_called()
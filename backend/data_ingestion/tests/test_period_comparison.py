@@ -0,0 +1,76 @@
+"""
+Unit tests for the period-over-period comparison helpers.
+"""
+
+import pytest
+from datetime import date
+
+from data_ingestion.services.period_comparison import (
+    metric_change,
+    previous_date_window,
+    previous_year_window,
+)
+
+
+@pytest.mark.unit
+class TestComparisonWindows:
+    """previous_date_window() / previous_year_window()"""
+
+    @pytest.mark.parametrize('compare_to, expected', [
+        # Same number of days (91) right before the window
+        ('previous_period', (date(2023, 10, 2), date(2023, 12, 31))),
+        ('previous_year', (date(2023, 1, 1), date(2023, 3, 31))),
+    ])
+    def test_date_window(self, compare_to, expected):
+        # Act
+        window = previous_date_window(date(2024, 1, 1), date(2024, 3, 31), compare_to)
+
+        # Assert
+        assert window == expected
+
+    def test_leap_day_maps_to_february_28(self):
+        # Act
+        window = previous_date_window(date(2024, 1, 1), date(2024, 2, 29), 'previous_year')
+
+        # Assert
+        assert window == (date(2023, 1, 1), date(2023, 2, 28))
+
+    @pytest.mark.parametrize('compare_to, expected', [
+        ('previous_period', (2018, 2020)),
+        ('previous_year', (2020, 2022)),
+    ])
+    def test_year_window(self, compare_to, expected):
+        # Act & Assert
+        assert previous_year_window(2021, 2023, compare_to) == expected
+
+
+@pytest.mark.unit
+class TestMetricChange:
+    """metric_change()"""
+
+    def test_delta_and_percentage(self):
+        # Act
+        change = metric_change(150, 120)
+
+        # Assert
+        assert change == {'current': 150, 'previous': 120, 'delta': 30, 'change_pct': 25.0}
+
+    def test_rounds_values(self):
+        # Act
+        change = metric_change(78.46, 76.22, digits=1)
+
+        # Assert
+        assert change == {'current': 78.5, 'previous': 76.2, 'delta': 2.2, 'change_pct': 2.9}
+
+    @pytest.mark.parametrize('current, previous, delta', [
+        (100, 0, 100),
+        (100, None, None),
+        (None, 100, None),
+    ])
+    def test_no_percentage_without_previous_value(self, current, previous, delta):
+        # Act
+        change = metric_change(current, previous)
+
+        # Assert
+        assert change['delta'] == delta
+        assert change['change_pct'] is None
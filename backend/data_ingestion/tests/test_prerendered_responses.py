@@ -0,0 +1,177 @@
+"""
+Tests for the pre-rendered (and pre-compressed) dashboard response cache.
+
+Following test-plan.md:
+- A warm request writes cached bytes without serializing or rendering
+- gzip copies are served to clients that accept them
+- Benchmark: requests/sec per worker on the hot dashboard paths
+"""
+
+import gzip
+import time
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+from rest_framework.test import APIClient
+
+from data_ingestion.api import responses as api_responses
+from data_ingestion.infrastructure.repositories import (
+    save_research_funding_data,
+    save_student_data,
+    save_publication_data,
+    save_department_kpi_data,
+)
+from data_ingestion.infrastructure.response_cache import (
+    DashboardResponseCache,
+    GZIP_MIN_BYTES,
+    RenderedResponse,
+)
+
+DEPARTMENTS = [f'학과{i:02d}' for i in range(40)]
+
+HOT_URLS = [
+    '/api/dashboard/research-funding/?department=all&period=latest',
+    '/api/dashboard/students/?department=all&status=all',
+    '/api/dashboard/publications/?department=all&journal_tier=all',
+    '/api/dashboard/department-kpi/?department=all',
+]
+
+
+def _ingest_all():
+    count = len(DEPARTMENTS)
+    save_research_funding_data(pd.DataFrame({
+        'execution_id': [f'E{i:03d}' for i in range(count)],
+        'department': DEPARTMENTS,
+        'total_budget': [100_000_000] * count,
+        'execution_date': pd.date_range(end=pd.Timestamp.now().normalize(), periods=count, freq='7D'),
+        'execution_amount': [1_000_000] * count,
+    }))
+    save_student_data(pd.DataFrame({
+        'student_id': [f'S{i:03d}' for i in range(count)],
+        'department': DEPARTMENTS,
+        'grade': [1] * count,
+        'program_type': ['학사'] * count,
+        'enrollment_status': ['재학'] * count,
+    }))
+    save_publication_data(pd.DataFrame({
+        'paper_id': [f'P{i:03d}' for i in range(count)],
+        'department': DEPARTMENTS,
+        'journal_tier': ['SCIE', 'KCI'] * (count // 2),
+        'impact_factor': [1.5] * count,
+    }))
+    save_department_kpi_data(pd.DataFrame({
+        'evaluation_year': [pd.Timestamp.now().year - 1] * count,
+        'department': DEPARTMENTS,
+        'employment_rate': [80.0] * count,
+        'tech_transfer_income': [1.0] * count,
+    }))
+
+
+@pytest.mark.unit
+class TestRenderedResponse:
+    """Pre-compression of rendered bodies."""
+
+    def test_large_bodies_are_precompressed(self):
+        body = b'{"departments": [' + b'"x",' * GZIP_MIN_BYTES + b'"x"]}'
+
+        rendered = RenderedResponse.from_body(body)
+
+        assert gzip.decompress(rendered.gzipped) == body
+
+    def test_small_bodies_or_disabled_setting_skip_gzip(self, settings):
+        large = b'0' * (GZIP_MIN_BYTES * 2)
+
+        small = RenderedResponse.from_body(b'{"total": 1}')
+        settings.DASHBOARD_CACHE_PRECOMPRESS = False
+        disabled = RenderedResponse.from_body(large)
+
+        assert small.gzipped is None
+        assert disabled.gzipped is None
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestPrerenderedDashboardResponses:
+    """Dashboard endpoints served from rendered bytes."""
+
+    def test_warm_request_skips_serialization_and_rendering(self):
+        """Only the first request renders; later ones write the cached body."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+        url = HOT_URLS[1]
+
+        # Act
+        serializer = Mock(wraps=api_responses.DASHBOARD_PAYLOADS['students'])
+        with patch.object(api_responses, 'render_json', wraps=api_responses.render_json) as render, \
+                patch.dict(api_responses.DASHBOARD_PAYLOADS, students=serializer):
+            responses = [client.get(url) for _ in range(3)]
+
+        # Assert
+        assert render.call_count == 1
+        assert serializer.call_count == 1
+        assert [r['X-Cache'] for r in responses] == ['MISS', 'HIT', 'HIT']
+        assert responses[0].content == responses[2].content
+        assert responses[2].json() == responses[2].data
+
+    def test_gzip_body_served_when_accepted(self):
+        """The pre-compressed copy is sent as-is with Content-Encoding."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+        url = HOT_URLS[1]
+        plain = client.get(url)
+
+        # Act
+        compressed = client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        # Assert
+        assert 'Content-Encoding' not in plain
+        assert compressed['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in compressed['Vary']
+        assert gzip.decompress(compressed.content) == plain.content
+
+    def test_errors_are_not_cached(self):
+        """Validation errors are rendered per request, never stored."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+
+        # Act
+        responses = [client.get('/api/dashboard/students/?department=없는학과') for _ in range(2)]
+
+        # Assert
+        assert [r.status_code for r in responses] == [400, 400]
+        assert all('X-Cache' not in r for r in responses)
+
+    def test_benchmark_hot_path_requests_per_second(self):
+        """Per-worker throughput: rendered-body hits vs service-result hits."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+        iterations = 200
+        for url in HOT_URLS:
+            client.get(url)
+
+        def requests_per_second(url):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                client.get(url)
+            return iterations / (time.perf_counter() - started)
+
+        # Act
+        results = {}
+        for url in HOT_URLS:
+            prerendered = requests_per_second(url)
+            with patch.object(DashboardResponseCache, 'get_rendered', return_value=None):
+                rendered_per_request = requests_per_second(url)
+            results[url] = (prerendered, rendered_per_request)
+
+        # Assert
+        for url, (prerendered, rendered_per_request) in results.items():
+            print(
+                f"\n[benchmark] {url}: {prerendered:.0f} req/s pre-rendered, "
+                f"{rendered_per_request:.0f} req/s serialize+render per request"
+            )
+            assert prerendered > 0
@@ -74,19 +74,26 @@ class PublicationRepositoryTestCase(TestCase):
             impact_factor=None
         )
 
+    def _total(self, summary):
+        return sum(row['count'] for row in summary)
+
     def test_get_all_publications(self):
         """
-        Test: Get all publications without filters.
+        Test: Tier summary of all publications without filters.
 
         GIVEN: 11 publications in database
-        WHEN: get_publications_by_filter() called with no filters
-        THEN: Returns all 11 publications
+        WHEN: get_tier_summary() called with no filters
+        THEN: Counts all 11 publications, largest tier first
         """
         # Act
-        queryset = self.repo.get_publications_by_filter()
+        summary = self.repo.get_tier_summary()
 
         # Assert
-        self.assertEqual(queryset.count(), 11)
+        self.assertEqual(self._total(summary), 11)
+        self.assertEqual(
+            [(row['journal_tier'], row['count']) for row in summary],
+            [('SCIE', 7), ('KCI', 4)]
+        )
 
     def test_filter_by_department(self):
         """
@@ -94,17 +101,13 @@ class PublicationRepositoryTestCase(TestCase):
 
         GIVEN: Multiple departments with publications
         WHEN: Filter by '컴퓨터공학과'
-        THEN: Returns only 8 publications from that department
+        THEN: Counts only the 8 publications from that department
         """
         # Act
-        queryset = self.repo.get_publications_by_filter(department='컴퓨터공학과')
+        summary = self.repo.get_tier_summary(department='컴퓨터공학과')
 
         # Assert
-        self.assertEqual(queryset.count(), 8)
-
-        # Verify all returned publications are from correct department
-        for pub in queryset:
-            self.assertEqual(pub.department, '컴퓨터공학과')
+        self.assertEqual(self._total(summary), 8)
 
     def test_filter_by_journal_tier(self):
         """
@@ -112,17 +115,14 @@ class PublicationRepositoryTestCase(TestCase):
 
         GIVEN: Publications with SCIE and KCI tiers
         WHEN: Filter by 'SCIE'
-        THEN: Returns only 7 SCIE publications
+        THEN: Returns one SCIE row counting 7 publications
         """
         # Act
-        queryset = self.repo.get_publications_by_filter(journal_tier='SCIE')
+        summary = self.repo.get_tier_summary(journal_tier='SCIE')
 
         # Assert
-        self.assertEqual(queryset.count(), 7)
-
-        # Verify all returned publications are SCIE
-        for pub in queryset:
-            self.assertEqual(pub.journal_tier, 'SCIE')
+        self.assertEqual([row['journal_tier'] for row in summary], ['SCIE'])
+        self.assertEqual(self._total(summary), 7)
 
     def test_filter_by_department_and_tier_combined(self):
         """
@@ -130,21 +130,32 @@ class PublicationRepositoryTestCase(TestCase):
 
         GIVEN: Publications across multiple departments and tiers
         WHEN: Filter by department='컴퓨터공학과' AND journal_tier='SCIE'
-        THEN: Returns only 5 publications matching both conditions
+        THEN: Counts only the 5 publications matching both conditions
         """
         # Act
-        queryset = self.repo.get_publications_by_filter(
+        summary = self.repo.get_tier_summary(
             department='컴퓨터공학과',
             journal_tier='SCIE'
         )
 
         # Assert
-        self.assertEqual(queryset.count(), 5)
+        self.assertEqual(self._total(summary), 5)
 
-        # Verify all results match both filters
-        for pub in queryset:
-            self.assertEqual(pub.department, '컴퓨터공학과')
-            self.assertEqual(pub.journal_tier, 'SCIE')
+    def test_impact_factor_sums_exclude_null(self):
+        """
+        Test: Papers without an IF are left out of the IF count and sum.
+
+        GIVEN: 4 KCI publications, one (기계공학과) without IF
+        WHEN: Filter by 'KCI'
+        THEN: if_count is 3 and if_sum adds the 3 known IFs
+        """
+        # Act
+        summary = self.repo.get_tier_summary(journal_tier='KCI')
+
+        # Assert
+        self.assertEqual(summary[0]['count'], 4)
+        self.assertEqual(summary[0]['if_count'], 3)
+        self.assertAlmostEqual(summary[0]['if_sum'], 1.0 + 1.2 + 1.4)
 
     def test_filter_by_nonexistent_department_returns_empty(self):
         """
@@ -152,13 +163,13 @@ class PublicationRepositoryTestCase(TestCase):
 
         GIVEN: Publications in various departments
         WHEN: Filter by '존재하지않는학과'
-        THEN: Returns empty queryset
+        THEN: Returns no rows
         """
         # Act
-        queryset = self.repo.get_publications_by_filter(department='존재하지않는학과')
+        summary = self.repo.get_tier_summary(department='존재하지않는학과')
 
         # Assert
-        self.assertEqual(queryset.count(), 0)
+        self.assertEqual(summary, [])
 
     def test_get_all_departments(self):
         """
@@ -197,28 +208,13 @@ class PublicationRepositoryTestCase(TestCase):
 
         GIVEN: 11 publications total
         WHEN: Filter with department='all' and journal_tier='all'
-        THEN: Returns all 11 publications
+        THEN: Counts all 11 publications
         """
         # Act
-        queryset = self.repo.get_publications_by_filter(
+        summary = self.repo.get_tier_summary(
             department='all',
             journal_tier='all'
         )
 
         # Assert
-        self.assertEqual(queryset.count(), 11)
-
-    def test_queryset_is_lazy_evaluated(self):
-        """
-        Test: Repository returns Django QuerySet (not list).
-
-        GIVEN: Repository method call
-        WHEN: get_publications_by_filter() returns
-        THEN: Result is a QuerySet (allows further chaining)
-        """
-        # Act
-        result = self.repo.get_publications_by_filter()
-
-        # Assert
-        from django.db.models.query import QuerySet
-        self.assertIsInstance(result, QuerySet)
+        self.assertEqual(self._total(summary), 11)
@@ -0,0 +1,107 @@
+"""
+Query budgets for the dashboard endpoints.
+
+Following test-plan.md:
+- A cold request (empty caches) stays within its endpoint's query budget
+- Each dashboard aggregates its data in exactly one query, from the rollups
+  (versioned ingestion) and from raw rows (written directly through the ORM)
+
+Queries outside the aggregate are the conditional-GET version read, the
+rollup availability check and, for filtered requests, the department catalog.
+"""
+
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from data_ingestion.infrastructure.models import (
+    DepartmentKPI,
+    Publication,
+    ResearchProject,
+    Student,
+)
+from data_ingestion.tests.test_prerendered_responses import _ingest_all
+
+# endpoint -> maximum queries for a cold, unfiltered request
+ENDPOINT_QUERY_BUDGETS = {
+    'research-funding': 3,
+    'students': 3,
+    'publications': 3,
+    'department-kpi': 2,
+}
+
+FILTERED_URLS = {
+    'research-funding': '/api/dashboard/research-funding/?department=학과01&period=latest',
+    'students': '/api/dashboard/students/?department=학과01&status=재학',
+    'publications': '/api/dashboard/publications/?department=학과01&journal_tier=SCIE',
+    'department-kpi': '/api/dashboard/department-kpi/?department=학과01',
+}
+
+
+def _create_raw_rows():
+    """Unversioned rows: no rollups, every dashboard reads the raw tables."""
+    ResearchProject.objects.create(
+        execution_id='E001', department='학과01', total_budget=100_000_000,
+        execution_date=date.today(), execution_amount=1_000_000
+    )
+    Student.objects.create(
+        student_id='S001', department='학과01', grade=1,
+        program_type='학사', enrollment_status='재학'
+    )
+    Publication.objects.create(
+        paper_id='P001', department='학과01', journal_tier='SCIE', impact_factor=1.5
+    )
+    DepartmentKPI.objects.create(
+        evaluation_year=date.today().year - 1, department='학과01',
+        employment_rate=80.0, tech_transfer_revenue=1.0
+    )
+
+
+def _aggregate_queries(queries):
+    """Captured queries over dashboard data (not versions or the department catalog)."""
+    return [
+        q['sql'] for q in queries
+        if 'dataset_versions' not in q['sql'] and 'SELECT DISTINCT' not in q['sql']
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestDashboardQueryBudgets:
+    """Per-endpoint query counts on cold requests."""
+
+    @pytest.mark.parametrize('endpoint', sorted(ENDPOINT_QUERY_BUDGETS))
+    def test_cold_request_within_budget(self, endpoint, django_assert_max_num_queries):
+        """An unfiltered request with empty caches stays within the budget."""
+        # Arrange
+        _ingest_all()
+        client = APIClient()
+
+        # Act
+        with django_assert_max_num_queries(ENDPOINT_QUERY_BUDGETS[endpoint]):
+            response = client.get(f'/api/dashboard/{endpoint}/?department=all')
+
+        # Assert
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize('versioned', [True, False], ids=['rollups', 'raw-rows'])
+    @pytest.mark.parametrize('endpoint', sorted(FILTERED_URLS))
+    def test_one_aggregate_query_per_dashboard(self, endpoint, versioned):
+        """Filtered requests aggregate the dashboard data in a single query."""
+        # Arrange
+        if versioned:
+            _ingest_all()
+        else:
+            _create_raw_rows()
+        client = APIClient()
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(FILTERED_URLS[endpoint])
+
+        # Assert
+        assert response.status_code == 200
+        assert len(_aggregate_queries(queries.captured_queries)) == 1
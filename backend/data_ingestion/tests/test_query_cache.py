@@ -0,0 +1,145 @@
+"""
+Tests for the ORM-level aggregate query cache.
+
+Following test-plan.md:
+- Identical aggregate()/count() queries hit the database once per dataset version
+- Writes through save_*_data() invalidate the cached aggregates of the dataset
+- Unversioned data, open transactions and query_cache_disabled() stay live
+- Inside a response-cache computation a warm aggregate runs no query at all
+
+Uses transactional_db: queries inside a transaction always bypass the cache.
+"""
+
+import pandas as pd
+import pytest
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+
+from data_ingestion.infrastructure.dataset_versions import DATASET_RESEARCH_FUNDING, get_dataset_version
+from data_ingestion.infrastructure.models import Publication, ResearchProject
+from data_ingestion.infrastructure.query_cache import known_dataset_version, query_cache_disabled
+from data_ingestion.infrastructure.repositories import save_research_funding_data
+from data_ingestion.infrastructure.response_cache import DashboardResponseCache
+
+
+def _funding_frame(amounts):
+    return pd.DataFrame({
+        'execution_id': [f'E{i:03d}' for i in range(len(amounts))],
+        'department': ['컴퓨터공학과'] * len(amounts),
+        'total_budget': [100_000_000] * len(amounts),
+        'execution_date': [pd.Timestamp('2024-03-01')] * len(amounts),
+        'execution_amount': amounts,
+    })
+
+
+def _aggregate_queries(queries):
+    """Captured queries that aggregate a dataset table (not version lookups)."""
+    return [q['sql'] for q in queries if 'SUM(' in q['sql'].upper() or 'COUNT(' in q['sql'].upper()]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db(transaction=True)
+class TestQueryCache:
+    """Read-through caching of aggregate querysets."""
+
+    def test_repeated_aggregate_hits_database_once(self):
+        """Two identical SUM aggregates run one SQL aggregate."""
+        # Arrange
+        save_research_funding_data(_funding_frame([1_000_000, 2_000_000]))
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            first = ResearchProject.objects.aggregate(total=Sum('execution_amount'))
+            second = ResearchProject.objects.aggregate(total=Sum('execution_amount'))
+
+        # Assert
+        assert first == second == {'total': 3_000_000}
+        assert len(_aggregate_queries(queries.captured_queries)) == 1
+
+    def test_warm_hit_with_known_version_runs_no_query(self, django_assert_num_queries):
+        """With the version already read, a cached aggregate costs zero queries."""
+        # Arrange
+        save_research_funding_data(_funding_frame([1_000_000]))
+        version = get_dataset_version(DATASET_RESEARCH_FUNDING)
+        with known_dataset_version(DATASET_RESEARCH_FUNDING, version):
+            ResearchProject.objects.count()  # Cached
+
+            # Act / Assert
+            with django_assert_num_queries(0):
+                total = ResearchProject.objects.count()
+
+        assert total == 1
+
+    def test_response_cache_computation_reuses_its_version(self, django_assert_num_queries):
+        """compute() of a response cache miss does not read the version again."""
+        # Arrange
+        save_research_funding_data(_funding_frame([1_000_000]))
+        ResearchProject.objects.count()  # Cached
+        version = get_dataset_version(DATASET_RESEARCH_FUNDING)
+
+        # Act
+        with django_assert_num_queries(0):
+            result, hit = DashboardResponseCache().get_or_compute(
+                'research_funding', DATASET_RESEARCH_FUNDING, {}, ResearchProject.objects.count,
+                version=version
+            )
+
+        # Assert
+        assert (result, hit) == (1, False)
+
+    def test_ingestion_invalidates_cached_aggregates(self):
+        """A save_*_data() write bumps the dataset version and the cache key."""
+        # Arrange
+        save_research_funding_data(_funding_frame([1_000_000]))
+        before = ResearchProject.objects.aggregate(total=Sum('execution_amount'))
+
+        # Act
+        save_research_funding_data(_funding_frame([5_000_000]))
+        after = ResearchProject.objects.aggregate(total=Sum('execution_amount'))
+
+        # Assert
+        assert before == {'total': 1_000_000}
+        assert after == {'total': 5_000_000}
+
+    def test_filters_are_part_of_the_key(self):
+        """Different parameters never share an entry."""
+        # Arrange
+        save_research_funding_data(_funding_frame([1_000_000]))
+
+        # Act
+        total = ResearchProject.objects.count()
+        filtered = ResearchProject.objects.filter(department='전자공학과').count()
+
+        # Assert
+        assert (total, filtered) == (1, 0)
+
+    def test_unversioned_tables_are_read_live(self):
+        """Rows created directly through the ORM are never cached."""
+        # Arrange
+        Publication.objects.create(paper_id='P1', department='컴퓨터공학과', journal_tier='SCIE')
+        first = Publication.objects.count()
+
+        # Act
+        Publication.objects.create(paper_id='P2', department='컴퓨터공학과', journal_tier='KCI')
+
+        # Assert
+        assert (first, Publication.objects.count()) == (1, 2)
+
+    def test_opt_out_and_transactions_bypass_cache(self, settings):
+        """query_cache_disabled(), QUERY_CACHE_ENABLED and atomic blocks run live."""
+        # Arrange
+        save_research_funding_data(_funding_frame([1_000_000]))
+        ResearchProject.objects.count()  # Cached
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            with query_cache_disabled():
+                ResearchProject.objects.count()
+            with transaction.atomic():
+                ResearchProject.objects.count()
+            settings.QUERY_CACHE_ENABLED = False
+            ResearchProject.objects.count()
+
+        # Assert
+        assert len(_aggregate_queries(queries.captured_queries)) == 3
@@ -92,6 +92,39 @@ class TestSaveResearchFundingData:
         assert ResearchProject.objects.count() == 1
         assert not ResearchProject.objects.filter(execution_id='OLD001').exists()
 
+    def test_checkpoint_abort_rolls_back_and_keeps_existing_data(self):
+        """A checkpoint that raises mid-insert should roll back the whole file."""
+        # Arrange
+        ResearchProject.objects.create(
+            execution_id='OLD001',
+            department='기계공학과',
+            total_budget=5000000,
+            execution_date='2024-12-31',
+            execution_amount=2500000
+        )
+        df = pd.DataFrame({
+            'execution_id': [f'R{i:04d}' for i in range(2500)],
+            'department': ['컴퓨터공학과'] * 2500,
+            'total_budget': [1000000] * 2500,
+            'execution_date': ['2025-01-01'] * 2500,
+            'execution_amount': [500000] * 2500
+        })
+        calls = []
+
+        def checkpoint():
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("cancelled")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            save_research_funding_data(df, replace=True, checkpoint=checkpoint)
+
+        # Assert - first batch rolled back, old data restored
+        assert len(calls) == 2
+        assert ResearchProject.objects.count() == 1
+        assert ResearchProject.objects.filter(execution_id='OLD001').exists()
+
     def test_save_bulk_creates_with_batch_size(self):
         """Save should use bulk_create for performance."""
         # Arrange - Create large dataset
@@ -0,0 +1,139 @@
+"""
+Tests for single-flight coalescing of identical dashboard requests.
+
+Following test-plan.md:
+- Concurrent identical misses compute once (threads and processes)
+- Waiters fall back to computing after DASHBOARD_CACHE_COALESCE_TIMEOUT
+- Coalesced requests and timeouts are reported in the cache statistics
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock
+
+from data_ingestion.infrastructure.dataset_versions import DATASET_STUDENTS
+from data_ingestion.infrastructure.response_cache import get_response_cache
+
+PARAMS = {'department': 'all', 'status': 'all'}
+
+
+def _request(compute):
+    return get_response_cache().get_or_compute('students', DATASET_STUDENTS, PARAMS, compute, version=1)
+
+
+@pytest.mark.unit
+class TestInProcessCoalescing:
+    """Concurrent identical requests within one worker process."""
+
+    def test_concurrent_misses_compute_once(self):
+        """One thread computes; the others reuse its result."""
+        # Arrange
+        calls = []
+
+        def slow_compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'total': 5}
+
+        # Act
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            results = list(pool.map(lambda _: _request(slow_compute), range(20)))
+
+        # Assert
+        assert len(calls) == 1
+        assert all(result == {'total': 5} for result, _ in results)
+        assert sum(1 for _, hit in results if not hit) == 1
+        stats = get_response_cache().stats()
+        assert stats['coalescing']['students'] == {'coalesced': 19, 'timeouts': 0}
+        assert stats['endpoints']['students']['misses'] == 1
+
+    def test_waiter_times_out_and_computes(self, settings):
+        """A stuck computation does not block identical requests forever."""
+        # Arrange
+        settings.DASHBOARD_CACHE_COALESCE_TIMEOUT = 0.1
+        release = threading.Event()
+        started = threading.Event()
+
+        def stuck_compute():
+            started.set()
+            release.wait(5)
+            return 'leader'
+
+        # Act
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(_request, stuck_compute)
+            started.wait(5)
+            follower = _request(lambda: 'follower')
+            release.set()
+
+        # Assert
+        assert follower == ('follower', False)
+        assert leader.result() == ('leader', False)
+        assert get_response_cache().stats()['coalescing']['students']['timeouts'] == 1
+
+    def test_failed_leader_is_not_shared(self):
+        """Errors are not handed to waiters; they compute independently."""
+        # Arrange
+        started = threading.Event()
+
+        def failing_compute():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError('db down')
+
+        # Act
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(_request, failing_compute)
+            started.wait(5)
+            follower = _request(lambda: 'recovered')
+
+        # Assert
+        with pytest.raises(RuntimeError):
+            leader.result()
+        assert follower == ('recovered', False)
+        assert 'students' not in get_response_cache().stats()['coalescing']
+
+
+@pytest.mark.unit
+class TestCrossProcessCoalescing:
+    """Waiting on a computation held by another worker process."""
+
+    def _hold_peer_lock(self):
+        namespace = get_response_cache().shared_cache.namespace(DATASET_STUDENTS, 1)
+        key = get_response_cache().entry_key('students', PARAMS)
+        assert namespace.add(f'{key}:lock', True, 5)
+        return namespace, key
+
+    def test_peer_result_is_reused(self):
+        """The shared lock key makes this process poll for the peer's result."""
+        # Arrange
+        namespace, key = self._hold_peer_lock()
+        peer = threading.Timer(0.2, lambda: namespace.set(key, {'total': 9}))
+        compute = Mock(return_value={'total': 0})
+
+        # Act
+        peer.start()
+        result = _request(compute)
+
+        # Assert
+        assert result == ({'total': 9}, True)
+        compute.assert_not_called()
+        assert get_response_cache().stats()['coalescing']['students']['coalesced'] == 1
+
+    def test_dead_peer_falls_back_after_timeout(self, settings):
+        """A lock whose holder never stores a result only delays the request."""
+        # Arrange
+        settings.DASHBOARD_CACHE_COALESCE_TIMEOUT = 0.2
+        self._hold_peer_lock()
+
+        # Act
+        started = time.monotonic()
+        result = _request(lambda: {'total': 1})
+
+        # Assert
+        assert result == ({'total': 1}, False)
+        assert time.monotonic() - started >= 0.2
+        assert get_response_cache().stats()['coalescing']['students']['timeouts'] == 1
@@ -258,3 +258,137 @@ class TestResearchFundingAPIView:
         if jan_data:
             # January should aggregate both EX001 and EX002 (100 + 50 = 150 million)
             assert jan_data['execution'] == 150000000
+
+    def test_get_research_funding_date_range_and_granularity(self):
+        """
+        Test Case 9: start/end/granularity 파라미터로 분기별 추이 조회
+        """
+        # Arrange
+        ResearchProject.objects.bulk_create([
+            ResearchProject(
+                execution_id=f'EX{month:02d}',
+                department='컴퓨터공학과',
+                total_budget=100000000,
+                execution_date=f'2024-{month:02d}-15',
+                execution_amount=10000000
+            )
+            for month in range(1, 13)
+        ])
+
+        # Act
+        response = self.client.get(
+            '/api/dashboard/research-funding/',
+            {'start': '2024-04-01', 'end': '2024-09-30', 'granularity': 'quarter'}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data['data']
+        assert data['granularity'] == 'quarter'
+        assert [item['month_formatted'] for item in data['trend']] == ['2024년 2분기', '2024년 3분기']
+        assert data['trend'][-1]['balance'] == 6 * (100000000 - 10000000)
+
+    def test_get_research_funding_department_comparison(self):
+        """
+        Test Case 10: departments 파라미터로 학과별 비교 시리즈 조회
+        """
+        # Arrange
+        ResearchProject.objects.bulk_create([
+            ResearchProject(
+                execution_id=f'EX{department}{month:02d}',
+                department=department,
+                total_budget=100000000,
+                execution_date=f'2024-{month:02d}-15',
+                execution_amount=10000000
+            )
+            for department in ('컴퓨터공학과', '전자공학과')
+            for month in range(1, 4)
+        ])
+
+        # Act
+        response = self.client.get(
+            '/api/dashboard/research-funding/',
+            {'departments': '전자공학과,컴퓨터공학과,없는학과'}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data['data']
+        assert data['granularity'] == 'month'
+        assert [series['department'] for series in data['series']] == ['전자공학과', '컴퓨터공학과', '없는학과']
+        assert data['series'][0]['current_balance'] == 3 * (100000000 - 10000000)
+        assert len(data['series'][1]['trend']) == 3
+        assert data['series'][2]['trend'] == []
+
+    def test_get_research_funding_compare_to_previous_year(self):
+        """
+        Test Case 11: compare_to=previous_year 로 전년 동기 대비 집행액 조회
+        """
+        # Arrange
+        ResearchProject.objects.bulk_create([
+            ResearchProject(
+                execution_id=f'EX{year}{month:02d}',
+                department='컴퓨터공학과',
+                total_budget=100000000,
+                execution_date=f'{year}-{month:02d}-15',
+                execution_amount=10000000 if year == 2024 else 5000000
+            )
+            for year in (2023, 2024)
+            for month in range(1, 7)
+        ])
+
+        # Act
+        response = self.client.get(
+            '/api/dashboard/research-funding/',
+            {'start': '2024-01-01', 'end': '2024-06-30', 'compare_to': 'previous_year'}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        execution = response.data['data']['comparison']['metrics']['execution']
+        assert (execution['current'], execution['previous']) == (60000000, 30000000)
+        assert execution['change_pct'] == 100.0
+        assert len(response.data['data']['trend']) == 6
+
+    def test_compare_to_with_departments_returns_400(self):
+        """
+        Test Case 12: departments와 compare_to 동시 사용 시 400
+        """
+        # Act
+        response = self.client.get(
+            '/api/dashboard/research-funding/',
+            {'departments': '컴퓨터공학과,전자공학과', 'compare_to': 'previous_year'}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_research_funding_period_with_quarter_granularity(self):
+        """
+        Test Case 13: period=1year&granularity=quarter 는 최근 1년만 집계
+        """
+        # Arrange
+        today = timezone.localdate()
+        ResearchProject.objects.bulk_create([
+            ResearchProject(
+                execution_id=f'EX{days:04d}',
+                department='컴퓨터공학과',
+                total_budget=100000000,
+                execution_date=today - timedelta(days=days),
+                execution_amount=10000000
+            )
+            for days in (10, 200, 800, 1200)
+        ])
+
+        # Act
+        response = self.client.get(
+            '/api/dashboard/research-funding/',
+            {'period': '1year', 'granularity': 'quarter'}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data['data']
+        assert data['granularity'] == 'quarter'
+        assert sum(item['execution'] for item in data['trend']) == 20000000
+        assert data['trend'][-1]['balance'] == 2 * (100000000 - 10000000)
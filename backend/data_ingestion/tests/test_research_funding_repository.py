@@ -3,8 +3,14 @@ Unit tests for ResearchFundingRepository.
 Following TDD Red-Green-Refactor cycle and plan.md Phase 1.2.
 """
 
+import os
+import time
+
 import pytest
 from datetime import date, timedelta
+from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from data_ingestion.infrastructure.models import ResearchProject
 from data_ingestion.infrastructure.repositories import ResearchFundingRepository
@@ -242,3 +248,330 @@ class TestResearchFundingRepository:
         # Month 2: balance = 2000M - (100M + 50M) = 1850M
         assert trend[0]['balance'] == 1900000000
         assert trend[1]['balance'] == 1850000000
+
+
+def _create_multi_year_executions(rows: int, years: int = 5):
+    """Executions spread evenly over the last `years` years, 20 departments."""
+    today = date.today()
+    ResearchProject.objects.bulk_create(
+        [
+            ResearchProject(
+                execution_id=f'EX{i:07d}',
+                department=f'학과{i % 20:02d}',
+                total_budget=100_000_000,
+                execution_date=today - timedelta(days=i % (365 * years)),
+                execution_amount=1_000 + i % 997,
+            )
+            for i in range(rows)
+        ],
+        batch_size=5000,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestMonthlyTotalsWindowFunctions:
+    """Running balance via SUM() OVER, with the Python accumulation fallback."""
+
+    def _results(self):
+        repo = ResearchFundingRepository()
+        return (
+            repo.get_current_balance(),
+            {period: repo.get_monthly_trend(period=period) for period in ('latest', '1year', '3years')},
+        )
+
+    def test_balance_and_trend_in_one_statement(self):
+        # Arrange
+        _create_multi_year_executions(rows=200)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            self._results()
+
+        # Assert
+        assert len(queries.captured_queries) == 2  # rollup availability + monthly totals
+        assert ' OVER ' in queries.captured_queries[-1]['sql']
+
+    def test_window_functions_match_python_fallback(self):
+        # Arrange
+        _create_multi_year_executions(rows=500)
+
+        # Act
+        windowed = self._results()
+        with patch.object(connection.features, 'supports_over_clause', False):
+            accumulated = self._results()
+
+        # Assert
+        assert windowed == accumulated
+        assert windowed[0] == windowed[1]['latest'][-1]['balance']
+
+
+@pytest.mark.django_db
+class TestMonthlyTotalsBenchmark:
+    """
+    Benchmark prints balance + trend latency, window functions vs Python.
+
+    RESEARCH_FUNDING_BENCHMARK_ROWS sets the table size (1000000 for the
+    full multi-year benchmark; the default keeps the suite fast).
+    """
+
+    def test_window_vs_python_accumulation(self):
+        # Arrange
+        rows = int(os.environ.get('RESEARCH_FUNDING_BENCHMARK_ROWS', 50_000))
+        _create_multi_year_executions(rows=rows)
+        rounds = 3
+
+        def mean_latency_ms():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                repo = ResearchFundingRepository()
+                repo.get_current_balance()
+                for period in ('latest', '1year', '3years'):
+                    repo.get_monthly_trend(period=period)
+            return (time.perf_counter() - start) * 1000 / rounds
+
+        # Act
+        window_ms = mean_latency_ms()
+        with patch.object(connection.features, 'supports_over_clause', False):
+            python_ms = mean_latency_ms()
+
+        # Assert
+        print(f"\n[benchmark] rows={rows} window={window_ms:.1f}ms "
+              f"python={python_ms:.1f}ms")
+        assert window_ms > 0 and python_ms > 0
+
+
+def _create_monthly_executions(first_year: int = 2020, years: int = 5):
+    """One execution on the 15th of every month, budget 1억, execution 100만."""
+    ResearchProject.objects.bulk_create([
+        ResearchProject(
+            execution_id=f'EX{year}{month:02d}',
+            department='컴퓨터공학과',
+            total_budget=100_000_000,
+            execution_date=date(year, month, 15),
+            execution_amount=1_000_000,
+        )
+        for year in range(first_year, first_year + years)
+        for month in range(1, 13)
+    ])
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestTrendGranularity:
+    """ResearchFundingRepository.get_trend(): date range, buckets, point budget."""
+
+    def test_month_buckets_match_monthly_trend(self):
+        # Arrange
+        _create_multi_year_executions(rows=300)
+        repo = ResearchFundingRepository()
+
+        # Act
+        bucketed = {
+            period: repo.get_trend(start=repo.period_start(period), max_points=1000)
+            for period in ('latest', '1year', '3years')
+        }
+
+        # Assert
+        for period, result in bucketed.items():
+            assert result['granularity'] == 'month'
+            assert [
+                {**point, 'period_start': point['period_start'].strftime('%Y-%m')}
+                for point in result['trend']
+            ] == [
+                {'period_start': point['month'], 'balance': point['balance'], 'execution': point['execution']}
+                for point in repo.get_monthly_trend(period=period)
+            ]
+
+    @pytest.mark.parametrize('granularity, first_bucket, points', [
+        ('week', date(2023, 12, 11), 2),
+        ('month', date(2023, 12, 1), 2),
+        ('quarter', date(2023, 10, 1), 2),
+        ('year', date(2023, 1, 1), 2),
+    ])
+    def test_buckets_within_date_range(self, granularity, first_bucket, points):
+        # Arrange
+        _create_monthly_executions()
+
+        # Act
+        result = ResearchFundingRepository().get_trend(
+            start=date(2023, 12, 1), end=date(2024, 1, 31), granularity=granularity
+        )
+
+        # Assert
+        assert result['granularity'] == granularity
+        assert len(result['trend']) == points
+        assert result['trend'][0]['period_start'] == first_bucket
+        assert result['trend'][-1]['balance'] == 200_000_000 - 2_000_000
+
+    @pytest.mark.parametrize('max_points, granularity, points', [
+        (60, 'month', 60),
+        (59, 'quarter', 20),
+        (19, 'year', 5),
+    ])
+    def test_coarsens_to_fit_point_budget(self, max_points, granularity, points):
+        # Arrange
+        _create_monthly_executions(years=5)
+
+        # Act
+        result = ResearchFundingRepository().get_trend(granularity='week', max_points=max_points)
+
+        # Assert
+        assert result['granularity'] == granularity
+        assert len(result['trend']) == points
+        assert result['trend'][-1]['balance'] == 60 * (100_000_000 - 1_000_000)
+
+    def test_keeps_most_recent_years_beyond_budget(self):
+        # Arrange
+        _create_monthly_executions(years=5)
+
+        # Act
+        result = ResearchFundingRepository().get_trend(granularity='year', max_points=2)
+
+        # Assert
+        assert [point['period_start'] for point in result['trend']] == [date(2023, 1, 1), date(2024, 1, 1)]
+
+    def test_empty_range(self):
+        # Arrange
+        _create_monthly_executions()
+
+        # Act
+        result = ResearchFundingRepository().get_trend(start=date(2030, 1, 1), granularity='quarter')
+
+        # Assert
+        assert result == {'granularity': 'quarter', 'trend': []}
+
+    def test_window_functions_match_python_fallback(self):
+        # Arrange
+        _create_multi_year_executions(rows=500)
+
+        # Act
+        windowed = ResearchFundingRepository().get_trend(granularity='week', max_points=500)
+        with patch.object(connection.features, 'supports_over_clause', False):
+            accumulated = ResearchFundingRepository().get_trend(granularity='week', max_points=500)
+
+        # Assert
+        assert windowed == accumulated
+        assert windowed['granularity'] == 'week'
+
+
+def _dataset_queries(queries):
+    """Captured queries that read the research funding rows."""
+    return [query for query in queries.captured_queries if 'research_projects' in query['sql']]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestTrendByDepartment:
+    """ResearchFundingRepository.get_trend_by_department() / get_current_balances()"""
+
+    DEPARTMENTS = ['학과03', '학과07', '학과11']
+
+    def test_series_match_single_department_trends(self):
+        # Arrange
+        _create_multi_year_executions(rows=600)
+        repo = ResearchFundingRepository()
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            result = repo.get_trend_by_department(self.DEPARTMENTS, max_points=1000)
+
+        # Assert: span query + one grouped bucket query for every department
+        assert len(_dataset_queries(queries)) == 2
+        assert result['granularity'] == 'month'
+        assert list(result['series']) == self.DEPARTMENTS
+        for department in self.DEPARTMENTS:
+            single = repo.get_trend(department=department, max_points=1000)
+            assert result['series'][department] == single['trend']
+
+    def test_shared_granularity_fits_all_departments(self):
+        # Arrange
+        _create_multi_year_executions(rows=600)
+
+        # Act
+        result = ResearchFundingRepository().get_trend_by_department(
+            self.DEPARTMENTS, granularity='week', max_points=10
+        )
+
+        # Assert
+        assert result['granularity'] == 'quarter'
+        assert all(0 < len(points) <= 10 for points in result['series'].values())
+
+    def test_department_without_rows_gets_empty_series(self):
+        # Arrange
+        _create_monthly_executions(years=1)
+
+        # Act
+        result = ResearchFundingRepository().get_trend_by_department(['컴퓨터공학과', '없는학과'])
+
+        # Assert
+        assert len(result['series']['컴퓨터공학과']) == 12
+        assert result['series']['없는학과'] == []
+
+    def test_window_functions_match_python_fallback(self):
+        # Arrange
+        _create_multi_year_executions(rows=500)
+
+        # Act
+        windowed = ResearchFundingRepository().get_trend_by_department(
+            self.DEPARTMENTS, granularity='week', max_points=500
+        )
+        with patch.object(connection.features, 'supports_over_clause', False):
+            accumulated = ResearchFundingRepository().get_trend_by_department(
+                self.DEPARTMENTS, granularity='week', max_points=500
+            )
+
+        # Assert
+        assert windowed == accumulated
+
+    def test_current_balances_in_one_query(self):
+        # Arrange
+        _create_multi_year_executions(rows=600)
+        repo = ResearchFundingRepository()
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            balances = repo.get_current_balances(self.DEPARTMENTS + ['없는학과'])
+
+        # Assert
+        assert len(_dataset_queries(queries)) == 1
+        assert balances == {
+            **{department: repo.get_current_balance(department) for department in self.DEPARTMENTS},
+            '없는학과': 0,
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestExecutionTotals:
+    """ResearchFundingRepository.get_execution_totals(): several windows in one pass."""
+
+    def test_windows_in_one_query(self):
+        # Arrange
+        _create_monthly_executions(years=3)
+        repo = ResearchFundingRepository()
+        windows = {
+            'current': (date(2022, 1, 1), date(2022, 6, 30)),
+            'previous': (date(2021, 1, 1), date(2021, 6, 30)),
+            'empty': (date(2030, 1, 1), date(2030, 12, 31)),
+        }
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            totals = repo.get_execution_totals('컴퓨터공학과', windows)
+
+        # Assert
+        assert len(_dataset_queries(queries)) == 1
+        assert totals == {'current': 6_000_000, 'previous': 6_000_000, 'empty': 0}
+
+    def test_department_filter(self):
+        # Arrange
+        _create_monthly_executions(years=1)
+
+        # Act
+        totals = ResearchFundingRepository().get_execution_totals(
+            '전자공학과', {'current': (date(2020, 1, 1), date(2020, 12, 31))}
+        )
+
+        # Assert
+        assert totals == {'current': 0}
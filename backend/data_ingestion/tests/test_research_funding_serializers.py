@@ -4,6 +4,7 @@ Following TDD Red-Green-Refactor cycle and plan.md Phase 3.
 """
 
 import pytest
+from datetime import date
 from rest_framework.exceptions import ValidationError
 from data_ingestion.api.serializers import ResearchFundingQuerySerializer
 
@@ -100,3 +101,74 @@ class TestResearchFundingQuerySerializer:
             # Assert
             assert is_valid
             assert serializer.validated_data['department'] == dept
+
+    def test_date_range_and_granularity(self):
+        """
+        Test Case 6: start/end 날짜 범위와 granularity 검증
+        """
+        # Arrange
+        serializer = ResearchFundingQuerySerializer(data={
+            'start': '2023-01-01',
+            'end': '2024-06-30',
+            'granularity': 'quarter'
+        })
+
+        # Act
+        is_valid = serializer.is_valid()
+
+        # Assert
+        assert is_valid
+        assert serializer.validated_data['start'] == date(2023, 1, 1)
+        assert serializer.validated_data['end'] == date(2024, 6, 30)
+        assert serializer.validated_data['granularity'] == 'quarter'
+
+    @pytest.mark.parametrize('params', [
+        {'start': '2024-02-01', 'end': '2024-01-01'},
+        {'start': '2024-01-01', 'period': '1year'},
+        {'granularity': 'day'},
+        {'end': '2024-13-01'},
+    ])
+    def test_invalid_date_range_or_granularity(self, params):
+        """
+        Test Case 7: 역순 범위, period와 동시 사용, 잘못된 granularity/날짜 거부
+        """
+        # Arrange
+        serializer = ResearchFundingQuerySerializer(data=params)
+
+        # Act
+        is_valid = serializer.is_valid()
+
+        # Assert
+        assert not is_valid
+
+    def test_departments_list(self):
+        """
+        Test Case 8: departments는 쉼표로 구분, 공백/중복 제거 (순서 유지)
+        """
+        # Arrange
+        serializer = ResearchFundingQuerySerializer(data={'departments': '전자공학과, 컴퓨터공학과,,전자공학과'})
+
+        # Act
+        is_valid = serializer.is_valid()
+
+        # Assert
+        assert is_valid
+        assert serializer.validated_data['departments'] == ['전자공학과', '컴퓨터공학과']
+
+    @pytest.mark.parametrize('params', [
+        {'departments': ' , '},
+        {'departments': ','.join(f'학과{i:02d}' for i in range(11))},
+        {'departments': '컴퓨터공학과,전자공학과', 'department': '컴퓨터공학과'},
+    ])
+    def test_invalid_departments(self, params):
+        """
+        Test Case 9: 빈 목록, 최대 개수 초과, department와 동시 사용 거부
+        """
+        # Arrange
+        serializer = ResearchFundingQuerySerializer(data=params)
+
+        # Act
+        is_valid = serializer.is_valid()
+
+        # Assert
+        assert not is_valid
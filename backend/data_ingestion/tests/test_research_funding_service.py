@@ -5,7 +5,9 @@ Using mocks to isolate service logic from repository.
 """
 
 import pytest
+from datetime import date
 from unittest.mock import Mock, MagicMock
+from django.utils import timezone
 from data_ingestion.services.research_funding_service import ResearchFundingService
 from data_ingestion.infrastructure.repositories import ResearchFundingRepository
 
@@ -126,3 +128,166 @@ class TestResearchFundingService:
         # Assert - Service should handle None gracefully
         assert data['current_balance'] == 0  # Convert None to 0
         assert data['trend'] == []  # Convert None to empty list
+
+    def test_date_range_uses_bucketed_trend(self):
+        """
+        Test Case 7: start/end/granularity 지정 시 DB 버킷 집계 사용
+        """
+        # Arrange
+        mock_repo = Mock(spec=ResearchFundingRepository)
+        mock_repo.get_current_balance.return_value = 1000000000
+        mock_repo.get_trend.return_value = {
+            'granularity': 'quarter',
+            'trend': [{'period_start': date(2024, 4, 1), 'balance': 900000000, 'execution': 100000000}],
+        }
+        service = ResearchFundingService(repository=mock_repo)
+
+        # Act
+        data = service.get_dashboard_data(start=date(2024, 1, 1), granularity='week')
+
+        # Assert
+        mock_repo.get_monthly_trend.assert_not_called()
+        assert mock_repo.get_trend.call_args.kwargs['start'] == date(2024, 1, 1)
+        assert mock_repo.get_trend.call_args.kwargs['granularity'] == 'week'
+        assert data['granularity'] == 'quarter'
+        assert data['trend'][0]['month'] == '2024-04'
+        assert data['trend'][0]['month_formatted'] == '2024년 2분기'
+        assert data['trend'][0]['period_start'] == '2024-04-01'
+
+    def test_long_monthly_trend_is_downsampled(self, settings):
+        """
+        Test Case 8: 월별 추이가 최대 포인트 수를 넘으면 더 큰 단위로 재집계
+        """
+        # Arrange
+        settings.RESEARCH_FUNDING_TREND_MAX_POINTS = 12
+        mock_repo = Mock(spec=ResearchFundingRepository)
+        mock_repo.get_current_balance.return_value = 0
+        mock_repo.get_monthly_trend.return_value = [
+            {'month': f'2023-{month:02d}', 'balance': 0, 'execution': 0} for month in range(1, 13)
+        ] + [{'month': '2024-01', 'balance': 0, 'execution': 0}]
+        mock_repo.period_start.return_value = None
+        mock_repo.get_trend.return_value = {'granularity': 'quarter', 'trend': []}
+        service = ResearchFundingService(repository=mock_repo)
+
+        # Act
+        data = service.get_dashboard_data(period='latest')
+
+        # Assert
+        mock_repo.get_trend.assert_called_once_with(
+            department='all', start=None, end=None, granularity='month', max_points=12
+        )
+        assert data['granularity'] == 'quarter'
+
+    def test_format_period(self):
+        """
+        Test Case 9: 버킷 단위별 한국어 레이블
+        """
+        # Arrange
+        service = ResearchFundingService()
+
+        # Act & Assert
+        assert service._format_period(date(2024, 1, 8), 'week') == '2024년 1월 8일 주'
+        assert service._format_period(date(2024, 1, 1), 'month') == '2024년 1월'
+        assert service._format_period(date(2024, 7, 1), 'quarter') == '2024년 3분기'
+        assert service._format_period(date(2024, 1, 1), 'year') == '2024년'
+
+    def test_get_comparison_data(self):
+        """
+        Test Case 10: 여러 학과 비교 - 학과별 잔액과 추이를 한 번에 조회
+        """
+        # Arrange
+        mock_repo = Mock(spec=ResearchFundingRepository)
+        mock_repo.period_start.return_value = date(2023, 6, 1)
+        mock_repo.get_current_balances.return_value = {'학과A': 1530000000, '학과B': 0}
+        mock_repo.get_trend_by_department.return_value = {
+            'granularity': 'month',
+            'series': {
+                '학과A': [{'period_start': date(2024, 1, 1), 'balance': 900000000, 'execution': 100000000}],
+                '학과B': [],
+            },
+        }
+        service = ResearchFundingService(repository=mock_repo)
+
+        # Act
+        data = service.get_comparison_data(departments=['학과A', '학과B'], period='1year')
+
+        # Assert
+        mock_repo.get_current_balance.assert_not_called()
+        assert mock_repo.get_trend_by_department.call_args.kwargs['start'] == date(2023, 6, 1)
+        assert data['granularity'] == 'month'
+        assert [series['department'] for series in data['series']] == ['학과A', '학과B']
+        assert data['series'][0]['current_balance_formatted'] == '15.3억원'
+        assert data['series'][0]['trend'][0]['month_formatted'] == '2024년 1월'
+        assert data['series'][1]['trend'] == []
+
+    def test_compare_to_previous_year(self):
+        """
+        Test Case 11: compare_to - 선택 기간과 비교 기간의 집행액을 한 번에 조회
+        """
+        # Arrange
+        mock_repo = Mock(spec=ResearchFundingRepository)
+        mock_repo.get_current_balance.return_value = 0
+        mock_repo.get_trend.return_value = {'granularity': 'month', 'trend': []}
+        mock_repo.get_execution_totals.return_value = {'current': 300000000, 'previous': 200000000}
+        service = ResearchFundingService(repository=mock_repo)
+
+        # Act
+        data = service.get_dashboard_data(
+            start=date(2024, 1, 1), end=date(2024, 6, 30), compare_to='previous_year'
+        )
+
+        # Assert
+        mock_repo.get_execution_totals.assert_called_once_with(
+            'all',
+            {
+                'current': (date(2024, 1, 1), date(2024, 6, 30)),
+                'previous': (date(2023, 1, 1), date(2023, 6, 30)),
+            }
+        )
+        comparison = data['comparison']
+        assert comparison['previous'] == {'start': '2023-01-01', 'end': '2023-06-30'}
+        assert comparison['metrics']['execution']['delta'] == 100000000
+        assert comparison['metrics']['execution']['change_pct'] == 50.0
+        assert comparison['metrics']['execution']['delta_formatted'] == '1.0억원'
+
+    def test_compare_to_without_range_uses_year_to_date(self):
+        """
+        Test Case 12: 기간 제한이 없으면 올해 누적(1월 1일~오늘)을 비교
+        """
+        # Arrange
+        mock_repo = Mock(spec=ResearchFundingRepository)
+        mock_repo.get_current_balance.return_value = 0
+        mock_repo.get_monthly_trend.return_value = []
+        mock_repo.period_start.return_value = None
+        mock_repo.get_execution_totals.return_value = {'current': 0, 'previous': 0}
+        service = ResearchFundingService(repository=mock_repo)
+
+        # Act
+        data = service.get_dashboard_data(period='latest', compare_to='previous_period')
+
+        # Assert
+        today = timezone.localdate()
+        assert data['comparison']['current'] == {
+            'start': date(today.year, 1, 1).isoformat(), 'end': today.isoformat()
+        }
+        assert data['comparison']['metrics']['execution']['change_pct'] is None
+
+    def test_period_with_other_granularity_keeps_period_filter(self):
+        """
+        Test Case 13: period와 월 이외 granularity 지정 시 기간 필터 유지
+        """
+        # Arrange
+        mock_repo = Mock(spec=ResearchFundingRepository)
+        mock_repo.get_current_balance.return_value = 0
+        mock_repo.period_start.return_value = date(2025, 10, 19)
+        mock_repo.get_trend.return_value = {'granularity': 'quarter', 'trend': []}
+        service = ResearchFundingService(repository=mock_repo)
+
+        # Act
+        service.get_dashboard_data(period='1year', granularity='quarter')
+
+        # Assert
+        mock_repo.period_start.assert_called_once_with('1year')
+        mock_repo.get_monthly_trend.assert_not_called()
+        assert mock_repo.get_trend.call_args.kwargs['start'] == date(2025, 10, 19)
+        assert mock_repo.get_trend.call_args.kwargs['granularity'] == 'quarter'
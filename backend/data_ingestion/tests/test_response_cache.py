@@ -0,0 +1,179 @@
+"""
+Tests for the dataset-versioned dashboard response cache.
+
+Following test-plan.md:
+- Cache hits never outlive the data they were computed from
+- Ingestion (save_*_data) bumps the dataset version on commit
+- Hit/miss statistics exposed via X-Cache and /api/dashboard/cache-stats/
+"""
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+from rest_framework.test import APIClient
+
+from data_ingestion.infrastructure.dataset_versions import (
+    DATASET_STUDENTS,
+    get_dataset_version,
+    get_all_dataset_versions,
+)
+from data_ingestion.infrastructure.models import Student
+from data_ingestion.infrastructure.repositories import save_student_data
+from data_ingestion.infrastructure.response_cache import (
+    DashboardResponseCache,
+    get_response_cache,
+)
+
+
+def _student_frame(student_ids):
+    return pd.DataFrame({
+        'student_id': student_ids,
+        'department': ['컴퓨터공학과'] * len(student_ids),
+        'grade': [1] * len(student_ids),
+        'program_type': ['학사'] * len(student_ids),
+        'enrollment_status': ['재학'] * len(student_ids),
+    })
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDashboardResponseCache:
+    """Read-through behaviour of DashboardResponseCache."""
+
+    def test_second_lookup_is_a_hit(self):
+        """Identical requests are computed once."""
+        # Arrange
+        cache = get_response_cache()
+        compute = Mock(return_value={'total': 3})
+
+        # Act
+        first, first_hit = cache.get_or_compute('students', DATASET_STUDENTS, {'department': 'all'}, compute)
+        second, second_hit = cache.get_or_compute('students', DATASET_STUDENTS, {'department': 'all'}, compute)
+
+        # Assert
+        assert (first_hit, second_hit) == (False, True)
+        assert first == second == {'total': 3}
+        compute.assert_called_once()
+        assert cache.stats()['endpoints']['students'] == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    def test_params_are_canonicalized(self):
+        """Parameter order does not create separate entries."""
+        key_a = DashboardResponseCache.make_key('kpi', 'kpi', 1, {'start_year': 2020, 'department': 'all'})
+        key_b = DashboardResponseCache.make_key('kpi', 'kpi', 1, {'department': 'all', 'start_year': '2020'})
+
+        assert key_a == key_b
+
+    def test_version_bump_invalidates_entries(self):
+        """A committed ingestion makes earlier entries unreachable."""
+        # Arrange
+        cache = get_response_cache()
+        cache.get_or_compute('students', DATASET_STUDENTS, {}, lambda: 'old')
+        version_before = get_dataset_version(DATASET_STUDENTS)
+
+        # Act
+        save_student_data(_student_frame(['S001']))
+        result, hit = cache.get_or_compute('students', DATASET_STUDENTS, {}, lambda: 'new')
+
+        # Assert
+        assert get_dataset_version(DATASET_STUDENTS) == version_before + 1
+        assert (result, hit) == ('new', False)
+
+    def test_rolled_back_ingestion_keeps_version(self):
+        """An aborted ingestion leaves both data and version untouched."""
+        # Arrange
+        save_student_data(_student_frame(['S001']))
+        version_before = get_dataset_version(DATASET_STUDENTS)
+
+        def abort():
+            raise RuntimeError('abort')
+
+        # Act
+        with pytest.raises(RuntimeError):
+            save_student_data(_student_frame(['S002']), checkpoint=abort)
+
+        # Assert
+        assert get_dataset_version(DATASET_STUDENTS) == version_before
+
+    def test_exceptions_are_not_cached(self):
+        """Failed computations are retried on the next request."""
+        # Arrange
+        cache = get_response_cache()
+
+        # Act
+        with pytest.raises(ValueError):
+            cache.get_or_compute('students', DATASET_STUDENTS, {}, Mock(side_effect=ValueError('boom')))
+        result, hit = cache.get_or_compute('students', DATASET_STUDENTS, {}, lambda: 'ok')
+
+        # Assert
+        assert (result, hit) == ('ok', False)
+
+    def test_disabled_cache_always_computes(self):
+        """DASHBOARD_CACHE_ENABLED=False bypasses the cache entirely."""
+        cache = get_response_cache()
+        compute = Mock(return_value='value')
+
+        with patch('django.conf.settings.DASHBOARD_CACHE_ENABLED', False):
+            cache.get_or_compute('students', DATASET_STUDENTS, {}, compute)
+            _, hit = cache.get_or_compute('students', DATASET_STUDENTS, {}, compute)
+
+        assert hit is False
+        assert compute.call_count == 2
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestDashboardCacheAPI:
+    """Cache behaviour observed through the dashboard endpoints."""
+
+    def test_x_cache_header_and_ingest_invalidation(self):
+        """Repeated GETs hit the cache until new data is ingested."""
+        # Arrange
+        client = APIClient()
+        save_student_data(_student_frame(['S001']))
+        url = '/api/dashboard/students/?department=all&status=재학'
+
+        # Act
+        first = client.get(url)
+        second = client.get(url)
+        save_student_data(_student_frame(['S001', 'S002']))
+        third = client.get(url)
+
+        # Assert
+        assert first['X-Cache'] == 'MISS'
+        assert second['X-Cache'] == 'HIT'
+        assert second.json() == first.json()
+        assert third['X-Cache'] == 'MISS'
+        assert third.json()['total_students'] == 2
+
+    def test_cache_stats_endpoint(self):
+        """Stats endpoint reports counters and dataset versions."""
+        # Arrange
+        client = APIClient()
+        Student.objects.create(
+            student_id='S001', department='컴퓨터공학과', grade=1,
+            program_type='학사', enrollment_status='재학'
+        )
+        client.get('/api/dashboard/students/')
+        client.get('/api/dashboard/students/')
+
+        # Act
+        with patch('django.conf.settings.ADMIN_API_KEY', 'test-key'):
+            response = client.get('/api/dashboard/cache-stats/', HTTP_X_ADMIN_KEY='test-key')
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert body['response_cache']['endpoints']['students']['hits'] == 1
+        assert body['response_cache']['total']['misses'] == 1
+        assert body['dataset_versions'] == get_all_dataset_versions()
+
+    def test_cache_stats_requires_admin_key(self):
+        """Stats endpoint is operational: requests without X-Admin-Key are rejected."""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        response = client.get('/api/dashboard/cache-stats/')
+
+        # Assert
+        assert response.status_code == 403
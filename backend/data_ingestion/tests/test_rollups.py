@@ -0,0 +1,187 @@
+"""
+Tests for the ingestion-time aggregate rollup tables.
+
+Following test-plan.md:
+- Rollups rebuilt inside save_*_data() (replace and rollback)
+- Repository/service results identical with and without rollups
+"""
+
+import pandas as pd
+import pytest
+
+from data_ingestion.infrastructure.models import (
+    DatasetVersion,
+    ResearchFundingDailyRollup,
+    StudentCountRollup,
+    PublicationTierRollup,
+)
+from data_ingestion.infrastructure.repositories import (
+    ResearchFundingRepository,
+    StudentRepository,
+    save_research_funding_data,
+    save_student_data,
+    save_publication_data,
+)
+from data_ingestion.services.publication_service import PublicationService
+from data_ingestion.services.student_dashboard_service import StudentDashboardService
+
+
+@pytest.fixture
+def research_frame():
+    return pd.DataFrame({
+        'execution_id': [f'E{i:03d}' for i in range(6)],
+        'department': ['컴퓨터공학과'] * 4 + ['전자공학과'] * 2,
+        'total_budget': [1_000_000_000] * 6,
+        'execution_date': pd.to_datetime([
+            '2024-01-05', '2024-01-05', '2024-02-10',
+            '2024-03-01', '2024-01-05', '2024-02-20'
+        ]),
+        'execution_amount': [10_000_000, 20_000_000, 30_000_000, 5_000_000, 7_000_000, 8_000_000],
+    })
+
+
+@pytest.fixture
+def student_frame():
+    return pd.DataFrame({
+        'student_id': [f'S{i:03d}' for i in range(7)],
+        'department': ['컴퓨터공학과'] * 4 + ['전자공학과'] * 3,
+        'grade': [1] * 7,
+        'program_type': ['학사', '학사', '석사', '박사', '학사', '석사', '석사'],
+        'enrollment_status': ['재학', '재학', '재학', '휴학', '재학', '졸업', '재학'],
+    })
+
+
+@pytest.fixture
+def publication_frame():
+    return pd.DataFrame({
+        'paper_id': [f'P{i:03d}' for i in range(6)],
+        'department': ['컴퓨터공학과'] * 4 + ['전자공학과'] * 2,
+        'journal_tier': ['SCIE', 'SCIE', 'KCI', '기타', 'SCIE', 'KCI'],
+        'impact_factor': [3.2, None, 1.1, None, 4.5, 0.8],
+    })
+
+
+def _without_rollups(dataset, compute):
+    """Evaluate compute() on the raw-table fallback path."""
+    DatasetVersion.objects.filter(dataset=dataset).delete()
+    return compute()
+
+
+@pytest.mark.django_db
+class TestRollupBuild:
+    """Rollups are rebuilt together with the raw tables."""
+
+    def test_rollups_group_raw_rows(self, research_frame, student_frame, publication_frame):
+        # Act
+        save_research_funding_data(research_frame)
+        save_student_data(student_frame)
+        save_publication_data(publication_frame)
+
+        # Assert: one row per group, not per record
+        assert ResearchFundingDailyRollup.objects.count() == 5
+        assert StudentCountRollup.objects.count() == 6
+        assert PublicationTierRollup.objects.count() == 5
+        jan_cs = ResearchFundingDailyRollup.objects.get(
+            department='컴퓨터공학과', execution_date='2024-01-05'
+        )
+        assert (jan_cs.execution_amount, jan_cs.record_count) == (30_000_000, 2)
+
+    def test_replace_rebuilds_rollup(self, student_frame):
+        # Arrange
+        save_student_data(student_frame)
+
+        # Act
+        save_student_data(student_frame.head(2))
+
+        # Assert
+        assert list(StudentCountRollup.objects.values_list('student_count', flat=True)) == [2]
+
+    def test_rolled_back_ingestion_keeps_rollup(self, student_frame):
+        # Arrange
+        save_student_data(student_frame)
+
+        def abort():
+            raise RuntimeError('abort')
+
+        # Act
+        with pytest.raises(RuntimeError):
+            save_student_data(student_frame.head(2), checkpoint=abort)
+
+        # Assert
+        assert sum(StudentCountRollup.objects.values_list('student_count', flat=True)) == 7
+
+
+@pytest.mark.django_db
+class TestRollupParity:
+    """Rollup-backed results match raw-table aggregation exactly."""
+
+    @pytest.mark.parametrize('department', ['all', '컴퓨터공학과'])
+    def test_research_funding_repository(self, research_frame, department):
+        # Arrange
+        save_research_funding_data(research_frame)
+        repository = ResearchFundingRepository()
+
+        def compute():
+            return (
+                repository.get_current_balance(department=department),
+                repository.get_monthly_trend(department=department, period='latest'),
+            )
+
+        # Act
+        from_rollup = compute()
+        from_raw = _without_rollups('research_funding', compute)
+
+        # Assert
+        assert from_rollup == from_raw
+        assert len(from_rollup[1]) == 3
+
+    @pytest.mark.parametrize('department,status', [
+        ('all', '재학'), ('all', 'all'), ('전자공학과', 'all'),
+    ])
+    def test_student_service(self, student_frame, department, status):
+        # Arrange
+        save_student_data(student_frame)
+        service = StudentDashboardService(StudentRepository())
+
+        def compute():
+            result = service.get_student_dashboard_data(department=department, status=status)
+            result.pop('updated_at')
+            return result
+
+        # Act
+        from_rollup = compute()
+        from_raw = _without_rollups('students', compute)
+
+        # Assert
+        assert from_rollup['total_students'] == from_raw['total_students']
+        assert sorted(from_rollup['by_department'], key=lambda d: d['department']) == \
+            sorted(from_raw['by_department'], key=lambda d: d['department'])
+
+    @pytest.mark.parametrize('department,journal_tier', [
+        ('all', 'all'), ('컴퓨터공학과', 'all'), ('all', 'SCIE'),
+    ])
+    def test_publication_service(self, publication_frame, department, journal_tier):
+        # Arrange
+        save_publication_data(publication_frame)
+        service = PublicationService()
+
+        def compute():
+            result = service.get_distribution(department=department, journal_tier=journal_tier)
+            result.pop('last_updated')
+            return result
+
+        # Act
+        from_rollup = compute()
+        from_raw = _without_rollups('publications', compute)
+
+        # Assert (tiers with equal counts have no defined order)
+        by_tier = lambda rows: sorted(rows, key=lambda d: d['journal_tier'])
+        assert by_tier(from_rollup.pop('distribution')) == by_tier(from_raw.pop('distribution'))
+        assert from_rollup == from_raw
+
+    def test_department_lookup_uses_rollup(self, student_frame):
+        # Arrange
+        save_student_data(student_frame)
+
+        # Act / Assert
+        assert sorted(StudentRepository().get_all_departments()) == ['전자공학과', '컴퓨터공학과']
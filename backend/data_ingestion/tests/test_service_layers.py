@@ -76,17 +76,14 @@ class TestKPIService:
         mock_repo = Mock()
         service.repository = mock_repo
 
-        # Mock queryset
-        mock_queryset = Mock()
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = []
-        mock_queryset.aggregate.return_value = {'avg': 85.5}
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        # Mock yearly summary
+        mock_repo.get_yearly_summary.return_value = {'data': [], 'overall_avg_employment_rate': None}
 
         # Act
         result = service.get_kpi_trend('컴퓨터공학과', 2020, 2025)
 
         # Assert
-        mock_repo.find_by_department_and_year.assert_called_once_with(
+        mock_repo.get_yearly_summary.assert_called_once_with(
             department='컴퓨터공학과',
             start_year=2020,
             end_year=2025
@@ -100,15 +97,15 @@ class TestKPIService:
         mock_repo = Mock()
         service.repository = mock_repo
 
-        # Mock queryset
-        mock_queryset = Mock()
+        # Mock yearly summary
         mock_trend_data = [
             {'evaluation_year': 2020, 'avg_employment_rate': 80.0, 'total_tech_income': 10.0},
             {'evaluation_year': 2021, 'avg_employment_rate': 85.0, 'total_tech_income': 12.0}
         ]
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = mock_trend_data
-        mock_queryset.aggregate.return_value = {'avg': 82.5}
-        mock_repo.find_by_department_and_year.return_value = mock_queryset
+        mock_repo.get_yearly_summary.return_value = {
+            'data': mock_trend_data,
+            'overall_avg_employment_rate': 82.5,
+        }
 
         # Act
         result = service.get_kpi_trend('all', 2020, 2021)
@@ -157,75 +154,30 @@ class TestPublicationService:
         with pytest.raises(ValidationError, match="존재하지 않는 학과입니다"):
             service._validate_inputs('기계공학과', 'SCIE')
 
-    def test_calculate_avg_impact_factor_with_no_data(self):
-        """calculate_avg_impact_factor with no IF data should return None."""
+    def test_summarize_tiers_with_no_rows(self):
+        """No tier rows should give an empty distribution and no average IF."""
         # Arrange
-        service = PublicationService()
-        mock_queryset = Mock()
-        mock_queryset.filter.return_value.count.return_value = 0
-
-        # Act
-        avg_if, papers_with_if = service._calculate_avg_impact_factor(mock_queryset)
-
-        # Assert
-        assert avg_if is None
-        assert papers_with_if == 0
-
-    def test_calculate_avg_impact_factor_with_valid_data(self):
-        """calculate_avg_impact_factor should calculate average correctly."""
-        # Arrange
-        service = PublicationService()
-        mock_queryset = Mock()
-        mock_filtered = Mock()
-        mock_filtered.count.return_value = 3
-        mock_filtered.aggregate.return_value = {'avg': 4.5}
-        mock_queryset.filter.return_value = mock_filtered
-
-        # Act
-        avg_if, papers_with_if = service._calculate_avg_impact_factor(mock_queryset)
-
-        # Assert
-        assert avg_if == 4.5
-        assert papers_with_if == 3
-
-    def test_aggregate_by_tier_with_empty_queryset(self):
-        """aggregate_by_tier with empty queryset should return empty list."""
-        # Arrange
-        service = PublicationService()
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 0
+        service = PublicationService(repository=Mock())
 
         # Act
-        result = service._aggregate_by_tier(mock_queryset)
+        result = service._summarize_tiers([])
 
         # Assert
-        assert result == []
+        assert result == ([], 0, None, 0)
 
-    def test_aggregate_by_tier_calculates_percentages(self):
-        """aggregate_by_tier should calculate percentages correctly."""
+    def test_summarize_tiers_without_if_data(self):
+        """Tiers without any IF should report avg_if None, not 0."""
         # Arrange
-        service = PublicationService()
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 100
-
-        mock_aggregated = [
-            {'journal_tier': 'SCIE', 'count': 60, 'avg_if': 3.5},
-            {'journal_tier': 'KCI', 'count': 30, 'avg_if': None},
-            {'journal_tier': '기타', 'count': 10, 'avg_if': 1.2}
-        ]
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = mock_aggregated
+        service = PublicationService(repository=Mock())
+        tier_summary = [{'journal_tier': 'KCI', 'count': 4, 'if_count': 0, 'if_sum': 0.0}]
 
         # Act
-        result = service._aggregate_by_tier(mock_queryset)
+        distribution, total_papers, avg_if, papers_with_if = service._summarize_tiers(tier_summary)
 
         # Assert
-        assert len(result) == 3
-        assert result[0]['journal_tier'] == 'SCIE'
-        assert result[0]['percentage'] == 60.0
-        assert result[0]['avg_if'] == 3.5
-
-        assert result[1]['percentage'] == 30.0
-        assert result[1]['avg_if'] is None
+        assert distribution[0]['percentage'] == 100.0
+        assert distribution[0]['avg_if'] is None
+        assert (total_papers, avg_if, papers_with_if) == (4, None, 0)
 
     def test_get_distribution_returns_formatted_response(self):
         """get_distribution should return properly formatted response."""
@@ -233,20 +185,10 @@ class TestPublicationService:
         mock_repo = Mock()
         mock_repo.get_all_departments.return_value = []
 
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 100
-
-        mock_aggregated = [
-            {'journal_tier': 'SCIE', 'count': 60, 'avg_if': 3.5}
+        mock_repo.get_tier_summary.return_value = [
+            {'journal_tier': 'SCIE', 'count': 60, 'if_count': 40, 'if_sum': 180.0},
+            {'journal_tier': 'KCI', 'count': 40, 'if_count': 10, 'if_sum': 20.0},
         ]
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = mock_aggregated
-
-        mock_filtered = Mock()
-        mock_filtered.count.return_value = 50
-        mock_filtered.aggregate.return_value = {'avg': 4.0}
-        mock_queryset.filter.return_value = mock_filtered
-
-        mock_repo.get_publications_by_filter.return_value = mock_queryset
 
         service = PublicationService(repository=mock_repo)
 
@@ -257,7 +199,9 @@ class TestPublicationService:
         assert result['total_papers'] == 100
         assert result['avg_impact_factor'] == 4.0
         assert result['papers_with_if'] == 50
-        assert len(result['distribution']) == 1
+        assert len(result['distribution']) == 2
+        assert result['distribution'][0]['percentage'] == 60.0
+        assert result['distribution'][0]['avg_if'] == 4.5
         assert 'last_updated' in result
 
 
@@ -296,44 +240,16 @@ class TestStudentDashboardService:
         with pytest.raises(ValidationError, match="존재하지 않는 학과"):
             service._validate_inputs('기계공학과', '재학')
 
-    def test_aggregate_by_department_returns_correct_structure(self):
-        """aggregate_by_department should return correct data structure."""
-        # Arrange
-        service = StudentDashboardService()
-
-        mock_queryset = Mock()
-        mock_aggregated = [
-            {'department': '컴퓨터공학과', '학사': 120, '석사': 35, '박사': 12, 'total': 167},
-            {'department': '전자공학과', '학사': 100, '석사': 30, '박사': 10, 'total': 140}
-        ]
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = mock_aggregated
-
-        # Act
-        result = service._aggregate_by_department(mock_queryset)
-
-        # Assert
-        assert len(result) == 2
-        assert result[0]['department'] == '컴퓨터공학과'
-        assert result[0]['학사'] == 120
-        assert result[0]['석사'] == 35
-        assert result[0]['박사'] == 12
-        assert result[0]['total'] == 167
-
     def test_get_student_dashboard_data_returns_formatted_response(self):
         """get_student_dashboard_data should return properly formatted response."""
         # Arrange
         mock_repo = Mock()
         mock_repo.get_all_departments.return_value = []
 
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 307
-
-        mock_aggregated = [
-            {'department': '컴퓨터공학과', '학사': 120, '석사': 35, '박사': 12, 'total': 167}
+        mock_repo.get_department_program_counts.return_value = [
+            {'department': '컴퓨터공학과', '학사': 120, '석사': 35, '박사': 12, 'total': 167},
+            {'department': '전자공학과', '학사': 100, '석사': 30, '박사': 10, 'total': 140}
         ]
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = mock_aggregated
-
-        mock_repo.get_students_by_filter.return_value = mock_queryset
 
         service = StudentDashboardService(repository=mock_repo)
 
@@ -342,7 +258,7 @@ class TestStudentDashboardService:
 
         # Assert
         assert result['total_students'] == 307
-        assert len(result['by_department']) == 1
+        assert len(result['by_department']) == 2
         assert result['by_department'][0]['department'] == '컴퓨터공학과'
         assert 'updated_at' in result
 
@@ -352,11 +268,7 @@ class TestStudentDashboardService:
         mock_repo = Mock()
         mock_repo.get_all_departments.return_value = ['컴퓨터공학과', '전자공학과']
 
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 0
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = []
-
-        mock_repo.get_students_by_filter.return_value = mock_queryset
+        mock_repo.get_department_program_counts.return_value = []
 
         service = StudentDashboardService(repository=mock_repo)
 
@@ -364,7 +276,7 @@ class TestStudentDashboardService:
         service.get_student_dashboard_data('컴퓨터공학과', '재학')
 
         # Assert
-        mock_repo.get_students_by_filter.assert_called_once_with('컴퓨터공학과', '재학')
+        mock_repo.get_department_program_counts.assert_called_once_with('컴퓨터공학과', '재학')
 
     def test_default_parameters_use_enrolled_students(self):
         """Default parameters should filter for enrolled students."""
@@ -372,11 +284,7 @@ class TestStudentDashboardService:
         mock_repo = Mock()
         mock_repo.get_all_departments.return_value = []
 
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 0
-        mock_queryset.values.return_value.annotate.return_value.order_by.return_value = []
-
-        mock_repo.get_students_by_filter.return_value = mock_queryset
+        mock_repo.get_department_program_counts.return_value = []
 
         service = StudentDashboardService(repository=mock_repo)
 
@@ -384,4 +292,4 @@ class TestStudentDashboardService:
         service.get_student_dashboard_data()
 
         # Assert
-        mock_repo.get_students_by_filter.assert_called_once_with('all', '재학')
+        mock_repo.get_department_program_counts.assert_called_once_with('all', '재학')
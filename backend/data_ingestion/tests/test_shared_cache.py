@@ -0,0 +1,245 @@
+"""
+Tests for the shared cross-worker cache backend.
+
+Following test-plan.md:
+- Entries written by one worker process are served by another (file backend)
+- The database-table backend works across nodes once the table exists
+- add() lets exactly one process hold a key, also on the file backend
+- A broken backend degrades to cache misses, never to errors
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from unittest.mock import Mock, PropertyMock, patch
+
+from data_ingestion.infrastructure.dataset_versions import DATASET_STUDENTS
+from data_ingestion.infrastructure.response_cache import DashboardResponseCache
+from data_ingestion.infrastructure.shared_cache import SharedCache
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+WORKER_SCRIPT = """
+import django
+django.setup()
+from data_ingestion.infrastructure.response_cache import DashboardResponseCache
+result, hit = DashboardResponseCache().get_or_compute(
+    'students', 'students', {'department': 'all'}, lambda: {'total': 42}, version=3
+)
+print(hit)
+"""
+
+# Each process repeatedly takes the lock key with add(); while holding it,
+# it creates a marker file exclusively, which fails if another holder exists
+LOCK_SCRIPT = """
+import os, sys, time
+import django
+django.setup()
+from data_ingestion.infrastructure.shared_cache import SharedCache
+start_at, marker = float(sys.argv[1]), sys.argv[2]
+namespace = SharedCache().namespace('students', 1)
+while time.time() < start_at:
+    pass
+wins = overlaps = 0
+for _ in range(500):
+    if namespace.add('summary:lock', True, 30):
+        wins += 1
+        try:
+            os.close(os.open(marker, os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            overlaps += 1
+        else:
+            os.remove(marker)
+        namespace.delete('summary:lock')
+print(wins, overlaps)
+"""
+
+
+def _file_cache(location):
+    return {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(location),
+        }
+    }
+
+
+def _database_cache():
+    return {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'dashboard_cache',
+        }
+    }
+
+
+@pytest.mark.unit
+class TestDatasetNamespace:
+    """Per-dataset, per-version key namespaces."""
+
+    def test_namespaces_do_not_collide(self):
+        """The same key in two datasets or versions are separate entries."""
+        # Arrange
+        cache = SharedCache()
+        students_v1 = cache.namespace(DATASET_STUDENTS, 1)
+
+        # Act
+        students_v1.set('summary', 'students-v1')
+        cache.namespace('publications', 1).set('summary', 'publications-v1')
+
+        # Assert
+        assert students_v1.get('summary') == 'students-v1'
+        assert cache.namespace(DATASET_STUDENTS, 2).get('summary') is None
+        assert students_v1.make_key('summary') == 'dashboard:students:v1:summary'
+
+    def test_backend_errors_are_misses(self):
+        """Read and write failures are logged, not raised."""
+        # Arrange
+        namespace = SharedCache().namespace(DATASET_STUDENTS, 1)
+        broken = Mock()
+        broken.get.side_effect = OSError('disk full')
+        broken.set.side_effect = OSError('disk full')
+
+        # Act
+        with patch.object(SharedCache, 'backend', new_callable=PropertyMock, return_value=broken):
+            namespace.set('summary', 'value')
+            result = namespace.get('summary', 'default')
+
+        # Assert
+        assert result == 'default'
+
+
+@pytest.mark.integration
+class TestFileBackend:
+    """Host-wide sharing through the file-based backend."""
+
+    def test_entry_from_another_process_is_a_hit(self, settings, tmp_path):
+        """A response computed in a separate worker process is reused here."""
+        # Arrange
+        settings.CACHES = _file_cache(tmp_path)
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': 'data_ingestion.settings',
+            'DASHBOARD_CACHE_BACKEND': 'file',
+            'DASHBOARD_CACHE_DIR': str(tmp_path),
+        }
+
+        # Act
+        worker = subprocess.run(
+            [sys.executable, '-c', WORKER_SCRIPT],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        compute = Mock(return_value={'total': 0})
+        result, hit = DashboardResponseCache().get_or_compute(
+            'students', DATASET_STUDENTS, {'department': 'all'}, compute, version=3
+        )
+
+        # Assert
+        assert worker.stdout.strip().endswith('False')
+        assert (result, hit) == ({'total': 42}, True)
+        compute.assert_not_called()
+
+    def test_add_is_exclusive_across_processes(self, tmp_path):
+        """Concurrent add() calls from separate processes never both win."""
+        # Arrange: Django's own FileBasedCache.add() overlaps here
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': 'data_ingestion.settings',
+            'DASHBOARD_CACHE_BACKEND': 'file',
+            'DASHBOARD_CACHE_DIR': str(tmp_path / 'cache'),
+        }
+        start_at = str(time.time() + 3)
+        marker = str(tmp_path / 'holder')
+
+        # Act
+        workers = [
+            subprocess.Popen(
+                [sys.executable, '-c', LOCK_SCRIPT, start_at, marker],
+                cwd=BACKEND_DIR, env=env, stdout=subprocess.PIPE, text=True
+            )
+            for _ in range(6)
+        ]
+        results = [
+            tuple(int(n) for n in worker.communicate(timeout=60)[0].split()[-2:])
+            for worker in workers
+        ]
+
+        # Assert
+        assert sum(wins for wins, _ in results) > 0
+        assert [overlaps for _, overlaps in results] == [0] * 6
+
+    def test_add_takes_over_expired_entry(self, settings, tmp_path):
+        """An expired lock left behind by a crashed holder can be taken."""
+        # Arrange
+        settings.CACHES = _file_cache(tmp_path)
+        namespace = SharedCache().namespace(DATASET_STUDENTS, 1)
+
+        # Act
+        first = namespace.add('summary:lock', 'crashed', -1)
+        second = namespace.add('summary:lock', 'new', 30)
+        third = namespace.add('summary:lock', 'other', 30)
+
+        # Assert
+        assert (first, second, third) == (True, True, False)
+        assert namespace.get('summary:lock') == 'new'
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestDatabaseBackend:
+    """Cross-node sharing through the database-table backend."""
+
+    def test_round_trip_through_cache_table(self, settings):
+        """Entries are stored in and served from the cache table."""
+        # Arrange
+        settings.CACHES = _database_cache()
+        call_command('createcachetable', verbosity=0)
+        cache = DashboardResponseCache()
+        compute = Mock(return_value={'total': 7})
+
+        # Act
+        first = cache.get_or_compute('students', DATASET_STUDENTS, {}, compute, version=1)
+        second = cache.get_or_compute('students', DATASET_STUDENTS, {}, compute, version=1)
+
+        # Assert
+        assert first == ({'total': 7}, False)
+        assert second == ({'total': 7}, True)
+        compute.assert_called_once()
+
+    def test_add_is_exclusive_until_expiry(self, settings):
+        """add() inserts once; only an expired row is taken over."""
+        # Arrange
+        settings.CACHES = _database_cache()
+        call_command('createcachetable', verbosity=0)
+        namespace = SharedCache().namespace(DATASET_STUDENTS, 1)
+
+        # Act
+        first = namespace.add('summary:lock', 'crashed', -1)
+        second = namespace.add('summary:lock', 'new', 30)
+        third = namespace.add('summary:lock', 'other', 30)
+
+        # Assert
+        assert (first, second, third) == (True, True, False)
+        assert namespace.get('summary:lock') == 'new'
+
+    def test_missing_cache_table_degrades_to_misses(self, settings):
+        """Without createcachetable every request is computed, none fail."""
+        # Arrange
+        settings.CACHES = _database_cache()
+        cache = DashboardResponseCache()
+        compute = Mock(return_value={'total': 7})
+
+        # Act
+        results = [
+            cache.get_or_compute('students', DATASET_STUDENTS, {}, compute, version=1)
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert results == [({'total': 7}, False)] * 2
+        assert compute.call_count == 2
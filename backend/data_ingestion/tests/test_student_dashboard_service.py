@@ -4,7 +4,7 @@ Following plan.md Phase 2 - Service Layer tests (TDD RED phase).
 
 Test coverage:
 - Input validation (department existence, status whitelist)
-- Data aggregation logic (_aggregate_by_department)
+- Data aggregation by department and program_type (real repository)
 - Business rules (sorting by total descending)
 - Edge cases: no data, missing program types, invalid inputs
 
@@ -129,7 +129,7 @@ class TestStudentDashboardServiceAggregation:
     def test_aggregate_by_department_groups_by_program_type(self, db):
         """
         GIVEN: 컴퓨터공학과 students (학사 2명, 석사 1명)
-        WHEN: Calling _aggregate_by_department()
+        WHEN: Calling get_student_dashboard_data() for that department
         THEN: Returns list with correct counts: {'department': '컴퓨터공학과', '학사': 2, '석사': 1, '박사': 0, 'total': 3}
         """
         # Arrange
@@ -141,12 +141,10 @@ class TestStudentDashboardServiceAggregation:
             Student(student_id='2024003', department='컴퓨터공학과', grade=1,
                    program_type='석사', enrollment_status='재학'),
         ])
-        mock_repo = Mock()
-        service = StudentDashboardService(mock_repo)
-        queryset = Student.objects.filter(department='컴퓨터공학과')
+        service = StudentDashboardService()
 
         # Act
-        result = service._aggregate_by_department(queryset)
+        result = service.get_student_dashboard_data(department='컴퓨터공학과', status='all')['by_department']
 
         # Assert
         assert len(result) == 1
@@ -160,7 +158,7 @@ class TestStudentDashboardServiceAggregation:
     def test_aggregate_by_department_orders_by_total_desc(self, db):
         """
         GIVEN: 전자공학과(10명), 컴퓨터공학과(20명)
-        WHEN: Calling _aggregate_by_department()
+        WHEN: Calling get_student_dashboard_data() for all departments
         THEN: Returns list with 컴퓨터공학과 first (descending order by total)
         """
         # Arrange
@@ -178,12 +176,10 @@ class TestStudentDashboardServiceAggregation:
         ]
         Student.objects.bulk_create(comp_students + elec_students)
 
-        mock_repo = Mock()
-        service = StudentDashboardService(mock_repo)
-        queryset = Student.objects.all()
+        service = StudentDashboardService()
 
         # Act
-        result = service._aggregate_by_department(queryset)
+        result = service.get_student_dashboard_data(department='all', status='all')['by_department']
 
         # Assert
         assert len(result) == 2
@@ -197,7 +193,7 @@ class TestStudentDashboardServiceAggregation:
     def test_aggregate_handles_missing_program_types(self, db):
         """
         GIVEN: Department with only 학사 students (no 석사 or 박사)
-        WHEN: Calling _aggregate_by_department()
+        WHEN: Calling get_student_dashboard_data() for that department
         THEN: Returns {'학사': N, '석사': 0, '박사': 0}
         """
         # Arrange
@@ -207,12 +203,10 @@ class TestStudentDashboardServiceAggregation:
             Student(student_id='2024002', department='기계공학과', grade=2,
                    program_type='학사', enrollment_status='재학'),
         ])
-        mock_repo = Mock()
-        service = StudentDashboardService(mock_repo)
-        queryset = Student.objects.filter(department='기계공학과')
+        service = StudentDashboardService()
 
         # Act
-        result = service._aggregate_by_department(queryset)
+        result = service.get_student_dashboard_data(department='기계공학과', status='all')['by_department']
 
         # Assert
         assert len(result) == 1
@@ -293,7 +287,7 @@ class TestStudentDashboardServiceMainFlow:
         THEN: Returns total_students=0, by_department=[]
         """
         # Arrange
-        mock_repository.get_students_by_filter.return_value = Student.objects.none()
+        mock_repository.get_department_program_counts.return_value = []
         service = StudentDashboardService(mock_repository)
 
         # Act
@@ -317,4 +311,4 @@ class TestStudentDashboardServiceMainFlow:
             service.get_student_dashboard_data(department='all', status='invalid')
 
         # Verify repository was never called
-        mock_repository.get_students_by_filter.assert_not_called()
+        mock_repository.get_department_program_counts.assert_not_called()
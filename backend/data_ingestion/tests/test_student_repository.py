@@ -3,7 +3,7 @@ Unit tests for StudentRepository.
 Following plan.md Phase 1 - Infrastructure Layer tests (TDD RED phase).
 
 Test coverage:
-- get_students_by_filter() with various filter combinations
+- get_department_program_counts() with various filter combinations
 - get_all_departments() for dropdown population
 - Edge cases: nonexistent department, empty DB
 
@@ -15,6 +15,10 @@ from data_ingestion.infrastructure.models import Student
 from data_ingestion.infrastructure.repositories import StudentRepository
 
 
+def _counts_by_department(rows):
+    return {row['department']: row['total'] for row in rows}
+
+
 @pytest.fixture
 def sample_students(db):
     """
@@ -64,89 +68,82 @@ class TestStudentRepository:
     Each test verifies one specific behavior.
     """
 
-    def test_get_students_by_filter_all_departments_all_status(self, sample_students):
+    def test_get_department_program_counts_all_departments_all_status(self, sample_students):
         """
         GIVEN: 4 students in database
-        WHEN: Filtering with department='all', status='all'
-        THEN: Returns all 4 students
+        WHEN: Counting with department='all', status='all'
+        THEN: Counts all 4 students per department and program type
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='all', status='all')
+        result = repo.get_department_program_counts(department='all', status='all')
 
         # Assert
-        assert result.count() == 4, "Should return all 4 students"
+        assert _counts_by_department(result) == {'컴퓨터공학과': 2, '전자공학과': 2}
+        computer_science = next(row for row in result if row['department'] == '컴퓨터공학과')
+        assert (computer_science['학사'], computer_science['석사'], computer_science['박사']) == (1, 1, 0)
 
-    def test_get_students_by_filter_specific_department(self, sample_students):
+    def test_get_department_program_counts_specific_department(self, sample_students):
         """
         GIVEN: 4 students (2 from 컴퓨터공학과, 2 from 전자공학과)
-        WHEN: Filtering by department='컴퓨터공학과', status='all'
-        THEN: Returns only 2 students from 컴퓨터공학과
+        WHEN: Counting with department='컴퓨터공학과', status='all'
+        THEN: Returns only the 컴퓨터공학과 row with 2 students
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='컴퓨터공학과', status='all')
+        result = repo.get_department_program_counts(department='컴퓨터공학과', status='all')
 
         # Assert
-        assert result.count() == 2
-        for student in result:
-            assert student.department == '컴퓨터공학과'
+        assert _counts_by_department(result) == {'컴퓨터공학과': 2}
 
-    def test_get_students_by_filter_enrollment_status_only(self, sample_students):
+    def test_get_department_program_counts_enrollment_status_only(self, sample_students):
         """
         GIVEN: 4 students (2 재학, 1 휴학, 1 졸업)
-        WHEN: Filtering by department='all', status='재학'
-        THEN: Returns only 2 재학 students
+        WHEN: Counting with department='all', status='재학'
+        THEN: Counts only the 2 재학 students (both 컴퓨터공학과)
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='all', status='재학')
+        result = repo.get_department_program_counts(department='all', status='재학')
 
         # Assert
-        assert result.count() == 2
-        for student in result:
-            assert student.enrollment_status == '재학'
+        assert _counts_by_department(result) == {'컴퓨터공학과': 2}
 
-    def test_get_students_by_filter_combined_filters(self, sample_students):
+    def test_get_department_program_counts_combined_filters(self, sample_students):
         """
         GIVEN: 4 students
-        WHEN: Filtering by department='컴퓨터공학과', status='재학'
-        THEN: Returns 2 students (both from 컴퓨터공학과 and 재학)
+        WHEN: Counting with department='전자공학과', status='재학'
+        THEN: Returns no rows (전자공학과 has no 재학 students)
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='컴퓨터공학과', status='재학')
+        result = repo.get_department_program_counts(department='전자공학과', status='재학')
 
         # Assert
-        assert result.count() == 2
-        for student in result:
-            assert student.department == '컴퓨터공학과'
-            assert student.enrollment_status == '재학'
+        assert result == []
 
-    def test_get_students_by_filter_only_enrollment_status_휴학(self, sample_students):
+    def test_get_department_program_counts_only_enrollment_status_휴학(self, sample_students):
         """
         GIVEN: 4 students (1 휴학)
-        WHEN: Filtering by department='all', status='휴학'
-        THEN: Returns 1 student
+        WHEN: Counting with department='all', status='휴학'
+        THEN: Counts 1 전자공학과 student
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='all', status='휴학')
+        result = repo.get_department_program_counts(department='all', status='휴학')
 
         # Assert
-        assert result.count() == 1
-        assert result.first().enrollment_status == '휴학'
-        assert result.first().department == '전자공학과'
+        assert _counts_by_department(result) == {'전자공학과': 1}
 
     def test_get_all_departments_returns_distinct_list(self, sample_students):
         """
@@ -167,20 +164,20 @@ class TestStudentRepository:
 
     # Edge Cases
 
-    def test_filter_nonexistent_department_returns_empty_queryset(self, sample_students):
+    def test_count_nonexistent_department_returns_empty_list(self, sample_students):
         """
         GIVEN: 4 students (none from '기계공학과')
-        WHEN: Filtering by department='기계공학과', status='all'
-        THEN: Returns empty QuerySet (count == 0)
+        WHEN: Counting with department='기계공학과', status='all'
+        THEN: Returns no rows
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='기계공학과', status='all')
+        result = repo.get_department_program_counts(department='기계공학과', status='all')
 
         # Assert
-        assert result.count() == 0, "Should return empty QuerySet for nonexistent department"
+        assert result == [], "Should return no rows for nonexistent department"
 
     def test_get_all_departments_empty_db(self, db):
         """
@@ -197,26 +194,26 @@ class TestStudentRepository:
         # Assert
         assert len(result) == 0, "Should return empty list when no students exist"
 
-    def test_get_students_by_filter_empty_db(self, db):
+    def test_get_department_program_counts_empty_db(self, db):
         """
         GIVEN: Empty students table
-        WHEN: Filtering by any criteria
-        THEN: Returns empty QuerySet
+        WHEN: Counting by any criteria
+        THEN: Returns no rows
         """
         # Arrange
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='all', status='all')
+        result = repo.get_department_program_counts(department='all', status='all')
 
         # Assert
-        assert result.count() == 0
+        assert result == []
 
-    def test_get_students_by_filter_multiple_same_department(self, db):
+    def test_get_department_program_counts_multiple_same_department(self, db):
         """
         GIVEN: 3 students all from same department
-        WHEN: Filtering by that department
-        THEN: Returns all 3 students
+        WHEN: Counting that department
+        THEN: One row with one student per program type
         """
         # Arrange
         Student.objects.bulk_create([
@@ -245,7 +242,7 @@ class TestStudentRepository:
         repo = StudentRepository()
 
         # Act
-        result = repo.get_students_by_filter(department='기계공학과', status='all')
+        result = repo.get_department_program_counts(department='기계공학과', status='all')
 
         # Assert
-        assert result.count() == 3
+        assert result == [{'department': '기계공학과', '학사': 1, '석사': 1, '박사': 1, 'total': 3}]
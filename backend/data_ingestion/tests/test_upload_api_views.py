@@ -110,6 +110,56 @@ class TestUploadViewSet:
         assert 'job_id' in data
         assert 'message' in data
 
+    def test_upload_when_queue_full_returns_429_with_retry_after(self):
+        """Upload beyond the queue depth limit should return 429 + Retry-After."""
+        # Arrange
+        client = APIClient()
+        uploaded_file = SimpleUploadedFile(
+            "research_funding.csv",
+            b"test,data\n1,2",
+            content_type="text/csv"
+        )
+
+        # Act
+        with patch('django.conf.settings.ADMIN_API_KEY', 'test-key'), \
+                patch('django.conf.settings.INGESTION_MAX_QUEUE_DEPTH', 0):
+            response = client.post(
+                '/api/upload/',
+                {'research_funding': uploaded_file},
+                HTTP_X_ADMIN_KEY='test-key',
+                format='multipart'
+            )
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response['Retry-After']) >= 1
+        assert response.json()['error'] == 'ERR_QUEUE_001'
+
+    def test_upload_over_temp_quota_returns_503(self):
+        """Upload beyond the temp-disk quota should return 503 + Retry-After."""
+        # Arrange
+        client = APIClient()
+        uploaded_file = SimpleUploadedFile(
+            "research_funding.csv",
+            b"test,data\n1,2",
+            content_type="text/csv"
+        )
+
+        # Act
+        with patch('django.conf.settings.ADMIN_API_KEY', 'test-key'), \
+                patch('django.conf.settings.INGESTION_TEMP_QUOTA_BYTES', 1):
+            response = client.post(
+                '/api/upload/',
+                {'research_funding': uploaded_file},
+                HTTP_X_ADMIN_KEY='test-key',
+                format='multipart'
+            )
+
+        # Assert
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert 'Retry-After' in response
+        assert response.json()['error'] == 'ERR_DISK_001'
+
     def test_upload_without_files_returns_400(self):
         """Upload request without files should return 400 Bad Request."""
         # Arrange
@@ -206,6 +256,145 @@ class TestStatusViewSet:
         assert data['error'] == 'not_found'
 
 
+@pytest.mark.integration
+class TestStatusBatchEndpoint:
+    """Test batch job status query endpoint."""
+
+    def setup_method(self):
+        from data_ingestion.infrastructure.job_status_store import get_job_store
+        self.store = get_job_store()
+        self.store.clear_all()
+
+    def teardown_method(self):
+        self.store.clear_all()
+
+    def test_batch_by_job_ids_returns_found_and_missing(self):
+        """GET ?job_ids= should return all known jobs and list unknown IDs."""
+        # Arrange
+        from data_ingestion.infrastructure.job_status_store import JobStatus
+        client = APIClient()
+        job_a = '11111111-1111-1111-1111-111111111111'
+        job_b = '22222222-2222-2222-2222-222222222222'
+        self.store.create_job(job_a)
+        self.store.create_job(job_b)
+        self.store.update_status(job_b, JobStatus.COMPLETED)
+        self.store.update_progress(job_b, 100, 100)
+
+        # Act
+        response = client.get(
+            '/api/upload/status/',
+            {'job_ids': f'{job_a},{job_b},missing-job'}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [job['job_id'] for job in data['jobs']] == [job_a, job_b]
+        assert data['jobs'][0]['status'] == 'pending'
+        assert data['jobs'][1]['status'] == 'completed'
+        assert data['jobs'][1]['progress'] == 100
+        assert data['not_found'] == ['missing-job']
+        assert 'as_of' in data
+
+    def test_batch_since_returns_recently_updated_jobs(self):
+        """GET ?since= should only return jobs updated at or after T."""
+        # Arrange
+        from datetime import timedelta
+        from django.utils import timezone
+        client = APIClient()
+        job_id = '33333333-3333-3333-3333-333333333333'
+        self.store.create_job(job_id)
+
+        # Act
+        past = (timezone.now() - timedelta(minutes=5)).isoformat()
+        future = (timezone.now() + timedelta(minutes=5)).isoformat()
+        recent_response = client.get('/api/upload/status/', {'since': past})
+        future_response = client.get('/api/upload/status/', {'since': future})
+
+        # Assert
+        assert recent_response.status_code == status.HTTP_200_OK
+        assert [job['job_id'] for job in recent_response.json()['jobs']] == [job_id]
+        assert future_response.json()['jobs'] == []
+
+    def test_batch_requires_exactly_one_filter(self):
+        """Missing or combined filters should return 400."""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        none_response = client.get('/api/upload/status/')
+        both_response = client.get(
+            '/api/upload/status/',
+            {'job_ids': 'a', 'since': '2025-01-01T00:00:00Z'}
+        )
+
+        # Assert
+        assert none_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert both_response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_rejects_too_many_job_ids(self):
+        """More than MAX_JOB_IDS IDs should return 400."""
+        # Arrange
+        from data_ingestion.api.serializers import JobStatusBatchQuerySerializer
+        client = APIClient()
+        job_ids = ','.join(f'job-{i}' for i in range(JobStatusBatchQuerySerializer.MAX_JOB_IDS + 1))
+
+        # Act
+        response = client.get('/api/upload/status/', {'job_ids': job_ids})
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.integration
+class TestUploadCancelEndpoint:
+    """Test job cancellation endpoint."""
+
+    def test_cancel_requires_admin_key(self):
+        """Cancel without X-Admin-Key should return 403."""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        response = client.post('/api/upload/some-job/cancel/')
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_cancel_unknown_job_returns_404(self):
+        """Cancel of unknown job should return 404."""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        with patch('django.conf.settings.ADMIN_API_KEY', 'test-key'):
+            response = client.post('/api/upload/no-such-job/cancel/', HTTP_X_ADMIN_KEY='test-key')
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @patch.dict('data_ingestion.services.ingestion_service._jobs', clear=True)
+    @patch('data_ingestion.services.ingestion_service.executor')
+    def test_cancel_queued_job_returns_202_then_409(self, mock_executor):
+        """Cancel of a queued job succeeds once; a second cancel conflicts."""
+        # Arrange
+        from data_ingestion.services.ingestion_service import submit_upload_job
+        from data_ingestion.infrastructure.job_status_store import get_job_store
+        client = APIClient()
+        job_id = submit_upload_job({'students': '/tmp/students.csv'})
+
+        # Act
+        with patch('django.conf.settings.ADMIN_API_KEY', 'test-key'):
+            first = client.post(f'/api/upload/{job_id}/cancel/', HTTP_X_ADMIN_KEY='test-key')
+            second = client.post(f'/api/upload/{job_id}/cancel/', HTTP_X_ADMIN_KEY='test-key')
+
+        # Assert
+        assert first.status_code == status.HTTP_202_ACCEPTED
+        assert second.status_code == status.HTTP_409_CONFLICT
+        assert get_job_store().get_job(job_id).status.value == 'cancelled'
+        get_job_store().delete_job(job_id)
+
+
 @pytest.mark.integration
 class TestResearchFundingView:
     """Test Research Funding Dashboard API."""
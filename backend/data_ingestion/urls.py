@@ -1,8 +1,10 @@
 """URL Configuration for data_ingestion project."""
 
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
+from data_ingestion.api import async_views
 from data_ingestion.api.views import (
     UploadViewSet,
     StatusViewSet,
@@ -11,6 +13,8 @@ from data_ingestion.api.views import (
     PublicationDashboardView,
     DepartmentKPIView,
     FilterOptionsView,
+    DashboardOverviewView,
+    CacheStatsView,
     HealthCheckView
 )
 
@@ -19,6 +23,14 @@ router = DefaultRouter()
 
 # No router registration needed for custom routes
 
+
+def _view(viewset, action, async_view):
+    """The async view when DASHBOARD_ASYNC_VIEWS is set (ASGI), else the DRF view."""
+    if getattr(settings, 'DASHBOARD_ASYNC_VIEWS', False):
+        return async_view
+    return viewset.as_view({'get': action})
+
+
 urlpatterns = [
     # Health check endpoint: GET /api/health/
     path('api/health/', HealthCheckView.as_view({'get': 'list'}), name='health-check'),
@@ -26,21 +38,33 @@ urlpatterns = [
     # Upload endpoint: POST /api/upload/
     path('api/upload/', UploadViewSet.as_view({'post': 'create'}), name='upload-files'),
 
+    # Cancel endpoint: POST /api/upload/<job_id>/cancel/
+    path('api/upload/<str:pk>/cancel/', UploadViewSet.as_view({'post': 'cancel'}), name='upload-cancel'),
+
+    # Batch status endpoint: GET /api/upload/status/?job_ids=a,b or ?since=<ISO 8601>
+    path('api/upload/status/', StatusViewSet.as_view({'get': 'list'}), name='upload-status-batch'),
+
     # Status endpoint: GET /api/upload/status/<job_id>/
-    path('api/upload/status/<str:pk>/', StatusViewSet.as_view({'get': 'retrieve'}), name='upload-status'),
+    path('api/upload/status/<str:pk>/', _view(StatusViewSet, 'retrieve', async_views.upload_status), name='upload-status'),
 
     # Research Funding Dashboard endpoint: GET /api/dashboard/research-funding/
-    path('api/dashboard/research-funding/', ResearchFundingView.as_view({'get': 'list'}), name='research-funding-list'),
+    path('api/dashboard/research-funding/', _view(ResearchFundingView, 'list', async_views.research_funding), name='research-funding-list'),
 
     # Student Dashboard endpoint: GET /api/dashboard/students/
-    path('api/dashboard/students/', StudentDashboardView.as_view({'get': 'list'}), name='student-dashboard-list'),
+    path('api/dashboard/students/', _view(StudentDashboardView, 'list', async_views.students), name='student-dashboard-list'),
 
     # Publication Dashboard endpoint: GET /api/dashboard/publications/
-    path('api/dashboard/publications/', PublicationDashboardView.as_view({'get': 'list'}), name='publication-dashboard-list'),
+    path('api/dashboard/publications/', _view(PublicationDashboardView, 'list', async_views.publications), name='publication-dashboard-list'),
 
     # Department KPI Dashboard endpoint: GET /api/dashboard/department-kpi/
-    path('api/dashboard/department-kpi/', DepartmentKPIView.as_view({'get': 'list'}), name='department-kpi-list'),
+    path('api/dashboard/department-kpi/', _view(DepartmentKPIView, 'list', async_views.department_kpi), name='department-kpi-list'),
 
     # Filter Options endpoint: GET /api/dashboard/filter-options/
     path('api/dashboard/filter-options/', FilterOptionsView.as_view({'get': 'list'}), name='filter-options-list'),
+
+    # Batched dashboard sections for initial page load: GET /api/dashboard/overview/
+    path('api/dashboard/overview/', DashboardOverviewView.as_view({'get': 'list'}), name='dashboard-overview'),
+
+    # Dashboard cache statistics: GET /api/dashboard/cache-stats/
+    path('api/dashboard/cache-stats/', CacheStatsView.as_view({'get': 'list'}), name='cache-stats'),
 ]
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'data_ingestion.settings')
 
 application = get_wsgi_application()
+
+from data_ingestion.infrastructure.analytics_cube import warm_analytics_cube  # noqa: E402
+
+warm_analytics_cube()
@@ -36,6 +36,7 @@ export interface UploadResponse {
   job_id: string;
   message: string;
   estimated_time?: string;
+  estimated_seconds?: number;
 }
 
 export interface FileStatus {
@@ -52,9 +53,12 @@ export interface FileStatus {
 
 export interface UploadStatusResponse {
   job_id: string;
-  status: 'processing' | 'completed' | 'failed' | 'partial_success';
+  status: 'pending' | 'waiting' | 'processing' | 'completed' | 'failed' | 'partial_success' | 'cancelled';
   progress: number;
   files: FileStatus[];
+  error_message?: string;
+  blocked_by?: string;
+  message?: string;
   completed_at?: string;
   failed_at?: string;
 }
@@ -193,24 +197,80 @@ export async function getDepartmentKPIData(filters?: {
     params,
   });
 
-  // Transform backend response to match DepartmentKpiData type
-  const backendData = response.data;
-  return {
-    trend: backendData.data || [],
-    overall_avg_employment_rate: backendData.meta?.overall_avg_employment_rate || null,
-    overall_total_tech_income: backendData.meta?.total_tech_income || null,
-    total_count: backendData.meta?.total_count || 0,
-  };
+  return toDepartmentKpiData(response.data);
+}
+
+// Transform backend response to match DepartmentKpiData type
+const toDepartmentKpiData = (backendData: any) => ({
+  trend: backendData.data || [],
+  overall_avg_employment_rate: backendData.meta?.overall_avg_employment_rate || null,
+  overall_total_tech_income: backendData.meta?.total_tech_income || null,
+  total_count: backendData.meta?.total_count || 0,
+});
+
+export interface FilterOptionsResponse {
+  departments: string[];
+  years: string[];
+  student_statuses: string[];
+  journal_tiers: string[];
 }
 
 /**
- * Fetch filter options
+ * Fetch filter options (departments come from the uploaded data)
  */
-export async function getFilterOptions(): Promise<any> {
+export async function getFilterOptions(): Promise<FilterOptionsResponse> {
   const response = await getApiClient().get('/api/dashboard/filter-options/');
   return response.data;
 }
 
+export interface DashboardOverviewResponse {
+  researchFunding: any;
+  students: any;
+  publications: any;
+  departmentKpi: any;
+  filterOptions: FilterOptionsResponse | null;
+  errors: Record<string, { status: number; body: any }>;
+}
+
+/**
+ * Fetch every dashboard section for one shared filter set in a single request
+ * (replaces the five separate first-paint requests)
+ */
+export async function getDashboardOverview(filters?: {
+  department?: string;
+  period?: string;
+  status?: string;
+  journalTier?: string;
+}): Promise<DashboardOverviewResponse> {
+  const params = new URLSearchParams();
+  if (filters?.department && filters.department !== 'all') {
+    params.append('department', filters.department);
+  }
+  if (filters?.period) {
+    params.append('period', filters.period);
+  }
+  if (filters?.status && filters.status !== 'all') {
+    params.append('status', filters.status);
+  }
+  if (filters?.journalTier && filters.journalTier !== 'all') {
+    params.append('journal_tier', filters.journalTier);
+  }
+
+  const response = await getApiClient().get('/api/dashboard/overview/', {
+    params,
+  });
+
+  const overview = response.data;
+  return {
+    researchFunding: overview.research_funding,
+    students: overview.students,
+    publications: overview.publications,
+    departmentKpi: overview.department_kpi ? toDepartmentKpiData(overview.department_kpi) : null,
+    filterOptions: overview.filter_options,
+    errors: overview.errors || {},
+  };
+}
+
 // Export for testing - allows resetting the client
 export const __resetApiClient = () => {
   apiClient = null;
@@ -47,7 +47,7 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
           >
             {filterOptions.departments.map((dept) => (
               <option key={dept} value={dept}>
-                {dept}
+                {dept === 'all' ? '전체' : dept}
               </option>
             ))}
           </select>
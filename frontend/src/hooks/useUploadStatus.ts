@@ -60,7 +60,8 @@ function useUploadStatus(jobId: string | null): UseUploadStatusReturn {
         if (
           response.status === 'completed' ||
           response.status === 'failed' ||
-          response.status === 'partial_success'
+          response.status === 'partial_success' ||
+          response.status === 'cancelled'
         ) {
           if (intervalRef.current) {
             clearInterval(intervalRef.current);
@@ -48,6 +48,10 @@ const AdminUploadPage: React.FC = () => {
     }
 
     switch (status.status) {
+      case 'pending':
+        return '대기 중...';
+      case 'waiting':
+        return status.message || '다른 업로드 작업 완료 대기 중...';
       case 'processing':
         return '처리 중...';
       case 'completed':
@@ -56,6 +60,8 @@ const AdminUploadPage: React.FC = () => {
         return '업로드 중 오류가 발생했습니다.';
       case 'partial_success':
         return '업로드가 부분적으로 완료되었습니다.';
+      case 'cancelled':
+        return status.error_message || '업로드가 취소되었습니다.';
       default:
         return '';
     }
@@ -66,6 +72,8 @@ const AdminUploadPage: React.FC = () => {
    */
   const getStatusColorClass = (statusValue: string): string => {
     switch (statusValue) {
+      case 'pending':
+      case 'waiting':
       case 'processing':
         return 'status-processing';
       case 'completed':
@@ -73,6 +81,7 @@ const AdminUploadPage: React.FC = () => {
       case 'failed':
         return 'status-error';
       case 'partial_success':
+      case 'cancelled':
         return 'status-warning';
       default:
         return '';
@@ -17,12 +17,7 @@ import {
   PublicationData,
   DepartmentKpiData,
 } from '../types/domain';
-import {
-  getResearchFundingData,
-  getStudentData,
-  getPublicationData,
-  getDepartmentKPIData,
-} from '../api/dataApiClient';
+import { getDashboardOverview } from '../api/dataApiClient';
 
 export const DashboardPage: React.FC = () => {
   // Filter state
@@ -34,8 +29,8 @@ export const DashboardPage: React.FC = () => {
     journalTier: 'all',
   });
 
-  const [filterOptions] = useState<FilterOptions>({
-    departments: ['전체', '컴퓨터공학과', '전자공학과', '기계공학과'],
+  const [filterOptions, setFilterOptions] = useState<FilterOptions>({
+    departments: ['all'],
     years: ['최근 1년', '최근 3년', '2024년', '2023년', '2022년'],
     periods: ['latest', '1year', '3years'],
   });
@@ -68,32 +63,29 @@ export const DashboardPage: React.FC = () => {
         setLoading(true);
         setError(null);
 
-        // Fetch all dashboard data in parallel
-        const [researchFunding, students, publications, kpi] = await Promise.all([
-          getResearchFundingData({
-            department: filters.department,
-            year: filters.year,
-            period: filters.period,
-          }),
-          getStudentData({
-            department: filters.department,
-            status: filters.studentStatus,
-          }),
-          getPublicationData({
-            department: filters.department,
-            tier: filters.journalTier,
-          }),
-          getDepartmentKPIData({
-            department: filters.department,
-            year: filters.year,
-          }),
-        ]);
+        // All sections (and the filter options) in one round trip
+        const overview = await getDashboardOverview({
+          department: filters.department,
+          period: filters.period,
+          status: filters.studentStatus,
+          journalTier: filters.journalTier,
+        });
 
         // Update state with fetched data
-        setResearchFundingData(researchFunding?.data || null);
-        setStudentData(students || null);
-        setPublicationData(publications || null);
-        setDepartmentKpiData(kpi || null);
+        setResearchFundingData(overview.researchFunding?.data || null);
+        setStudentData(overview.students || null);
+        setPublicationData(overview.publications || null);
+        setDepartmentKpiData(overview.departmentKpi || null);
+
+        // Department dropdown lists the departments present in uploaded data
+        const departments = overview.filterOptions?.departments;
+        if (departments) {
+          setFilterOptions((prev) => ({ ...prev, departments }));
+        }
+
+        if (Object.keys(overview.errors).length > 0) {
+          console.error('Some dashboard sections failed:', overview.errors);
+        }
       } catch (err) {
         console.error('Failed to fetch dashboard data:', err);
         setError(err as Error);
@@ -0,0 +1,67 @@
+-- ============================================================================
+-- Migration: Dashboard Filter Indexes
+-- Project: 대학교 사내 데이터 시각화 대시보드 MVP
+-- Version: 2.1
+-- Created: 2026-10-19
+-- Description: 대시보드 필터 조합에 맞춘 복합/커버링/부분 인덱스
+--              (Django 마이그레이션 0007_dashboard_filter_indexes의 원본 테이블 인덱스와 동일)
+-- ============================================================================
+
+-- ============================================================================
+-- 1. 연구비 집행 (Research Projects)
+-- ============================================================================
+
+-- 인덱스: 학과 + 집행일자 범위, 월별 집계 커버링 (Index Only Scan)
+CREATE INDEX IF NOT EXISTS idx_research_projects_dept_date
+    ON research_projects(department, execution_date)
+    INCLUDE (total_budget, execution_amount);
+
+-- ============================================================================
+-- 2. 학생 명단 (Students)
+-- ============================================================================
+
+-- 인덱스: 학적상태 + 학과 필터, 과정구분별 집계
+CREATE INDEX IF NOT EXISTS idx_students_status_dept_program
+    ON students(enrollment_status, department, program_type)
+    INCLUDE (student_id);
+
+-- 부분 인덱스: 기본 필터 (재학)
+CREATE INDEX IF NOT EXISTS idx_students_enrolled_dept_program
+    ON students(department, program_type)
+    INCLUDE (student_id)
+    WHERE enrollment_status = '재학';
+
+-- ============================================================================
+-- 3. 논문 목록 (Publications)
+-- ============================================================================
+
+-- 인덱스: 학과 + 저널등급 필터, Impact Factor 집계 커버링
+CREATE INDEX IF NOT EXISTS idx_publications_dept_tier_if
+    ON publications(department, journal_tier, impact_factor)
+    INCLUDE (paper_id);
+
+-- ============================================================================
+-- 4. 통계 갱신
+-- ============================================================================
+
+ANALYZE research_projects;
+ANALYZE students;
+ANALYZE publications;
+
+-- ============================================================================
+-- 5. 마이그레이션 검증 쿼리
+-- ============================================================================
+
+-- 인덱스 확인
+-- SELECT tablename, indexname, indexdef FROM pg_indexes
+-- WHERE schemaname = 'public'
+-- AND tablename IN ('research_projects', 'students', 'publications');
+
+-- 실행 계획 확인 (Index Only Scan using idx_students_enrolled_dept_program)
+-- EXPLAIN SELECT department, program_type, COUNT(student_id) FROM students
+-- WHERE enrollment_status = '재학' AND department = '컴퓨터공학과'
+-- GROUP BY department, program_type;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================